@@ -0,0 +1,89 @@
+"""Measure the memory retained per buffered event, pydantic vs compact.
+
+Run with ``python benchmarks/compact_memory.py [COUNT]``.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import random
+import sys
+import tracemalloc
+import typing
+
+from chaturbate_poller.models.compact import CompactEvent
+from chaturbate_poller.models.event import Event
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+USERS = [f"user_{index}" for index in range(500)]
+
+
+def make_payloads(count: int, seed: int = 0) -> list[str]:
+    """Generate a realistic mix of tip, chat and enter events as raw JSON."""
+    rng = random.Random(seed)  # noqa: S311
+    payloads: list[str] = []
+    for index in range(count):
+        user = {
+            "username": rng.choice(USERS),
+            "inFanclub": rng.random() < 0.1,
+            "hasTokens": True,
+            "isMod": False,
+            "recentTips": rng.choice(["none", "some", "lots"]),
+            "gender": rng.choice(["m", "f"]),
+        }
+        kind = rng.random()
+        if kind < 0.2:
+            body = {
+                "method": "tip",
+                "object": {
+                    "broadcaster": "example_broadcaster",
+                    "user": user,
+                    "tip": {"tokens": rng.randint(1, 500), "isAnon": False, "message": ""},
+                },
+            }
+        elif kind < 0.7:
+            body = {
+                "method": "chatMessage",
+                "object": {
+                    "broadcaster": "example_broadcaster",
+                    "user": user,
+                    "message": {"color": "#494949", "font": "default", "message": f"hi {index}"},
+                },
+            }
+        else:
+            body = {
+                "method": "userEnter",
+                "object": {"broadcaster": "example_broadcaster", "user": user},
+            }
+        payloads.append(json.dumps({**body, "id": f"{index:020d}"}))
+    return payloads
+
+
+def bytes_per_event(build: Callable[[], list[typing.Any]]) -> float:
+    """Get the memory retained per item built by ``build``."""
+    gc.collect()
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    items = build()
+    retained: int = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return retained / len(items)
+
+
+def main(count: int) -> None:
+    """Print bytes per buffered event for both representations."""
+    payloads = make_payloads(count)
+    full = bytes_per_event(lambda: [Event.model_validate_json(raw) for raw in payloads])
+    compact = bytes_per_event(
+        lambda: [CompactEvent.from_event(Event.model_validate_json(raw)) for raw in payloads]
+    )
+    print(f"events:        {count}")
+    print(f"pydantic:      {full:8.0f} bytes/event")
+    print(f"compact:       {compact:8.0f} bytes/event ({full / compact:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,74 @@
+"""Measure formatted messages per second, one at a time and by page.
+
+Run with ``python benchmarks/format_messages.py [EVENTS]``.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import typing
+
+from chaturbate_poller.constants import EventMethod
+from chaturbate_poller.models.event import Event
+from chaturbate_poller.models.event_data import EventData
+from chaturbate_poller.models.message import Message
+from chaturbate_poller.models.tip import Tip
+from chaturbate_poller.models.user import User
+from chaturbate_poller.utils.format_messages import DEFAULT_FORMATTER, format_message
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+PAGE_SIZE = 1000
+
+
+def make_events(count: int) -> list[Event]:
+    """Build a mix of tip, chat and enter events."""
+    events: list[Event] = []
+    for index in range(count):
+        user = User(
+            username=f"user_{index % 500}",
+            inFanclub=False,
+            hasTokens=True,
+            isMod=False,
+            recentTips="some",
+            gender="m",
+        )
+        kind: int = index % 10
+        if kind < 2:
+            data = EventData(user=user, tip=Tip(tokens=25, isAnon=kind == 1, message="| hi"))
+            method = EventMethod.TIP
+        elif kind < 7:
+            message = Message(
+                color="", bgColor=None, font="", message=f"hi {index}", fromUser=None, toUser=None
+            )
+            data = EventData(user=user, message=message)
+            method = EventMethod.CHAT_MESSAGE
+        else:
+            data = EventData(user=user)
+            method = EventMethod.USER_ENTER
+        events.append(Event(method=method, object=data, id=str(index)))
+    return events
+
+
+def measure(name: str, count: int, run: Callable[[], object]) -> None:
+    """Time one pass over the events and print the rate."""
+    started: float = time.perf_counter()
+    run()
+    elapsed: float = time.perf_counter() - started
+    print(f"{name}: {count / elapsed:,.0f} messages/s")
+
+
+def main(count: int) -> None:
+    """Format the events one by one, then page by page."""
+    events: list[Event] = make_events(count)
+    pages: list[list[Event]] = [
+        events[start : start + PAGE_SIZE] for start in range(0, count, PAGE_SIZE)
+    ]
+    measure("format_message", count, lambda: [format_message(event) for event in events])
+    measure("format_batch", count, lambda: [DEFAULT_FORMATTER.format_batch(page) for page in pages])
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
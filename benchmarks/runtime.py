@@ -0,0 +1,156 @@
+"""Compare event throughput and fetch-to-handle latency across runtime choices.
+
+A mock Events API runs in a separate process and answers every request with
+a page of tip events stamped with the time the page was served. For each
+runtime choice, several clients poll it concurrently for a fixed time and
+the handler records how long each page took from being served to being
+handled.
+
+Run with ``python benchmarks/runtime.py [SECONDS]``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import sys
+import time
+import typing
+
+from chaturbate_poller.constants import LoopImplementation
+from chaturbate_poller.core.client import ChaturbateClient
+from chaturbate_poller.core.polling import poll_pages
+from chaturbate_poller.core.runtime import loop_factory, run, uvloop_available
+from chaturbate_poller.core.transport import PooledTransport
+
+if typing.TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+    from chaturbate_poller.models.event import Event
+
+PAGE_SIZE = 100
+CLIENTS = 8
+STAMP = b"__STAMP__"
+
+
+def make_page(port: int) -> bytes:
+    """Build the body of a page, with a placeholder for the time it is served."""
+    event = {
+        "method": "tip",
+        "object": {
+            "broadcaster": "bench",
+            "user": {
+                "username": "user",
+                "inFanclub": False,
+                "hasTokens": True,
+                "isMod": False,
+                "recentTips": "some",
+                "gender": "m",
+            },
+            "tip": {"tokens": 25, "isAnon": False, "message": ""},
+        },
+        "id": "__STAMP__",
+    }
+    return json.dumps({
+        "events": [event] * PAGE_SIZE,
+        "nextUrl": f"http://127.0.0.1:{port}/events/bench/token/",
+    }).encode()
+
+
+async def serve(pipe: Connection) -> None:
+    """Answer every request with a freshly stamped page until terminated."""
+    page: bytes = b""
+
+    async def answer(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                body = page.replace(STAMP, str(time.time_ns()).encode())
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(answer, "127.0.0.1", 0)
+    port: int = server.sockets[0].getsockname()[1]
+    page = make_page(port)
+    pipe.send(port)
+    await server.serve_forever()
+
+
+def serve_process(pipe: Connection) -> None:
+    """Run the mock API on the fastest loop available."""
+    asyncio.run(serve(pipe), loop_factory=loop_factory(LoopImplementation.AUTO))
+
+
+class Recorder:
+    """Handler counting events and recording page latencies."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.events: int = 0
+        self.latencies: list[float] = []
+
+    async def handle_batch(self, events: list[Event]) -> None:
+        """Record the latency of a page and touch each of its events."""
+        self.latencies.append((time.time_ns() - int(events[0].id)) / 1e6)
+        for event in events:
+            if event.object.tip is not None:
+                self.events += 1
+
+
+async def measure(port: int, seconds: float) -> Recorder:
+    """Poll the mock API with several clients sharing one pool."""
+    recorder = Recorder()
+    stop = asyncio.Event()
+    transport = PooledTransport()
+    url = f"http://127.0.0.1:{port}/events/bench/token/"
+
+    async def poll() -> None:
+        async with ChaturbateClient("bench", "token", transport=transport) as client:
+            async for response in poll_pages(client, url=url, stop=stop):
+                await recorder.handle_batch(response.events)
+
+    pollers = [asyncio.create_task(poll()) for _ in range(CLIENTS)]
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*pollers)
+    return recorder
+
+
+def main(seconds: float) -> None:
+    """Run the benchmark for every runtime choice."""
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    server = context.Process(target=serve_process, args=(sender,), daemon=True)
+    server.start()
+    port: int = receiver.recv()
+
+    choices: list[tuple[LoopImplementation, bool]] = [
+        (LoopImplementation.ASYNCIO, False),
+        (LoopImplementation.ASYNCIO, True),
+    ]
+    if uvloop_available():
+        choices.append((LoopImplementation.UVLOOP, False))
+    try:
+        for implementation, eager in choices:
+            recorder = run(measure(port, seconds), loop=implementation, eager_tasks=eager)
+            latencies = sorted(recorder.latencies)
+            p50 = latencies[len(latencies) // 2]
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            label = f"{implementation.value}{' + eager tasks' if eager else ''}"
+            print(
+                f"{label:<22} {recorder.events / seconds:>10,.0f} events/s"
+                f"   p50 {p50:6.2f} ms   p99 {p99:6.2f} ms"
+            )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0)
@@ -0,0 +1,71 @@
+"""Measure SQLite sink write throughput and rollup query latency.
+
+Run with ``python benchmarks/sqlite_queries.py [EVENTS]``.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import tempfile
+import time
+
+from chaturbate_poller.constants import EventMethod
+from chaturbate_poller.database.sqlite_store import SQLiteStore
+from chaturbate_poller.models.event import Event
+from chaturbate_poller.models.event_data import EventData
+from chaturbate_poller.models.tip import Tip
+from chaturbate_poller.models.user import User
+
+PAGE_SIZE = 1000
+USERS = 5000
+
+
+def make_page(offset: int) -> list[Event]:
+    """Build a page of tip events from a rotating set of users."""
+    page: list[Event] = []
+    for index in range(offset, offset + PAGE_SIZE):
+        user = User.model_construct(
+            username=f"user_{index % USERS}",
+            in_fanclub=False,
+            has_tokens=True,
+            is_mod=False,
+            recent_tips="some",
+            gender="m",
+            subgender="",
+        )
+        tip = Tip.model_construct(tokens=1 + index % 50, is_anon=False, message="")
+        page.append(
+            Event.model_construct(
+                method=EventMethod.TIP,
+                object=EventData.model_construct(user=user, tip=tip),
+                id=str(index),
+            )
+        )
+    return page
+
+
+def main(count: int) -> None:
+    """Write events spread over a day, then time the rollup queries."""
+    with tempfile.TemporaryDirectory() as directory:
+        store = SQLiteStore(str(pathlib.Path(directory) / "events.db"))
+        pages: int = count // PAGE_SIZE
+        started = time.perf_counter()
+        for number in range(pages):
+            store.submit(make_page(number * PAGE_SIZE), received_at=number * 86400 / pages)
+        store.flush()
+        elapsed = time.perf_counter() - started
+        print(f"wrote {pages * PAGE_SIZE} events in {elapsed:.1f}s")
+
+        for name, query in (
+            ("top_tippers", lambda: store.top_tippers(10)),
+            ("events_per_hour", store.events_per_hour),
+        ):
+            started = time.perf_counter()
+            query()
+            print(f"{name}: {(time.perf_counter() - started) * 1000:.2f} ms")
+        store.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
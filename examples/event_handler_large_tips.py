@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from rich.logging import RichHandler
 
 from chaturbate_poller import ChaturbateClient, ConfigManager, format_message
+from chaturbate_poller.analytics.rules import FollowedBy, RuleEngine, TipBurst
+from chaturbate_poller.constants import EventMethod
 from chaturbate_poller.models.event import Event
 from chaturbate_poller.models.tip import Tip
 from chaturbate_poller.models.user import User
@@ -14,6 +16,7 @@ from chaturbate_poller.models.user import User
 LARGE_TIP_THRESHOLD = 100
 MEGA_TIP_THRESHOLD = 500
 BIG_TIP_THRESHOLD = 200
+TIP_RUSH_TOKENS = 500
 
 logging.basicConfig(
     level=logging.INFO, format="%(message)s", handlers=[RichHandler(rich_tracebacks=True)]
@@ -50,10 +53,16 @@ class TipHandler:
 async def monitor_events(client: ChaturbateClient, handler: TipHandler) -> None:
     """Monitor events."""
     url: str | None = None
+    rules = RuleEngine([
+        TipBurst("tip rush", tips=3, tokens=TIP_RUSH_TOKENS, within=60),
+        FollowedBy("follow and tip", EventMethod.FOLLOW, EventMethod.TIP, within=60),
+    ])
 
     try:
         while True:
             response = await client.fetch_events(url)
+            for match in rules.process_batch(response.events):
+                logger.info("%s! %s, %d events", match.rule.upper(), match.key, len(match.events))
             for event in response.events:
                 if event.method == "tip" and event.object.tip and event.object.user:
                     await handler.handle_tip(event.object.tip, event.object.user, event)
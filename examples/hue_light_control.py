@@ -8,6 +8,7 @@
 
 import asyncio
 import contextlib
+import functools
 import logging
 import time
 from dataclasses import dataclass, field
@@ -17,9 +18,11 @@ from phue import Bridge, PhueException
 from rich.logging import RichHandler
 
 from chaturbate_poller import ChaturbateClient, ConfigManager
+from chaturbate_poller.core.actuator import Actuator
 from chaturbate_poller.exceptions import AuthenticationError
 from chaturbate_poller.models.event import Event
 from chaturbate_poller.models.tip import Tip
+from chaturbate_poller.utils.rate_limit import TokenBucket
 
 if TYPE_CHECKING:
     from chaturbate_poller.models.api_response import EventsAPIResponse
@@ -63,6 +66,10 @@ class HueConfig:
 
     CONNECTION_RETRIES: ClassVar[int] = 3
     RETRY_DELAY: ClassVar[int] = 5  # seconds
+    BRIDGE_RATE: ClassVar[int] = 10  # light updates per second
+
+
+LIGHTS_KEY = "lights"
 
 
 @dataclass
@@ -167,6 +174,17 @@ class HueController:
 
         self._update_lights()
         self._save_light_states()
+        # The bridge handles about ten light updates per second; a burst of
+        # tips sends only the latest color or flash, never a backlog. The
+        # bucket holds enough for one flash, which is the largest command.
+        self.actuator: Actuator = Actuator(
+            TokenBucket(
+                max(HueConfig.BRIDGE_RATE, self._flash_cost(self.config.num_flashes)),
+                HueConfig.BRIDGE_RATE,
+            ),
+            blocking=True,
+            name="hue",
+        )
 
     def _update_lights(self) -> None:
         """Update available lights based on config."""
@@ -196,6 +214,10 @@ class HueController:
     async def _revert_lights(self, delay: float) -> None:
         """Revert lights after a delay."""
         await asyncio.sleep(delay)
+        self.actuator.submit(LIGHTS_KEY, self._restore_lights, cost=len(self._lights))
+
+    def _restore_lights(self) -> None:
+        """Restore the saved light states; runs on the blocking pool."""
         try:
             for light_id in self._lights:
                 state: HueLightState | dict[Any, Any] = self._last_state.get(light_id, {})
@@ -213,7 +235,10 @@ class HueController:
             logger.warning("Failed to revert lights")
 
     async def set_color(self, color: str) -> None:
-        """Set lights to a color and schedule reversion."""
+        """Set lights to a color and schedule reversion.
+
+        Only the latest color or flash waiting for the bridge is sent.
+        """
         if not self._lights:
             logger.warning("No lights available")
             return
@@ -229,6 +254,13 @@ class HueController:
             with contextlib.suppress(asyncio.CancelledError):
                 await self._color_timer
 
+        self.actuator.submit(
+            LIGHTS_KEY, functools.partial(self._apply_color, color, xy), cost=len(self._lights)
+        )
+        self._color_timer = asyncio.create_task(self._revert_lights(self.config.color_timeout))
+
+    def _apply_color(self, color: str, xy: list[float]) -> None:
+        """Set every light to a color; runs on the blocking pool."""
         self._save_light_states()
         for light_id in self._lights:
             self.bridge.set_light(
@@ -242,8 +274,6 @@ class HueController:
             )
         logger.info("Lights set to %s", color)
 
-        self._color_timer = asyncio.create_task(self._revert_lights(HueConfig.COLOR_TIMEOUT))
-
     async def flash_lights(self, color: str, count: int | None = None) -> None:
         """Flash lights in a specific color."""
         if not self._lights:
@@ -256,9 +286,24 @@ class HueController:
             logger.warning("Unknown color for flash: %s", color)
             return
 
-        flashes: int = count or self.config.num_flashes
-        self._save_light_states()
+        requested: int = count or self.config.num_flashes
+        capacity: float = self.actuator.bucket.capacity
+        flashes: int = min(requested, max(1, int(capacity // len(self._lights) - 1) // 2))
+        if flashes < requested:
+            logger.warning("Flashing %d times, the most the bridge rate allows", flashes)
+        self.actuator.submit(
+            LIGHTS_KEY,
+            functools.partial(self._flash, xy, flashes),
+            cost=min(self._flash_cost(flashes), capacity),
+        )
 
+    def _flash_cost(self, flashes: int) -> int:
+        """Count the bridge calls of a flash: on and off per flash, then a restore."""
+        return (2 * flashes + 1) * len(self._lights)
+
+    def _flash(self, xy: list[float], flashes: int) -> None:
+        """Flash every light, then restore them; runs on the blocking pool."""
+        self._save_light_states()
         try:
             for _ in range(flashes):
                 for light_id in self._lights:
@@ -271,12 +316,18 @@ class HueController:
                             "transitiontime": 0,
                         },
                     )
-                await asyncio.sleep(HueConfig.FLASH_DELAY)
+                time.sleep(HueConfig.FLASH_DELAY)
                 for light_id in self._lights:
                     self.bridge.set_light(light_id, parameter={"on": False})
-                await asyncio.sleep(HueConfig.FLASH_DELAY)
+                time.sleep(HueConfig.FLASH_DELAY)
         finally:
-            await self._revert_lights(delay=0)
+            self._restore_lights()
+
+    async def close(self) -> None:
+        """Cancel the pending reversion and send the commands still waiting."""
+        if self._color_timer:
+            self._color_timer.cancel()
+        await self.actuator.close()
 
 
 # -------------------------------
@@ -403,6 +454,8 @@ async def main(*, testbed: bool) -> None:
         except asyncio.CancelledError:
             monitor.stop()
             logger.info("Shutdown received...")
+        finally:
+            await hue_controller.close()
 
 
 @click.command()
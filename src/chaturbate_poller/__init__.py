@@ -1,12 +1,16 @@
 """chaturbate_poller package."""
 
-import importlib.metadata
+from __future__ import annotations
 
-from chaturbate_poller.config.manager import ConfigManager
-from chaturbate_poller.core.client import ChaturbateClient
-from chaturbate_poller.utils.format_messages import format_message
+import importlib
+import typing
 
-__version__ = importlib.metadata.version(distribution_name="chaturbate_poller")
+if typing.TYPE_CHECKING:
+    from chaturbate_poller.config.manager import ConfigManager
+    from chaturbate_poller.core.client import ChaturbateClient
+    from chaturbate_poller.utils.format_messages import format_message
+
+__version__: str
 __author__ = "MountainGod2"
 __author_email__ = "admin@reid.ca"
 __maintainer__ = "MountainGod2"
@@ -15,5 +19,44 @@ __license__ = "MIT"
 __url__ = "https://github.com/MountainGod2/chaturbate_poller"
 __description__ = "Python library for interacting with the Chaturbate Events API."
 
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "ChaturbateClient": "chaturbate_poller.core.client",
+    "ConfigManager": "chaturbate_poller.config.manager",
+    "format_message": "chaturbate_poller.utils.format_messages",
+}
+"""dict[str, str]: Public attributes and the modules they are imported from on first use."""
+
+
+def __getattr__(name: str) -> object:
+    """Import public attributes on first access.
+
+    Keeps ``import chaturbate_poller`` and short CLI commands from paying for
+    httpx, pydantic and backoff until they are actually needed.
+
+    Args:
+        name: The attribute name.
+
+    Returns:
+        The attribute value.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+    """
+    value: object
+    if name == "__version__":
+        value = importlib.import_module("importlib.metadata").version("chaturbate_poller")
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including those imported lazily."""
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, "__version__"})
+
 
 __all__: list[str] = ["ChaturbateClient", "ConfigManager", "format_message"]
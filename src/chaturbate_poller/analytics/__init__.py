@@ -0,0 +1 @@
+"""In-memory analytics over polled events."""
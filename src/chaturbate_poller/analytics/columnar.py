@@ -0,0 +1,226 @@
+"""Columnar batches of events for vectorized rollups."""
+
+from __future__ import annotations
+
+import array
+import collections
+import dataclasses
+import functools
+import importlib
+import importlib.util
+import math
+import time
+import typing
+
+from chaturbate_poller.analytics.users import UserTable
+from chaturbate_poller.models.compact import METHOD_CODES, METHODS
+
+if typing.TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+
+    from chaturbate_poller.constants import EventMethod
+    from chaturbate_poller.models.api_response import EventsAPIResponse
+    from chaturbate_poller.models.event import Event
+
+NO_USER: int = -1
+"""int: User ID stored for events without a user."""
+
+
+def numpy_available() -> bool:
+    """Check whether the optional NumPy dependency is installed.
+
+    Returns:
+        True if the ``numpy`` package can be imported, False otherwise.
+    """
+    return importlib.util.find_spec("numpy") is not None
+
+
+@functools.cache
+def _numpy() -> typing.Any:  # noqa: ANN401
+    """Import NumPy once, or return None when it is not installed."""
+    return importlib.import_module("numpy") if numpy_available() else None
+
+
+def _interpolate(ordered: list[int], q: float) -> float:
+    """Get a percentile of sorted values with linear interpolation."""
+    position: float = q / 100 * (len(ordered) - 1)
+    lower: int = math.floor(position)
+    upper: int = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+@dataclasses.dataclass(slots=True)
+class EventBatch:
+    """Events stored as parallel typed columns.
+
+    Columns are ``array.array`` buffers, so NumPy reads them without a copy.
+    Reductions use NumPy when it is installed and fall back to the standard
+    library otherwise; both give the same results.
+    """
+
+    methods: array.array[int] = dataclasses.field(default_factory=lambda: array.array("B"))
+    """array.array[int]: Method code of each event, see :data:`METHODS`."""
+    tokens: array.array[int] = dataclasses.field(default_factory=lambda: array.array("q"))
+    """array.array[int]: Tokens tipped or spent on media, or 0."""
+    user_ids: array.array[int] = dataclasses.field(default_factory=lambda: array.array("q"))
+    """array.array[int]: User ID from the user table, or :data:`NO_USER`."""
+    timestamps: array.array[float] = dataclasses.field(default_factory=lambda: array.array("d"))
+    """array.array[float]: Time the event was received, in seconds since the epoch."""
+
+    def __len__(self) -> int:
+        """Get the number of events in the batch."""
+        return len(self.methods)
+
+    def total_tokens(self) -> int:
+        """Get the tokens tipped or spent on media in the batch."""
+        if (np := _numpy()) is not None:
+            return int(np.frombuffer(self.tokens, dtype=np.int64).sum())
+        return sum(self.tokens)
+
+    def count_by_method(self) -> dict[EventMethod, int]:
+        """Count the events of each method.
+
+        Returns:
+            The number of events of each method present in the batch.
+        """
+        if (np := _numpy()) is not None:
+            counts = np.bincount(
+                np.frombuffer(self.methods, dtype=np.uint8), minlength=len(METHODS)
+            )
+            return {METHODS[code]: int(count) for code, count in enumerate(counts) if count}
+        return {
+            METHODS[code]: count
+            for code, count in sorted(collections.Counter(self.methods).items())
+        }
+
+    def tokens_by_method(self) -> dict[EventMethod, int]:
+        """Sum the tokens of each method.
+
+        Returns:
+            The tokens of each method with a non-zero total.
+        """
+        if (np := _numpy()) is not None:
+            sums = np.bincount(
+                np.frombuffer(self.methods, dtype=np.uint8),
+                weights=np.frombuffer(self.tokens, dtype=np.int64),
+                minlength=len(METHODS),
+            )
+            return {METHODS[code]: int(total) for code, total in enumerate(sums) if total}
+        totals: collections.Counter[int] = collections.Counter()
+        for code, amount in zip(self.methods, self.tokens, strict=True):
+            totals[code] += amount
+        return {METHODS[code]: total for code, total in sorted(totals.items()) if total}
+
+    def count_by_user(self) -> dict[int, int]:
+        """Count the events of each user.
+
+        Returns:
+            The number of events of each user ID, excluding events without a user.
+        """
+        if (np := _numpy()) is not None:
+            ids = np.frombuffer(self.user_ids, dtype=np.int64)
+            users, counts = np.unique(ids[ids != NO_USER], return_counts=True)
+            return dict(zip(users.tolist(), counts.tolist(), strict=True))
+        counts_: collections.Counter[int] = collections.Counter(self.user_ids)
+        counts_.pop(NO_USER, None)
+        return dict(sorted(counts_.items()))
+
+    def token_percentile(self, q: float) -> float:
+        """Get a percentile of the token amounts of events with tokens.
+
+        Args:
+            q: The percentile, from 0 to 100.
+
+        Returns:
+            The percentile, linearly interpolated, or 0.0 if no event has tokens.
+
+        Raises:
+            ValueError: If the percentile is out of range.
+        """
+        if not 0 <= q <= 100:  # noqa: PLR2004
+            msg = "Percentile must be between 0 and 100."
+            raise ValueError(msg)
+        if (np := _numpy()) is not None:
+            amounts = np.frombuffer(self.tokens, dtype=np.int64)
+            amounts = amounts[amounts > 0]
+            return float(np.percentile(amounts, q)) if amounts.size else 0.0
+        ordered: list[int] = sorted(amount for amount in self.tokens if amount > 0)
+        return _interpolate(ordered, q) if ordered else 0.0
+
+
+class BatchBuilder:
+    """Append pages of events to column buffers and hand them out as batches.
+
+    Args:
+        users: Table used to map usernames to user IDs; a new one if omitted.
+        clock: Function returning the current time in seconds since the epoch.
+    """
+
+    def __init__(
+        self, users: UserTable | None = None, *, clock: Callable[[], float] = time.time
+    ) -> None:
+        """Initialize an empty builder."""
+        self.users: UserTable = users if users is not None else UserTable()
+        self._clock: Callable[[], float] = clock
+        self._batch: EventBatch = EventBatch()
+
+    def __len__(self) -> int:
+        """Get the number of events waiting to be built."""
+        return len(self._batch)
+
+    def add_page(self, events: Iterable[Event], timestamp: float | None = None) -> None:
+        """Append the events of one page.
+
+        Args:
+            events: The events to append.
+            timestamp: Time the page was received; now if omitted.
+        """
+        received: float = self._clock() if timestamp is None else timestamp
+        batch: EventBatch = self._batch
+        user_id: Callable[[str], int] = self.users.user_id
+        count: int = 0
+        for event in events:
+            data = event.object
+            batch.methods.append(METHOD_CODES[event.method])
+            if data.tip is not None:
+                batch.tokens.append(data.tip.tokens)
+            elif data.media is not None:
+                batch.tokens.append(data.media.tokens)
+            else:
+                batch.tokens.append(0)
+            batch.user_ids.append(NO_USER if data.user is None else user_id(data.user.username))
+            count += 1
+        batch.timestamps.extend(array.array("d", [received]) * count)
+
+    def build(self) -> EventBatch:
+        """Hand out the events appended so far and start a new batch.
+
+        Returns:
+            The batch of appended events.
+        """
+        batch, self._batch = self._batch, EventBatch()
+        return batch
+
+
+async def batches(
+    pages: AsyncIterable[EventsAPIResponse], builder: BatchBuilder, *, size: int = 1
+) -> AsyncIterator[EventBatch]:
+    """Turn pages of events into batches of at least ``size`` events.
+
+    Pages are never split. Events left over when the pages end are yielded
+    as a final, smaller batch.
+
+    Args:
+        pages: Pages of events, such as those from ``poll_pages``.
+        builder: The builder that buffers the columns.
+        size: The minimum number of events in each batch.
+
+    Yields:
+        Each batch of events.
+    """
+    async for page in pages:
+        builder.add_page(page.events)
+        if len(builder) >= size:
+            yield builder.build()
+    if len(builder):
+        yield builder.build()
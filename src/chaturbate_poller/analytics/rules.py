@@ -0,0 +1,370 @@
+"""Windowed pattern rules evaluated incrementally over the event stream."""
+
+from __future__ import annotations
+
+import abc
+import collections
+import dataclasses
+import time
+import typing
+
+from chaturbate_poller.constants import RULES_MAX_KEYS, RULES_MAX_WINDOW_EVENTS, EventMethod
+from chaturbate_poller.metrics import Counter, registry
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Sequence
+
+    from chaturbate_poller.models.event import Event
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Match:
+    """A completed rule pattern."""
+
+    rule: str
+    """str: The name of the rule."""
+    key: Hashable
+    """Hashable: The broadcaster, or broadcaster and username, the pattern matched for."""
+    time: float
+    """float: Time the pattern completed, in seconds since the epoch."""
+    events: tuple[Event, ...]
+    """tuple[Event, ...]: The events that completed the pattern, oldest first."""
+
+
+class Rule[S](abc.ABC):
+    """A pattern over the events of one key, kept as incremental state.
+
+    Each rule keeps its state per key in a least-recently-used table holding
+    at most ``max_keys`` keys, and updates it in O(1) amortized time per
+    event. The state of a key is reset when its pattern matches, so one burst
+    of activity produces one match.
+
+    Args:
+        name: The name reported in matches.
+        methods: The event methods the rule reads.
+        max_keys: Keys kept before the least recently updated is dropped.
+    """
+
+    def __init__(self, name: str, methods: Iterable[EventMethod], max_keys: int) -> None:
+        """Initialize the rule without state."""
+        if max_keys < 1:
+            msg = "Rule key limit must be a positive integer."
+            raise ValueError(msg)
+        self.name: str = name
+        self.methods: frozenset[EventMethod] = frozenset(methods)
+        self.max_keys: int = max_keys
+        self._states: collections.OrderedDict[Hashable, S] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of keys with state."""
+        return len(self._states)
+
+    @abc.abstractmethod
+    def feed(self, event: Event, now: float) -> tuple[Hashable, tuple[Event, ...]] | None:
+        """Advance the rule with an event.
+
+        Args:
+            event: An event with one of the rule's methods.
+            now: The current time, in seconds since the epoch.
+
+        Returns:
+            The key and events of a completed pattern, or None.
+        """
+
+    @abc.abstractmethod
+    def _new_state(self) -> S:
+        """Create the state of a new key."""
+
+    def _state(self, key: Hashable) -> S:
+        """Get or create the state of a key and mark it as recently updated."""
+        state: S | None = self._states.get(key)
+        if state is not None:
+            self._states.move_to_end(key)
+            return state
+        if len(self._states) >= self.max_keys:
+            self._states.popitem(last=False)
+        state = self._states[key] = self._new_state()
+        return state
+
+    def _reset(self, key: Hashable) -> None:
+        """Drop the state of a key."""
+        self._states.pop(key, None)
+
+
+def _broadcaster(event: Event) -> str:
+    """Key an event by broadcaster."""
+    return event.object.broadcaster or ""
+
+
+def _user(event: Event) -> tuple[str, str] | None:
+    """Key an event by broadcaster and username, or None without a user."""
+    user = event.object.user
+    return None if user is None else (event.object.broadcaster or "", user.username)
+
+
+class _TipWindow:
+    """Tips of one broadcaster within the window, with running totals."""
+
+    __slots__: tuple[str, ...] = ("tippers", "tips", "tokens")
+
+    def __init__(self) -> None:
+        """Initialize an empty window."""
+        self.tips: collections.deque[tuple[float, str, int, Event]] = collections.deque()
+        self.tokens: int = 0
+        self.tippers: collections.Counter[str] = collections.Counter()
+
+    def pop(self) -> None:
+        """Remove the oldest tip from the window."""
+        _, username, tokens, _ = self.tips.popleft()
+        self.tokens -= tokens
+        self.tippers[username] -= 1
+        if not self.tippers[username]:
+            del self.tippers[username]
+
+
+class TipBurst(Rule[_TipWindow]):
+    """Match when a broadcaster receives enough tips and tokens within a window.
+
+    Example: ``TipBurst("rush", tips=3, tokens=500, within=60)`` matches three
+    tips from three different users totaling at least 500 tokens within a
+    minute.
+
+    Args:
+        name: The name reported in matches.
+        tips: Tips needed, counted once per user when ``distinct_users`` is set.
+        tokens: Tokens the tips must total.
+        within: Length of the window, in seconds.
+        distinct_users: Whether tips must come from different users.
+        max_tips: Tips kept per broadcaster; older ones leave the window early.
+        max_keys: Broadcasters kept before the least recently updated is dropped.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        name: str,
+        *,
+        tips: int,
+        tokens: int,
+        within: float,
+        distinct_users: bool = True,
+        max_tips: int = RULES_MAX_WINDOW_EVENTS,
+        max_keys: int = RULES_MAX_KEYS,
+    ) -> None:
+        """Initialize the rule."""
+        super().__init__(name, {EventMethod.TIP}, max_keys)
+        if tips < 1 or max_tips < tips:
+            msg = "Tip count must be positive and no larger than the tips kept."
+            raise ValueError(msg)
+        self.tips: int = tips
+        self.tokens: int = tokens
+        self.within: float = within
+        self.distinct_users: bool = distinct_users
+        self.max_tips: int = max_tips
+
+    def _new_state(self) -> _TipWindow:
+        """Create an empty window."""
+        return _TipWindow()
+
+    def feed(self, event: Event, now: float) -> tuple[Hashable, tuple[Event, ...]] | None:
+        """Add a tip to its broadcaster's window and check the thresholds."""
+        data = event.object
+        if data.tip is None or data.user is None:
+            return None
+        key: str = _broadcaster(event)
+        window: _TipWindow = self._state(key)
+        cutoff: float = now - self.within
+        while window.tips and window.tips[0][0] < cutoff:
+            window.pop()
+        if len(window.tips) >= self.max_tips:
+            window.pop()
+        window.tips.append((now, data.user.username, data.tip.tokens, event))
+        window.tokens += data.tip.tokens
+        window.tippers[data.user.username] += 1
+        count: int = len(window.tippers) if self.distinct_users else len(window.tips)
+        if count < self.tips or window.tokens < self.tokens:
+            return None
+        self._reset(key)
+        return key, tuple(tip[3] for tip in window.tips)
+
+
+class _Started:
+    """The pending first event of a sequence."""
+
+    __slots__: tuple[str, ...] = ("event", "time")
+
+    def __init__(self) -> None:
+        """Initialize without a pending event."""
+        self.time: float = 0.0
+        self.event: Event | None = None
+
+
+class FollowedBy(Rule[_Started]):
+    """Match when a user's event is followed by another of theirs within a window.
+
+    Example: ``FollowedBy("thanks", EventMethod.FOLLOW, EventMethod.TIP,
+    within=60)`` matches a user who tips within a minute of following.
+
+    Args:
+        name: The name reported in matches.
+        first: The method that starts the sequence.
+        then: The method that completes it.
+        within: Longest time between the two events, in seconds.
+        max_keys: Users kept before the least recently updated is dropped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        first: EventMethod,
+        then: EventMethod,
+        *,
+        within: float,
+        max_keys: int = RULES_MAX_KEYS,
+    ) -> None:
+        """Initialize the rule."""
+        super().__init__(name, {first, then}, max_keys)
+        self.first: EventMethod = first
+        self.then: EventMethod = then
+        self.within: float = within
+
+    def _new_state(self) -> _Started:
+        """Create a state without a pending event."""
+        return _Started()
+
+    def feed(self, event: Event, now: float) -> tuple[Hashable, tuple[Event, ...]] | None:
+        """Start or complete the user's sequence."""
+        key: tuple[str, str] | None = _user(event)
+        if key is None:
+            return None
+        if event.method is self.then:
+            started: _Started | None = self._states.get(key)
+            if started is not None and started.event is not None:
+                if now - started.time <= self.within:
+                    self._reset(key)
+                    return key, (started.event, event)
+                if event.method is not self.first:
+                    self._reset(key)
+        if event.method is self.first:
+            state: _Started = self._state(key)
+            state.time, state.event = now, event
+        return None
+
+
+class Repeated(Rule["collections.deque[tuple[float, Event]]"]):
+    """Match when a user sends the same event method often within a window.
+
+    Example: ``Repeated("restless", EventMethod.USER_ENTER, count=6,
+    within=3600)`` matches a user entering more than five times in an hour.
+
+    Args:
+        name: The name reported in matches.
+        method: The method to count.
+        count: Events needed within the window.
+        within: Length of the window, in seconds.
+        max_keys: Users kept before the least recently updated is dropped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        method: EventMethod,
+        *,
+        count: int,
+        within: float,
+        max_keys: int = RULES_MAX_KEYS,
+    ) -> None:
+        """Initialize the rule."""
+        super().__init__(name, {method}, max_keys)
+        if count < 1:
+            msg = "Repeat count must be a positive integer."
+            raise ValueError(msg)
+        self.count: int = count
+        self.within: float = within
+
+    def _new_state(self) -> collections.deque[tuple[float, Event]]:
+        """Create an empty history holding the last ``count`` events."""
+        return collections.deque(maxlen=self.count)
+
+    def feed(self, event: Event, now: float) -> tuple[Hashable, tuple[Event, ...]] | None:
+        """Add the event to the user's history and check the oldest kept one."""
+        key: tuple[str, str] | None = _user(event)
+        if key is None:
+            return None
+        history: collections.deque[tuple[float, Event]] = self._state(key)
+        history.append((now, event))
+        if len(history) < self.count or history[0][0] < now - self.within:
+            return None
+        self._reset(key)
+        return key, tuple(seen[1] for seen in history)
+
+
+class RuleEngine:
+    """Evaluate rules over events, reading only the rules each method needs.
+
+    Rules are indexed by event method when the engine is created, so an
+    event costs one dictionary lookup plus the O(1) amortized update of each
+    rule that reads its method; other rules are not touched.
+
+    Args:
+        rules: The rules to evaluate. Names must be unique.
+        clock: Function returning the current time in seconds since the epoch.
+    """
+
+    def __init__(
+        self, rules: Iterable[Rule[typing.Any]], *, clock: Callable[[], float] = time.time
+    ) -> None:
+        """Initialize the engine and index the rules by method."""
+        self._rules: tuple[Rule[typing.Any], ...] = tuple(rules)
+        if len({rule.name for rule in self._rules}) != len(self._rules):
+            msg = "Rule names must be unique."
+            raise ValueError(msg)
+        self._clock: Callable[[], float] = clock
+        index: dict[EventMethod, list[Rule[typing.Any]]] = {}
+        for rule in self._rules:
+            for method in rule.methods:
+                index.setdefault(method, []).append(rule)
+        self._index: dict[EventMethod, tuple[Rule[typing.Any], ...]] = {
+            method: tuple(rules) for method, rules in index.items()
+        }
+        self._matches: dict[str, Counter] = {
+            rule.name: registry.counter(
+                "rule_matches_total", "Rule patterns matched.", rule=rule.name
+            )
+            for rule in self._rules
+        }
+
+    @property
+    def rules(self) -> tuple[Rule[typing.Any], ...]:
+        """Get the rules, in evaluation order."""
+        return self._rules
+
+    def process(self, event: Event) -> list[Match]:
+        """Evaluate the rules on an event.
+
+        Args:
+            event: The event to evaluate.
+
+        Returns:
+            The patterns the event completed.
+        """
+        return self.process_batch([event])
+
+    def process_batch(self, events: Sequence[Event]) -> list[Match]:
+        """Evaluate the rules on a page of events, reading the clock once.
+
+        Args:
+            events: The events to evaluate, oldest first.
+
+        Returns:
+            The patterns the events completed, in order.
+        """
+        now: float = self._clock()
+        matches: list[Match] = []
+        index: dict[EventMethod, tuple[Rule[typing.Any], ...]] = self._index
+        for event in events:
+            for rule in index.get(event.method, ()):
+                result: tuple[Hashable, tuple[Event, ...]] | None = rule.feed(event, now)
+                if result is not None:
+                    self._matches[rule.name].inc()
+                    matches.append(Match(rule.name, result[0], now, result[1]))
+        return matches
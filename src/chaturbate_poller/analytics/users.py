@@ -0,0 +1,241 @@
+"""Per-broadcaster table of users seen in events, keyed by small integer IDs."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import heapq
+import itertools
+import sys
+import time
+import typing
+
+from chaturbate_poller.constants import MEMORY_USER_BYTES, USER_TABLE_MAX_USERS, EventMethod
+from chaturbate_poller.core.memory import shared_memory_budget
+from chaturbate_poller.metrics import Counter, registry
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from chaturbate_poller.models.event import Event
+
+MESSAGE_METHODS: frozenset[EventMethod] = frozenset({
+    EventMethod.CHAT_MESSAGE,
+    EventMethod.PRIVATE_MESSAGE,
+})
+"""frozenset[EventMethod]: Methods counted as messages sent by the user."""
+
+
+@dataclasses.dataclass(slots=True)
+class UserState:
+    """Rolling state kept for one user."""
+
+    user_id: int
+    """int: The ID assigned to the user by the table."""
+    username: str
+    """str: The interned username."""
+    first_seen: float
+    """float: Time the user was first seen, in seconds since the epoch."""
+    last_seen: float
+    """float: Time the user was last seen, in seconds since the epoch."""
+    tip_total: int = 0
+    """int: Tokens tipped by the user."""
+    tip_count: int = 0
+    """int: Number of tips sent by the user."""
+    message_count: int = 0
+    """int: Number of chat and private messages sent by the user."""
+    in_fanclub: bool = False
+    """bool: Whether the user was in the fan club when last seen."""
+    is_mod: bool = False
+    """bool: Whether the user was a moderator when last seen."""
+
+
+class UserTable:
+    """Least-recently-seen bounded table of the users of one broadcaster.
+
+    Usernames are interned and mapped to small integer IDs so handlers can
+    key their own state by ``int`` instead of re-hashing strings. IDs are
+    never reused, so an ID held after its user was evicted does not point to
+    another user. All lookups and updates are O(1). Under memory pressure,
+    the least recently seen half of the users is evicted.
+
+    Args:
+        max_users: Number of users kept before the least recently seen is evicted.
+        broadcaster: Name of the broadcaster, used as a metric label.
+        clock: Function returning the current time in seconds since the epoch.
+    """
+
+    def __init__(
+        self,
+        max_users: int = USER_TABLE_MAX_USERS,
+        *,
+        broadcaster: str = "",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an empty table."""
+        if max_users < 1:
+            msg = "User table size must be a positive integer."
+            raise ValueError(msg)
+        self.max_users: int = max_users
+        self.broadcaster: str = broadcaster
+        self._clock: Callable[[], float] = clock
+        self._ids: dict[str, int] = {}
+        self._states: collections.OrderedDict[int, UserState] = collections.OrderedDict()
+        self._next_id: Iterator[int] = itertools.count()
+        self._evictions: Counter = registry.counter(
+            "user_table_evictions_total",
+            "Users evicted from the user table.",
+            broadcaster=broadcaster,
+        )
+        shared_memory_budget().register("user_table", self)
+
+    def __len__(self) -> int:
+        """Get the number of users in the table."""
+        return len(self._states)
+
+    def __contains__(self, username: object) -> bool:
+        """Check whether a username is in the table."""
+        return username in self._ids
+
+    def __iter__(self) -> Iterator[UserState]:
+        """Iterate over the users, least recently seen first."""
+        return iter(self._states.values())
+
+    def user_id(self, username: str) -> int:
+        """Get the ID of a username, adding the user if it is new.
+
+        Args:
+            username: The username to look up.
+
+        Returns:
+            The user ID.
+        """
+        return self._touch(username, self._clock()).user_id
+
+    def get(self, username: str) -> UserState | None:
+        """Get the state of a user without marking them as seen.
+
+        Args:
+            username: The username to look up.
+
+        Returns:
+            The user state, or None if the user is not in the table.
+        """
+        user_id: int | None = self._ids.get(username)
+        return None if user_id is None else self._states[user_id]
+
+    def by_id(self, user_id: int) -> UserState | None:
+        """Get the state of a user by ID without marking them as seen.
+
+        Args:
+            user_id: The ID to look up.
+
+        Returns:
+            The user state, or None if the ID is unknown or was evicted.
+        """
+        return self._states.get(user_id)
+
+    def record(self, event: Event) -> UserState | None:
+        """Update the table from an event.
+
+        Args:
+            event: The event to record.
+
+        Returns:
+            The state of the user in the event, or None if it has no user.
+        """
+        data = event.object
+        if data.user is None:
+            return None
+        state: UserState = self._touch(data.user.username, self._clock())
+        state.in_fanclub = data.user.in_fanclub
+        state.is_mod = data.user.is_mod
+        if data.tip is not None:
+            state.tip_total += data.tip.tokens
+            state.tip_count += 1
+        elif event.method in MESSAGE_METHODS:
+            state.message_count += 1
+        return state
+
+    def top_tippers(self, count: int = 10) -> list[UserState]:
+        """Get the users with the highest tip totals.
+
+        Args:
+            count: The number of users to return.
+
+        Returns:
+            The users, highest tip total first.
+        """
+        return heapq.nlargest(count, self._states.values(), key=lambda state: state.tip_total)
+
+    def memory_usage(self) -> int:
+        """Estimate the bytes held by the table.
+
+        Returns:
+            The estimated size of the table.
+        """
+        return len(self._states) * MEMORY_USER_BYTES
+
+    def shed_memory(self) -> None:
+        """Evict the least recently seen half of the users."""
+        for _ in range((len(self._states) + 1) // 2):
+            self._evict()
+
+    def _evict(self) -> None:
+        """Evict the least recently seen user."""
+        _, evicted = self._states.popitem(last=False)
+        del self._ids[evicted.username]
+        self._evictions.inc()
+
+    def _touch(self, username: str, now: float) -> UserState:
+        """Get or add a user and move them to the most recently seen end."""
+        user_id: int | None = self._ids.get(username)
+        if user_id is not None:
+            state: UserState = self._states[user_id]
+            self._states.move_to_end(user_id)
+            state.last_seen = now
+            return state
+        if len(self._states) >= self.max_users:
+            self._evict()
+        username = sys.intern(username)
+        user_id = next(self._next_id)
+        state = self._states[user_id] = UserState(user_id, username, now, now)
+        self._ids[username] = user_id
+        return state
+
+
+class UserTables:
+    """User tables for each broadcaster, created on first use.
+
+    Args:
+        max_users: Size of each broadcaster's table.
+    """
+
+    def __init__(self, max_users: int = USER_TABLE_MAX_USERS) -> None:
+        """Initialize without any table."""
+        self.max_users: int = max_users
+        self._tables: dict[str, UserTable] = {}
+
+    def __getitem__(self, broadcaster: str) -> UserTable:
+        """Get the table of a broadcaster, creating it if needed."""
+        table: UserTable | None = self._tables.get(broadcaster)
+        if table is None:
+            table = self._tables[broadcaster] = UserTable(self.max_users, broadcaster=broadcaster)
+        return table
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the broadcasters with a table."""
+        return iter(self._tables)
+
+    def record(self, event: Event, broadcaster: str | None = None) -> UserState | None:
+        """Update the table of the event's broadcaster.
+
+        Args:
+            event: The event to record.
+            broadcaster: The broadcaster to file the event under, when the
+                event does not name one.
+
+        Returns:
+            The state of the user in the event, or None if it has no user.
+        """
+        return self[event.object.broadcaster or broadcaster or ""].record(event)
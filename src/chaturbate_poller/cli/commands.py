@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import sys
 
 import rich_click as click
 
-from chaturbate_poller import __version__
-from chaturbate_poller.config.manager import ConfigManager
-from chaturbate_poller.constants import API_TIMEOUT
-from chaturbate_poller.core.runner import main
+from chaturbate_poller.constants import (
+    ADAPTIVE_TIMEOUT_MAX,
+    ADAPTIVE_TIMEOUT_MIN,
+    API_TIMEOUT,
+    FANOUT_HOST,
+    HEALTH_HOST,
+    LOOP_MONITOR_THRESHOLD,
+    SHUTDOWN_TIMEOUT,
+    LoopImplementation,
+)
 from chaturbate_poller.exceptions import AuthenticationError, PollingError
 from chaturbate_poller.logging.exception_hook import handle_uncaught_exception
 from chaturbate_poller.models.options import PollerOptions
@@ -33,8 +38,15 @@ logger: logging.Logger = logging.getLogger(name=__name__)
 """logging.Logger: The module-level logger."""
 
 
+def _config_default(key: str) -> str:
+    """Read a default option value from the configuration when it is needed."""
+    from chaturbate_poller.config.manager import get_config  # noqa: PLC0415
+
+    return get_config().get(key=key, default="") or ""
+
+
 @click.group()
-@click.version_option(version=__version__, prog_name="chaturbate-poller")
+@click.version_option(package_name="chaturbate_poller", prog_name="chaturbate-poller")
 def cli() -> None:
     """Manage and run the Chaturbate Poller CLI."""
 
@@ -42,13 +54,13 @@ def cli() -> None:
 @cli.command()
 @click.option(
     "--username",
-    default=lambda: ConfigManager().get(key="CB_USERNAME", default=""),
+    default=lambda: _config_default("CB_USERNAME"),
     show_default="(from configuration)",
     help="Your Chaturbate username.",
 )
 @click.option(
     "--token",
-    default=lambda: ConfigManager().get(key="CB_TOKEN", default=""),
+    default=lambda: _config_default("CB_TOKEN"),
     show_default="(from configuration)",
     help="Your Chaturbate API token.",
 )
@@ -66,8 +78,119 @@ def cli() -> None:
     show_default=True,
     help="Enable or disable database integration.",
 )
+@click.option(
+    "--sqlite",
+    is_flag=True,
+    help="Store events in a local SQLite database (path from SQLITE_PATH).",
+)
+@click.option(
+    "--parquet",
+    is_flag=True,
+    help="Archive events to hourly Parquet files (requires 'pyarrow'; directory from ARCHIVE_DIR).",
+)
+@click.option(
+    "--jsonl",
+    is_flag=True,
+    help="Append events to a rotating JSON Lines log (directory from JSONL_DIR).",
+)
 @click.option("--testbed", is_flag=True, help="Enable testbed mode.")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging.")
+@click.option("--http2", is_flag=True, help="Use HTTP/2 when available (requires 'h2').")
+@click.option(
+    "--adaptive-timeout",
+    is_flag=True,
+    help="Adjust the long-poll timeout from observed room activity.",
+)
+@click.option(
+    "--min-timeout",
+    default=ADAPTIVE_TIMEOUT_MIN,
+    show_default=True,
+    help="Lower bound for the adaptive timeout, in seconds.",
+)
+@click.option(
+    "--max-timeout",
+    default=ADAPTIVE_TIMEOUT_MAX,
+    show_default=True,
+    help="Upper bound for the adaptive timeout, in seconds.",
+)
+@click.option(
+    "--shutdown-timeout",
+    default=SHUTDOWN_TIMEOUT,
+    show_default=True,
+    help="Time allowed to drain and flush pending events on shutdown, in seconds.",
+)
+@click.option(
+    "--watch-config",
+    is_flag=True,
+    help="Reload configuration when the .env file changes (SIGHUP always reloads).",
+)
+@click.option(
+    "--checkpoint-file",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="File storing the event cursor so a restart resumes where polling stopped.",
+)
+@click.option(
+    "--fanout-port",
+    type=int,
+    default=None,
+    help="Serve events to WebSocket and SSE subscribers on this port (0 picks a free one).",
+)
+@click.option(
+    "--fanout-host",
+    default=FANOUT_HOST,
+    show_default=True,
+    help="Interface the fan-out server listens on.",
+)
+@click.option(
+    "--monitor-loop",
+    is_flag=True,
+    help="Measure event loop lag and log what blocks the loop and slow handler calls.",
+)
+@click.option(
+    "--slow-callback-threshold",
+    default=LOOP_MONITOR_THRESHOLD,
+    show_default=True,
+    help="Time a callback or handler call may take before it is logged, in seconds.",
+)
+@click.option(
+    "--loop",
+    "event_loop",
+    type=click.Choice([implementation.value for implementation in LoopImplementation]),
+    default=LoopImplementation.AUTO.value,
+    show_default=True,
+    help="Event loop to run on; 'auto' uses uvloop when installed (requires 'uvloop').",
+)
+@click.option(
+    "--executor-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Threads in the default executor used for blocking work.",
+)
+@click.option(
+    "--eager-tasks",
+    is_flag=True,
+    help="Run new tasks eagerly until their first suspension.",
+)
+@click.option(
+    "--health-port",
+    type=int,
+    default=lambda: _config_default("HEALTH_PORT") or None,
+    show_default="(from configuration)",
+    help="Serve /healthz and /readyz probes and /metrics on this port.",
+)
+@click.option(
+    "--health-host",
+    default=HEALTH_HOST,
+    show_default=True,
+    help="Interface the health server listens on.",
+)
+@click.option(
+    "--memory-budget",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Memory budget in MiB; near it, DEBUG logs are dropped and buffers and caches shed.",
+)
 def start(  # noqa: PLR0913  # pylint: disable=too-many-arguments
     username: str,
     token: str,
@@ -75,9 +198,33 @@ def start(  # noqa: PLR0913  # pylint: disable=too-many-arguments
     *,
     testbed: bool,
     database: bool,
+    sqlite: bool,
+    parquet: bool,
+    jsonl: bool,
     verbose: bool,
+    http2: bool,
+    adaptive_timeout: bool,
+    min_timeout: int,
+    max_timeout: int,
+    shutdown_timeout: float,
+    checkpoint_file: str | None,
+    watch_config: bool,
+    fanout_port: int | None,
+    fanout_host: str,
+    monitor_loop: bool,
+    slow_callback_threshold: float,
+    event_loop: str,
+    executor_workers: int | None,
+    eager_tasks: bool,
+    health_port: int | None,
+    health_host: str,
+    memory_budget: int | None,
 ) -> None:
     """Start the Chaturbate Poller."""
+    # Imported here so that --help and --version stay fast.
+    from chaturbate_poller.core.runner import main  # noqa: PLC0415
+    from chaturbate_poller.core.runtime import run  # noqa: PLC0415
+
     try:
         options = PollerOptions(
             username=username,
@@ -85,9 +232,34 @@ def start(  # noqa: PLR0913  # pylint: disable=too-many-arguments
             timeout=timeout,
             testbed=testbed,
             use_database=database,
+            use_sqlite=sqlite,
+            use_parquet=parquet,
+            use_jsonl=jsonl,
             verbose=verbose,
+            http2=http2,
+            adaptive_timeout=adaptive_timeout,
+            min_timeout=min_timeout,
+            max_timeout=max_timeout,
+            shutdown_timeout=shutdown_timeout,
+            checkpoint_file=checkpoint_file,
+            watch_config=watch_config,
+            fanout_port=fanout_port,
+            fanout_host=fanout_host,
+            monitor_loop=monitor_loop,
+            slow_callback_threshold=slow_callback_threshold,
+            event_loop=LoopImplementation(event_loop),
+            executor_workers=executor_workers,
+            eager_tasks=eager_tasks,
+            health_port=health_port,
+            health_host=health_host,
+            memory_budget=memory_budget,
+        )
+        run(
+            main(options),
+            loop=options.event_loop,
+            executor_workers=options.executor_workers,
+            eager_tasks=options.eager_tasks,
         )
-        asyncio.run(main(options))
     except AuthenticationError:
         logger.error("Authentication failed. Please check your username and token.")  # noqa: TRY400
         sys.exit(1)
@@ -1,5 +1,21 @@
 """Configuration module for the chaturbate_poller package."""
 
-from chaturbate_poller.config.manager import ConfigManager
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from chaturbate_poller.config.manager import ConfigManager
+
+
+def __getattr__(name: str) -> object:
+    """Import the manager on first access so submodules stay cheap to import."""
+    if name == "ConfigManager":
+        from chaturbate_poller.config.manager import ConfigManager  # noqa: PLC0415
+
+        return ConfigManager
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 __all__ = ["ConfigManager"]
@@ -0,0 +1,43 @@
+"""HTTP client configuration for the Chaturbate Poller."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import httpx
+
+from chaturbate_poller.constants import (
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+)
+
+
+@dataclass(frozen=True)
+class HTTPClientConfig:
+    """Connection pool and protocol settings for the HTTP client."""
+
+    max_connections: int | None = HTTP_MAX_CONNECTIONS
+    max_keepalive_connections: int | None = HTTP_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float | None = HTTP_KEEPALIVE_EXPIRY
+    http2: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the pool settings after initialization."""
+        for name in ("max_connections", "max_keepalive_connections"):
+            value: int | None = getattr(self, name)
+            if value is not None and value < 1:
+                msg = f"{name} must be a positive integer."
+                raise ValueError(msg)
+        if self.keepalive_expiry is not None and self.keepalive_expiry < 0:
+            msg = "keepalive_expiry must be non-negative."
+            raise ValueError(msg)
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """Get the httpx connection pool limits."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
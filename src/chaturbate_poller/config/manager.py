@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import functools
+import logging
 import os
 import pathlib
 from typing import ClassVar
 
 import dotenv
 
+logger = logging.getLogger(__name__)
+
 
 class ConfigManager:
-    """Configuration manager for environment variables and .env files."""
+    """Configuration manager for environment variables and .env files.
+
+    The loaded values form a snapshot that is only re-read on :meth:`reload`.
+    Use :func:`get_config` to share one snapshot across the process.
+    """
 
     # Define all supported environment variables in one place
     ENV_VARIABLES: ClassVar[dict[str, str | bool]] = {
@@ -21,6 +29,16 @@ class ConfigManager:
         "INFLUXDB_ORG": "",
         "INFLUXDB_BUCKET": "",
         "USE_DATABASE": False,
+        "LOG_LEVEL": "",
+        "SQLITE_PATH": "",
+        "ARCHIVE_DIR": "",
+        "JSONL_DIR": "",
+        "MESSAGE_TEMPLATES": "",
+        "WEBHOOK_URLS": "",
+        "WEBHOOK_SECRET": "",
+        "WEBHOOK_METHODS": "",
+        "WEBHOOK_DEAD_LETTER": "",
+        "HEALTH_PORT": "",
         "INFLUXDB_INIT_MODE": "",
         "INFLUXDB_INIT_USERNAME": "",
         "INFLUXDB_INIT_PASSWORD": "",
@@ -34,12 +52,45 @@ class ConfigManager:
         Args:
             env_file: The path to the environment file.
         """
-        env_path: pathlib.Path = pathlib.Path(env_file)
-        if env_path.exists():
-            dotenv.load_dotenv(dotenv_path=env_path)
+        self.env_path: pathlib.Path = pathlib.Path(env_file)
+        self._file_keys: set[str] = set()
+        if self.env_path.exists():
+            # Variables already in the environment win over the file.
+            self._file_keys = set(dotenv.dotenv_values(self.env_path)) - os.environ.keys()
+            dotenv.load_dotenv(dotenv_path=self.env_path)
         self.config: dict[str, str | bool | None] = {}
         self._load_env_variables()
 
+    def reload(self) -> None:
+        """Re-read the environment file and environment variables.
+
+        As at startup, variables set outside the environment file win over
+        it. Keys taken from the file pick up its edits, and are unset once
+        they are removed from it. The snapshot is replaced in a single step,
+        so readers never see a partially reloaded configuration.
+        """
+        self._apply_env_file()
+        self._load_env_variables()
+        logger.info("Configuration reloaded.")
+
+    def _apply_env_file(self) -> None:
+        """Set the environment file's keys, except those set outside of it."""
+        values: dict[str, str] = {}
+        if self.env_path.exists():
+            values = {
+                key: value
+                for key, value in dotenv.dotenv_values(self.env_path).items()
+                if value is not None
+            }
+        for key in self._file_keys - values.keys():
+            os.environ.pop(key, None)
+        file_keys: set[str] = set()
+        for key, value in values.items():
+            if key in self._file_keys or key not in os.environ:
+                os.environ[key] = value
+                file_keys.add(key)
+        self._file_keys = file_keys
+
     @staticmethod
     def str_to_bool(value: str) -> bool:
         """Convert a string to a boolean value.
@@ -53,16 +104,18 @@ class ConfigManager:
         return value.lower() in {"true", "1", "yes"}
 
     def _load_env_variables(self) -> None:
-        """Load environment variables and update the config dictionary."""
+        """Load environment variables and replace the config dictionary."""
+        config: dict[str, str | bool | None] = {}
         for key, default_value in self.ENV_VARIABLES.items():
             env_value = os.getenv(key)
             if env_value is not None:
                 if isinstance(default_value, bool):
-                    self.config[key] = self.str_to_bool(env_value)
+                    config[key] = self.str_to_bool(env_value)
                 else:
-                    self.config[key] = env_value
+                    config[key] = env_value
             else:
-                self.config[key] = default_value
+                config[key] = default_value
+        self.config = config
 
     def get(self, key: str, default: str | None = None) -> str | None:
         """Retrieve a configuration value by key, or default value if the key is not found.
@@ -95,3 +148,55 @@ class ConfigManager:
         if isinstance(value, str):
             return self.str_to_bool(value)
         return default
+
+    def get_int(self, key: str, *, default: int = 0) -> int:
+        """Retrieve an integer configuration value by key.
+
+        Args:
+            key: The configuration key to retrieve.
+            default: The default value to return if the key is missing or invalid.
+
+        Returns:
+            The integer configuration value or default value.
+        """
+        value = self.config.get(key)
+        if isinstance(value, str) and value.strip():
+            try:
+                return int(value)
+            except ValueError:
+                logger.warning("Ignoring non-integer value for %s.", key)
+        return default
+
+    def get_float(self, key: str, *, default: float = 0.0) -> float:
+        """Retrieve a float configuration value by key.
+
+        Args:
+            key: The configuration key to retrieve.
+            default: The default value to return if the key is missing or invalid.
+
+        Returns:
+            The float configuration value or default value.
+        """
+        value = self.config.get(key)
+        if isinstance(value, str) and value.strip():
+            try:
+                return float(value)
+            except ValueError:
+                logger.warning("Ignoring non-numeric value for %s.", key)
+        return default
+
+
+@functools.cache
+def get_config(env_file: str = ".env") -> ConfigManager:
+    """Get the process-wide configuration snapshot.
+
+    The environment is read once per ``env_file``; call
+    :meth:`ConfigManager.reload` on the returned instance to refresh it.
+
+    Args:
+        env_file: The path to the environment file.
+
+    Returns:
+        The shared configuration manager.
+    """
+    return ConfigManager(env_file=env_file)
@@ -0,0 +1,80 @@
+"""File watcher that reloads the configuration when the environment file changes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing
+
+from chaturbate_poller.constants import CONFIG_WATCH_INTERVAL
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from chaturbate_poller.config.manager import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigWatcher:
+    """Poll an environment file and reload the configuration when it changes.
+
+    Polling the file's modification time and size avoids a dependency on a
+    platform-specific file notification API.
+
+    Args:
+        config: The configuration to reload.
+        interval: Seconds between checks.
+        on_reload: Callbacks invoked with the configuration after each reload.
+
+    Raises:
+        ValueError: If the interval is not positive.
+    """
+
+    def __init__(
+        self,
+        config: ConfigManager,
+        interval: float = CONFIG_WATCH_INTERVAL,
+        on_reload: Iterable[Callable[[ConfigManager], None]] = (),
+    ) -> None:
+        """Initialize the watcher with the file's current state."""
+        if interval <= 0:
+            msg = "Watch interval must be positive."
+            raise ValueError(msg)
+        self.config: ConfigManager = config
+        self.interval: float = interval
+        self.on_reload: list[Callable[[ConfigManager], None]] = list(on_reload)
+        self._stamp: tuple[int, int] | None = self._read_stamp()
+
+    def _read_stamp(self) -> tuple[int, int] | None:
+        """Get the file's modification time and size, or None if it is missing."""
+        try:
+            stat = self.config.env_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self) -> bool:
+        """Reload the configuration if the file changed since the last check.
+
+        Returns:
+            True if the configuration was reloaded.
+        """
+        stamp: tuple[int, int] | None = self._read_stamp()
+        if stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        logger.info("Detected a change to %s.", self.config.env_path)
+        self.config.reload()
+        for callback in self.on_reload:
+            callback(self.config)
+        return True
+
+    async def run(self) -> None:
+        """Check the file every ``interval`` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Failed to reload configuration.")
@@ -22,17 +22,125 @@ class EventMethod(str, enum.Enum):
     MEDIA_PURCHASE = "mediaPurchase"
 
 
+class LoopImplementation(str, enum.Enum):
+    """Enum for the event loop implementations the poller can run on."""
+
+    AUTO = "auto"
+    """Use uvloop when it is installed, and asyncio otherwise."""
+    ASYNCIO = "asyncio"
+    """The standard library event loop."""
+    UVLOOP = "uvloop"
+    """The libuv-based loop from the optional ``uvloop`` package."""
+
+
 # API Configuration
 DEFAULT_BASE_URL = "https://eventsapi.chaturbate.com/events/{username}/{token}/"
 TESTBED_BASE_URL = "https://events.testbed.cb.dev/events/{username}/{token}/"
 API_TIMEOUT = 10
 
+# Adaptive Long-Poll Configuration
+ADAPTIVE_TIMEOUT_MIN = 1
+ADAPTIVE_TIMEOUT_MAX = 60
+ADAPTIVE_BUSY_THRESHOLD = 10
+ADAPTIVE_GROWTH_FACTOR = 2.0
+
 # Retry Configuration
 MAX_RETRIES = 6
 BACKOFF_BASE = 2.0
 BACKOFF_FACTOR = 2.0
 CONSTANT_INTERVAL = 10
 READ_ERROR_MAX_TRIES = 5
+BACKOFF_MAX_VALUE = 120.0
+
+# Circuit Breaker and Retry Budget Configuration
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 30.0
+RETRY_BUDGET_CAPACITY = 20
+RETRY_BUDGET_REFILL_RATE = 0.5
+
+# Sharding Configuration
+SHARD_BATCH_SIZE = 500
+SHARD_FLUSH_INTERVAL = 1.0
+
+# Event Loop Monitor Configuration
+LOOP_MONITOR_INTERVAL = 0.1
+LOOP_MONITOR_THRESHOLD = 0.1
+LOOP_MONITOR_WINDOW = 600
+LOOP_MONITOR_QUANTILES = (0.5, 0.9, 0.99)
+
+# Blocking Handler Configuration
+BLOCKING_POOL_WORKERS = 8
+BLOCKING_HANDLER_CONCURRENCY = 1
+BLOCKING_HANDLER_QUEUE_SIZE = 100
+
+# Actuator Configuration
+ACTUATOR_MAX_PENDING = 16
+
+# Memory Budget Configuration
+MEMORY_HIGH_WATER = 0.9
+MEMORY_LOW_WATER = 0.75
+MEMORY_CHECK_INTERVAL = 5.0
+MEMORY_USER_BYTES = 400
+MEMORY_ARCHIVE_ROW_BYTES = 1200
+
+# Shutdown Configuration
+SHUTDOWN_TIMEOUT = 10.0
+
+# Configuration Reload
+CONFIG_WATCH_INTERVAL = 5.0
+
+# SQLite Configuration
+SQLITE_DEFAULT_PATH = "chaturbate_events.db"
+SQLITE_QUEUE_SIZE = 1000
+
+# JSONL Log Configuration
+JSONL_DEFAULT_DIR = "events"
+JSONL_MAX_BYTES = 64 * 1024 * 1024
+JSONL_MAX_AGE = 3600.0
+JSONL_BUFFER_SIZE = 1024 * 1024
+JSONL_LOOKUP_SEGMENTS = 32
+
+# Parquet Archive Configuration
+ARCHIVE_DEFAULT_DIR = "archive"
+ARCHIVE_FLUSH_ROWS = 10_000
+ARCHIVE_FLUSH_INTERVAL = 60.0
+ARCHIVE_COMPRESSION = "zstd"
+
+# Fan-out Server Configuration
+FANOUT_HOST = "127.0.0.1"
+FANOUT_PATH = "/events"
+FANOUT_BUFFER_SIZE = 1000
+FANOUT_HEARTBEAT = 15.0
+FANOUT_HANDSHAKE_TIMEOUT = 5.0
+FANOUT_MAX_CLIENT_FRAME = 64 * 1024
+
+# Health Check Configuration
+HEALTH_HOST = "127.0.0.1"
+HEALTH_STALE_AFTER = 300.0
+HEALTH_MAX_FAILURES = 5
+HEALTH_MAX_QUEUE_DEPTH = 100
+HEALTH_QUEUE_GAUGES = ("blocking_handler_queue_depth", "sqlite_queue_depth")
+HEALTH_SINK_GAUGE = "sink_failing"
+HEALTH_REQUEST_TIMEOUT = 5.0
+
+# Webhook Configuration
+WEBHOOK_BATCH_SIZE = 100
+WEBHOOK_FLUSH_INTERVAL = 0.5
+WEBHOOK_CONCURRENCY = 4
+WEBHOOK_QUEUE_SIZE = 10_000
+WEBHOOK_MAX_TRIES = 5
+WEBHOOK_RETRY_WAIT = 0.5
+WEBHOOK_RETRY_MAX_WAIT = 30.0
+WEBHOOK_TIMEOUT = 10.0
+WEBHOOK_DEAD_LETTER_PATH = "webhook_dead_letters.jsonl"
+WEBHOOK_SIGNATURE_HEADER = "X-Signature-256"
+
+# User Table Configuration
+USER_TABLE_MAX_USERS = 10_000
+
+# Rules Engine Configuration
+RULES_MAX_KEYS = 10_000
+RULES_MAX_WINDOW_EVENTS = 1000
 
 # Logging Configuration
 DEFAULT_CONSOLE_WIDTH = 100
@@ -40,6 +148,9 @@ MAX_TRACEBACK_FRAMES = 10
 
 # HTTP Client Configuration
 HTTP_CLIENT_TIMEOUT = 300
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY = 60.0
 
 
 class HttpStatusCode(enum.IntEnum):
@@ -1,5 +1,21 @@
 """Core components for Chaturbate API polling and event handling."""
 
-from chaturbate_poller.core.client import ChaturbateClient
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from chaturbate_poller.core.client import ChaturbateClient
+
+
+def __getattr__(name: str) -> object:
+    """Import the client on first access so submodules stay cheap to import."""
+    if name == "ChaturbateClient":
+        from chaturbate_poller.core.client import ChaturbateClient  # noqa: PLC0415
+
+        return ChaturbateClient
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 __all__ = ["ChaturbateClient"]
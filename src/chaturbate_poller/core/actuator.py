@@ -0,0 +1,192 @@
+"""Rate-limited, coalescing command queue for controlling devices from handlers."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import dataclasses
+import inspect
+import logging
+import typing
+
+from chaturbate_poller.constants import ACTUATOR_MAX_PENDING
+from chaturbate_poller.handlers.blocking_handler import BlockingPool, shared_blocking_pool
+from chaturbate_poller.metrics import Counter, Gauge, registry
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from chaturbate_poller.utils.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Command:
+    """A command waiting to be sent to a device."""
+
+    key: Hashable
+    """Hashable: What the command sets; a newer command with the same key replaces it."""
+    action: Callable[[], object]
+    """Callable[[], object]: Sends the command; may return an awaitable."""
+    cost: float = 1.0
+    """float: Rate-limit tokens the command uses, such as the number of device calls."""
+
+
+class Actuator:
+    """Send commands to a device at a limited rate, keeping only the latest per key.
+
+    Handlers :meth:`submit` commands without waiting for the device. Commands
+    wait in submission order; a command whose key is already waiting replaces
+    it in place, or is combined with it by ``merge``, so a burst of "set the
+    color" commands sends only the latest color. Before each command runs,
+    its cost is taken from the token bucket, waiting for a refill if needed.
+    Under overload, once ``max_pending`` keys are waiting, the oldest is
+    dropped. One command runs at a time.
+
+    Args:
+        bucket: The rate limit toward the device.
+        max_pending: Commands waiting before the oldest is dropped.
+        blocking: Whether the actions block, so they run on the thread pool.
+        pool: The thread pool for blocking actions; the shared one by default.
+        name: Name of the device, used in logs and as a metric label.
+
+    Raises:
+        ValueError: If the number of pending commands is not positive.
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        *,
+        max_pending: int = ACTUATOR_MAX_PENDING,
+        blocking: bool = False,
+        pool: BlockingPool | None = None,
+        name: str = "device",
+    ) -> None:
+        """Initialize the actuator; its worker starts with the first command."""
+        if max_pending < 1:
+            msg = "Actuator pending commands must be a positive integer."
+            raise ValueError(msg)
+        self.bucket: TokenBucket = bucket
+        self.max_pending: int = max_pending
+        self.blocking: bool = blocking
+        self.pool: BlockingPool | None = pool
+        self.name: str = name
+        self._pending: collections.OrderedDict[Hashable, Command] = collections.OrderedDict()
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+        self._closing: bool = False
+        self._sent: Counter = registry.counter(
+            "actuator_commands_total", "Commands sent to a device.", actuator=name
+        )
+        self._coalesced: Counter = registry.counter(
+            "actuator_coalesced_total", "Commands replaced or merged before sending.", actuator=name
+        )
+        self._dropped: Counter = registry.counter(
+            "actuator_dropped_total", "Commands dropped under overload.", actuator=name
+        )
+        self._errors: Counter = registry.counter(
+            "actuator_errors_total", "Commands that failed.", actuator=name
+        )
+        self._depth: Gauge = registry.gauge(
+            "actuator_pending", "Commands waiting to be sent.", actuator=name
+        )
+
+    @property
+    def pending(self) -> list[Command]:
+        """Get the waiting commands, next first."""
+        return list(self._pending.values())
+
+    def submit(
+        self,
+        key: Hashable,
+        action: Callable[[], object],
+        *,
+        cost: float = 1.0,
+        merge: Callable[[Command, Command], Command] | None = None,
+    ) -> None:
+        """Queue a command without waiting for the device.
+
+        Args:
+            key: What the command sets; a waiting command with the same key is replaced.
+            action: Sends the command; may return an awaitable.
+            cost: Rate-limit tokens the command uses.
+            merge: Combines the waiting command with the new one instead of replacing it.
+
+        Raises:
+            RuntimeError: If the actuator has been closed.
+            ValueError: If the cost exceeds the bucket capacity, so it could never run.
+        """
+        if self._closing:
+            msg = f"Actuator {self.name!r} has been closed."
+            raise RuntimeError(msg)
+        if cost > self.bucket.capacity:
+            msg = "Command cost must not exceed the token bucket capacity."
+            raise ValueError(msg)
+        command = Command(key, action, cost)
+        waiting: Command | None = self._pending.get(key)
+        if waiting is not None:
+            self._pending[key] = merge(waiting, command) if merge else command
+            self._coalesced.inc()
+        else:
+            if len(self._pending) >= self.max_pending:
+                dropped: Hashable = self._pending.popitem(last=False)[0]
+                self._dropped.inc()
+                logger.warning("Dropped command %r for %s under overload.", dropped, self.name)
+            self._pending[key] = command
+        self._depth.set(len(self._pending))
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+        self._wakeup.set()
+
+    async def close(self, *, drain: bool = True) -> None:
+        """Stop the worker.
+
+        Args:
+            drain: Whether to send the waiting commands first, still at the
+                limited rate, instead of discarding them.
+        """
+        self._closing = True
+        if not drain:
+            self._pending.clear()
+            self._depth.set(0)
+        if self._worker is None:
+            return
+        self._wakeup.set()
+        if not drain:
+            self._worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._worker
+
+    async def _run(self) -> None:
+        """Send waiting commands as the rate limit allows."""
+        while self._pending or not self._closing:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            command: Command = next(iter(self._pending.values()))
+            if not self.bucket.try_acquire(command.cost):
+                # Keep coalescing while waiting; the next command is read again.
+                await asyncio.sleep(self.bucket.time_until_available(command.cost))
+                continue
+            self._pending.popitem(last=False)
+            self._depth.set(len(self._pending))
+            await self._send(command)
+
+    async def _send(self, command: Command) -> None:
+        """Run a command, logging instead of raising on failure."""
+        try:
+            if self.blocking:
+                result: object = await (self.pool or shared_blocking_pool()).run(command.action)
+            else:
+                result = command.action()
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            self._errors.inc()
+            logger.exception("Command %r for %s failed.", command.key, self.name)
+        else:
+            self._sent.inc()
@@ -0,0 +1,108 @@
+"""Adaptive long-poll timeout tuning."""
+
+from __future__ import annotations
+
+import logging
+import math
+import typing
+
+import httpx
+
+from chaturbate_poller.constants import (
+    ADAPTIVE_BUSY_THRESHOLD,
+    ADAPTIVE_GROWTH_FACTOR,
+    ADAPTIVE_TIMEOUT_MAX,
+    ADAPTIVE_TIMEOUT_MIN,
+    API_TIMEOUT,
+)
+
+if typing.TYPE_CHECKING:
+    from chaturbate_poller.metrics import Gauge
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveTimeout:
+    """Long-poll timeout that adapts to how busy the room is.
+
+    Idle responses (no events) grow the timeout so quiet rooms make fewer
+    empty round-trips. Full pages shrink it so bursts are delivered in
+    smaller, more frequent pages. Partially filled pages leave it unchanged.
+
+    Args:
+        initial: The starting timeout in seconds.
+        minimum: The lower bound for the timeout.
+        maximum: The upper bound for the timeout.
+        busy_threshold: Number of events that counts as a full page.
+        gauge: Optional gauge that reports the chosen timeout.
+
+    Raises:
+        ValueError: If the bounds or threshold are invalid.
+    """
+
+    def __init__(
+        self,
+        initial: int = API_TIMEOUT,
+        minimum: int = ADAPTIVE_TIMEOUT_MIN,
+        maximum: int = ADAPTIVE_TIMEOUT_MAX,
+        *,
+        busy_threshold: int = ADAPTIVE_BUSY_THRESHOLD,
+        gauge: Gauge | None = None,
+    ) -> None:
+        """Initialize the adaptive timeout within its bounds."""
+        if minimum < 1 or maximum < minimum:
+            msg = "Adaptive timeout bounds must satisfy 1 <= minimum <= maximum."
+            raise ValueError(msg)
+        if busy_threshold < 1:
+            msg = "Busy threshold must be a positive integer."
+            raise ValueError(msg)
+
+        self.minimum: int = minimum
+        self.maximum: int = maximum
+        self.busy_threshold: int = busy_threshold
+        self.fill_rate: float = 0.0
+        self.gauge: Gauge | None = gauge
+        self.value: int = min(max(initial, minimum), maximum)
+        self._report()
+
+    def _report(self) -> None:
+        """Publish the current timeout to the gauge, if any."""
+        if self.gauge is not None:
+            self.gauge.set(self.value)
+
+    def observe(self, event_count: int) -> int:
+        """Update the timeout from the number of events in a response.
+
+        Args:
+            event_count: Number of events returned by the last request.
+
+        Returns:
+            The timeout to use for the next request.
+        """
+        self.fill_rate = min(event_count / self.busy_threshold, 1.0)
+        previous: int = self.value
+        if event_count == 0:
+            self.value = min(math.ceil(self.value * ADAPTIVE_GROWTH_FACTOR), self.maximum)
+        elif self.fill_rate >= 1.0:
+            self.value = max(self.value // 2, self.minimum)
+
+        if self.value != previous:
+            logger.debug(
+                "Adjusted long-poll timeout from %ss to %ss (fill rate %.2f).",
+                previous,
+                self.value,
+                self.fill_rate,
+            )
+            self._report()
+        return self.value
+
+    def apply(self, url: str) -> str:
+        """Set the ``timeout`` query parameter of a URL to the current value.
+
+        Args:
+            url: The events endpoint URL.
+
+        Returns:
+            The URL with its timeout parameter replaced.
+        """
+        return str(httpx.URL(url).copy_set_param("timeout", self.value))
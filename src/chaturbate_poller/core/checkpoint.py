@@ -0,0 +1,88 @@
+"""Persisted Events API cursors for resuming after a restart."""
+
+from __future__ import annotations
+
+import json
+import logging
+import pathlib
+import tempfile
+import typing
+
+import httpx
+
+if typing.TYPE_CHECKING:
+    import os
+
+logger = logging.getLogger(__name__)
+
+
+def cursor_from_url(url: str) -> str | None:
+    """Extract the event cursor from an Events API ``nextUrl``.
+
+    Args:
+        url: The URL returned by the API.
+
+    Returns:
+        The value of the ``i`` query parameter, if present.
+    """
+    cursor: str | None = httpx.URL(url).params.get("i")
+    return cursor
+
+
+class Checkpoint:
+    """JSON file mapping each broadcaster to its last fully handled cursor.
+
+    Only the cursor is stored, never the URL, so the API token does not end
+    up on disk.
+
+    Args:
+        path: Location of the checkpoint file.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Initialize the checkpoint for a file path."""
+        self.path: pathlib.Path = pathlib.Path(path)
+
+    def _read(self) -> dict[str, str]:
+        """Read all stored cursors, treating a missing or corrupt file as empty."""
+        try:
+            data: object = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable checkpoint file %s.", self.path)
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        cursors: dict[object, object] = typing.cast("dict[object, object]", data)
+        return {str(key): str(value) for key, value in cursors.items()}
+
+    def load(self, username: str) -> str | None:
+        """Get the stored cursor for a broadcaster.
+
+        Args:
+            username: Chaturbate username.
+
+        Returns:
+            The stored cursor, or None if there is none.
+        """
+        return self._read().get(username)
+
+    def save(self, username: str, cursor: str) -> None:
+        """Store the cursor for a broadcaster.
+
+        The file is replaced atomically so a crash never leaves it half written.
+
+        Args:
+            username: Chaturbate username.
+            cursor: The cursor to resume from.
+        """
+        data: dict[str, str] = self._read()
+        data[username] = cursor
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.path.parent, delete=False
+        ) as handle:
+            json.dump(data, handle)
+        pathlib.Path(handle.name).replace(self.path)
+        logger.debug("Saved checkpoint for %s.", username)
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import random
 import typing
 
 import backoff
@@ -10,21 +13,29 @@ import httpx
 from pydantic import ValidationError
 
 from chaturbate_poller.config.backoff import BackoffConfig
+from chaturbate_poller.config.http import HTTPClientConfig
 from chaturbate_poller.constants import (
     DEFAULT_BASE_URL,
     HTTP_CLIENT_TIMEOUT,
     TESTBED_BASE_URL,
     HttpStatusCode,
 )
+from chaturbate_poller.core.resilience import decorrelated_jitter
+from chaturbate_poller.core.transport import ConnectionStats, PooledTransport
 from chaturbate_poller.exceptions import AuthenticationError, ClientProcessingError, NotFoundError
 from chaturbate_poller.logging.config import sanitize_sensitive_data
+from chaturbate_poller.metrics import registry
 from chaturbate_poller.models.api_response import EventsAPIResponse
 from chaturbate_poller.utils import helpers
 from chaturbate_poller.utils.error_handler import handle_giveup, log_backoff
 
 if typing.TYPE_CHECKING:
     import types
-    from collections.abc import Awaitable, Callable
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from chaturbate_poller.core.adaptive_timeout import AdaptiveTimeout
+    from chaturbate_poller.core.health import PollerHealth
+    from chaturbate_poller.core.resilience import CircuitBreaker, RetryBudget
 
 
 logger = logging.getLogger(__name__)
@@ -39,12 +50,18 @@ class ChaturbateClient:
         timeout: Request timeout in seconds.
         testbed: Use testbed environment.
         backoff_config: Retry configuration.
+        http_config: Connection pool and HTTP/2 settings for a private transport.
+        transport: Shared transport to use instead of a private one.
+        adaptive_timeout: Tuner that overrides the long-poll timeout per request.
+        circuit_breaker: Breaker that pauses requests while the upstream is failing.
+        retry_budget: Token bucket that limits retries, usually shared between clients.
+        health: Health state recording the outcome of every fetch attempt.
 
     Raises:
         ValueError: If credentials are missing or timeout is invalid.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         username: str,
         token: str,
@@ -52,6 +69,12 @@ class ChaturbateClient:
         *,
         testbed: bool = False,
         backoff_config: BackoffConfig | None = None,
+        http_config: HTTPClientConfig | None = None,
+        transport: PooledTransport | None = None,
+        adaptive_timeout: AdaptiveTimeout | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        retry_budget: RetryBudget | None = None,
+        health: PollerHealth | None = None,
     ) -> None:
         """Initialize client with credentials and configuration.
 
@@ -73,12 +96,37 @@ class ChaturbateClient:
         self.username: str = username
         self.token: str = token
         self.backoff_config: BackoffConfig = backoff_config or BackoffConfig()
+        self.http_config: HTTPClientConfig = http_config or (
+            transport.config if transport else HTTPClientConfig()
+        )
 
+        self.circuit_breaker: CircuitBreaker | None = circuit_breaker
+        self.retry_budget: RetryBudget | None = retry_budget
+        self.health: PollerHealth | None = health
+        self.adaptive_timeout: AdaptiveTimeout | None = adaptive_timeout
+        if adaptive_timeout is not None and adaptive_timeout.gauge is None:
+            adaptive_timeout.gauge = registry.gauge(
+                "long_poll_timeout_seconds",
+                "Long-poll timeout chosen for the next request.",
+                broadcaster=username,
+            )
+            adaptive_timeout.gauge.set(adaptive_timeout.value)
+
+        self._shared_transport: PooledTransport | None = transport
+        self._transport: PooledTransport | None = None
         self._client: httpx.AsyncClient | None = None
 
+    @property
+    def connection_stats(self) -> ConnectionStats | None:
+        """Get connection reuse statistics for the active transport, if any."""
+        return self._transport.stats if self._transport else None
+
     async def __aenter__(self) -> typing.Self:
         """Enter async context and initialize HTTP client."""
-        self._client = httpx.AsyncClient(timeout=HTTP_CLIENT_TIMEOUT)
+        self._transport = (
+            self._shared_transport or PooledTransport(config=self.http_config)
+        ).acquire()
+        self._client = httpx.AsyncClient(timeout=HTTP_CLIENT_TIMEOUT, transport=self._transport)
         return self
 
     async def __aexit__(
@@ -108,8 +156,9 @@ class ChaturbateClient:
         return backoff.on_exception(
             wait_gen=backoff.constant,
             interval=self.backoff_config.constant_interval,
-            jitter=None,
+            jitter=backoff.full_jitter,
             exception=httpx.ReadError,
+            giveup=lambda _exc: not self._retry_allowed(),
             max_tries=self.backoff_config.read_error_max_tries,
             on_giveup=handle_giveup,
             on_backoff=log_backoff,
@@ -124,12 +173,14 @@ class ChaturbateClient:
     ]:
         """Create backoff decorator for HTTP status errors."""
         return backoff.on_exception(
-            wait_gen=backoff.expo,
+            wait_gen=decorrelated_jitter,
             jitter=None,
             base=self.backoff_config.base,
             factor=self.backoff_config.factor,
             exception=httpx.HTTPStatusError,
-            giveup=lambda retry: not helpers.need_retry(exception=retry),
+            giveup=lambda retry: (
+                not helpers.need_retry(exception=retry) or not self._retry_allowed()
+            ),
             on_giveup=handle_giveup,
             max_tries=self.backoff_config.max_tries,
             on_backoff=log_backoff,
@@ -137,6 +188,37 @@ class ChaturbateClient:
             raise_on_giveup=False,
         )
 
+    def _retry_allowed(self) -> bool:
+        """Spend one retry from the retry budget, if one is configured."""
+        return self.retry_budget.try_acquire() if self.retry_budget else True
+
+    @contextlib.asynccontextmanager
+    async def _circuit_guard(self) -> AsyncIterator[None]:
+        """Wait for the circuit breaker to allow a call, then record its outcome."""
+        breaker: CircuitBreaker | None = self.circuit_breaker
+        if breaker is None:
+            yield
+            return
+
+        while (delay := breaker.acquire()) > 0:
+            # Spread waiting clients out so they do not all probe at once
+            wait: float = delay + random.uniform(0, delay)  # noqa: S311
+            logger.warning("Circuit '%s' is open; waiting %.1f seconds.", breaker.name, wait)
+            await asyncio.sleep(wait)
+
+        try:
+            yield
+        except Exception as exc:
+            if helpers.is_upstream_failure(exc):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+
     async def fetch_events(self, url: str | None = None) -> EventsAPIResponse:
         """Fetch events from Chaturbate API with retry logic.
 
@@ -161,54 +243,103 @@ class ChaturbateClient:
                 msg = "Client has not been initialized. Use 'async with ChaturbateClient()'."
                 raise RuntimeError(msg)
 
-            logger.debug("Fetching events from URL: %s", sanitize_sensitive_data(arg=fetch_url))
-
             try:
-                response: httpx.Response = await self._client.get(url=fetch_url, timeout=None)
-                response.raise_for_status()
-                logger.debug(
-                    "Successfully fetched events from: %s", sanitize_sensitive_data(arg=fetch_url)
-                )
-                return EventsAPIResponse.model_validate(obj=response.json())
-            except httpx.HTTPStatusError as http_err:
-                status_code: int = http_err.response.status_code
-                logger.warning(
-                    "HTTPStatusError: %s occurred while fetching events from URL: %s",
-                    status_code,
-                    sanitize_sensitive_data(arg=fetch_url),
-                )
-
-                if status_code == HttpStatusCode.UNAUTHORIZED:
-                    msg = "Invalid authentication credentials."
-                    raise AuthenticationError(message=msg) from http_err
-                if status_code == HttpStatusCode.NOT_FOUND:
-                    msg = "Resource not found at the requested URL."
-                    raise NotFoundError(message=msg) from http_err
-                raise
-            except httpx.TimeoutException as timeout_err:
-                logger.exception(
-                    "Timeout occurred while fetching events from URL: %s",
-                    sanitize_sensitive_data(arg=fetch_url),
-                )
-                msg = "Timeout while fetching events."
-                raise TimeoutError(msg) from timeout_err
-            except ValidationError:
+                async with self._circuit_guard():
+                    return await self._request_events(self._client, fetch_url)
+            except Exception:
+                if self.health:
+                    self.health.record_failure()
                 raise
-            except TypeError as type_err:
-                logger.exception(
-                    "TypeError occurred while fetching events from URL: %s",
-                    sanitize_sensitive_data(arg=fetch_url),
-                )
-                raise ClientProcessingError from type_err
-            except ValueError as value_err:
-                logger.exception(
-                    "ValueError occurred while fetching events from URL: %s",
-                    sanitize_sensitive_data(arg=fetch_url),
-                )
-                raise ClientProcessingError from value_err
-
-        fetch_url: str = url or self._construct_url()
-        return await _fetch_events(fetch_url)
+
+        fetch_url: str = self._apply_adaptive_timeout(url or self._construct_url())
+        response: EventsAPIResponse = await _fetch_events(fetch_url)
+        self._observe_response(response)
+        if self.health:
+            self.health.record_success()
+        return response
+
+    async def _request_events(self, client: httpx.AsyncClient, fetch_url: str) -> EventsAPIResponse:
+        """Request a single page of events and map errors to client exceptions.
+
+        Args:
+            client: The initialized HTTP client.
+            fetch_url: The URL to request.
+
+        Returns:
+            The validated API response.
+
+        Raises:
+            AuthenticationError: Invalid credentials.
+            NotFoundError: Resource not found.
+            TimeoutError: Request timeout.
+            HTTPStatusError: Other HTTP errors.
+            ClientProcessingError: The response could not be processed.
+        """
+        logger.debug("Fetching events from URL: %s", sanitize_sensitive_data(arg=fetch_url))
+
+        try:
+            response: httpx.Response = await client.get(url=fetch_url, timeout=None)
+            response.raise_for_status()
+            logger.debug(
+                "Successfully fetched events from: %s", sanitize_sensitive_data(arg=fetch_url)
+            )
+            return EventsAPIResponse.model_validate(obj=response.json())
+        except httpx.HTTPStatusError as http_err:
+            status_code: int = http_err.response.status_code
+            logger.warning(
+                "HTTPStatusError: %s occurred while fetching events from URL: %s",
+                status_code,
+                sanitize_sensitive_data(arg=fetch_url),
+            )
+
+            if status_code == HttpStatusCode.UNAUTHORIZED:
+                msg = "Invalid authentication credentials."
+                raise AuthenticationError(message=msg) from http_err
+            if status_code == HttpStatusCode.NOT_FOUND:
+                msg = "Resource not found at the requested URL."
+                raise NotFoundError(message=msg) from http_err
+            raise
+        except httpx.TimeoutException as timeout_err:
+            logger.exception(
+                "Timeout occurred while fetching events from URL: %s",
+                sanitize_sensitive_data(arg=fetch_url),
+            )
+            msg = "Timeout while fetching events."
+            raise TimeoutError(msg) from timeout_err
+        except ValidationError:
+            raise
+        except TypeError as type_err:
+            logger.exception(
+                "TypeError occurred while fetching events from URL: %s",
+                sanitize_sensitive_data(arg=fetch_url),
+            )
+            raise ClientProcessingError from type_err
+        except ValueError as value_err:
+            logger.exception(
+                "ValueError occurred while fetching events from URL: %s",
+                sanitize_sensitive_data(arg=fetch_url),
+            )
+            raise ClientProcessingError from value_err
+
+    def _apply_adaptive_timeout(self, url: str) -> str:
+        """Replace the URL's long-poll timeout when adaptive tuning is enabled."""
+        return self.adaptive_timeout.apply(url) if self.adaptive_timeout else url
+
+    def _observe_response(self, response: EventsAPIResponse | None) -> None:
+        """Feed the number of returned events to the adaptive timeout, if enabled."""
+        if self.adaptive_timeout and response:
+            self.adaptive_timeout.observe(len(response.events))
+
+    def resume_url(self, cursor: str) -> str:
+        """Construct the endpoint URL that resumes after a saved event cursor.
+
+        Args:
+            cursor: The ``i`` parameter of a previously returned ``nextUrl``.
+
+        Returns:
+            Complete URL for events endpoint.
+        """
+        return str(httpx.URL(self._construct_url()).copy_set_param("i", cursor))
 
     def _construct_url(self) -> str:
         """Construct API endpoint URL with optional timeout parameter.
@@ -0,0 +1,112 @@
+"""Liveness and readiness of the poller, computed from its polling and sink state."""
+
+from __future__ import annotations
+
+import time
+import typing
+
+from chaturbate_poller.constants import (
+    HEALTH_MAX_FAILURES,
+    HEALTH_MAX_QUEUE_DEPTH,
+    HEALTH_QUEUE_GAUGES,
+    HEALTH_SINK_GAUGE,
+    HEALTH_STALE_AFTER,
+)
+from chaturbate_poller.metrics import registry
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class PollerHealth:
+    """Track the outcome of fetches and judge whether the poller is alive and ready.
+
+    Clients record each fetch with two attribute writes, so recording adds
+    nothing measurable to polling; the checks run only when asked. The
+    poller is alive while a fetch has succeeded within ``stale_after``
+    seconds, counting from startup. It is ready when it is alive, has
+    fetched at least once, is not failing repeatedly, no sink reports
+    failure through the ``sink_failing`` gauge and no queue named in
+    ``HEALTH_QUEUE_GAUGES`` is at ``max_queue_depth``.
+
+    Args:
+        stale_after: Seconds without a successful fetch before the poller is not alive.
+        max_failures: Consecutive failed fetches before the poller is not ready.
+        max_queue_depth: Queued pages in a handler or sink before the poller is not ready.
+        clock: Monotonic clock used to age the last successful fetch.
+
+    Raises:
+        ValueError: If any limit is not positive.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_clock",
+        "failures",
+        "fetches",
+        "last_success",
+        "max_failures",
+        "max_queue_depth",
+        "stale_after",
+    )
+
+    def __init__(
+        self,
+        stale_after: float = HEALTH_STALE_AFTER,
+        max_failures: int = HEALTH_MAX_FAILURES,
+        max_queue_depth: int = HEALTH_MAX_QUEUE_DEPTH,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the state as of startup, with no fetches yet."""
+        if stale_after <= 0 or max_failures < 1 or max_queue_depth < 1:
+            msg = "Health check limits must be positive."
+            raise ValueError(msg)
+        self.stale_after: float = stale_after
+        self.max_failures: int = max_failures
+        self.max_queue_depth: int = max_queue_depth
+        self._clock: Callable[[], float] = clock
+        self.last_success: float = clock()
+        self.fetches: int = 0
+        self.failures: int = 0
+
+    def record_success(self) -> None:
+        """Record a successful fetch."""
+        self.last_success = self._clock()
+        self.fetches += 1
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed fetch attempt, including ones that will be retried."""
+        self.failures += 1
+
+    def liveness(self) -> str | None:
+        """Check whether polling is making progress.
+
+        Returns:
+            None if the poller is alive, otherwise the reason it is not.
+        """
+        age: float = self._clock() - self.last_success
+        if age > self.stale_after:
+            return f"no successful fetch for {age:.0f}s"
+        return None
+
+    def readiness(self) -> str | None:
+        """Check whether the poller is alive and its sinks keep up.
+
+        Returns:
+            None if the poller is ready, otherwise the reason it is not.
+        """
+        if problem := self.liveness():
+            return problem
+        if not self.fetches:
+            return "no successful fetch yet"
+        if self.failures >= self.max_failures:
+            return f"{self.failures} consecutive failed fetches"
+        for sink in registry.series(HEALTH_SINK_GAUGE):
+            if sink.value:
+                return f"sink {sink.labels.get('sink', sink.key)} is failing"
+        for name in HEALTH_QUEUE_GAUGES:
+            for queue in registry.series(name):
+                if queue.value >= self.max_queue_depth:
+                    return f"{queue.key} is {queue.value:.0f}"
+        return None
@@ -0,0 +1,207 @@
+"""Event loop lag measurement and blocked-loop detection."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import logging
+import sys
+import threading
+import time
+import traceback
+import typing
+
+from chaturbate_poller.constants import (
+    LOOP_MONITOR_INTERVAL,
+    LOOP_MONITOR_QUANTILES,
+    LOOP_MONITOR_THRESHOLD,
+    LOOP_MONITOR_WINDOW,
+)
+from chaturbate_poller.metrics import Counter, Gauge, registry
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = logging.getLogger(__name__)
+
+PUBLISH_EVERY: int = 10
+"""int: Lag samples taken between updates of the lag gauges."""
+
+
+class LoopMonitor:
+    """Measure event loop lag and report what blocks the loop.
+
+    A task on the loop sleeps for ``interval`` seconds at a time and records
+    how late it wakes up; the lag percentiles of the last ``window`` samples
+    are exported as the ``event_loop_lag_seconds`` gauges. A watchdog thread
+    notices when that task has not run for ``threshold`` seconds past its
+    interval and logs the stack the loop thread is executing while the loop
+    is still blocked, naming the handler only if the task running at that
+    moment entered it through :meth:`track`. Handler calls taking longer
+    than ``threshold`` are logged as slow when they return; that time is
+    wall-clock time and includes awaits, so a slow call has not necessarily
+    blocked the loop.
+
+    Args:
+        threshold: Seconds a callback or handler call may take before it is reported.
+        interval: Seconds between lag samples.
+        window: Number of recent lag samples the percentiles are computed over.
+
+    Raises:
+        ValueError: If a setting is not positive.
+    """
+
+    def __init__(
+        self,
+        threshold: float = LOOP_MONITOR_THRESHOLD,
+        *,
+        interval: float = LOOP_MONITOR_INTERVAL,
+        window: int = LOOP_MONITOR_WINDOW,
+    ) -> None:
+        """Initialize the monitor without starting it."""
+        if threshold <= 0 or interval <= 0 or window < 1:
+            msg = "Loop monitor threshold, interval and window must be positive."
+            raise ValueError(msg)
+        self.threshold: float = threshold
+        self.interval: float = interval
+        self._samples: collections.deque[float] = collections.deque(maxlen=window)
+        self._beat: float = time.monotonic()
+        self._reported: float | None = None
+        self._activities: dict[asyncio.Task[typing.Any], str] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._ticker: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopping: threading.Event = threading.Event()
+        self._lag: dict[float, Gauge] = {
+            quantile: registry.gauge(
+                "event_loop_lag_seconds", "Event loop lag percentile.", quantile=str(quantile)
+            )
+            for quantile in LOOP_MONITOR_QUANTILES
+        }
+        self._max_lag: Gauge = registry.gauge(
+            "event_loop_lag_max_seconds", "Largest recent event loop lag."
+        )
+        self._stalls: Counter = registry.counter(
+            "event_loop_stalls_total", "Times the event loop was blocked past the threshold."
+        )
+
+    def start(self) -> None:
+        """Start sampling on the running loop and start the watchdog thread."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._ticker = asyncio.create_task(self._tick())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._watchdog.start()
+
+    async def close(self) -> None:
+        """Stop sampling and the watchdog thread."""
+        self._stopping.set()
+        if self._ticker is not None:
+            self._ticker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._ticker
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+        self._publish()
+
+    def percentiles(self) -> dict[float, float]:
+        """Get the lag percentiles of the recent samples.
+
+        Returns:
+            A mapping of each quantile to the lag at it, in seconds.
+        """
+        ordered: list[float] = sorted(self._samples)
+        if not ordered:
+            return dict.fromkeys(LOOP_MONITOR_QUANTILES, 0.0)
+        last: int = len(ordered) - 1
+        return {
+            quantile: ordered[min(last, int(quantile * len(ordered)))]
+            for quantile in LOOP_MONITOR_QUANTILES
+        }
+
+    @contextlib.contextmanager
+    def track(self, name: str) -> Iterator[None]:
+        """Name the work the current task runs and report it if it is slow.
+
+        Must be entered from a task on the monitored loop.
+
+        Args:
+            name: The handler or function being run.
+
+        Yields:
+            None: The work runs inside the context.
+        """
+        task: asyncio.Task[typing.Any] | None = asyncio.current_task()
+        previous: str | None = None
+        if task is not None:
+            previous = self._activities.get(task)
+            self._activities[task] = name
+        started: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            if task is not None:
+                if previous is None:
+                    self._activities.pop(task, None)
+                else:
+                    self._activities[task] = previous
+            elapsed: float = time.perf_counter() - started
+            if elapsed >= self.threshold:
+                logger.warning(
+                    "Slow call: %s took %.3fs including awaits, over the %.3fs threshold.",
+                    name,
+                    elapsed,
+                    self.threshold,
+                )
+                registry.counter(
+                    "slow_handler_calls_total", "Handler calls over the threshold.", handler=name
+                ).inc()
+
+    async def _tick(self) -> None:
+        """Sample how late the loop wakes a sleeping task."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        ticks: int = 0
+        while True:
+            expected: float = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self._samples.append(max(0.0, loop.time() - expected))
+            self._beat = time.monotonic()
+            ticks += 1
+            if ticks % PUBLISH_EVERY == 0:
+                self._publish()
+
+    def _publish(self) -> None:
+        """Update the lag gauges from the recent samples."""
+        for quantile, lag in self.percentiles().items():
+            self._lag[quantile].set(lag)
+        self._max_lag.set(max(self._samples, default=0.0))
+
+    def _watch(self) -> None:
+        """Log the loop thread's stack when the sampling task stops running."""
+        while not self._stopping.wait(self.interval):
+            beat: float = self._beat
+            blocked: float = time.monotonic() - beat - self.interval
+            if blocked < self.threshold or beat == self._reported:
+                continue
+            self._reported = beat
+            self._stalls.inc()
+            # No public API exposes another thread's frame; this is the documented debugging hook.
+            frames = sys._current_frames()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+            frame = frames.get(self._loop_thread or 0)
+            stack: str = "".join(traceback.format_stack(frame)) if frame else "unavailable\n"
+            logger.warning(
+                "Event loop blocked for %.3fs in %s; loop thread stack:\n%s",
+                blocked,
+                self._running_activity() or "a callback",
+                stack.rstrip(),
+            )
+
+    def _running_activity(self) -> str | None:
+        """Get the name tracked by the task running on the loop right now, if any."""
+        if self._loop is None:
+            return None
+        task: asyncio.Task[typing.Any] | None = asyncio.current_task(self._loop)
+        return self._activities.get(task) if task is not None else None
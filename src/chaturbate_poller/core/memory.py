@@ -0,0 +1,248 @@
+"""Process memory budget with per-component accounting and shedding under pressure."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import logging
+import os
+import pathlib
+import typing
+import weakref
+
+from chaturbate_poller.constants import (
+    MEMORY_CHECK_INTERVAL,
+    MEMORY_HIGH_WATER,
+    MEMORY_LOW_WATER,
+)
+from chaturbate_poller.metrics import Gauge, registry
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+package_logger = logging.getLogger(__name__.partition(".")[0])
+"""logging.Logger: The package's root logger, raised to INFO under memory pressure."""
+
+MIB: int = 1024 * 1024
+"""int: Bytes in a mebibyte."""
+
+
+class MemoryConsumer(typing.Protocol):
+    """A component holding memory that can be given back under pressure."""
+
+    def memory_usage(self) -> int:
+        """Estimate the bytes held by the component's buffers and caches."""
+        ...
+
+    def shed_memory(self) -> None:
+        """Give memory back, such as by spilling buffers to disk or shrinking caches."""
+        ...
+
+
+def resident_memory() -> int | None:
+    """Get the resident set size of the process.
+
+    Returns:
+        The resident memory in bytes, or None where ``/proc`` is not available.
+    """
+    try:
+        pages: str = pathlib.Path("/proc/self/statm").read_text(encoding="ascii").split()[1]
+    except (OSError, IndexError):
+        return None
+    return int(pages) * os.sysconf("SC_PAGE_SIZE")
+
+
+class MemoryBudget:
+    """Account memory per component and shed load when the process nears a limit.
+
+    Components :meth:`register` themselves and are held weakly, so one that
+    is garbage collected drops out of the accounting. Every ``interval``
+    seconds, the resident memory of the process (or, where it cannot be
+    read, the sum of the component estimates) is compared with ``limit``.
+    From ``high_water`` of the limit, the package's DEBUG logs are dropped
+    and components holding more than an equal share of the high-water mark
+    shed memory, largest first, until usage is measured back under the mark;
+    DEBUG logs return once usage falls below ``low_water``. Freed memory is
+    not always returned to the system, so a component already under its
+    share is not asked again while usage stays high. Without a limit, usage
+    is only reported.
+
+    Args:
+        limit: The budget in bytes, or None to only report usage.
+        high_water: Fraction of the limit at which shedding starts.
+        low_water: Fraction of the limit below which DEBUG logs return.
+        interval: Seconds between checks.
+        measure: Function returning the memory used by the process, if known.
+
+    Raises:
+        ValueError: If the limit or interval is not positive, or the marks are out of order.
+    """
+
+    def __init__(
+        self,
+        limit: int | None = None,
+        *,
+        high_water: float = MEMORY_HIGH_WATER,
+        low_water: float = MEMORY_LOW_WATER,
+        interval: float = MEMORY_CHECK_INTERVAL,
+        measure: Callable[[], int | None] = resident_memory,
+    ) -> None:
+        """Initialize the budget without starting the checks."""
+        if (limit is not None and limit <= 0) or interval <= 0:
+            msg = "Memory budget and check interval must be positive."
+            raise ValueError(msg)
+        if not 0 < low_water <= high_water <= 1:
+            msg = "Memory marks must satisfy 0 < low_water <= high_water <= 1."
+            raise ValueError(msg)
+        self.limit: int | None = limit
+        self.high_water: float = high_water
+        self.low_water: float = low_water
+        self.interval: float = interval
+        self._measure: Callable[[], int | None] = measure
+        self._consumers: weakref.WeakKeyDictionary[MemoryConsumer, str] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._pressure: bool = False
+        self._log_level: int = logging.NOTSET
+        self._checker: asyncio.Task[None] | None = None
+        self._budget: Gauge = registry.gauge("memory_budget_bytes", "Memory budget of the process.")
+        self._used: Gauge = registry.gauge("memory_used_bytes", "Memory used by the process.")
+        self._pressure_gauge: Gauge = registry.gauge(
+            "memory_pressure", "1 while memory is over the budget's high-water mark."
+        )
+
+    @property
+    def under_pressure(self) -> bool:
+        """Get whether memory is being shed and DEBUG logs are dropped."""
+        return self._pressure
+
+    def register(self, name: str, consumer: MemoryConsumer) -> None:
+        """Account a component's memory under a name, shared by components of a kind.
+
+        Args:
+            name: The component name, used as a metric label.
+            consumer: The component.
+        """
+        self._consumers[consumer] = name
+
+    def unregister(self, consumer: MemoryConsumer) -> None:
+        """Stop accounting a component.
+
+        Args:
+            consumer: The component.
+        """
+        self._consumers.pop(consumer, None)
+
+    def usage(self) -> dict[str, int]:
+        """Get the estimated memory of each kind of component.
+
+        Returns:
+            A mapping of component names to bytes.
+        """
+        usage: dict[str, int] = {}
+        for consumer, name in list(self._consumers.items()):
+            usage[name] = usage.get(name, 0) + consumer.memory_usage()
+        return usage
+
+    def check(self) -> int:
+        """Measure usage, report it and shed memory if it is over the high-water mark.
+
+        Returns:
+            The memory used by the process, in bytes.
+        """
+        usage: dict[str, int] = self.usage()
+        for name, size in usage.items():
+            registry.gauge(
+                "memory_component_bytes", "Estimated memory of a component.", component=name
+            ).set(size)
+        used: int = self._measure() or sum(usage.values())
+        self._used.set(used)
+        if self.limit is None:
+            return used
+        self._budget.set(self.limit)
+        if used >= self.limit * self.high_water:
+            if not self._pressure:
+                logger.warning(
+                    "Memory use of %d MiB is over %.0f%% of the %d MiB budget; shedding.",
+                    used // MIB,
+                    self.high_water * 100,
+                    self.limit // MIB,
+                )
+                self._set_pressure(active=True)
+            used = self._shed(used)
+        elif self._pressure and used < self.limit * self.low_water:
+            logger.info("Memory use of %d MiB is back under the budget.", used // MIB)
+            self._set_pressure(active=False)
+        return used
+
+    def start(self) -> None:
+        """Start checking the budget periodically on the running loop."""
+        self._checker = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the checks and let DEBUG logs through again."""
+        if self._checker is not None:
+            self._checker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._checker
+            self._checker = None
+        if self._pressure:
+            self._set_pressure(active=False)
+
+    async def _run(self) -> None:
+        """Check the budget every interval."""
+        while True:
+            self.check()
+            await asyncio.sleep(self.interval)
+
+    def _shed(self, used: int) -> int:
+        """Ask components over their share to shed memory, largest first, until under the mark."""
+        mark: float = (self.limit or 0) * self.high_water
+        consumers: list[tuple[int, str, MemoryConsumer]] = sorted(
+            (
+                (consumer.memory_usage(), name, consumer)
+                for consumer, name in list(self._consumers.items())
+            ),
+            key=lambda entry: entry[0],
+            reverse=True,
+        )
+        share: float = mark / max(len(consumers), 1)
+        for size, name, consumer in consumers:
+            if size <= share:
+                break
+            try:
+                consumer.shed_memory()
+            except Exception:
+                logger.exception("%s failed to shed memory.", name)
+                continue
+            registry.counter(
+                "memory_sheds_total", "Times a component shed memory.", component=name
+            ).inc()
+            used = self._measure() or sum(self.usage().values())
+            if used < mark:
+                break
+        return used
+
+    def _set_pressure(self, *, active: bool) -> None:
+        """Enter or leave the pressure state, dropping or restoring the package's DEBUG logs."""
+        self._pressure = active
+        self._pressure_gauge.set(int(active))
+        if active:
+            self._log_level = package_logger.level
+            if package_logger.getEffectiveLevel() < logging.INFO:
+                package_logger.setLevel(logging.INFO)
+        else:
+            package_logger.setLevel(self._log_level)
+
+
+@functools.cache
+def shared_memory_budget() -> MemoryBudget:
+    """Get the process-wide memory budget that components register with.
+
+    Returns:
+        The shared memory budget; it has no limit until one is set.
+    """
+    return MemoryBudget()
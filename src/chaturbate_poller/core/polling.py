@@ -2,18 +2,82 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from typing import TYPE_CHECKING
 
+from chaturbate_poller.core.checkpoint import cursor_from_url
 from chaturbate_poller.core.client import ChaturbateClient
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
     from chaturbate_poller.config.backoff import BackoffConfig
+    from chaturbate_poller.config.http import HTTPClientConfig
+    from chaturbate_poller.core.adaptive_timeout import AdaptiveTimeout
+    from chaturbate_poller.core.checkpoint import Checkpoint
+    from chaturbate_poller.core.health import PollerHealth
+    from chaturbate_poller.core.resilience import CircuitBreaker, RetryBudget
     from chaturbate_poller.handlers.event_handler import EventHandler
+    from chaturbate_poller.models.api_response import EventsAPIResponse
     from chaturbate_poller.models.event import Event
 
 
+async def _fetch_unless_stopped(
+    client: ChaturbateClient, url: str | None, stop: asyncio.Event | None
+) -> EventsAPIResponse | None:
+    """Fetch a page of events, abandoning the request if a stop is requested.
+
+    Args:
+        client: Configured Chaturbate client instance.
+        url: The URL to fetch, or None for the initial request.
+        stop: Event that is set when polling should stop.
+
+    Returns:
+        The API response, or None if polling was stopped first.
+    """
+    if stop is None:
+        return await client.fetch_events(url=url)
+    fetch: asyncio.Task[EventsAPIResponse] = asyncio.create_task(client.fetch_events(url=url))
+    stopped: asyncio.Task[bool] = asyncio.create_task(stop.wait())
+    try:
+        done, _ = await asyncio.wait({fetch, stopped}, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        fetch.cancel()
+        raise
+    finally:
+        stopped.cancel()
+    if fetch in done:
+        return fetch.result()
+    # Nothing from this page has been handled, so it is safe to drop.
+    fetch.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await fetch
+    return None
+
+
+async def poll_pages(
+    client: ChaturbateClient, *, url: str | None = None, stop: asyncio.Event | None = None
+) -> AsyncIterator[EventsAPIResponse]:
+    """Poll for pages of events until the feed ends or a stop is requested.
+
+    Args:
+        client: Configured Chaturbate client instance.
+        url: The URL to start from, or None to start from the live feed.
+        stop: Event that is set when polling should stop.
+
+    Yields:
+        Each API response.
+    """
+    next_url: str | None = url
+    while not (stop is not None and stop.is_set()):
+        if not (response := await _fetch_unless_stopped(client, next_url, stop)):
+            return
+        yield response
+        if not (next_url := response.next_url):
+            return
+
+
 async def poll_events(client: ChaturbateClient) -> AsyncIterator[Event]:
     """Poll for events continuously, yielding each event.
 
@@ -23,12 +87,9 @@ async def poll_events(client: ChaturbateClient) -> AsyncIterator[Event]:
     Yields:
         Individual events from the API response.
     """
-    next_url: str | None = None
-    while response := await client.fetch_events(url=next_url):
+    async for response in poll_pages(client):
         for event in response.events:
             yield event
-        if not (next_url := response.next_url):
-            break
 
 
 async def start_polling(  # noqa: PLR0913
@@ -39,9 +100,19 @@ async def start_polling(  # noqa: PLR0913
     *,
     testbed: bool = False,
     backoff_config: BackoffConfig | None = None,
+    http_config: HTTPClientConfig | None = None,
+    adaptive_timeout: AdaptiveTimeout | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    retry_budget: RetryBudget | None = None,
+    stop: asyncio.Event | None = None,
+    checkpoint: Checkpoint | None = None,
+    health: PollerHealth | None = None,
 ) -> None:
     """Start polling Chaturbate events with configured handler.
 
+    Polling stops once ``stop`` is set: an in-flight request is abandoned,
+    but every event of a page that was already received is handled first.
+
     Args:
         username: Chaturbate username.
         token: Chaturbate API token.
@@ -49,6 +120,13 @@ async def start_polling(  # noqa: PLR0913
         event_handler: Handler for processing events.
         testbed: Use testbed environment.
         backoff_config: Retry configuration.
+        http_config: Connection pool and HTTP/2 settings.
+        adaptive_timeout: Tuner for the long-poll timeout, if enabled.
+        circuit_breaker: Circuit breaker shared with other clients, if any.
+        retry_budget: Retry budget shared with other clients, if any.
+        stop: Event that is set when polling should stop.
+        checkpoint: Store for the cursor to resume from after a restart.
+        health: Health state recording the outcome of every fetch attempt.
     """
     async with ChaturbateClient(
         username=username,
@@ -56,6 +134,20 @@ async def start_polling(  # noqa: PLR0913
         timeout=api_timeout,
         testbed=testbed,
         backoff_config=backoff_config,
+        http_config=http_config,
+        adaptive_timeout=adaptive_timeout,
+        circuit_breaker=circuit_breaker,
+        retry_budget=retry_budget,
+        health=health,
     ) as client:
-        async for event in poll_events(client):
-            await event_handler.handle_event(event)
+        cursor: str | None = checkpoint.load(username) if checkpoint else None
+        url: str | None = client.resume_url(cursor) if cursor else None
+        try:
+            async for response in poll_pages(client, url=url, stop=stop):
+                if response.events:
+                    await event_handler.handle_batch(response.events)
+                if response.next_url:
+                    cursor = cursor_from_url(response.next_url) or cursor
+        finally:
+            if checkpoint and cursor:
+                checkpoint.save(username, cursor)
@@ -0,0 +1,96 @@
+"""Runtime configuration reload on SIGHUP or configuration file changes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+import typing
+
+from chaturbate_poller.config.watcher import ConfigWatcher
+from chaturbate_poller.constants import CONFIG_WATCH_INTERVAL
+from chaturbate_poller.logging.config import set_log_level
+
+if typing.TYPE_CHECKING:
+    from chaturbate_poller.config.manager import ConfigManager
+    from chaturbate_poller.handlers.reloadable_handler import ReloadableEventHandler
+
+logger = logging.getLogger(__name__)
+
+
+class HotReloader:
+    """Apply configuration changes to a running poller.
+
+    A reload re-reads the configuration, applies ``LOG_LEVEL`` and rebuilds
+    the handler graph. Polling is not interrupted, so the long-poll cursor
+    is kept.
+
+    Args:
+        config: The configuration to reload.
+        event_handler: The handler whose graph is rebuilt on reload.
+        watch: Also reload when the environment file changes.
+        interval: Seconds between checks of the environment file.
+    """
+
+    def __init__(
+        self,
+        config: ConfigManager,
+        event_handler: ReloadableEventHandler,
+        *,
+        watch: bool = False,
+        interval: float = CONFIG_WATCH_INTERVAL,
+    ) -> None:
+        """Initialize the reloader without installing any trigger."""
+        self.config: ConfigManager = config
+        self.event_handler: ReloadableEventHandler = event_handler
+        self.watcher: ConfigWatcher | None = (
+            ConfigWatcher(config, interval, on_reload=[self.apply]) if watch else None
+        )
+
+    @staticmethod
+    def apply_log_level(config: ConfigManager) -> None:
+        """Apply ``LOG_LEVEL`` from the configuration, if it is set.
+
+        Args:
+            config: The configuration to read.
+        """
+        if level := config.get("LOG_LEVEL"):
+            set_log_level(level)
+
+    def apply(self, config: ConfigManager) -> None:
+        """Apply a freshly loaded configuration.
+
+        Args:
+            config: The reloaded configuration.
+        """
+        self.apply_log_level(config)
+        self.event_handler.rebuild(config)
+
+    def reload(self) -> None:
+        """Re-read the configuration and apply it."""
+        logger.info("Reloading configuration.")
+        try:
+            self.config.reload()
+        except Exception:
+            logger.exception("Failed to reload configuration.")
+            return
+        self.apply(self.config)
+
+    async def run(self) -> None:
+        """Reload on SIGHUP, and on file changes if watching, until cancelled."""
+        loop = asyncio.get_running_loop()
+        sighup: signal.Signals | None = getattr(signal, "SIGHUP", None)
+        try:
+            if sighup is not None:
+                loop.add_signal_handler(sighup, self.reload)
+        except (NotImplementedError, RuntimeError):
+            sighup = None
+            logger.debug("SIGHUP reload is not supported on this platform.")
+        try:
+            if self.watcher is not None:
+                await self.watcher.run()
+            else:
+                await asyncio.Event().wait()
+        finally:
+            if sighup is not None:
+                loop.remove_signal_handler(sighup)
@@ -0,0 +1,242 @@
+"""Circuit breaker and retry budget shared between Chaturbate clients."""
+
+from __future__ import annotations
+
+import enum
+import functools
+import logging
+import random
+import threading
+import time
+import typing
+
+from chaturbate_poller.constants import (
+    BACKOFF_MAX_VALUE,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    RETRY_BUDGET_CAPACITY,
+    RETRY_BUDGET_REFILL_RATE,
+)
+from chaturbate_poller.metrics import Gauge, registry
+from chaturbate_poller.utils.rate_limit import TokenBucket
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+logger = logging.getLogger(__name__)
+
+
+def decorrelated_jitter(
+    base: float = 3.0, factor: float = 1.0, max_value: float = BACKOFF_MAX_VALUE
+) -> Generator[float, typing.Any]:
+    """Generate decorrelated jitter backoff intervals for ``backoff``.
+
+    Each wait is drawn uniformly between ``factor`` and ``base`` times the
+    previous wait, capped at ``max_value``, so clients that fail together
+    spread their retries out instead of retrying in lockstep.
+
+    Args:
+        base: Upper growth bound relative to the previous wait.
+        factor: The first and smallest wait in seconds.
+        max_value: The largest wait in seconds.
+
+    Yields:
+        Wait intervals in seconds.
+    """
+    wait: float = factor
+    # backoff primes the generator with .send(None) and discards this value.
+    yield wait
+    while True:
+        wait = min(max_value, random.uniform(factor, wait * base))  # noqa: S311
+        yield wait
+
+
+class CircuitState(str, enum.Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+_STATE_VALUES: dict[CircuitState, int] = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for upstream API calls.
+
+    The circuit opens after ``failure_threshold`` consecutive upstream
+    failures and rejects calls for ``reset_timeout`` seconds. It then lets a
+    limited number of probe calls through (half-open); a successful probe
+    closes the circuit and a failed one opens it again.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit.
+        reset_timeout: Seconds to wait before probing an open circuit.
+        half_open_max_calls: Concurrent probe calls allowed while half-open.
+        name: Name used for logging and metrics.
+        clock: Monotonic clock used to time the open state.
+
+    Raises:
+        ValueError: If any threshold or timeout is not positive.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+        half_open_max_calls: int = 1,
+        *,
+        name: str = "chaturbate",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed circuit."""
+        if failure_threshold < 1 or half_open_max_calls < 1 or reset_timeout <= 0:
+            msg = "Circuit breaker thresholds and timeout must be positive."
+            raise ValueError(msg)
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+        self.half_open_max_calls: int = half_open_max_calls
+        self.name: str = name
+        self._clock: Callable[[], float] = clock
+        self._state: CircuitState = CircuitState.CLOSED
+        self._failures: int = 0
+        self._opened_at: float = 0.0
+        self._probes: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._gauge: Gauge = registry.gauge(
+            "circuit_breaker_state", "0 closed, 1 half-open, 2 open.", name=name
+        )
+        self._gauge.set(_STATE_VALUES[self._state])
+
+    def _transition(self, state: CircuitState) -> None:
+        """Move to a new state and report it."""
+        if state is self._state:
+            return
+        logger.warning("Circuit '%s' changed from %s to %s.", self.name, self._state, state)
+        self._state = state
+        self._gauge.set(_STATE_VALUES[state])
+
+    def _update(self) -> None:
+        """Move an open circuit to half-open once the reset timeout elapses."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            self._probes = 0
+            self._transition(CircuitState.HALF_OPEN)
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current circuit state."""
+        with self._lock:
+            self._update()
+            return self._state
+
+    def acquire(self) -> float:
+        """Ask permission to make a call.
+
+        Returns:
+            Zero if the call may proceed, otherwise the seconds to wait before asking again.
+        """
+        with self._lock:
+            self._update()
+            if self._state is CircuitState.CLOSED:
+                return 0.0
+            if self._state is CircuitState.HALF_OPEN:
+                if self._probes < self.half_open_max_calls:
+                    self._probes += 1
+                    return 0.0
+                return self.reset_timeout
+            return max(self.reset_timeout - (self._clock() - self._opened_at), 0.0)
+
+    def release(self) -> None:
+        """Give back a permission whose call ended without a recorded outcome."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._probes:
+                self._probes -= 1
+
+    def record_success(self) -> None:
+        """Record a call that reached a healthy upstream."""
+        with self._lock:
+            self._failures = 0
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a call that failed because of the upstream."""
+        with self._lock:
+            self._failures += 1
+            if self._state is CircuitState.HALF_OPEN or (
+                self._state is CircuitState.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self._transition(CircuitState.OPEN)
+
+
+class RetryBudget(TokenBucket):
+    """Token bucket limiting how many retries all clients may make.
+
+    Every retry spends one token. When the bucket is empty, failing calls give
+    up instead of retrying, which caps the extra load sent to a struggling
+    upstream regardless of how many clients are running.
+
+    Args:
+        capacity: Maximum number of retries that can be made in a burst.
+        refill_rate: Retries regained per second.
+        name: Name used for metrics.
+        clock: Monotonic clock used to measure refills.
+    """
+
+    def __init__(
+        self,
+        capacity: float = RETRY_BUDGET_CAPACITY,
+        refill_rate: float = RETRY_BUDGET_REFILL_RATE,
+        *,
+        name: str = "chaturbate",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full retry budget."""
+        super().__init__(capacity, refill_rate, clock=clock)
+        self._gauge: Gauge = registry.gauge(
+            "retry_budget_tokens", "Retries currently available.", name=name
+        )
+        self._gauge.set(capacity)
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Spend retry tokens if enough are available.
+
+        Args:
+            tokens: Number of tokens to spend.
+
+        Returns:
+            True if the retry may proceed, False if the budget is exhausted.
+        """
+        acquired: bool = super().try_acquire(tokens)
+        self._gauge.set(self.tokens)
+        if not acquired:
+            logger.warning("Retry budget exhausted; giving up instead of retrying.")
+        return acquired
+
+
+@functools.cache
+def shared_circuit_breaker() -> CircuitBreaker:
+    """Get the process-wide circuit breaker for the Events API.
+
+    Returns:
+        The shared circuit breaker.
+    """
+    return CircuitBreaker()
+
+
+@functools.cache
+def shared_retry_budget() -> RetryBudget:
+    """Get the process-wide retry budget for the Events API.
+
+    Returns:
+        The shared retry budget.
+    """
+    return RetryBudget()
@@ -2,40 +2,162 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import typing
 
 from chaturbate_poller.config.backoff import BackoffConfig
+from chaturbate_poller.config.http import HTTPClientConfig
+from chaturbate_poller.config.manager import get_config
+from chaturbate_poller.core.adaptive_timeout import AdaptiveTimeout
+from chaturbate_poller.core.checkpoint import Checkpoint
+from chaturbate_poller.core.health import PollerHealth
+from chaturbate_poller.core.loop_monitor import LoopMonitor
+from chaturbate_poller.core.memory import MIB, MemoryBudget, shared_memory_budget
 from chaturbate_poller.core.polling import start_polling
-from chaturbate_poller.handlers.factory import HandlerType, create_event_handler
+from chaturbate_poller.core.reload import HotReloader
+from chaturbate_poller.core.resilience import shared_circuit_breaker, shared_retry_budget
+from chaturbate_poller.core.shutdown import GracefulShutdown
+from chaturbate_poller.handlers.factory import (
+    HandlerType,
+    create_event_handler,
+    create_webhook_dispatcher,
+)
+from chaturbate_poller.handlers.fanout_handler import FanoutEventHandler
+from chaturbate_poller.handlers.monitored_handler import MonitoredEventHandler
+from chaturbate_poller.handlers.reloadable_handler import ReloadableEventHandler
+from chaturbate_poller.handlers.webhook_handler import WebhookEventHandler
 from chaturbate_poller.logging.config import setup_logging
+from chaturbate_poller.server.fanout import FanoutServer
+from chaturbate_poller.server.health import HealthServer
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from chaturbate_poller.config.manager import ConfigManager
     from chaturbate_poller.handlers.event_handler import EventHandler
     from chaturbate_poller.models.options import PollerOptions
 
 
+def _handler_factory(
+    options: PollerOptions,
+    fanout: FanoutServer | None = None,
+    monitor: LoopMonitor | None = None,
+) -> Callable[[ConfigManager], EventHandler]:
+    """Create the function that builds the handler graph from a configuration."""
+
+    def build(config: ConfigManager) -> EventHandler:
+        handler_type: HandlerType = HandlerType.LOGGING
+        if options.use_database or config.get_bool("USE_DATABASE"):
+            handler_type = HandlerType.DATABASE
+        elif options.use_sqlite or config.get("SQLITE_PATH"):
+            handler_type = HandlerType.SQLITE
+        elif options.use_parquet or config.get("ARCHIVE_DIR"):
+            handler_type = HandlerType.PARQUET
+        elif options.use_jsonl or config.get("JSONL_DIR"):
+            handler_type = HandlerType.JSONL
+        handler: EventHandler = create_event_handler(handler_type=handler_type, config=config)
+        if monitor is not None:
+            handler = MonitoredEventHandler(monitor, handler)
+        if (webhooks := create_webhook_dispatcher(config)) is not None:
+            handler = WebhookEventHandler(webhooks, handler)
+        return FanoutEventHandler(fanout, handler) if fanout is not None else handler
+
+    return build
+
+
 async def main(options: PollerOptions) -> None:
     """Configure and start the Chaturbate poller.
 
-    Sets up logging, creates event handler, and begins polling.
+    Sets up logging, creates event handler, and begins polling until the
+    feed ends or SIGTERM/SIGINT requests a graceful shutdown. SIGHUP, or a
+    change to the ``.env`` file when watching it, reloads the configuration
+    and swaps the handlers without interrupting polling. With a fan-out port,
+    events are also served to WebSocket and SSE subscribers. When monitoring
+    the loop, its lag is measured and handlers that block it are logged.
+    With a health port, liveness and readiness probes and metrics are
+    served. With a memory budget, components shed memory when the process
+    nears it.
 
     Args:
         options: Poller configuration options.
+
+    Raises:
+        ShutdownTimeoutError: If pending work was not flushed before the deadline.
     """
     setup_logging(verbose=options.verbose)
+    config: ConfigManager = get_config()
+    HotReloader.apply_log_level(config)
 
-    event_handler: EventHandler = create_event_handler(
-        handler_type=HandlerType.DATABASE if options.use_database else HandlerType.LOGGING
-    )
+    monitor: LoopMonitor | None = None
+    if options.monitor_loop:
+        monitor = LoopMonitor(options.slow_callback_threshold)
+        monitor.start()
+
+    fanout: FanoutServer | None = None
+    if options.fanout_port is not None:
+        fanout = FanoutServer(options.fanout_host, options.fanout_port)
+        await fanout.start()
+
+    budget: MemoryBudget | None = None
+    if options.memory_budget is not None:
+        budget = shared_memory_budget()
+        budget.limit = options.memory_budget * MIB
+        budget.start()
+
+    health: PollerHealth | None = None
+    health_server: HealthServer | None = None
+    if options.health_port is not None:
+        health = PollerHealth()
+        health_server = HealthServer(health, options.health_host, options.health_port)
+        await health_server.start()
+
+    event_handler = ReloadableEventHandler(_handler_factory(options, fanout, monitor), config)
+    reloader = HotReloader(config, event_handler, watch=options.watch_config)
 
     # Create backoff configuration instance
     backoff_config = BackoffConfig()
 
-    await start_polling(
+    adaptive_timeout: AdaptiveTimeout | None = (
+        AdaptiveTimeout(
+            initial=options.timeout, minimum=options.min_timeout, maximum=options.max_timeout
+        )
+        if options.adaptive_timeout
+        else None
+    )
+
+    shutdown = GracefulShutdown(timeout=options.shutdown_timeout)
+    checkpoint: Checkpoint | None = (
+        Checkpoint(options.checkpoint_file) if options.checkpoint_file else None
+    )
+
+    polling = start_polling(
         username=options.username,
         token=options.token,
         api_timeout=options.timeout,
         event_handler=event_handler,
         testbed=options.testbed,
         backoff_config=backoff_config,
+        http_config=HTTPClientConfig(http2=options.http2),
+        adaptive_timeout=adaptive_timeout,
+        circuit_breaker=shared_circuit_breaker(),
+        retry_budget=shared_retry_budget(),
+        stop=shutdown.stop_event,
+        checkpoint=checkpoint,
+        health=health,
     )
+    reloading: asyncio.Task[None] = asyncio.create_task(reloader.run())
+    try:
+        await shutdown.run(polling, event_handler)
+    finally:
+        reloading.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await reloading
+        if fanout is not None:
+            await fanout.close()
+        if health_server is not None:
+            await health_server.close()
+        if monitor is not None:
+            await monitor.close()
+        if budget is not None:
+            await budget.close()
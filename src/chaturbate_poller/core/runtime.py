@@ -0,0 +1,106 @@
+"""Event loop selection and tuning for running the poller."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+import importlib.util
+import logging
+import typing
+
+from chaturbate_poller.constants import LoopImplementation
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+logger = logging.getLogger(__name__)
+
+
+def uvloop_available() -> bool:
+    """Check whether the optional uvloop dependency is installed.
+
+    Returns:
+        True if the ``uvloop`` package can be imported, False otherwise.
+    """
+    return importlib.util.find_spec("uvloop") is not None
+
+
+@functools.cache
+def _uvloop_factory() -> Callable[[], asyncio.AbstractEventLoop]:
+    """Import uvloop once and get its loop factory."""
+    factory: Callable[[], asyncio.AbstractEventLoop] = importlib.import_module(
+        "uvloop"
+    ).new_event_loop
+    return factory
+
+
+def loop_factory(
+    implementation: LoopImplementation = LoopImplementation.AUTO,
+) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get the factory creating loops of an implementation.
+
+    Requesting uvloop when it is not installed logs a warning and falls back
+    to asyncio, like requesting HTTP/2 without ``h2``.
+
+    Args:
+        implementation: The requested loop implementation.
+
+    Returns:
+        The loop factory, or None for the default asyncio loop.
+    """
+    if implementation is LoopImplementation.ASYNCIO:
+        return None
+    if uvloop_available():
+        return _uvloop_factory()
+    if implementation is LoopImplementation.UVLOOP:
+        logger.warning("uvloop requested but not installed; falling back to asyncio.")
+    return None
+
+
+def run[T](
+    main: Coroutine[typing.Any, typing.Any, T],
+    *,
+    loop: LoopImplementation = LoopImplementation.AUTO,
+    executor_workers: int | None = None,
+    eager_tasks: bool = False,
+) -> T:
+    """Run a coroutine to completion on a new, tuned event loop.
+
+    Args:
+        main: The coroutine to run.
+        loop: The event loop implementation.
+        executor_workers: Threads in the default executor used by
+            ``asyncio.to_thread``, or None for the asyncio default.
+        eager_tasks: Whether new tasks start running synchronously until
+            their first suspension, which skips a loop iteration for tasks
+            that finish without waiting. Only the asyncio loop supports it.
+
+    Returns:
+        The result of the coroutine.
+
+    Raises:
+        ValueError: If the executor size is not positive.
+    """
+    if executor_workers is not None and executor_workers < 1:
+        msg = "Executor workers must be a positive integer."
+        raise ValueError(msg)
+    with asyncio.Runner(loop_factory=loop_factory(loop)) as runner:
+        event_loop: asyncio.AbstractEventLoop = runner.get_loop()
+        if executor_workers is not None:
+            event_loop.set_default_executor(
+                concurrent.futures.ThreadPoolExecutor(
+                    executor_workers, thread_name_prefix="chaturbate-poller"
+                )
+            )
+        if eager_tasks and not isinstance(event_loop, asyncio.BaseEventLoop):
+            logger.warning("Eager tasks are only supported on the asyncio loop; ignoring.")
+        elif eager_tasks:
+            event_loop.set_task_factory(asyncio.eager_task_factory)
+        logger.debug(
+            "Running on %s (executor workers: %s, eager tasks: %s).",
+            type(event_loop).__module__,
+            executor_workers or "default",
+            eager_tasks,
+        )
+        return runner.run(main)
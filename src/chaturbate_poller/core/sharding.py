@@ -0,0 +1,335 @@
+"""Sharded polling across worker processes with a single InfluxDB writer."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import time
+import typing
+import zlib
+
+from chaturbate_poller.constants import API_TIMEOUT, SHARD_BATCH_SIZE, SHARD_FLUSH_INTERVAL
+from chaturbate_poller.core.polling import start_polling
+from chaturbate_poller.core.resilience import shared_circuit_breaker, shared_retry_budget
+from chaturbate_poller.database.influxdb_handler import InfluxDBHandler
+from chaturbate_poller.handlers.event_handler import EventHandler
+from chaturbate_poller.logging.config import setup_logging
+from chaturbate_poller.metrics import Counter, registry
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterable
+    from multiprocessing.connection import _ConnectionBase  # pyright: ignore[reportPrivateUsage]
+    from multiprocessing.process import BaseProcess
+
+    # Pipe ends are Connection objects, or PipeConnection objects on Windows.
+    type Connection = _ConnectionBase[typing.Any, typing.Any]
+
+    from chaturbate_poller.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+MEASUREMENT: str = "chaturbate_events"
+
+
+@dataclasses.dataclass(frozen=True)
+class BroadcasterCredentials:
+    """Credentials for one broadcaster's Events API feed.
+
+    Args:
+        username: Chaturbate username.
+        token: Chaturbate API token.
+    """
+
+    username: str
+    token: str
+
+
+def shard_for(username: str, shards: int) -> int:
+    """Get the shard a broadcaster is assigned to.
+
+    Uses a stable hash so a broadcaster lands on the same shard across runs.
+
+    Args:
+        username: Chaturbate username.
+        shards: Total number of shards.
+
+    Returns:
+        The zero-based shard index.
+    """
+    return zlib.crc32(username.lower().encode()) % shards
+
+
+def assign_shards(
+    broadcasters: Iterable[BroadcasterCredentials], shards: int
+) -> list[list[BroadcasterCredentials]]:
+    """Group broadcasters by shard.
+
+    Args:
+        broadcasters: The broadcasters to poll.
+        shards: Total number of shards.
+
+    Returns:
+        One list of broadcasters per shard; some may be empty.
+
+    Raises:
+        ValueError: If the shard count is not positive.
+    """
+    if shards < 1:
+        msg = "Shard count must be a positive integer."
+        raise ValueError(msg)
+    groups: list[list[BroadcasterCredentials]] = [[] for _ in range(shards)]
+    for broadcaster in broadcasters:
+        groups[shard_for(broadcaster.username, shards)].append(broadcaster)
+    return groups
+
+
+class LineProtocolPipeHandler(EventHandler):
+    """Event handler that sends encoded Line Protocol over a pipe.
+
+    Events are encoded in the worker process, stamped with their arrival
+    time, and buffered; each flush sends the buffered lines as a single
+    newline-separated message so the writer never has to decode or
+    re-validate them. Sends run in a thread so a full pipe does not block
+    the worker's event loop, and one at a time so messages stay whole.
+
+    Args:
+        connection: Write end of the pipe to the writer process.
+        batch_size: Number of buffered lines that triggers a flush.
+        flush_interval: Seconds after which buffered lines are flushed.
+        encoder: Encoder for Line Protocol; created from the environment if omitted.
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        *,
+        batch_size: int = SHARD_BATCH_SIZE,
+        flush_interval: float = SHARD_FLUSH_INTERVAL,
+        encoder: InfluxDBHandler | None = None,
+    ) -> None:
+        """Initialize the handler with an empty buffer."""
+        self.connection: Connection = connection
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.encoder: InfluxDBHandler = encoder or InfluxDBHandler()
+        self._buffer: list[str] = []
+        self._last_flush: float = time.monotonic()
+        self._sending: asyncio.Lock = asyncio.Lock()
+
+    async def handle_event(self, event: Event) -> None:
+        """Encode an event and buffer it for the writer.
+
+        Args:
+            event: The event to be handled.
+        """
+        # Line Protocol has no null; absent optional fields are simply omitted.
+        data = event.model_dump(exclude_none=True)
+        self._buffer.append(
+            self.encoder.encode_event(MEASUREMENT, data, timestamp=self.encoder.next_timestamp())
+        )
+        if (
+            len(self._buffer) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Send the buffered lines to the writer."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        payload: bytes = "\n".join(self._buffer).encode()
+        self._buffer = []
+        async with self._sending:
+            await asyncio.to_thread(self.connection.send_bytes, payload)
+
+    async def close(self) -> None:
+        """Send any buffered lines before shutdown."""
+        await self.flush()
+
+    async def flush_periodically(self) -> None:
+        """Flush buffered lines every ``flush_interval`` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                await self.flush()
+
+
+async def run_shard(
+    broadcasters: list[BroadcasterCredentials],
+    connection: Connection,
+    *,
+    api_timeout: int = API_TIMEOUT,
+    testbed: bool = False,
+) -> None:
+    """Poll every broadcaster of a shard, sending encoded events to the writer.
+
+    Args:
+        broadcasters: The broadcasters assigned to this shard.
+        connection: Write end of the pipe to the writer process.
+        api_timeout: Request timeout in seconds.
+        testbed: Use testbed environment.
+    """
+    handler = LineProtocolPipeHandler(connection)
+    flusher: asyncio.Task[None] = asyncio.create_task(handler.flush_periodically())
+    try:
+        async with asyncio.TaskGroup() as group:
+            for broadcaster in broadcasters:
+                group.create_task(
+                    start_polling(
+                        username=broadcaster.username,
+                        token=broadcaster.token,
+                        api_timeout=api_timeout,
+                        event_handler=handler,
+                        testbed=testbed,
+                        circuit_breaker=shared_circuit_breaker(),
+                        retry_budget=shared_retry_budget(),
+                    )
+                )
+    finally:
+        flusher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await flusher
+        await handler.flush()
+
+
+def _worker_main(  # noqa: PLR0913
+    index: int,
+    broadcasters: list[BroadcasterCredentials],
+    connection: Connection,
+    api_timeout: int,
+    testbed: bool,  # noqa: FBT001
+    verbose: bool,  # noqa: FBT001
+) -> None:
+    """Entry point of a shard worker process."""
+    setup_logging(verbose=verbose)
+    logger.info("Shard %d polling %d broadcaster(s).", index, len(broadcasters))
+    try:
+        asyncio.run(run_shard(broadcasters, connection, api_timeout=api_timeout, testbed=testbed))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        connection.close()
+
+
+class ShardedRunner:
+    """Poll many broadcasters across worker processes.
+
+    Broadcasters are hashed onto ``workers`` processes. Each worker runs the
+    polling loops for its broadcasters and does the CPU-heavy work of
+    validating events and encoding them as Line Protocol. Encoded batches are
+    sent over pipes to this process, which is the only one writing to InfluxDB.
+
+    Args:
+        broadcasters: The broadcasters to poll.
+        workers: Number of worker processes; defaults to the CPU count.
+        writer: InfluxDB writer used by the parent process.
+        api_timeout: Request timeout in seconds.
+        testbed: Use testbed environment.
+        verbose: Enable debug logging in the workers.
+        poll_interval: Seconds to wait for worker output before checking for cancellation.
+
+    Raises:
+        ValueError: If no broadcasters are given.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        broadcasters: Iterable[BroadcasterCredentials],
+        workers: int | None = None,
+        *,
+        writer: InfluxDBHandler | None = None,
+        api_timeout: int = API_TIMEOUT,
+        testbed: bool = False,
+        verbose: bool = False,
+        poll_interval: float = 1.0,
+    ) -> None:
+        """Initialize the runner and assign broadcasters to shards."""
+        self.broadcasters: list[BroadcasterCredentials] = list(broadcasters)
+        if not self.broadcasters:
+            msg = "At least one broadcaster is required."
+            raise ValueError(msg)
+        self.workers: int = min(workers or os.cpu_count() or 1, len(self.broadcasters))
+        self.shards: list[list[BroadcasterCredentials]] = assign_shards(
+            self.broadcasters, self.workers
+        )
+        self.writer: InfluxDBHandler = writer or InfluxDBHandler()
+        self.api_timeout: int = api_timeout
+        self.testbed: bool = testbed
+        self.verbose: bool = verbose
+        self.poll_interval: float = poll_interval
+        self._lines_written: Counter = registry.counter(
+            "sharded_lines_written_total", "Line Protocol lines written by the shard writer."
+        )
+
+    async def run(self) -> None:
+        """Start the workers and write their output until all of them exit."""
+        context = multiprocessing.get_context("spawn")
+        processes: list[BaseProcess] = []
+        readers: list[Connection] = []
+        for index, shard in enumerate(self.shards):
+            if not shard:
+                continue
+            reader, sender = context.Pipe(duplex=False)
+            process: BaseProcess = context.Process(
+                target=_worker_main,
+                args=(index, shard, sender, self.api_timeout, self.testbed, self.verbose),
+                name=f"chaturbate-shard-{index}",
+                daemon=True,
+            )
+            process.start()
+            # Only the worker keeps the write end, so its exit is seen as EOF.
+            sender.close()
+            processes.append(process)
+            readers.append(reader)
+
+        logger.info("Started %d shard worker(s).", len(processes))
+        try:
+            await self.drain(readers)
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+                if process.exitcode:
+                    logger.error("%s exited with status %s.", process.name, process.exitcode)
+
+    async def drain(self, readers: list[Connection]) -> None:
+        """Write everything received from the readers until they are all closed.
+
+        Messages that are ready at the same time are written in one request.
+
+        Args:
+            readers: Read ends of the worker pipes.
+        """
+        pending: list[Connection] = list(readers)
+        while pending:
+            ready = await asyncio.to_thread(
+                multiprocessing.connection.wait,
+                typing.cast("list[multiprocessing.connection.Connection]", pending),
+                self.poll_interval,
+            )
+            payloads: list[bytes] = []
+            for reader in typing.cast("list[Connection]", ready):
+                try:
+                    payloads.append(reader.recv_bytes())
+                except EOFError:
+                    pending.remove(reader)
+                    reader.close()
+            if payloads:
+                await self._write(b"\n".join(payloads))
+
+    async def _write(self, payload: bytes) -> None:
+        """Write a batch of lines, logging instead of raising on failure."""
+        lines: int = payload.count(b"\n") + 1
+        try:
+            await self.writer.write_line_protocol(payload)
+        except Exception:
+            logger.exception("Dropped %d line(s) after a failed write.", lines)
+        else:
+            self._lines_written.inc(lines)
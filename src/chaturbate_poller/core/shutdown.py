@@ -0,0 +1,135 @@
+"""Graceful shutdown on termination signals."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import signal
+import time
+import typing
+
+from chaturbate_poller.constants import SHUTDOWN_TIMEOUT
+from chaturbate_poller.exceptions import ShutdownTimeoutError
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Awaitable, Iterable
+
+    from chaturbate_poller.handlers.event_handler import EventHandler
+
+logger = logging.getLogger(__name__)
+
+
+class GracefulShutdown:
+    """Stop polling on SIGTERM or SIGINT and flush pending work within a deadline.
+
+    When a signal arrives, polling stops fetching new pages, finishes the
+    events of the page in hand, and the event handler is closed so it can
+    flush its buffers. All of this must complete within ``timeout`` seconds.
+
+    Args:
+        timeout: Seconds allowed for draining and flushing after a stop request.
+        signals: Signals that request a stop.
+
+    Raises:
+        ValueError: If the timeout is not positive.
+    """
+
+    def __init__(
+        self,
+        timeout: float = SHUTDOWN_TIMEOUT,
+        signals: Iterable[signal.Signals] = (signal.SIGTERM, signal.SIGINT),
+    ) -> None:
+        """Initialize the coordinator without installing signal handlers."""
+        if timeout <= 0:
+            msg = "Shutdown timeout must be positive."
+            raise ValueError(msg)
+        self.timeout: float = timeout
+        self.signals: tuple[signal.Signals, ...] = tuple(signals)
+        self.stop_event: asyncio.Event = asyncio.Event()
+        self.received: signal.Signals | None = None
+        self._installed: list[signal.Signals] = []
+
+    def request_stop(self, signum: signal.Signals | None = None) -> None:
+        """Ask polling to stop.
+
+        Args:
+            signum: The signal that triggered the request, if any.
+        """
+        if self.stop_event.is_set():
+            logger.warning("Shutdown already in progress.")
+            return
+        self.received = signum
+        logger.info(
+            "Received %s; shutting down.", signal.Signals(signum).name if signum else "stop request"
+        )
+        self.stop_event.set()
+
+    def install(self) -> None:
+        """Register signal handlers on the running event loop."""
+        loop = asyncio.get_running_loop()
+        for signum in self.signals:
+            try:
+                loop.add_signal_handler(signum, self.request_stop, signum)
+            except (NotImplementedError, RuntimeError, ValueError):
+                logger.debug("Cannot handle %s on this platform.", signal.Signals(signum).name)
+            else:
+                self._installed.append(signum)
+
+    def uninstall(self) -> None:
+        """Remove the registered signal handlers."""
+        loop = asyncio.get_running_loop()
+        while self._installed:
+            loop.remove_signal_handler(self._installed.pop())
+
+    async def run(self, polling: Awaitable[None], event_handler: EventHandler) -> None:
+        """Run polling until it ends or a stop is requested, then close the handler.
+
+        Args:
+            polling: The polling coroutine; it should watch ``stop_event``.
+            event_handler: The handler to close once polling has stopped.
+
+        Raises:
+            ShutdownTimeoutError: If draining did not finish within the deadline.
+        """
+        self.install()
+        task: asyncio.Future[None] = asyncio.ensure_future(polling)
+        stopped: asyncio.Future[typing.Any] = asyncio.ensure_future(self.stop_event.wait())
+        try:
+            await asyncio.wait({task, stopped}, return_when=asyncio.FIRST_COMPLETED)
+            if self.stop_event.is_set():
+                await self._drain(task, event_handler)
+            else:
+                try:
+                    task.result()
+                finally:
+                    await event_handler.close()
+        finally:
+            stopped.cancel()
+            if not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+            self.uninstall()
+
+    async def _drain(self, polling: asyncio.Future[None], event_handler: EventHandler) -> None:
+        """Wait for polling to stop and the handler to flush, within the deadline."""
+        started: float = time.monotonic()
+        drained: float = started
+        try:
+            async with asyncio.timeout(self.timeout):
+                await polling
+                drained = time.monotonic()
+                await event_handler.close()
+        except TimeoutError as exc:
+            logger.error(  # noqa: TRY400
+                "Shutdown deadline of %.1fs exceeded; pending work was abandoned.", self.timeout
+            )
+            raise ShutdownTimeoutError from exc
+        finished: float = time.monotonic()
+        logger.info(
+            "Shutdown completed in %.3fs (drain %.3fs, flush %.3fs).",
+            finished - started,
+            drained - started,
+            finished - drained,
+        )
@@ -0,0 +1,160 @@
+"""Pooled HTTP transport that can be shared between Chaturbate clients."""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import typing
+import weakref
+from dataclasses import dataclass
+
+import httpx
+
+from chaturbate_poller.config.http import HTTPClientConfig
+
+if typing.TYPE_CHECKING:
+    import types
+
+logger = logging.getLogger(__name__)
+
+
+def http2_available() -> bool:
+    """Check whether the optional HTTP/2 dependency is installed.
+
+    Returns:
+        True if the ``h2`` package can be imported, False otherwise.
+    """
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class ConnectionStats:
+    """Connection reuse statistics for a pooled transport."""
+
+    requests: int = 0
+    """int: Number of requests that received a response."""
+    connections_opened: int = 0
+    """int: Number of responses served over a newly opened connection."""
+    connections_reused: int = 0
+    """int: Number of responses served over an already open connection."""
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Get the fraction of requests served over a reused connection."""
+        return self.connections_reused / self.requests if self.requests else 0.0
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """Connection-pooling transport with reuse tracking.
+
+    A single instance can be passed to several ``ChaturbateClient`` objects so
+    they share one connection pool. Each client holds a reference while it is
+    open, and the underlying pool is closed once the last reference is released.
+
+    Args:
+        config: Connection pool and protocol settings.
+        transport: Transport to wrap instead of creating a default one.
+    """
+
+    def __init__(
+        self,
+        config: HTTPClientConfig | None = None,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize the transport and its connection pool."""
+        self.config: HTTPClientConfig = config or HTTPClientConfig()
+        self.stats: ConnectionStats = ConnectionStats()
+
+        http2: bool = self.config.http2
+        if http2 and transport is None and not http2_available():
+            logger.warning("HTTP/2 requested but 'h2' is not installed; falling back to HTTP/1.1.")
+            http2 = False
+        self.http2: bool = http2
+
+        self._transport: httpx.AsyncBaseTransport = transport or httpx.AsyncHTTPTransport(
+            limits=self.config.limits, http2=http2
+        )
+        self._streams: weakref.WeakSet[object] = weakref.WeakSet()
+        self._references: int = 0
+        self._closed: bool = False
+
+    @property
+    def closed(self) -> bool:
+        """Check whether the underlying connection pool has been closed."""
+        return self._closed
+
+    def acquire(self) -> typing.Self:
+        """Register a new user of this transport.
+
+        Returns:
+            The transport itself.
+
+        Raises:
+            RuntimeError: If the transport has already been closed.
+        """
+        if self._closed:
+            msg = "Transport has been closed and cannot be reused."
+            raise RuntimeError(msg)
+        self._references += 1
+        return self
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request through the pool and record connection reuse.
+
+        Args:
+            request: The request to send.
+
+        Returns:
+            The response from the underlying transport.
+        """
+        response: httpx.Response = await self._transport.handle_async_request(request)
+        self._record(response)
+        return response
+
+    def _record(self, response: httpx.Response) -> None:
+        """Update reuse statistics from the response's network stream."""
+        self.stats.requests += 1
+        stream: object | None = response.extensions.get("network_stream")
+        if stream is None:
+            return
+        try:
+            if stream in self._streams:
+                self.stats.connections_reused += 1
+                return
+            self._streams.add(stream)
+        except TypeError:
+            return
+        self.stats.connections_opened += 1
+
+    async def aclose(self) -> None:
+        """Release one reference and close the pool when none remain."""
+        self._references = max(self._references - 1, 0)
+        if self._references or self._closed:
+            return
+        self._closed = True
+        await self._transport.aclose()
+        logger.debug(
+            "Closed HTTP transport after %s requests (%s reused connections).",
+            self.stats.requests,
+            self.stats.connections_reused,
+        )
+
+    async def __aenter__(self) -> typing.Self:
+        """Enter async context and hold a reference to the transport."""
+        return self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: types.TracebackType | None = None,
+    ) -> None:
+        """Exit async context and release the held reference.
+
+        Args:
+            exc_type: Exception type if raised.
+            exc_value: Exception value if raised.
+            traceback: Exception traceback if raised.
+        """
+        await self.aclose()
@@ -0,0 +1,320 @@
+"""Batched, signed delivery of events to HTTP webhooks."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import hmac
+import json
+import logging
+import pathlib
+import time
+import typing
+
+import httpx
+
+from chaturbate_poller.config.http import HTTPClientConfig
+from chaturbate_poller.constants import (
+    HEALTH_SINK_GAUGE,
+    WEBHOOK_BATCH_SIZE,
+    WEBHOOK_CONCURRENCY,
+    WEBHOOK_DEAD_LETTER_PATH,
+    WEBHOOK_FLUSH_INTERVAL,
+    WEBHOOK_MAX_TRIES,
+    WEBHOOK_QUEUE_SIZE,
+    WEBHOOK_RETRY_MAX_WAIT,
+    WEBHOOK_RETRY_WAIT,
+    WEBHOOK_SIGNATURE_HEADER,
+    WEBHOOK_TIMEOUT,
+)
+from chaturbate_poller.core.resilience import decorrelated_jitter
+from chaturbate_poller.core.transport import PooledTransport
+from chaturbate_poller.database.jsonl_log import EVENT_ADAPTER
+from chaturbate_poller.metrics import Counter, Gauge, registry
+
+if typing.TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable, Sequence
+
+    from chaturbate_poller.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES: frozenset[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+"""frozenset[int]: Response statuses that are retried; other errors go to the dead-letter file."""
+
+
+@dataclasses.dataclass(frozen=True)
+class WebhookDestination:
+    """A webhook URL and how events are delivered to it."""
+
+    url: str
+    """str: The URL events are POSTed to."""
+    secret: str | None = None
+    """str | None: Key of the HMAC-SHA256 signature of each body, if signing."""
+    methods: frozenset[str] | None = None
+    """frozenset[str] | None: Event methods to deliver, or None for all of them."""
+    concurrency: int = WEBHOOK_CONCURRENCY
+    """int: Maximum number of requests in flight to this URL."""
+
+    def __post_init__(self) -> None:
+        """Validate the destination after initialization."""
+        if self.concurrency < 1:
+            msg = "Webhook concurrency must be a positive integer."
+            raise ValueError(msg)
+
+    def sign(self, body: bytes) -> str | None:
+        """Sign a request body.
+
+        Args:
+            body: The request body.
+
+        Returns:
+            The signature header value, or None without a secret.
+        """
+        if not self.secret:
+            return None
+        digest: str = hmac.new(self.secret.encode(), body, hashlib.sha256).hexdigest()
+        return f"sha256={digest}"
+
+
+class _Route:
+    """The queue, concurrency limit, tasks and health gauges of one destination."""
+
+    def __init__(self, destination: WebhookDestination, queue_size: int) -> None:
+        """Initialize the route with an empty queue."""
+        self.destination: WebhookDestination = destination
+        self.queue: asyncio.Queue[bytes | None] = asyncio.Queue(queue_size)
+        self.slots: asyncio.Semaphore = asyncio.Semaphore(destination.concurrency)
+        self.batcher: asyncio.Task[None] | None = None
+        self.sending: set[asyncio.Task[None]] = set()
+        self.failing: Gauge = registry.gauge(
+            HEALTH_SINK_GAUGE,
+            "1 while the last write to a sink failed.",
+            sink="webhook",
+            url=destination.url,
+        )
+        self.depth: Gauge = registry.gauge(
+            "webhook_queue_depth", "Events queued for a webhook.", url=destination.url
+        )
+
+
+class WebhookDispatcher:
+    """Deliver events to webhooks in batches, off the polling path.
+
+    :meth:`submit` serializes each event once and queues it for every
+    destination whose filter matches, without waiting on the network. A task
+    per destination gathers queued events into JSON array bodies of up to
+    ``batch_size`` events, waiting at most ``flush_interval`` seconds for a
+    batch to fill, and POSTs them through one pooled client with at most
+    ``concurrency`` requests in flight per destination. Failed requests are
+    retried with decorrelated jitter; batches that exhaust their retries, get
+    a non-retryable response, or overflow a full queue are appended to the
+    dead-letter file as JSON lines, and mark the destination as failing in
+    the ``sink_failing`` gauge until a batch is delivered again.
+
+    Args:
+        destinations: The webhooks to deliver to.
+        batch_size: Maximum number of events per request.
+        flush_interval: Longest wait, in seconds, for a batch to fill.
+        queue_size: Events queued per destination before they are dead-lettered.
+        max_tries: Attempts per batch, including the first.
+        retry_wait: First retry wait, in seconds.
+        dead_letter_path: JSON Lines file receiving undeliverable batches.
+        transport: Transport for the client; a pooled one by default.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        destinations: Iterable[WebhookDestination],
+        *,
+        batch_size: int = WEBHOOK_BATCH_SIZE,
+        flush_interval: float = WEBHOOK_FLUSH_INTERVAL,
+        queue_size: int = WEBHOOK_QUEUE_SIZE,
+        max_tries: int = WEBHOOK_MAX_TRIES,
+        retry_wait: float = WEBHOOK_RETRY_WAIT,
+        dead_letter_path: str | os.PathLike[str] = WEBHOOK_DEAD_LETTER_PATH,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize the dispatcher; delivery starts with the first submitted event."""
+        if batch_size < 1 or max_tries < 1:
+            msg = "Webhook batch size and tries must be positive integers."
+            raise ValueError(msg)
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.max_tries: int = max_tries
+        self.retry_wait: float = retry_wait
+        self.dead_letter_path: pathlib.Path = pathlib.Path(dead_letter_path)
+        self._routes: list[_Route] = [_Route(dest, queue_size) for dest in destinations]
+        self._client: httpx.AsyncClient = httpx.AsyncClient(
+            transport=transport or PooledTransport(HTTPClientConfig()).acquire(),
+            timeout=WEBHOOK_TIMEOUT,
+        )
+        self._sent: Counter = registry.counter(
+            "webhook_events_sent_total", "Events delivered to webhooks."
+        )
+        self._retries: Counter = registry.counter(
+            "webhook_retries_total", "Webhook requests retried."
+        )
+        self._dead_lettered: Counter = registry.counter(
+            "webhook_dead_letters_total", "Events written to the webhook dead-letter file."
+        )
+        self._dead_letter_lock: asyncio.Lock = asyncio.Lock()
+        self._dead_letters: set[asyncio.Task[None]] = set()
+        self._closed: bool = False
+
+    @property
+    def destinations(self) -> list[WebhookDestination]:
+        """Get the destinations, in delivery order."""
+        return [route.destination for route in self._routes]
+
+    def submit(self, events: Sequence[Event]) -> None:
+        """Queue a page of events for delivery.
+
+        Args:
+            events: The events to deliver.
+
+        Raises:
+            RuntimeError: If the dispatcher has been closed.
+        """
+        if self._closed:
+            msg = "Webhook dispatcher has been closed."
+            raise RuntimeError(msg)
+        payloads: list[tuple[str, bytes]] = [
+            (event.method.value, EVENT_ADAPTER.dump_json(event, by_alias=True)) for event in events
+        ]
+        for route in self._routes:
+            if route.batcher is None:
+                route.batcher = asyncio.create_task(self._batch(route))
+            methods: frozenset[str] | None = route.destination.methods
+            overflow: list[bytes] = []
+            for method, payload in payloads:
+                if methods is None or method in methods:
+                    try:
+                        route.queue.put_nowait(payload)
+                    except asyncio.QueueFull:
+                        overflow.append(payload)
+            route.depth.set(route.queue.qsize())
+            if overflow:
+                route.failing.set(1)
+                self._dead_letter_later(route.destination, overflow, "Queue full", 0)
+
+    async def _batch(self, route: _Route) -> None:
+        """Gather queued events into batches and start a request for each."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        stopping: bool = False
+        while not stopping:
+            first: bytes | None = await route.queue.get()
+            if first is None:
+                break
+            batch: list[bytes] = [first]
+            deadline: float = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item: bytes | None = route.queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    try:
+                        item = await asyncio.wait_for(route.queue.get(), deadline - loop.time())
+                    except TimeoutError:
+                        break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            route.depth.set(route.queue.qsize())
+            await route.slots.acquire()
+            task: asyncio.Task[None] = asyncio.create_task(self._deliver(route, batch))
+            route.sending.add(task)
+            task.add_done_callback(route.sending.discard)
+
+    async def _deliver(self, route: _Route, batch: list[bytes]) -> None:
+        """POST a batch, retrying with jitter and dead-lettering it on failure."""
+        destination: WebhookDestination = route.destination
+        body: bytes = b"[" + b",".join(batch) + b"]"
+        headers: dict[str, str] = {"Content-Type": "application/json"}
+        if (signature := destination.sign(body)) is not None:
+            headers[WEBHOOK_SIGNATURE_HEADER] = signature
+        waits = decorrelated_jitter(factor=self.retry_wait, max_value=WEBHOOK_RETRY_MAX_WAIT)
+        next(waits)
+        error: str = ""
+        attempt: int = 0
+        try:
+            for attempt in range(1, self.max_tries + 1):
+                try:
+                    response: httpx.Response = await self._client.post(
+                        destination.url, content=body, headers=headers
+                    )
+                except httpx.TransportError as exc:
+                    error = f"{type(exc).__name__}: {exc}"
+                except (httpx.HTTPError, httpx.InvalidURL) as exc:
+                    error = f"{type(exc).__name__}: {exc}"
+                    break
+                else:
+                    if response.is_success:
+                        self._sent.inc(len(batch))
+                        route.failing.set(0)
+                        return
+                    error = f"HTTP {response.status_code}"
+                    if response.status_code not in RETRYABLE_STATUSES:
+                        break
+                if attempt < self.max_tries:
+                    self._retries.inc()
+                    await asyncio.sleep(next(waits))
+            route.failing.set(1)
+            await self._dead_letter(destination, batch, error, attempt)
+        finally:
+            route.slots.release()
+
+    def _dead_letter_later(
+        self, destination: WebhookDestination, batch: list[bytes], error: str, attempts: int
+    ) -> None:
+        """Dead-letter a batch from synchronous code."""
+        task: asyncio.Task[None] = asyncio.create_task(
+            self._dead_letter(destination, batch, error, attempts)
+        )
+        self._dead_letters.add(task)
+        task.add_done_callback(self._dead_letters.discard)
+
+    async def _dead_letter(
+        self, destination: WebhookDestination, batch: list[bytes], error: str, attempts: int
+    ) -> None:
+        """Append an undeliverable batch to the dead-letter file."""
+        logger.error(
+            "Dead-lettering %d events for %s after %d attempts: %s",
+            len(batch),
+            destination.url,
+            attempts,
+            error,
+        )
+        self._dead_lettered.inc(len(batch))
+        record: dict[str, object] = {
+            "url": destination.url,
+            "error": error,
+            "attempts": attempts,
+            "failed_at": time.time(),
+        }
+        line: bytes = json.dumps(record).encode()[:-1] + b',"events":[' + b",".join(batch) + b"]}\n"
+        async with self._dead_letter_lock:
+            await asyncio.to_thread(self._append, line)
+
+    def _append(self, line: bytes) -> None:
+        """Append a line to the dead-letter file."""
+        self.dead_letter_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.dead_letter_path.open("ab") as file:
+            file.write(line)
+
+    async def close(self) -> None:
+        """Deliver what is queued, wait for requests in flight and close the client."""
+        if self._closed:
+            return
+        self._closed = True
+        for route in self._routes:
+            if route.batcher is not None:
+                await route.queue.put(None)
+                await route.batcher
+            await asyncio.gather(*route.sending)
+        await asyncio.gather(*self._dead_letters)
+        with contextlib.suppress(httpx.HTTPError):
+            await self._client.aclose()
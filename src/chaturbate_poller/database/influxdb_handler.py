@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import enum
 import logging
+import time
 import typing
 
 import httpx
 
-from chaturbate_poller.config.manager import ConfigManager
+from chaturbate_poller.config.manager import ConfigManager, get_config
+from chaturbate_poller.constants import HEALTH_SINK_GAUGE
+from chaturbate_poller.metrics import Gauge, registry
 
 if typing.TYPE_CHECKING:
     from chaturbate_poller.database.nested_types import FieldValue, FlattenedDict, NestedDict
@@ -23,11 +26,15 @@ class InfluxData(typing.TypedDict, total=False):
 
 
 class InfluxDBHandler:
-    """Class to handle InfluxDB operations via HTTP API."""
+    """Class to handle InfluxDB operations via HTTP API.
 
-    def __init__(self) -> None:
+    Args:
+        config: Configuration to read connection settings from; defaults to the shared snapshot.
+    """
+
+    def __init__(self, config: ConfigManager | None = None) -> None:
         """Initialize the InfluxDB handler by setting up configuration."""
-        config_manager: ConfigManager = ConfigManager()
+        config_manager: ConfigManager = config or get_config()
 
         url_value: str | None = config_manager.get(key="INFLUXDB_URL", default="")
         self.url: str = url_value.rstrip("/") if url_value is not None else ""
@@ -36,13 +43,30 @@ class InfluxDBHandler:
         self.bucket: str = config_manager.get(key="INFLUXDB_BUCKET", default="") or ""
 
         self.write_url: str = (
-            f"{self.url}/api/v2/write?org={self.org}&bucket={self.bucket}&precision=s"
+            f"{self.url}/api/v2/write?org={self.org}&bucket={self.bucket}&precision=ns"
         )
         self.headers: dict[str, str] = {
             "Authorization": f"Token {self.token}",
             "Content-Type": "text/plain",
             "Accept": "application/json",
         }
+        self._failing: Gauge = registry.gauge(
+            HEALTH_SINK_GAUGE, "1 while the last write to a sink failed.", sink="influxdb"
+        )
+        self._last_timestamp: int = 0
+
+    def next_timestamp(self) -> int:
+        """Get the arrival time of a point, later than any this handler issued before.
+
+        Points without a timestamp all get the server's receive time, so
+        points written in one request would overwrite each other. Points
+        arriving within the same nanosecond are spread one nanosecond apart.
+
+        Returns:
+            A Unix timestamp in nanoseconds.
+        """
+        self._last_timestamp = max(time.time_ns(), self._last_timestamp + 1)
+        return self._last_timestamp
 
     def _is_nested_dict(self, value: dict[str, typing.Any]) -> typing.TypeGuard[NestedDict]:
         """Type guard to check if a dictionary is a valid NestedDict.
@@ -103,53 +127,86 @@ class InfluxDBHandler:
         escaped_value = str(value).replace('"', '\\"')
         return f'{key}="{escaped_value}"'
 
-    def format_line_protocol(self, measurement: str, data: FlattenedDict) -> str:
+    def format_line_protocol(
+        self, measurement: str, data: FlattenedDict, timestamp: int | None = None
+    ) -> str:
         """Format the given data as InfluxDB Line Protocol.
 
         Args:
             measurement: The measurement name.
             data: The flattened event data to format.
+            timestamp: Unix timestamp in nanoseconds; the server's time is used if omitted.
 
         Returns:
             A properly formatted InfluxDB Line Protocol string.
         """
         fields = [self._format_field(key, value) for key, value in data.items()]
-        return f"{measurement} {','.join(fields)}"
+        line: str = f"{measurement} {','.join(fields)}"
+        return line if timestamp is None else f"{line} {timestamp}"
 
-    async def write_event(self, measurement: str, data: NestedDict) -> None:
-        """Write event data to InfluxDB via HTTP API.
+    def encode_event(self, measurement: str, data: NestedDict, timestamp: int | None = None) -> str:
+        """Encode event data as a single InfluxDB Line Protocol line.
 
         Args:
             measurement: The measurement name.
-            data: The event data to write.
+            data: The event data to encode.
+            timestamp: Unix timestamp in nanoseconds; the server's time is used if omitted.
+
+        Returns:
+            The encoded line.
 
         Raises:
-            httpx.HTTPStatusError: If the request returns an HTTP error.
-            httpx.RequestError: If a network error occurs.
             ValueError: If data cannot be processed for InfluxDB.
         """
         try:
             flattened_data: FlattenedDict = self.flatten_dict(data)
-            line_protocol: str = self.format_line_protocol(measurement, data=flattened_data)
+            return self.format_line_protocol(measurement, data=flattened_data, timestamp=timestamp)
         except (TypeError, ValueError) as e:
             logger.exception("Error processing data for InfluxDB")
             msg = "Unable to process data for InfluxDB format"
             raise ValueError(msg) from e
 
+    async def write_event(self, measurement: str, data: NestedDict) -> None:
+        """Write event data to InfluxDB via HTTP API.
+
+        Args:
+            measurement: The measurement name.
+            data: The event data to write.
+
+        Raises:
+            httpx.HTTPStatusError: If the request returns an HTTP error.
+            httpx.RequestError: If a network error occurs.
+            ValueError: If data cannot be processed for InfluxDB.
+        """
+        await self.write_line_protocol(self.encode_event(measurement, data))
+
+    async def write_line_protocol(self, payload: str | bytes) -> None:
+        """Write pre-encoded, newline-separated Line Protocol to InfluxDB.
+
+        Args:
+            payload: One or more encoded lines.
+
+        Raises:
+            httpx.HTTPStatusError: If the request returns an HTTP error.
+            httpx.RequestError: If a network error occurs.
+        """
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.post(
                     url=self.write_url,
                     headers=self.headers,
-                    content=line_protocol,
+                    content=payload,
                 )
                 response.raise_for_status()
                 logger.debug("Data written to InfluxDB successfully")
         except httpx.HTTPStatusError as e:
+            self._failing.set(1)
             logger.exception(
                 "HTTP error occurred while writing data to InfluxDB: %s", e.response.text
             )
             raise
         except httpx.RequestError:
+            self._failing.set(1)
             logger.exception("Network error occurred while writing data to InfluxDB")
             raise
+        self._failing.set(0)
@@ -0,0 +1,307 @@
+"""Append-only JSON Lines event log with rotation, compression and indexes."""
+
+from __future__ import annotations
+
+import bisect
+import concurrent.futures
+import dataclasses
+import gzip
+import itertools
+import logging
+import os
+import pathlib
+import shutil
+import time
+import typing
+
+import pydantic
+
+from chaturbate_poller.constants import (
+    JSONL_BUFFER_SIZE,
+    JSONL_LOOKUP_SEGMENTS,
+    JSONL_MAX_AGE,
+    JSONL_MAX_BYTES,
+)
+from chaturbate_poller.metrics import Counter, registry
+from chaturbate_poller.models.event import Event
+
+if typing.TYPE_CHECKING:
+    import io
+    from collections.abc import Callable, Iterator, Sequence
+
+logger = logging.getLogger(__name__)
+
+EVENT_ADAPTER: pydantic.TypeAdapter[Event] = pydantic.TypeAdapter(Event)
+"""pydantic.TypeAdapter[Event]: Serializes events straight to JSON bytes."""
+
+SEGMENT_SUFFIX: str = ".jsonl"
+"""str: Suffix of an open or uncompressed segment."""
+INDEX_SUFFIX: str = ".idx"
+"""str: Suffix of a segment's index, appended to the segment name."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class IndexEntry:
+    """Location of one event in a segment."""
+
+    offset: int
+    """int: Byte offset of the event's line in the uncompressed segment."""
+    received_at: float
+    """float: Time the event was received, in seconds since the epoch."""
+    event_id: str
+    """str: The event ID."""
+
+
+class _Segment:
+    """An open segment file and its index."""
+
+    def __init__(self, path: pathlib.Path, buffer_size: int, opened_at: float) -> None:
+        """Open the segment and its index for appending."""
+        self.path: pathlib.Path = path
+        self.opened_at: float = opened_at
+        self.file: typing.BinaryIO = path.open("ab", buffering=buffer_size)
+        self.index: typing.TextIO = pathlib.Path(f"{path}{INDEX_SUFFIX}").open(  # noqa: SIM115
+            "a", buffering=buffer_size, encoding="utf-8"
+        )
+        self.size: int = self.file.tell()
+
+    def close(self) -> None:
+        """Flush and close the segment and its index."""
+        self.file.close()
+        self.index.close()
+
+
+def _compress(path: pathlib.Path) -> None:
+    """Gzip a closed segment and remove the original."""
+    target = path.with_suffix(f"{SEGMENT_SUFFIX}.gz")
+    with path.open("rb") as source, gzip.open(target, "wb") as destination:
+        shutil.copyfileobj(source, destination)
+    path.unlink()
+    logger.debug("Compressed %s.", target)
+
+
+def _open_segment(path: pathlib.Path) -> io.BufferedIOBase:
+    """Open a segment for reading, compressed or not."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    return path.open("rb")
+
+
+def _segment_name(path: pathlib.Path) -> str:
+    """Get the name of a segment without its compression suffix."""
+    return path.name.removesuffix(".gz")
+
+
+class JSONLEventLog:
+    """Write events as JSON lines to rotating, compressed segment files.
+
+    Each event is serialized to bytes with a pydantic ``TypeAdapter`` and
+    appended to the current segment through a write buffer. A segment is
+    closed once it reaches ``max_bytes`` or ``max_age`` seconds, then gzipped
+    in a background thread. Every segment has a plain-text index of line
+    offsets, receive times and event IDs, kept uncompressed so that lookups
+    read only the segments they need. Index entries are in receive order, so
+    :meth:`replay` bisects on the receive time; :meth:`find` bisects a copy
+    sorted by event ID, kept for the ``JSONL_LOOKUP_SEGMENTS`` most recently
+    searched segments until their index grows.
+
+    Args:
+        directory: Directory holding the segments.
+        max_bytes: Size at which a segment is rotated.
+        max_age: Age, in seconds, at which a segment is rotated.
+        compress: Gzip closed segments.
+        buffer_size: Size of the write buffer, in bytes.
+        clock: Function returning the current time in seconds since the epoch.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        max_bytes: int = JSONL_MAX_BYTES,
+        max_age: float = JSONL_MAX_AGE,
+        compress: bool = True,
+        buffer_size: int = JSONL_BUFFER_SIZE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the log without opening a segment."""
+        if max_bytes <= 0 or max_age <= 0:
+            msg = "Segment size and age limits must be positive."
+            raise ValueError(msg)
+        self.directory: pathlib.Path = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes: int = max_bytes
+        self.max_age: float = max_age
+        self.compress: bool = compress
+        self.buffer_size: int = buffer_size
+        self._clock: Callable[[], float] = clock
+        self._segment: _Segment | None = None
+        self._sequence: Iterator[int] = itertools.count()
+        self._compressor: concurrent.futures.ThreadPoolExecutor = (
+            concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="jsonl-gzip")
+        )
+        self._events_written: Counter = registry.counter(
+            "jsonl_events_written_total", "Events appended to the JSONL log."
+        )
+        self._lookups: dict[str, tuple[int, list[str], list[int]]] = {}
+
+    def write(self, events: Sequence[Event], received_at: float | None = None) -> None:
+        """Append a page of events.
+
+        Args:
+            events: The events to append.
+            received_at: Time the events were received; now if omitted.
+        """
+        if not events:
+            return
+        received: float = self._clock() if received_at is None else received_at
+        segment: _Segment = self._current(received)
+        lines: list[bytes] = []
+        entries: list[str] = []
+        for event in events:
+            line: bytes = EVENT_ADAPTER.dump_json(event, by_alias=True) + b"\n"
+            entries.append(f"{segment.size} {received!r} {event.id}\n")
+            segment.size += len(line)
+            lines.append(line)
+        segment.file.write(b"".join(lines))
+        segment.index.write("".join(entries))
+        self._events_written.inc(len(events))
+
+    def _current(self, now: float) -> _Segment:
+        """Get the open segment, rotating it if it is too large or too old."""
+        segment: _Segment | None = self._segment
+        if segment is not None and (
+            segment.size >= self.max_bytes or now - segment.opened_at >= self.max_age
+        ):
+            self.rotate()
+            segment = None
+        if segment is None:
+            stamp: str = time.strftime("%Y%m%dT%H%M%S", time.gmtime(now))
+            name: str = f"events-{stamp}-{os.getpid()}-{next(self._sequence):06d}{SEGMENT_SUFFIX}"
+            segment = self._segment = _Segment(self.directory / name, self.buffer_size, now)
+        return segment
+
+    def flush(self) -> None:
+        """Write the buffered lines of the open segment to disk."""
+        if self._segment is not None:
+            self._segment.file.flush()
+            self._segment.index.flush()
+
+    def rotate(self) -> None:
+        """Close the open segment and compress it in the background."""
+        if (segment := self._segment) is None:
+            return
+        self._segment = None
+        segment.close()
+        logger.debug("Rotated %s at %d bytes.", segment.path, segment.size)
+        if self.compress:
+            future: concurrent.futures.Future[None] = self._compressor.submit(
+                _compress, segment.path
+            )
+            future.add_done_callback(self._compressed)
+
+    @staticmethod
+    def _compressed(future: concurrent.futures.Future[None]) -> None:
+        """Report a failed compression."""
+        if (error := future.exception()) is not None:
+            logger.error("Failed to compress a segment: %s", error)
+
+    def close(self) -> None:
+        """Close the open segment and wait for compression to finish."""
+        self.rotate()
+        self._compressor.shutdown(wait=True)
+
+    def segments(self) -> list[pathlib.Path]:
+        """Get the segment files, oldest first.
+
+        Returns:
+            The paths of the compressed and uncompressed segments.
+        """
+        paths: dict[str, pathlib.Path] = {
+            _segment_name(path): path for path in self.directory.glob(f"*{SEGMENT_SUFFIX}.gz")
+        }
+        # A segment being compressed keeps its original until the copy is complete.
+        paths.update((path.name, path) for path in self.directory.glob(f"*{SEGMENT_SUFFIX}"))
+        return [paths[name] for name in sorted(paths)]
+
+    def _index_path(self, segment: pathlib.Path) -> pathlib.Path:
+        """Get the path of a segment's index."""
+        return self.directory / f"{_segment_name(segment)}{INDEX_SUFFIX}"
+
+    def index(self, segment: pathlib.Path) -> list[IndexEntry]:
+        """Read the index of a segment.
+
+        Args:
+            segment: The segment file.
+
+        Returns:
+            The index entries, in file order.
+        """
+        index_path: pathlib.Path = self._index_path(segment)
+        entries: list[IndexEntry] = []
+        with index_path.open(encoding="utf-8") as index:
+            for line in index:
+                offset, received_at, event_id = line.rstrip("\n").split(" ", 2)
+                entries.append(IndexEntry(int(offset), float(received_at), event_id))
+        return entries
+
+    def find(self, event_id: str) -> Event | None:
+        """Find an event by ID, reading only the line it is on.
+
+        Args:
+            event_id: The event ID.
+
+        Returns:
+            The event, or None if it is not in the log.
+        """
+        self.flush()
+        for segment in reversed(self.segments()):
+            event_ids, offsets = self._lookup(segment)
+            position: int = bisect.bisect_left(event_ids, event_id)
+            if position < len(event_ids) and event_ids[position] == event_id:
+                with _open_segment(segment) as file:
+                    file.seek(offsets[position])
+                    return Event.model_validate_json(file.readline())
+        return None
+
+    def _lookup(self, segment: pathlib.Path) -> tuple[list[str], list[int]]:
+        """Get a segment's event IDs in sorted order, with the offset of each."""
+        name: str = _segment_name(segment)
+        size: int = self._index_path(segment).stat().st_size
+        cached: tuple[int, list[str], list[int]] | None = self._lookups.get(name)
+        if cached is None or cached[0] != size:
+            # Equal IDs keep file order, so the first line with an ID is found.
+            entries: list[IndexEntry] = sorted(self.index(segment), key=lambda e: e.event_id)
+            cached = (
+                size,
+                [entry.event_id for entry in entries],
+                [entry.offset for entry in entries],
+            )
+        self._lookups.pop(name, None)
+        self._lookups[name] = cached
+        if len(self._lookups) > JSONL_LOOKUP_SEGMENTS:
+            del self._lookups[next(iter(self._lookups))]
+        return cached[1], cached[2]
+
+    def replay(self, since: float = 0.0) -> Iterator[Event]:
+        """Read the events received at or after a time, oldest first.
+
+        Segments that end before ``since`` are skipped using their index, and
+        reading starts at the first matching line.
+
+        Args:
+            since: Earliest receive time, in seconds since the epoch.
+
+        Yields:
+            Each event.
+        """
+        self.flush()
+        for segment in self.segments():
+            entries: list[IndexEntry] = self.index(segment)
+            start: int = bisect.bisect_left(entries, since, key=lambda entry: entry.received_at)
+            if start == len(entries):
+                continue
+            with _open_segment(segment) as file:
+                file.seek(entries[start].offset)
+                for line in file:
+                    yield Event.model_validate_json(line)
@@ -0,0 +1,285 @@
+"""Columnar Parquet archive of events, rolled by hour and broadcaster."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import enum
+import functools
+import importlib
+import importlib.util
+import itertools
+import logging
+import os
+import pathlib
+import time
+import types
+import typing
+
+import pydantic
+
+from chaturbate_poller.constants import (
+    ARCHIVE_COMPRESSION,
+    ARCHIVE_FLUSH_INTERVAL,
+    ARCHIVE_FLUSH_ROWS,
+)
+from chaturbate_poller.metrics import Counter, registry
+from chaturbate_poller.models.event import Event
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+logger = logging.getLogger(__name__)
+
+DICTIONARY_COLUMNS: frozenset[str] = frozenset({
+    "method",
+    "user_username",
+    "user_recent_tips",
+    "user_gender",
+    "message_color",
+    "message_font",
+})
+"""frozenset[str]: Low-cardinality string columns stored dictionary-encoded."""
+
+PARTITION_COLUMNS: frozenset[str] = frozenset({"broadcaster"})
+"""frozenset[str]: Columns stored in the directory names instead of the files."""
+
+
+def pyarrow_available() -> bool:
+    """Check whether the optional PyArrow dependency is installed.
+
+    Returns:
+        True if the ``pyarrow`` package can be imported, False otherwise.
+    """
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+@functools.cache
+def _pyarrow() -> tuple[typing.Any, typing.Any]:
+    """Import PyArrow and its Parquet module once.
+
+    Raises:
+        ImportError: If PyArrow is not installed.
+    """
+    if not pyarrow_available():
+        msg = "The Parquet archive requires 'pyarrow'; install chaturbate-poller[parquet]."
+        raise ImportError(msg)
+    return importlib.import_module("pyarrow"), importlib.import_module("pyarrow.parquet")
+
+
+def _columns(
+    model: type[pydantic.BaseModel], prefix: str = "", *, nullable: bool = False
+) -> Iterator[tuple[str, type, bool]]:
+    """Walk a model's fields, flattening nested models into prefixed columns."""
+    for name, field in model.model_fields.items():
+        annotation: typing.Any = field.annotation
+        optional: bool = nullable
+        if isinstance(annotation, types.UnionType):
+            members = [member for member in typing.get_args(annotation) if member is not type(None)]
+            optional = optional or len(members) < len(typing.get_args(annotation))
+            annotation = members[0]
+        if isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel):
+            # The event payload is the whole record, so its fields are not prefixed.
+            nested: str = "" if model is Event else f"{prefix}{name}_"
+            yield from _columns(annotation, nested, nullable=optional)
+        else:
+            yield f"{prefix}{name}", annotation, optional
+
+
+def _arrow_type(column: str, annotation: type) -> typing.Any:  # noqa: ANN401
+    """Map a model field type to an Arrow type."""
+    pa, _ = _pyarrow()
+    if column in DICTIONARY_COLUMNS or issubclass(annotation, enum.Enum):
+        return pa.dictionary(pa.int32(), pa.string())
+    types_: dict[type, typing.Any] = {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        str: pa.string(),
+    }
+    return types_[annotation]
+
+
+@functools.cache
+def arrow_schema() -> typing.Any:  # noqa: ANN401
+    """Build the Arrow schema of archived events from the event models.
+
+    Nested models are flattened into ``<field>_<nested field>`` columns, and a
+    ``received_at`` timestamp column is added. The broadcaster is left out, as
+    it is part of the partition path.
+
+    Returns:
+        The ``pyarrow.Schema`` of the archive.
+    """
+    pa, _ = _pyarrow()
+    fields = [pa.field("received_at", pa.timestamp("ms", tz="UTC"), nullable=False)]
+    fields.extend(
+        pa.field(name, _arrow_type(name, annotation), nullable=optional)
+        for name, annotation, optional in _columns(Event)
+        if name not in PARTITION_COLUMNS
+    )
+    return pa.schema(fields)
+
+
+def _flatten(event: Event, received_at: float) -> dict[str, typing.Any]:
+    """Flatten an event into a row of archive columns."""
+    row: dict[str, typing.Any] = {
+        "received_at": datetime.datetime.fromtimestamp(received_at, tz=datetime.UTC),
+        "method": event.method.value,
+        "id": event.id,
+    }
+    for name, value in event.object:
+        if isinstance(value, pydantic.BaseModel):
+            for nested, nested_value in value:
+                row[f"{name}_{nested}"] = nested_value
+        else:
+            row[name] = value
+    return row
+
+
+@dataclasses.dataclass
+class _Partition:
+    """Rows buffered for one broadcaster and hour, and their open file."""
+
+    path: pathlib.Path
+    rows: list[dict[str, typing.Any]] = dataclasses.field(default_factory=list)
+    writer: typing.Any = None
+
+
+class ParquetArchive:
+    """Buffer events and write them to hourly Parquet files per broadcaster.
+
+    Files are laid out as ``broadcaster=<name>/hour=<YYYY-MM-DDTHH>/<part>.parquet``
+    so that ``pyarrow.dataset`` and most query engines read the partitions
+    directly. Each flush appends a compressed row group to the open file of
+    its hour, and closes the files of hours that have ended. :meth:`add`
+    only buffers; :meth:`due` tells when a flush is needed, which is once
+    ``flush_rows`` rows are buffered, rows have waited ``flush_interval``
+    seconds or a later hour has started. Not thread-safe.
+
+    Args:
+        directory: Root directory of the archive.
+        broadcaster: Broadcaster for events that do not name one.
+        flush_rows: Number of buffered rows that makes a flush due.
+        flush_interval: Seconds buffered rows may wait before a flush is due.
+        compression: Parquet compression codec.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        broadcaster: str = "",
+        *,
+        flush_rows: int = ARCHIVE_FLUSH_ROWS,
+        flush_interval: float = ARCHIVE_FLUSH_INTERVAL,
+        compression: str = ARCHIVE_COMPRESSION,
+    ) -> None:
+        """Initialize the archive; PyArrow is required."""
+        _pyarrow()
+        self.directory: pathlib.Path = pathlib.Path(directory)
+        self.broadcaster: str = broadcaster
+        self.flush_rows: int = flush_rows
+        self.flush_interval: float = flush_interval
+        self.compression: str = compression
+        self._partitions: dict[tuple[str, int], _Partition] = {}
+        self._part: str = f"{int(time.time())}-{os.getpid()}"
+        self._files: Iterator[int] = itertools.count()
+        self._buffered: int = 0
+        self._flushed_at: float = time.monotonic()
+        self._rows_written: Counter = registry.counter(
+            "archive_rows_written_total", "Events written to the Parquet archive."
+        )
+
+    @property
+    def buffered(self) -> int:
+        """Get the number of rows waiting to be written."""
+        return self._buffered
+
+    def add(self, events: Sequence[Event], received_at: float | None = None) -> None:
+        """Buffer a page of events.
+
+        Args:
+            events: The events to buffer.
+            received_at: Time the events were received; now if omitted.
+        """
+        received: float = time.time() if received_at is None else received_at
+        hour: int = int(received // 3600)
+        for event in events:
+            broadcaster: str = event.object.broadcaster or self.broadcaster
+            partition: _Partition | None = self._partitions.get((broadcaster, hour))
+            if partition is None:
+                partition = self._partitions[broadcaster, hour] = self._partition(broadcaster, hour)
+            partition.rows.append(_flatten(event, received))
+        self._buffered += len(events)
+
+    def due(self, now: float | None = None) -> bool:
+        """Check whether buffered rows should be written or a finished hour's file closed.
+
+        Args:
+            now: Current time in seconds since the epoch; hours before it count
+                as finished. Only the hours of buffered events count if omitted.
+
+        Returns:
+            True if :meth:`flush` has work to do.
+        """
+        if self._buffered >= self.flush_rows or (
+            self._buffered and time.monotonic() - self._flushed_at >= self.flush_interval
+        ):
+            return True
+        latest: int = self._latest_hour(now)
+        return any(hour < latest for _, hour in self._partitions)
+
+    def _latest_hour(self, now: float | None) -> int:
+        """Get the newest hour, from the buffered events and the current time if given."""
+        latest: int = max((hour for _, hour in self._partitions), default=0)
+        return latest if now is None else max(latest, int(now // 3600))
+
+    def _partition(self, broadcaster: str, hour: int) -> _Partition:
+        """Create the partition for a broadcaster and hour, with a file name of its own."""
+        start = datetime.datetime.fromtimestamp(hour * 3600, tz=datetime.UTC)
+        path: pathlib.Path = (
+            self.directory
+            / f"broadcaster={broadcaster or 'unknown'}"
+            / f"hour={start:%Y-%m-%dT%H}"
+            / f"{self._part}-{next(self._files)}.parquet"
+        )
+        return _Partition(path)
+
+    def flush(self, *, roll: bool = True, now: float | None = None) -> None:
+        """Write the buffered rows and close the files of past hours.
+
+        Args:
+            roll: Close the file of every hour older than the newest one.
+            now: Current time in seconds since the epoch, so that the file of
+                an hour that has ended is closed even if no later event arrived.
+        """
+        pa, pq = _pyarrow()
+        schema: typing.Any = arrow_schema()
+        latest: int = self._latest_hour(now)
+        for key, partition in list(self._partitions.items()):
+            if partition.rows:
+                if partition.writer is None:
+                    partition.path.parent.mkdir(parents=True, exist_ok=True)
+                    partition.writer = pq.ParquetWriter(
+                        partition.path, schema, compression=self.compression
+                    )
+                partition.writer.write_table(pa.Table.from_pylist(partition.rows, schema=schema))
+                self._rows_written.inc(len(partition.rows))
+                partition.rows = []
+            if roll and key[1] < latest:
+                self._close(key)
+        self._buffered = 0
+        self._flushed_at = time.monotonic()
+
+    def _close(self, key: tuple[str, int]) -> None:
+        """Close and forget the file of a partition."""
+        partition: _Partition = self._partitions.pop(key)
+        if partition.writer is not None:
+            partition.writer.close()
+            logger.debug("Closed archive file %s.", partition.path)
+
+    def close(self) -> None:
+        """Write the buffered rows and close every open file."""
+        self.flush(roll=False)
+        for key in list(self._partitions):
+            self._close(key)
@@ -0,0 +1,392 @@
+"""Local SQLite storage for events, written from a dedicated thread."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import typing
+
+from chaturbate_poller.constants import HEALTH_SINK_GAUGE, SQLITE_QUEUE_SIZE
+from chaturbate_poller.metrics import Counter, Gauge, registry
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from chaturbate_poller.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    event_id TEXT NOT NULL,
+    received_at REAL NOT NULL,
+    method TEXT NOT NULL,
+    broadcaster TEXT,
+    user_id INTEGER REFERENCES users (id),
+    in_fanclub INTEGER,
+    has_tokens INTEGER,
+    is_mod INTEGER,
+    recent_tips TEXT,
+    gender TEXT,
+    subgender TEXT
+);
+CREATE INDEX IF NOT EXISTS events_received_at ON events (received_at);
+CREATE INDEX IF NOT EXISTS events_method ON events (method, received_at);
+CREATE INDEX IF NOT EXISTS events_user ON events (user_id, received_at);
+CREATE TABLE IF NOT EXISTS tips (
+    event_id INTEGER PRIMARY KEY REFERENCES events (id),
+    tokens INTEGER NOT NULL,
+    is_anon INTEGER NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS messages (
+    event_id INTEGER PRIMARY KEY REFERENCES events (id),
+    message TEXT NOT NULL,
+    color TEXT,
+    bg_color TEXT,
+    font TEXT,
+    from_user TEXT,
+    to_user TEXT
+);
+CREATE TABLE IF NOT EXISTS media_purchases (
+    event_id INTEGER PRIMARY KEY REFERENCES events (id),
+    media_id INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    tokens INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS room_subjects (
+    event_id INTEGER PRIMARY KEY REFERENCES events (id),
+    subject TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tip_totals (
+    user_id INTEGER PRIMARY KEY REFERENCES users (id),
+    tokens INTEGER NOT NULL,
+    tips INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tip_totals_tokens ON tip_totals (tokens);
+CREATE TABLE IF NOT EXISTS hourly_events (
+    hour INTEGER NOT NULL,
+    method TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (hour, method)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS events_hourly AFTER INSERT ON events BEGIN
+    INSERT INTO hourly_events (hour, method, count)
+    VALUES (CAST(NEW.received_at / 3600 AS INTEGER) * 3600, NEW.method, 1)
+    ON CONFLICT (hour, method) DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS tips_total AFTER INSERT ON tips BEGIN
+    INSERT INTO tip_totals (user_id, tokens, tips)
+    SELECT user_id, NEW.tokens, 1 FROM events WHERE id = NEW.event_id AND user_id IS NOT NULL
+    ON CONFLICT (user_id) DO UPDATE SET tokens = tokens + excluded.tokens, tips = tips + 1;
+END;
+"""
+"""str: Tables, indexes and rollup triggers, one table per kind of event payload.
+
+``tip_totals`` and ``hourly_events`` are maintained by triggers in the same
+transaction as the inserts, so the common queries read a few rows instead of
+scanning every event.
+"""
+
+type _Page = tuple[float, Sequence[Event]]
+
+
+class SQLiteStore:
+    """Store events in a SQLite database in WAL mode.
+
+    Pages of events are queued and written by a single background thread,
+    which groups every page waiting in the queue into one transaction of
+    ``executemany`` inserts. Queries use a separate connection, so WAL lets
+    them run while the writer commits. A page that fails to write is
+    dropped; if the writer itself fails, the store is closed and the queued
+    pages are dropped, so nothing waits on a writer that is gone. Failures
+    set the ``sink_failing`` gauge and the queue length is exported as
+    ``sqlite_queue_depth``, so both show in the readiness check.
+
+    Args:
+        path: Path of the database file.
+        queue_size: Number of pages that may wait for the writer.
+    """
+
+    def __init__(self, path: str, queue_size: int = SQLITE_QUEUE_SIZE) -> None:
+        """Create the schema and start the writer thread."""
+        self.path: str = path
+        self._queue: queue.Queue[_Page | None] = queue.Queue(maxsize=queue_size)
+        self._writer: sqlite3.Connection = self._connect(check_same_thread=False)
+        self._writer.executescript(SCHEMA)
+        self._reader: sqlite3.Connection = self._connect(check_same_thread=False)
+        self._read_lock: threading.Lock = threading.Lock()
+        self._user_ids: dict[str, int] = dict(
+            self._writer.execute("SELECT username, id FROM users").fetchall()
+        )
+        self._written: Counter = registry.counter(
+            "sqlite_events_written_total", "Events committed to SQLite."
+        )
+        self._dropped: Counter = registry.counter(
+            "sqlite_events_dropped_total", "Events that failed to be written to SQLite."
+        )
+        self._failing: Gauge = registry.gauge(
+            HEALTH_SINK_GAUGE, "1 while the last write to a sink failed.", sink="sqlite"
+        )
+        self._depth: Gauge = registry.gauge(
+            "sqlite_queue_depth", "Pages waiting for the SQLite writer."
+        )
+        self._closed: bool = False
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run, name="sqlite-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _connect(self, *, check_same_thread: bool) -> sqlite3.Connection:
+        """Open a connection in WAL mode."""
+        connection = sqlite3.connect(
+            self.path, check_same_thread=check_same_thread, isolation_level=None
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        return connection
+
+    def submit(
+        self, events: Sequence[Event], received_at: float | None = None, *, block: bool = True
+    ) -> None:
+        """Queue a page of events for the writer.
+
+        Args:
+            events: The events to write.
+            received_at: Time the events were received; now if omitted.
+            block: Wait for room in the queue instead of raising.
+
+        Raises:
+            queue.Full: If the queue is full and ``block`` is False.
+            RuntimeError: If the store has been closed; the events are counted as dropped.
+        """
+        if self._closed:
+            self._dropped.inc(len(events))
+            msg = f"SQLite store {self.path!r} has been closed."
+            raise RuntimeError(msg)
+        if events:
+            page: _Page = (time.time() if received_at is None else received_at, events)
+            self._queue.put(page, block=block)
+            self._depth.set(self._queue.qsize())
+
+    def flush(self) -> None:
+        """Wait until every queued page has been written."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write the queued pages, stop the writer and close the database."""
+        self._closed = True
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._writer.close()
+        with self._read_lock:
+            self._reader.close()
+
+    def _run(self) -> None:
+        """Write queued pages until the stop sentinel arrives."""
+        while True:
+            pages: list[_Page] = []
+            item: _Page | None = self._queue.get()
+            stop: bool = item is None
+            if item is not None:
+                pages.append(item)
+            # Group commit: everything already waiting goes into this transaction.
+            while not stop:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                else:
+                    pages.append(item)
+            self._depth.set(self._queue.qsize())
+            try:
+                if pages:
+                    self._write(pages)
+            except Exception:
+                logger.exception("SQLite writer failed; closing the store.")
+                self._closed = True
+                self._failing.set(1)
+                self._dropped.inc(sum(len(page) for _, page in pages))
+                self._discard_queued()
+                return
+            finally:
+                for _ in range(len(pages) + stop):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _discard_queued(self) -> None:
+        """Drop every page still waiting for the writer."""
+        while True:
+            try:
+                item: _Page | None = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None:
+                self._dropped.inc(len(item[1]))
+            self._queue.task_done()
+
+    def _user_id(self, username: str) -> int:
+        """Get the ID of a user, inserting the user if needed."""
+        user_id: int | None = self._user_ids.get(username)
+        if user_id is None:
+            row: tuple[int] | None = self._writer.execute(
+                (
+                    "INSERT INTO users (username) VALUES (?) "
+                    "ON CONFLICT (username) DO UPDATE SET username = excluded.username RETURNING id"
+                ),
+                (username,),
+            ).fetchone()
+            if row is None:
+                msg = f"No ID was returned for user {username!r}."
+                raise sqlite3.IntegrityError(msg)
+            user_id = self._user_ids[username] = row[0]
+        return user_id
+
+    def _write(self, pages: list[_Page]) -> None:
+        """Insert pages of events in a single transaction."""
+        events: list[tuple[typing.Any, ...]] = []
+        tips: list[tuple[typing.Any, ...]] = []
+        messages: list[tuple[typing.Any, ...]] = []
+        media: list[tuple[typing.Any, ...]] = []
+        subjects: list[tuple[int, str]] = []
+        try:
+            self._writer.execute("BEGIN IMMEDIATE")
+            # Read under the write lock, as another store may write to the same file.
+            next_id: int = self._writer.execute(
+                "SELECT COALESCE(MAX(id), 0) + 1 FROM events"
+            ).fetchone()[0]
+            for received_at, page in pages:
+                for event in page:
+                    row_id: int = next_id
+                    next_id += 1
+                    data = event.object
+                    user = data.user
+                    events.append((
+                        row_id,
+                        event.id,
+                        received_at,
+                        event.method.value,
+                        data.broadcaster,
+                        *(
+                            (
+                                self._user_id(user.username),
+                                user.in_fanclub,
+                                user.has_tokens,
+                                user.is_mod,
+                                user.recent_tips,
+                                user.gender,
+                                user.subgender,
+                            )
+                            if user is not None
+                            else (None,) * 7
+                        ),
+                    ))
+                    if (tip := data.tip) is not None:
+                        tips.append((row_id, tip.tokens, tip.is_anon, tip.message))
+                    if (message := data.message) is not None:
+                        messages.append((
+                            row_id,
+                            message.message,
+                            message.color,
+                            message.bg_color,
+                            message.font,
+                            message.from_user,
+                            message.to_user,
+                        ))
+                    if (purchase := data.media) is not None:
+                        media.append((
+                            row_id,
+                            purchase.id,
+                            purchase.type,
+                            purchase.name,
+                            purchase.tokens,
+                        ))
+                    if data.subject is not None:
+                        subjects.append((row_id, data.subject))
+            self._writer.executemany(
+                "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", events
+            )
+            self._writer.executemany("INSERT INTO tips VALUES (?, ?, ?, ?)", tips)
+            self._writer.executemany("INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?, ?)", messages)
+            self._writer.executemany("INSERT INTO media_purchases VALUES (?, ?, ?, ?, ?)", media)
+            self._writer.executemany("INSERT INTO room_subjects VALUES (?, ?)", subjects)
+            self._writer.execute("COMMIT")
+        except Exception:
+            if self._writer.in_transaction:
+                self._writer.execute("ROLLBACK")
+            # Users inserted in the rolled back transaction no longer exist.
+            self._user_ids = dict(self._writer.execute("SELECT username, id FROM users").fetchall())
+            self._dropped.inc(sum(len(page) for _, page in pages))
+            self._failing.set(1)
+            logger.exception("Failed to write %d event(s) to SQLite.", len(events))
+            return
+        self._failing.set(0)
+        self._written.inc(len(events))
+
+    def _query(self, sql: str, parameters: Sequence[typing.Any] = ()) -> list[typing.Any]:
+        """Run a read-only query on the reader connection."""
+        with self._read_lock:
+            return self._reader.execute(sql, parameters).fetchall()
+
+    def top_tippers(self, limit: int = 10) -> list[tuple[str, int, int]]:
+        """Get the users who tipped the most tokens.
+
+        Args:
+            limit: The number of users to return.
+
+        Returns:
+            Tuples of username, tokens tipped and number of tips, highest first.
+        """
+        return self._query(
+            (
+                "SELECT users.username, tip_totals.tokens, tip_totals.tips FROM tip_totals "
+                "JOIN users ON users.id = tip_totals.user_id "
+                "ORDER BY tip_totals.tokens DESC LIMIT ?"
+            ),
+            (limit,),
+        )
+
+    def events_per_hour(
+        self, since: float = 0.0, until: float | None = None, method: str | None = None
+    ) -> list[tuple[int, int]]:
+        """Count the events received in each hour.
+
+        Args:
+            since: Start of the range, in seconds since the epoch.
+            until: End of the range, in seconds since the epoch; now if omitted.
+            method: Count only events of this method.
+
+        Returns:
+            Tuples of the hour start, in seconds since the epoch, and the event count.
+        """
+        sql: str = "SELECT hour, SUM(count) FROM hourly_events WHERE hour >= ? AND hour < ?"
+        parameters: list[typing.Any] = [
+            int(since // 3600 * 3600),
+            time.time() if until is None else until,
+        ]
+        if method is not None:
+            sql += " AND method = ?"
+            parameters.append(method)
+        return self._query(f"{sql} GROUP BY hour ORDER BY hour", parameters)
+
+    def count(self) -> int:
+        """Get the number of stored events.
+
+        Returns:
+            The number of events.
+        """
+        return int(self._query("SELECT COUNT(*) FROM events")[0][0])
@@ -38,3 +38,9 @@ class ClientProcessingError(PollingError):
     """Exception raised if an error occurs during processing."""
 
     default_message: str = "Error processing request."
+
+
+class ShutdownTimeoutError(PollingError):
+    """Exception raised when pending work is not flushed before the shutdown deadline."""
+
+    default_message: str = "Shutdown deadline exceeded before pending work was flushed."
@@ -0,0 +1,211 @@
+"""Blocking event handlers run on a shared, bounded thread pool."""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import logging
+import typing
+
+from chaturbate_poller.constants import (
+    BLOCKING_HANDLER_CONCURRENCY,
+    BLOCKING_HANDLER_QUEUE_SIZE,
+    BLOCKING_POOL_WORKERS,
+)
+from chaturbate_poller.handlers.event_handler import EventHandler
+from chaturbate_poller.metrics import Counter, Gauge, registry
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from chaturbate_poller.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+
+class BlockingPool:
+    """Bounded thread pool running the work of blocking handlers.
+
+    Its saturation, the calls submitted per worker thread, is exported as
+    the ``blocking_pool_saturation`` gauge; above 1, calls are waiting for a
+    free thread.
+
+    Args:
+        max_workers: Number of threads in the pool.
+
+    Raises:
+        ValueError: If the number of threads is not positive.
+    """
+
+    def __init__(self, max_workers: int = BLOCKING_POOL_WORKERS) -> None:
+        """Initialize the pool; threads are started as calls arrive."""
+        if max_workers < 1:
+            msg = "Blocking pool size must be a positive integer."
+            raise ValueError(msg)
+        self.max_workers: int = max_workers
+        self._executor: concurrent.futures.ThreadPoolExecutor = (
+            concurrent.futures.ThreadPoolExecutor(max_workers, thread_name_prefix="blocking")
+        )
+        self._submitted: int = 0
+        self._in_flight: Gauge = registry.gauge(
+            "blocking_pool_calls", "Blocking handler calls submitted and not yet finished."
+        )
+        self._saturation: Gauge = registry.gauge(
+            "blocking_pool_saturation", "Blocking handler calls per pool thread."
+        )
+
+    @property
+    def submitted(self) -> int:
+        """Get the number of calls submitted and not yet finished."""
+        return self._submitted
+
+    async def run[T](self, function: Callable[..., T], *args: object) -> T:
+        """Run a blocking function on the pool and wait for its result.
+
+        Args:
+            function: The function to run.
+            *args: Positional arguments for the function.
+
+        Returns:
+            The result of the function.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self._update(1)
+        try:
+            return await loop.run_in_executor(self._executor, functools.partial(function, *args))
+        finally:
+            self._update(-1)
+
+    def _update(self, change: int) -> None:
+        """Track a submitted or finished call in the gauges."""
+        self._submitted += change
+        self._in_flight.set(self._submitted)
+        self._saturation.set(self._submitted / self.max_workers)
+
+
+@functools.cache
+def shared_blocking_pool() -> BlockingPool:
+    """Get the process-wide pool for blocking handlers.
+
+    Returns:
+        The shared blocking pool.
+    """
+    return BlockingPool()
+
+
+class BlockingEventHandler(EventHandler, abc.ABC):
+    """Base class for handlers whose work blocks, such as synchronous SDK calls.
+
+    Subclasses implement the synchronous :meth:`process`, and optionally
+    :meth:`process_batch` and :meth:`shutdown`. Pages are queued per handler
+    and processed on a thread pool by at most ``concurrency`` calls at a
+    time, so polling only waits when the queue is full. With a concurrency
+    above one, pages may be processed out of order. Errors are logged and
+    counted instead of being raised to polling.
+
+    Args:
+        concurrency: Pages processed at the same time.
+        queue_size: Pages queued before :meth:`handle_batch` waits.
+        pool: The thread pool; the shared one by default.
+
+    Raises:
+        ValueError: If the concurrency or queue size is not positive.
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = BLOCKING_HANDLER_CONCURRENCY,
+        queue_size: int = BLOCKING_HANDLER_QUEUE_SIZE,
+        pool: BlockingPool | None = None,
+    ) -> None:
+        """Initialize the handler; its workers start with the first page."""
+        if concurrency < 1 or queue_size < 1:
+            msg = "Blocking handler concurrency and queue size must be positive integers."
+            raise ValueError(msg)
+        self.concurrency: int = concurrency
+        self.pool: BlockingPool = pool or shared_blocking_pool()
+        self._queue: asyncio.Queue[Sequence[Event]] = asyncio.Queue(queue_size)
+        self._workers: list[asyncio.Task[None]] = []
+        name: str = type(self).__name__
+        self._depth: Gauge = registry.gauge(
+            "blocking_handler_queue_depth", "Pages queued for a blocking handler.", handler=name
+        )
+        self._full: Counter = registry.counter(
+            "blocking_handler_queue_full_total",
+            "Times polling waited for a blocking handler's queue.",
+            handler=name,
+        )
+        self._errors: Counter = registry.counter(
+            "blocking_handler_errors_total", "Pages a blocking handler failed on.", handler=name
+        )
+
+    @abc.abstractmethod
+    def process(self, event: Event) -> None:
+        """Handle an event; runs on a pool thread.
+
+        Args:
+            event: The event to be handled.
+        """
+
+    def process_batch(self, events: Sequence[Event]) -> None:
+        """Handle a page of events; runs on a pool thread.
+
+        The default handles each event in order with :meth:`process`.
+
+        Args:
+            events: The events to be handled, in order.
+        """
+        for event in events:
+            self.process(event)
+
+    def shutdown(self) -> None:
+        """Release resources after the queue is drained; runs on a pool thread."""
+
+    async def handle_event(self, event: Event) -> None:
+        """Queue an event for the pool.
+
+        Args:
+            event: The event to be handled.
+        """
+        await self.handle_batch([event])
+
+    async def handle_batch(self, events: Sequence[Event]) -> None:
+        """Queue a page of events for the pool, waiting only while the queue is full.
+
+        Args:
+            events: The events to be handled.
+        """
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._work()) for _ in range(self.concurrency)]
+        if self._queue.full():
+            self._full.inc()
+        await self._queue.put(events)
+        self._depth.set(self._queue.qsize())
+
+    async def close(self) -> None:
+        """Process the queued pages, stop the workers and call :meth:`shutdown`."""
+        if self._workers:
+            await self._queue.join()
+            for worker in self._workers:
+                worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await asyncio.gather(*self._workers)
+            self._workers = []
+        await self.pool.run(self.shutdown)
+
+    async def _work(self) -> None:
+        """Process queued pages on the pool."""
+        while True:
+            events: Sequence[Event] = await self._queue.get()
+            self._depth.set(self._queue.qsize())
+            try:
+                await self.pool.run(self.process_batch, events)
+            except Exception:
+                self._errors.inc()
+                logger.exception("%s failed on %d event(s).", type(self).__name__, len(events))
+            finally:
+                self._queue.task_done()
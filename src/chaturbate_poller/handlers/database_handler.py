@@ -8,6 +8,8 @@ import typing
 from chaturbate_poller.handlers.event_handler import EventHandler
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from chaturbate_poller.database.influxdb_handler import InfluxDBHandler
     from chaturbate_poller.models.event import Event
 
@@ -31,3 +33,25 @@ class DatabaseEventHandler(EventHandler):  # pylint: disable=too-few-public-meth
         await self.influxdb_handler.write_event(
             measurement="chaturbate_events", data=event.model_dump()
         )
+
+    async def handle_batch(self, events: Sequence[Event]) -> None:
+        """Handle a page of events with a single write to the database.
+
+        Each point carries its own timestamp, so points of the same page do
+        not overwrite each other.
+
+        Args:
+            events: The events to be handled.
+        """
+        if not events:
+            return
+        logger.debug("Handling %d events for database.", len(events))
+        lines: list[str] = [
+            self.influxdb_handler.encode_event(
+                "chaturbate_events",
+                event.model_dump(),
+                timestamp=self.influxdb_handler.next_timestamp(),
+            )
+            for event in events
+        ]
+        await self.influxdb_handler.write_line_protocol("\n".join(lines))
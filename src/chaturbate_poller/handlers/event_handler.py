@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from chaturbate_poller.models.event import Event
 
 
@@ -19,3 +21,22 @@ class EventHandler(ABC):  # pylint: disable=too-few-public-methods
         Args:
             event (Event): The event to be handled.
         """
+
+    async def handle_batch(self, events: Sequence[Event]) -> None:
+        """Handle a page of events.
+
+        Polling calls this once per page. The default handles each event in
+        order with :meth:`handle_event`; handlers that can process a page at
+        once override it.
+
+        Args:
+            events (Sequence[Event]): The events to be handled, in order.
+        """
+        for event in events:
+            await self.handle_event(event)
+
+    async def close(self) -> None:  # noqa: B027
+        """Flush any buffered work before shutdown.
+
+        Handlers that buffer events override this; the default does nothing.
+        """
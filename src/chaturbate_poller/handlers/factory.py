@@ -5,11 +5,27 @@ from __future__ import annotations
 from enum import Enum
 from typing import TYPE_CHECKING
 
+from chaturbate_poller.config.manager import get_config
+from chaturbate_poller.constants import (
+    ARCHIVE_DEFAULT_DIR,
+    JSONL_DEFAULT_DIR,
+    SQLITE_DEFAULT_PATH,
+    WEBHOOK_DEAD_LETTER_PATH,
+)
+from chaturbate_poller.core.webhooks import WebhookDestination, WebhookDispatcher
 from chaturbate_poller.database.influxdb_handler import InfluxDBHandler
+from chaturbate_poller.database.jsonl_log import JSONLEventLog
+from chaturbate_poller.database.parquet_archive import ParquetArchive
+from chaturbate_poller.database.sqlite_store import SQLiteStore
 from chaturbate_poller.handlers.database_handler import DatabaseEventHandler
+from chaturbate_poller.handlers.jsonl_handler import JSONLEventHandler
 from chaturbate_poller.handlers.logging_handler import LoggingEventHandler
+from chaturbate_poller.handlers.parquet_handler import ParquetEventHandler
+from chaturbate_poller.handlers.sqlite_handler import SQLiteEventHandler
+from chaturbate_poller.utils.format_messages import MessageFormatter, load_templates
 
 if TYPE_CHECKING:
+    from chaturbate_poller.config.manager import ConfigManager
     from chaturbate_poller.handlers.event_handler import EventHandler
 
 
@@ -17,20 +33,74 @@ class HandlerType(str, Enum):
     """Available event handler types."""
 
     DATABASE = "database"
+    JSONL = "jsonl"
     LOGGING = "logging"
+    PARQUET = "parquet"
+    SQLITE = "sqlite"
 
 
-def create_event_handler(handler_type: HandlerType) -> EventHandler:
+def create_event_handler(
+    handler_type: HandlerType, config: ConfigManager | None = None
+) -> EventHandler:
     """Create an event handler.
 
     Args:
         handler_type: The type of event handler to create.
+        config: Configuration for the handler; defaults to the shared snapshot.
 
     Returns:
         The appropriate event handler based on the type.
     """
     match handler_type:
         case HandlerType.DATABASE:
-            return DatabaseEventHandler(InfluxDBHandler())
+            return DatabaseEventHandler(InfluxDBHandler(config))
         case HandlerType.LOGGING:
-            return LoggingEventHandler()
+            config = config or get_config()
+            templates: str | None = config.get("MESSAGE_TEMPLATES")
+            if not templates:
+                return LoggingEventHandler()
+            return LoggingEventHandler(MessageFormatter(load_templates(templates)))
+        case HandlerType.SQLITE:
+            config = config or get_config()
+            return SQLiteEventHandler(SQLiteStore(config.get("SQLITE_PATH") or SQLITE_DEFAULT_PATH))
+        case HandlerType.PARQUET:
+            config = config or get_config()
+            archive = ParquetArchive(
+                config.get("ARCHIVE_DIR") or ARCHIVE_DEFAULT_DIR,
+                broadcaster=config.get("CB_USERNAME") or "",
+            )
+            return ParquetEventHandler(archive)
+        case HandlerType.JSONL:
+            config = config or get_config()
+            return JSONLEventHandler(JSONLEventLog(config.get("JSONL_DIR") or JSONL_DEFAULT_DIR))
+
+
+def create_webhook_dispatcher(config: ConfigManager | None = None) -> WebhookDispatcher | None:
+    """Create the webhook dispatcher described by the configuration.
+
+    ``WEBHOOK_URLS`` is a comma-separated list of URLs. ``WEBHOOK_SECRET``
+    signs the requests, ``WEBHOOK_METHODS`` limits them to a comma-separated
+    list of event methods and ``WEBHOOK_DEAD_LETTER`` names the dead-letter file.
+
+    Args:
+        config: Configuration to read; defaults to the shared snapshot.
+
+    Returns:
+        The dispatcher, or None if no webhook URL is configured.
+    """
+    config = config or get_config()
+    urls: list[str] = [url.strip() for url in (config.get("WEBHOOK_URLS") or "").split(",")]
+    if not any(urls):
+        return None
+    methods: frozenset[str] = frozenset(
+        method.strip() for method in (config.get("WEBHOOK_METHODS") or "").split(",")
+    ) - {""}
+    destinations: list[WebhookDestination] = [
+        WebhookDestination(url, config.get("WEBHOOK_SECRET") or None, methods or None)
+        for url in urls
+        if url
+    ]
+    return WebhookDispatcher(
+        destinations,
+        dead_letter_path=config.get("WEBHOOK_DEAD_LETTER") or WEBHOOK_DEAD_LETTER_PATH,
+    )
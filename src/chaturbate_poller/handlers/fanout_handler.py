@@ -0,0 +1,55 @@
+"""Fan-out event handler implementation."""
+
+from __future__ import annotations
+
+import logging
+import typing
+
+from chaturbate_poller.handlers.event_handler import EventHandler
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from chaturbate_poller.models.event import Event
+    from chaturbate_poller.server.fanout import FanoutServer
+
+logger = logging.getLogger(__name__)
+
+
+class FanoutEventHandler(EventHandler):
+    """Event handler publishing events to a fan-out server, then to another handler.
+
+    The server outlives the handler, so that subscribers stay connected while
+    the handlers are rebuilt on a configuration reload.
+
+    Args:
+        server: The fan-out server to publish to.
+        handler: The handler that receives the events afterwards.
+    """
+
+    def __init__(self, server: FanoutServer, handler: EventHandler) -> None:
+        """Initialize the fan-out event handler."""
+        self.server: FanoutServer = server
+        self.handler: EventHandler = handler
+
+    async def handle_event(self, event: Event) -> None:
+        """Handle an event by publishing it and passing it on.
+
+        Args:
+            event: The event to be handled.
+        """
+        await self.handle_batch([event])
+
+    async def handle_batch(self, events: Sequence[Event]) -> None:
+        """Handle a page of events by publishing it and passing it on.
+
+        Args:
+            events: The events to be handled.
+        """
+        logger.debug("Publishing %d events to fan-out subscribers.", len(events))
+        self.server.publish(events)
+        await self.handler.handle_batch(events)
+
+    async def close(self) -> None:
+        """Close the wrapped handler, leaving the server running."""
+        await self.handler.close()
@@ -0,0 +1,65 @@
+"""JSON Lines event log handler implementation."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing
+
+from chaturbate_poller.constants import HEALTH_SINK_GAUGE
+from chaturbate_poller.handlers.event_handler import EventHandler
+from chaturbate_poller.metrics import Gauge, registry
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from chaturbate_poller.database.jsonl_log import JSONLEventLog
+    from chaturbate_poller.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+
+class JSONLEventHandler(EventHandler):
+    """Event handler for appending events to a JSON Lines log.
+
+    Writes run in a worker thread, one at a time, so serialization and
+    disk writes never block the event loop. A failed write is logged and
+    sets the ``sink_failing`` gauge instead of stopping polling.
+    """
+
+    def __init__(self, log: JSONLEventLog) -> None:
+        """Initialize the JSONL event handler."""
+        self.log: JSONLEventLog = log
+        self._writing: asyncio.Lock = asyncio.Lock()
+        self._failing: Gauge = registry.gauge(
+            HEALTH_SINK_GAUGE, "1 while the last write to a sink failed.", sink="jsonl"
+        )
+
+    async def handle_event(self, event: Event) -> None:
+        """Handle an event by appending it to the log.
+
+        Args:
+            event: The event to be handled.
+        """
+        await self.handle_batch([event])
+
+    async def handle_batch(self, events: Sequence[Event]) -> None:
+        """Handle a page of events by appending it to the log's write buffer.
+
+        Args:
+            events: The events to be handled.
+        """
+        logger.debug("Appending %d events to the JSONL log.", len(events))
+        async with self._writing:
+            try:
+                await asyncio.to_thread(self.log.write, events)
+            except Exception:
+                self._failing.set(1)
+                logger.exception("Failed to append %d events to the JSONL log.", len(events))
+            else:
+                self._failing.set(0)
+
+    async def close(self) -> None:
+        """Close the log and wait for the last segment to be compressed."""
+        async with self._writing:
+            await asyncio.to_thread(self.log.close)
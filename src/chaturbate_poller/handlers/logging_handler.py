@@ -6,17 +6,28 @@ import logging
 import typing
 
 from chaturbate_poller.handlers.event_handler import EventHandler
-from chaturbate_poller.utils.format_messages import format_message
+from chaturbate_poller.utils.format_messages import DEFAULT_FORMATTER
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from chaturbate_poller.models.event import Event
+    from chaturbate_poller.utils.format_messages import MessageFormatter
 
 logger: logging.Logger = logging.getLogger(name=__name__)
 """logging.Logger: The module-level logger."""
 
 
 class LoggingEventHandler(EventHandler):  # pylint: disable=too-few-public-methods
-    """Event handler for logging events."""
+    """Event handler for logging events.
+
+    Args:
+        formatter: Formats events into messages; the built-in templates by default.
+    """
+
+    def __init__(self, formatter: MessageFormatter | None = None) -> None:
+        """Initialize the handler."""
+        self.formatter: MessageFormatter = formatter or DEFAULT_FORMATTER
 
     async def handle_event(self, event: Event) -> None:
         """Handle an event by logging it.
@@ -25,5 +36,17 @@ class LoggingEventHandler(EventHandler):  # pylint: disable=too-few-public-metho
             event: The event to be handled.
         """
         logger.debug("Handling event for logging: %s", event.method)
-        if message := format_message(event):
+        if message := self.formatter.format(event):
+            logger.info(message)
+
+    async def handle_batch(self, events: Sequence[Event]) -> None:
+        """Handle a page of events, formatting them only if INFO is enabled.
+
+        Args:
+            events: The events to be handled.
+        """
+        logger.debug("Handling %d events for logging.", len(events))
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        for message in self.formatter.format_many(events):
             logger.info(message)
@@ -0,0 +1,51 @@
+"""Loop-monitored event handler implementation."""
+
+from __future__ import annotations
+
+import typing
+
+from chaturbate_poller.handlers.event_handler import EventHandler
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from chaturbate_poller.core.loop_monitor import LoopMonitor
+    from chaturbate_poller.models.event import Event
+
+
+class MonitoredEventHandler(EventHandler):
+    """Event handler naming the calls of another handler to the loop monitor.
+
+    Args:
+        monitor: Reports slow calls and calls that block the loop.
+        handler: The handler whose calls are tracked.
+    """
+
+    def __init__(self, monitor: LoopMonitor, handler: EventHandler) -> None:
+        """Initialize the monitored event handler."""
+        self.monitor: LoopMonitor = monitor
+        self.handler: EventHandler = handler
+        self.name: str = type(handler).__name__
+
+    async def handle_event(self, event: Event) -> None:
+        """Handle an event with the wrapped handler.
+
+        Args:
+            event: The event to be handled.
+        """
+        with self.monitor.track(f"{self.name}.handle_event"):
+            await self.handler.handle_event(event)
+
+    async def handle_batch(self, events: Sequence[Event]) -> None:
+        """Handle a page of events with the wrapped handler.
+
+        Args:
+            events: The events to be handled.
+        """
+        with self.monitor.track(f"{self.name}.handle_batch"):
+            await self.handler.handle_batch(events)
+
+    async def close(self) -> None:
+        """Close the wrapped handler."""
+        with self.monitor.track(f"{self.name}.close"):
+            await self.handler.close()
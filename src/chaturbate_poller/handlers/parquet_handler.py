@@ -0,0 +1,111 @@
+"""Parquet archive event handler implementation."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+import typing
+
+from chaturbate_poller.constants import HEALTH_SINK_GAUGE, MEMORY_ARCHIVE_ROW_BYTES
+from chaturbate_poller.core.memory import shared_memory_budget
+from chaturbate_poller.handlers.event_handler import EventHandler
+from chaturbate_poller.metrics import Gauge, registry
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from chaturbate_poller.database.parquet_archive import ParquetArchive
+    from chaturbate_poller.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+
+class ParquetEventHandler(EventHandler):
+    """Event handler for archiving events to Parquet files.
+
+    The buffer is written in a worker thread whenever the archive says a
+    flush is due, checked with every page and every ``flush_interval``
+    seconds, so a quiet room neither holds events in memory for long nor
+    leaves the file of a finished hour without its footer. Under memory
+    pressure, the buffer is written with the next page. A failed write is
+    logged and sets the ``sink_failing`` gauge; its rows stay buffered for
+    the next flush.
+    """
+
+    def __init__(self, archive: ParquetArchive) -> None:
+        """Initialize the Parquet event handler."""
+        self.archive: ParquetArchive = archive
+        self._spill: bool = False
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._flusher: asyncio.Task[None] | None = None
+        self._failing: Gauge = registry.gauge(
+            HEALTH_SINK_GAUGE, "1 while the last write to a sink failed.", sink="parquet"
+        )
+        shared_memory_budget().register("parquet_archive", self)
+
+    def memory_usage(self) -> int:
+        """Estimate the bytes held by the buffered rows.
+
+        Returns:
+            The estimated size of the buffer.
+        """
+        return self.archive.buffered * MEMORY_ARCHIVE_ROW_BYTES
+
+    def shed_memory(self) -> None:
+        """Write the buffer to disk with the next page."""
+        self._spill = True
+
+    async def handle_event(self, event: Event) -> None:
+        """Handle an event by buffering it in the archive.
+
+        Args:
+            event: The event to be handled.
+        """
+        await self.handle_batch([event])
+
+    async def handle_batch(self, events: Sequence[Event]) -> None:
+        """Handle a page of events, writing the buffer in a thread once a flush is due.
+
+        Args:
+            events: The events to be handled.
+        """
+        logger.debug("Archiving %d events.", len(events))
+        async with self._lock:
+            self.archive.add(events)
+            now: float = time.time()
+            if self._spill or self.archive.due(now):
+                self._spill = False
+                await self._flush(now)
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        """Flush the archive when it is due, even while no events arrive."""
+        while True:
+            await asyncio.sleep(self.archive.flush_interval)
+            async with self._lock:
+                now: float = time.time()
+                if self.archive.due(now):
+                    await self._flush(now)
+
+    async def _flush(self, now: float) -> None:
+        """Write the buffer in a thread, recording whether the write failed."""
+        try:
+            await asyncio.to_thread(self.archive.flush, now=now)
+        except Exception:
+            self._failing.set(1)
+            logger.exception("Failed to write the Parquet archive.")
+        else:
+            self._failing.set(0)
+
+    async def close(self) -> None:
+        """Write the buffered events and close the archive files."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        async with self._lock:
+            await asyncio.to_thread(self.archive.close)
@@ -0,0 +1,122 @@
+"""Event handler that can be rebuilt from a new configuration while polling."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import typing
+
+from chaturbate_poller.handlers.event_handler import EventHandler
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+    from chaturbate_poller.config.manager import ConfigManager
+    from chaturbate_poller.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class _Generation:
+    """A built handler and the events it is still processing."""
+
+    handler: EventHandler
+    in_flight: int = 0
+    retired: bool = False
+
+
+class ReloadableEventHandler(EventHandler):
+    """Delegate to a handler graph that is swapped atomically on reload.
+
+    Each event is handled by the graph that was current when it arrived, so
+    events in flight during a reload finish on the old configuration. A
+    replaced graph is closed once its last in-flight event completes.
+
+    Args:
+        factory: Builds the handler graph from a configuration.
+        config: The configuration to build the initial graph from.
+    """
+
+    def __init__(
+        self, factory: Callable[[ConfigManager], EventHandler], config: ConfigManager
+    ) -> None:
+        """Initialize the handler with a graph built from the configuration."""
+        self.factory: Callable[[ConfigManager], EventHandler] = factory
+        self._current: _Generation = _Generation(factory(config))
+        self._closing: set[asyncio.Task[None]] = set()
+
+    @property
+    def handler(self) -> EventHandler:
+        """Get the current handler graph."""
+        return self._current.handler
+
+    @contextlib.contextmanager
+    def _current_generation(self) -> Iterator[_Generation]:
+        """Pin the current handler graph while it processes events."""
+        generation: _Generation = self._current
+        generation.in_flight += 1
+        try:
+            yield generation
+        finally:
+            generation.in_flight -= 1
+            if generation.retired and not generation.in_flight:
+                self._schedule_close(generation)
+
+    async def handle_event(self, event: Event) -> None:
+        """Handle an event with the current handler graph.
+
+        Args:
+            event: The event to be handled.
+        """
+        with self._current_generation() as generation:
+            await generation.handler.handle_event(event)
+
+    async def handle_batch(self, events: Sequence[Event]) -> None:
+        """Handle a page of events with the current handler graph.
+
+        Args:
+            events: The events to be handled.
+        """
+        with self._current_generation() as generation:
+            await generation.handler.handle_batch(events)
+
+    def rebuild(self, config: ConfigManager) -> bool:
+        """Build a new handler graph and swap it in.
+
+        Must be called from the event loop. If the new graph cannot be built,
+        the current one stays in place.
+
+        Args:
+            config: The configuration to build the new graph from.
+
+        Returns:
+            True if the graph was swapped.
+        """
+        try:
+            handler: EventHandler = self.factory(config)
+        except Exception:
+            logger.exception("Keeping the current event handlers; the new configuration failed.")
+            return False
+        previous, self._current = self._current, _Generation(handler)
+        previous.retired = True
+        if not previous.in_flight:
+            self._schedule_close(previous)
+        logger.info("Swapped event handlers to %s.", type(handler).__name__)
+        return True
+
+    def _schedule_close(self, generation: _Generation) -> None:
+        """Close a retired handler graph in the background."""
+        task: asyncio.Task[None] = asyncio.get_running_loop().create_task(
+            generation.handler.close()
+        )
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def close(self) -> None:
+        """Wait for retired graphs to close, then close the current one."""
+        if self._closing:
+            await asyncio.gather(*self._closing)
+        await self._current.handler.close()
@@ -0,0 +1,61 @@
+"""SQLite event handler implementation."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import typing
+
+from chaturbate_poller.handlers.event_handler import EventHandler
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from chaturbate_poller.database.sqlite_store import SQLiteStore
+    from chaturbate_poller.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteEventHandler(EventHandler):
+    """Event handler for writing events to a local SQLite database."""
+
+    def __init__(self, store: SQLiteStore) -> None:
+        """Initialize the SQLite event handler."""
+        self.store: SQLiteStore = store
+        self._closed_logged: bool = False
+
+    async def handle_event(self, event: Event) -> None:
+        """Handle an event by queueing it for the database writer.
+
+        Args:
+            event: The event to be handled.
+        """
+        await self.handle_batch([event])
+
+    async def handle_batch(self, events: Sequence[Event]) -> None:
+        """Handle a page of events by queueing it for the database writer.
+
+        Waits in a worker thread, not on the event loop, when the writer
+        has fallen behind. Pages are dropped, not raised, once the store
+        has closed.
+
+        Args:
+            events: The events to be handled.
+        """
+        logger.debug("Queueing %d events for SQLite.", len(events))
+        try:
+            try:
+                self.store.submit(events, block=False)
+            except queue.Full:
+                await asyncio.to_thread(self.store.submit, events)
+        except RuntimeError:
+            # The writer has shut down; polling and the other handlers carry on.
+            log = logger.debug if self._closed_logged else logger.error
+            log("SQLite store is closed; dropping %d events.", len(events))
+            self._closed_logged = True
+
+    async def close(self) -> None:
+        """Write the queued events and close the database."""
+        await asyncio.to_thread(self.store.close)
@@ -0,0 +1,53 @@
+"""Webhook event handler implementation."""
+
+from __future__ import annotations
+
+import logging
+import typing
+
+from chaturbate_poller.handlers.event_handler import EventHandler
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from chaturbate_poller.core.webhooks import WebhookDispatcher
+    from chaturbate_poller.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookEventHandler(EventHandler):
+    """Event handler queueing events for webhooks, then passing them to another handler.
+
+    Args:
+        dispatcher: Delivers the events to the webhooks.
+        handler: The handler that receives the events afterwards.
+    """
+
+    def __init__(self, dispatcher: WebhookDispatcher, handler: EventHandler) -> None:
+        """Initialize the webhook event handler."""
+        self.dispatcher: WebhookDispatcher = dispatcher
+        self.handler: EventHandler = handler
+
+    async def handle_event(self, event: Event) -> None:
+        """Handle an event by queueing it for the webhooks and passing it on.
+
+        Args:
+            event: The event to be handled.
+        """
+        await self.handle_batch([event])
+
+    async def handle_batch(self, events: Sequence[Event]) -> None:
+        """Handle a page of events by queueing it for the webhooks and passing it on.
+
+        Args:
+            events: The events to be handled.
+        """
+        logger.debug("Queueing %d events for webhooks.", len(events))
+        self.dispatcher.submit(events)
+        await self.handler.handle_batch(events)
+
+    async def close(self) -> None:
+        """Deliver the queued events, then close the wrapped handler."""
+        await self.dispatcher.close()
+        await self.handler.close()
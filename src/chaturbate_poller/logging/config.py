@@ -9,8 +9,6 @@ import logging.config
 import re
 import sys
 
-import rich.traceback
-
 from chaturbate_poller.constants import DEFAULT_CONSOLE_WIDTH, MAX_TRACEBACK_FRAMES
 
 URL_REGEX: re.Pattern[str] = re.compile(r"events/([^/]+)/([^/]+)")
@@ -138,10 +136,15 @@ def _get_console_handler_config(*, json_logging: bool, verbose: bool) -> dict[st
 
 
 def setup_logging(*, verbose: bool = False) -> None:
-    """Set up logging configuration."""
+    """Set up logging configuration.
+
+    Rich is only imported when stdout is a TTY; otherwise logs are plain JSON.
+    """
     json_logging = not sys.stdout.isatty()
 
-    if sys.stdout.isatty():
+    if not json_logging:
+        import rich.traceback  # noqa: PLC0415
+
         rich.traceback.install()
 
     log_format = {
@@ -171,3 +174,23 @@ def setup_logging(*, verbose: bool = False) -> None:
         },
     }
     logging.config.dictConfig(config=log_format)
+
+
+def set_log_level(level: str) -> bool:
+    """Change the level of the root logger and its handlers at runtime.
+
+    Args:
+        level: A level name such as ``DEBUG`` or ``INFO``.
+
+    Returns:
+        True if the level was applied, False if the name is not a known level.
+    """
+    numeric_level: int | None = logging.getLevelNamesMapping().get(level.strip().upper())
+    if numeric_level is None:
+        logging.getLogger(__name__).warning("Ignoring unknown log level %r.", level)
+        return False
+    root: logging.Logger = logging.getLogger()
+    root.setLevel(numeric_level)
+    for handler in root.handlers:
+        handler.setLevel(numeric_level)
+    return True
@@ -0,0 +1,188 @@
+"""In-process metrics for the Chaturbate Poller."""
+
+from __future__ import annotations
+
+import math
+import threading
+
+
+def _escape(text: str, *, quotes: bool = True) -> str:
+    """Escape a label value, or a description without ``quotes``, for Prometheus."""
+    text = text.replace("\\", "\\\\").replace("\n", "\\n")
+    return text.replace('"', '\\"') if quotes else text
+
+
+def _format_key(name: str, labels: dict[str, str]) -> str:
+    """Format a metric name and its labels as a single sample key."""
+    if not labels:
+        return name
+    rendered: str = ",".join(f'{key}="{_escape(value)}"' for key, value in sorted(labels.items()))
+    return f"{name}{{{rendered}}}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the Prometheus text format."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class Metric:
+    """Base class for a named metric with optional labels.
+
+    Args:
+        name: The metric name.
+        description: A short description of the metric.
+        labels: Label names and values identifying this series.
+    """
+
+    kind: str = "untyped"
+
+    def __init__(
+        self, name: str, description: str = "", labels: dict[str, str] | None = None
+    ) -> None:
+        """Initialize the metric with a zero value."""
+        self.name: str = name
+        self.description: str = description
+        self.labels: dict[str, str] = labels or {}
+        self.key: str = _format_key(name, self.labels)
+        self.value: float = 0.0
+
+
+class Gauge(Metric):
+    """Metric holding the most recently observed value."""
+
+    kind: str = "gauge"
+
+    def set(self, value: float) -> None:
+        """Set the gauge to a value.
+
+        Args:
+            value: The new value.
+        """
+        self.value: float = value
+
+
+class Counter(Metric):
+    """Metric holding a monotonically increasing total."""
+
+    kind: str = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: The non-negative amount to add.
+
+        Raises:
+            ValueError: If the amount is negative.
+        """
+        if amount < 0:
+            msg = "Counters can only increase."
+            raise ValueError(msg)
+        self.value: float = self.value + amount
+
+
+class MetricsRegistry:
+    """Registry of the metrics reported by the running process."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, Metric] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _get_or_create[M: Metric](
+        self, metric_type: type[M], name: str, description: str, labels: dict[str, str]
+    ) -> M:
+        """Return the registered metric for a key, creating it if needed."""
+        key: str = _format_key(name, labels)
+        with self._lock:
+            metric: Metric | None = self._metrics.get(key)
+            if metric is None:
+                metric = self._metrics[key] = metric_type(name, description, labels)
+        if not isinstance(metric, metric_type):
+            msg = f"Metric {key!r} is already registered as a {metric.kind}."
+            raise TypeError(msg)
+        return metric
+
+    def gauge(self, name: str, description: str = "", /, **labels: str) -> Gauge:
+        """Get or create a gauge.
+
+        Args:
+            name: The metric name.
+            description: A short description of the metric.
+            **labels: Label names and values identifying the series.
+
+        Returns:
+            The registered gauge.
+        """
+        return self._get_or_create(Gauge, name, description, labels)
+
+    def counter(self, name: str, description: str = "", /, **labels: str) -> Counter:
+        """Get or create a counter.
+
+        Args:
+            name: The metric name.
+            description: A short description of the metric.
+            **labels: Label names and values identifying the series.
+
+        Returns:
+            The registered counter.
+        """
+        return self._get_or_create(Counter, name, description, labels)
+
+    def series(self, name: str) -> list[Metric]:
+        """Get every registered series of a metric.
+
+        Args:
+            name: The metric name.
+
+        Returns:
+            The metrics with that name, one per label set.
+        """
+        with self._lock:
+            return [metric for metric in self._metrics.values() if metric.name == name]
+
+    def snapshot(self) -> dict[str, float]:
+        """Get the current value of every registered metric.
+
+        Returns:
+            A mapping of sample keys, such as ``name{label="value"}``, to values.
+        """
+        with self._lock:
+            return {key: metric.value for key, metric in self._metrics.items()}
+
+    def exposition(self) -> str:
+        """Render every registered metric in the Prometheus text format.
+
+        Returns:
+            The ``HELP`` and ``TYPE`` lines and samples of each metric.
+        """
+        with self._lock:
+            metrics: list[Metric] = sorted(
+                self._metrics.values(), key=lambda metric: (metric.name, metric.key)
+            )
+        families: dict[str, list[Metric]] = {}
+        for metric in metrics:
+            families.setdefault(metric.name, []).append(metric)
+        lines: list[str] = []
+        for name, family in families.items():
+            description: str = next(
+                (metric.description for metric in family if metric.description), ""
+            )
+            if description:
+                lines.append(f"# HELP {name} {_escape(description, quotes=False)}")
+            lines.append(f"# TYPE {name} {family[0].kind}")
+            lines.extend(f"{metric.key} {_format_value(metric.value)}" for metric in family)
+        return "".join(f"{line}\n" for line in lines)
+
+    def clear(self) -> None:
+        """Remove every registered metric."""
+        with self._lock:
+            self._metrics.clear()
+
+
+registry: MetricsRegistry = MetricsRegistry()
+"""MetricsRegistry: The process-wide metrics registry."""
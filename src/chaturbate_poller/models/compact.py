@@ -0,0 +1,186 @@
+"""Compact, slotted representation of events for in-memory buffering."""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+import typing
+
+from chaturbate_poller.constants import EventMethod
+from chaturbate_poller.models.event import Event
+from chaturbate_poller.models.event_data import EventData
+from chaturbate_poller.models.media import Media
+from chaturbate_poller.models.message import Message
+from chaturbate_poller.models.tip import Tip
+from chaturbate_poller.models.user import User
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+METHODS: tuple[EventMethod, ...] = tuple(EventMethod)
+"""tuple[EventMethod, ...]: Event methods indexed by their compact code."""
+METHOD_CODES: dict[EventMethod, int] = {method: code for code, method in enumerate(METHODS)}
+"""dict[EventMethod, int]: Compact code of each event method."""
+
+IN_FANCLUB: int = 1
+"""int: Flag set when the user is in the fan club."""
+HAS_TOKENS: int = 2
+"""int: Flag set when the user has tokens."""
+IS_MOD: int = 4
+"""int: Flag set when the user is a moderator."""
+IS_ANON: int = 8
+"""int: Flag set when the tip is anonymous."""
+
+
+def _intern_optional(intern: Callable[[str], str], value: str | None) -> str | None:
+    """Intern a string that may be missing."""
+    return None if value is None else intern(value)
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class CompactEvent:
+    """Flat, slotted copy of an :class:`Event`.
+
+    Nested models are flattened into one object, booleans are packed into
+    ``flags`` and the method is stored as a small integer code. Repeated
+    strings such as usernames, genders and colors are interned so buffered
+    events share them.
+    """
+
+    id: str
+    method_code: int
+    flags: int = 0
+    broadcaster: str | None = None
+    username: str | None = None
+    recent_tips: str | None = None
+    gender: str | None = None
+    subgender: str | None = None
+    tip_tokens: int | None = None
+    tip_message: str | None = None
+    media_id: int | None = None
+    media_type: str | None = None
+    media_name: str | None = None
+    media_tokens: int | None = None
+    color: str | None = None
+    bg_color: str | None = None
+    text: str | None = None
+    font: str | None = None
+    from_user: str | None = None
+    to_user: str | None = None
+    subject: str | None = None
+
+    @property
+    def method(self) -> EventMethod:
+        """Get the event method."""
+        return METHODS[self.method_code]
+
+    @property
+    def tokens(self) -> int:
+        """Get the tokens spent in the event, from a tip or a media purchase."""
+        return self.tip_tokens or self.media_tokens or 0
+
+    @classmethod
+    def from_event(cls, event: Event, intern: Callable[[str], str] = sys.intern) -> CompactEvent:
+        """Build a compact event from a validated event.
+
+        Args:
+            event: The event to convert.
+            intern: Function used to share repeated strings.
+
+        Returns:
+            The compact event.
+        """
+        data: EventData = event.object
+        fields: dict[str, typing.Any] = {
+            "broadcaster": _intern_optional(intern, data.broadcaster),
+            "subject": data.subject,
+        }
+        flags: int = 0
+        if (user := data.user) is not None:
+            flags |= (
+                (IN_FANCLUB if user.in_fanclub else 0)
+                | (HAS_TOKENS if user.has_tokens else 0)
+                | (IS_MOD if user.is_mod else 0)
+            )
+            fields.update(
+                username=intern(user.username),
+                recent_tips=intern(user.recent_tips),
+                gender=intern(user.gender),
+                subgender=intern(user.subgender),
+            )
+        if (tip := data.tip) is not None:
+            flags |= IS_ANON if tip.is_anon else 0
+            fields.update(tip_tokens=tip.tokens, tip_message=tip.message)
+        if (media := data.media) is not None:
+            fields.update(
+                media_id=media.id,
+                media_type=intern(media.type),
+                media_name=media.name,
+                media_tokens=media.tokens,
+            )
+        if (message := data.message) is not None:
+            fields.update(
+                color=intern(message.color),
+                bg_color=_intern_optional(intern, message.bg_color),
+                text=message.message,
+                font=intern(message.font),
+                from_user=_intern_optional(intern, message.from_user),
+                to_user=_intern_optional(intern, message.to_user),
+            )
+        return cls(id=event.id, method_code=METHOD_CODES[event.method], flags=flags, **fields)
+
+    def to_event(self) -> Event:
+        """Rebuild the pydantic event without validating it again.
+
+        Returns:
+            An event equal to the one this was built from.
+        """
+        # Optional fields are always set together with the field checked here,
+        # so the values are passed through untyped to skip validation.
+        values: dict[str, typing.Any]
+        user: User | None = None
+        if self.username is not None:
+            values = {
+                "recent_tips": self.recent_tips,
+                "gender": self.gender,
+                "subgender": self.subgender,
+            }
+            user = User.model_construct(
+                username=self.username,
+                in_fanclub=bool(self.flags & IN_FANCLUB),
+                has_tokens=bool(self.flags & HAS_TOKENS),
+                is_mod=bool(self.flags & IS_MOD),
+                **values,
+            )
+        tip: Tip | None = None
+        if self.tip_tokens is not None:
+            values = {"message": self.tip_message}
+            tip = Tip.model_construct(
+                tokens=self.tip_tokens, is_anon=bool(self.flags & IS_ANON), **values
+            )
+        media: Media | None = None
+        if self.media_id is not None:
+            values = {"type": self.media_type, "name": self.media_name, "tokens": self.media_tokens}
+            media = Media.model_construct(id=self.media_id, **values)
+        message: Message | None = None
+        if self.text is not None:
+            values = {"color": self.color, "font": self.font}
+            message = Message.model_construct(
+                bg_color=self.bg_color,
+                message=self.text,
+                from_user=self.from_user,
+                to_user=self.to_user,
+                **values,
+            )
+        return Event.model_construct(
+            method=self.method,
+            object=EventData.model_construct(
+                broadcaster=self.broadcaster,
+                user=user,
+                tip=tip,
+                media=media,
+                message=message,
+                subject=self.subject,
+            ),
+            id=self.id,
+        )
@@ -4,6 +4,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from chaturbate_poller.constants import (
+    ADAPTIVE_TIMEOUT_MAX,
+    ADAPTIVE_TIMEOUT_MIN,
+    FANOUT_HOST,
+    HEALTH_HOST,
+    LOOP_MONITOR_THRESHOLD,
+    SHUTDOWN_TIMEOUT,
+    LoopImplementation,
+)
+
 
 @dataclass(frozen=True)
 class PollerOptions:
@@ -14,7 +24,27 @@ class PollerOptions:
     timeout: int
     testbed: bool = False
     use_database: bool = False
+    use_sqlite: bool = False
+    use_parquet: bool = False
+    use_jsonl: bool = False
     verbose: bool = False
+    http2: bool = False
+    adaptive_timeout: bool = False
+    min_timeout: int = ADAPTIVE_TIMEOUT_MIN
+    max_timeout: int = ADAPTIVE_TIMEOUT_MAX
+    shutdown_timeout: float = SHUTDOWN_TIMEOUT
+    checkpoint_file: str | None = None
+    watch_config: bool = False
+    fanout_port: int | None = None
+    fanout_host: str = FANOUT_HOST
+    monitor_loop: bool = False
+    slow_callback_threshold: float = LOOP_MONITOR_THRESHOLD
+    event_loop: LoopImplementation = LoopImplementation.AUTO
+    executor_workers: int | None = None
+    eager_tasks: bool = False
+    health_port: int | None = None
+    health_host: str = HEALTH_HOST
+    memory_budget: int | None = None
 
     def __post_init__(self) -> None:
         """Validate the options after initialization."""
@@ -24,3 +54,24 @@ class PollerOptions:
         if self.timeout < 0:
             msg = "Timeout must be a non-negative integer."
             raise ValueError(msg)
+        if self.adaptive_timeout and not 1 <= self.min_timeout <= self.max_timeout:
+            msg = "Adaptive timeout bounds must satisfy 1 <= min_timeout <= max_timeout."
+            raise ValueError(msg)
+        if self.shutdown_timeout <= 0:
+            msg = "Shutdown timeout must be positive."
+            raise ValueError(msg)
+        if self.fanout_port is not None and not 0 <= self.fanout_port <= 65535:  # noqa: PLR2004
+            msg = "Fan-out port must be between 0 and 65535."
+            raise ValueError(msg)
+        if self.slow_callback_threshold <= 0:
+            msg = "Slow callback threshold must be positive."
+            raise ValueError(msg)
+        if self.health_port is not None and not 0 <= self.health_port <= 65535:  # noqa: PLR2004
+            msg = "Health port must be between 0 and 65535."
+            raise ValueError(msg)
+        if self.memory_budget is not None and self.memory_budget < 1:
+            msg = "Memory budget must be a positive number of MiB."
+            raise ValueError(msg)
+        if self.executor_workers is not None and self.executor_workers < 1:
+            msg = "Executor workers must be a positive integer."
+            raise ValueError(msg)
@@ -0,0 +1 @@
+"""Embedded servers fed by the poller."""
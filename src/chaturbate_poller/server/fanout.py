@@ -0,0 +1,480 @@
+"""Fan the live event stream out to WebSocket and Server-Sent Events subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import collections
+import contextlib
+import enum
+import hashlib
+import logging
+import struct
+import typing
+import urllib.parse
+
+from chaturbate_poller.constants import (
+    FANOUT_BUFFER_SIZE,
+    FANOUT_HANDSHAKE_TIMEOUT,
+    FANOUT_HEARTBEAT,
+    FANOUT_HOST,
+    FANOUT_MAX_CLIENT_FRAME,
+    FANOUT_PATH,
+    EventMethod,
+)
+from chaturbate_poller.core.memory import shared_memory_budget
+from chaturbate_poller.database.jsonl_log import EVENT_ADAPTER
+from chaturbate_poller.metrics import Counter, Gauge, registry
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from chaturbate_poller.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+WEBSOCKET_GUID: bytes = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+"""bytes: Suffix of the key hashed into ``Sec-WebSocket-Accept`` (RFC 6455)."""
+
+OPCODE_TEXT: int = 0x1
+"""int: WebSocket text frame."""
+OPCODE_CLOSE: int = 0x8
+"""int: WebSocket close frame."""
+OPCODE_PING: int = 0x9
+"""int: WebSocket ping frame."""
+OPCODE_PONG: int = 0xA
+"""int: WebSocket pong frame."""
+
+METHOD_NAMES: frozenset[str] = frozenset(method.value for method in EventMethod)
+"""frozenset[str]: Event methods subscribers may filter on."""
+
+
+class SlowConsumerPolicy(str, enum.Enum):
+    """What to do with a subscriber whose send buffer is full."""
+
+    EVICT = "evict"
+    """Disconnect the subscriber."""
+    DROP_OLDEST = "drop_oldest"
+    """Keep the subscriber and discard its oldest unsent event."""
+
+
+class Protocol(enum.Enum):
+    """Wire protocol of a subscriber."""
+
+    SSE = "sse"
+    WEBSOCKET = "websocket"
+
+
+def sse_frame(method: str, payload: bytes) -> bytes:
+    """Frame an event for Server-Sent Events.
+
+    Args:
+        method: The event method, sent as the SSE event name.
+        payload: The event as JSON.
+
+    Returns:
+        The frame.
+    """
+    return b"event: " + method.encode() + b"\ndata: " + payload + b"\n\n"
+
+
+def websocket_frame(payload: bytes, opcode: int = OPCODE_TEXT) -> bytes:
+    """Frame a payload as an unmasked, unfragmented server WebSocket frame.
+
+    Args:
+        payload: The frame payload.
+        opcode: The frame opcode.
+
+    Returns:
+        The frame.
+    """
+    length: int = len(payload)
+    if length < 126:  # noqa: PLR2004
+        header: bytes = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+HEARTBEATS: dict[Protocol, bytes] = {
+    Protocol.SSE: b": ping\n\n",
+    Protocol.WEBSOCKET: websocket_frame(b"", OPCODE_PING),
+}
+"""dict[Protocol, bytes]: Frame sent to an idle subscriber to keep the connection alive."""
+
+
+class Subscriber:
+    """One connected client, its method filter and its bounded send buffer.
+
+    Args:
+        protocol: The wire protocol.
+        writer: The client connection.
+        methods: Event methods to send, or None for all of them.
+        max_buffer: Number of frames buffered before the slow-consumer policy applies.
+        policy: The slow-consumer policy.
+    """
+
+    def __init__(
+        self,
+        protocol: Protocol,
+        writer: asyncio.StreamWriter,
+        methods: frozenset[str] | None,
+        max_buffer: int,
+        policy: SlowConsumerPolicy,
+    ) -> None:
+        """Initialize the subscriber with an empty buffer."""
+        self.protocol: Protocol = protocol
+        self.methods: frozenset[str] | None = methods
+        self.max_buffer: int = max_buffer
+        self.policy: SlowConsumerPolicy = policy
+        self.closed: bool = False
+        self._writer: asyncio.StreamWriter = writer
+        self._buffer: collections.deque[bytes] = collections.deque()
+        self._ready: asyncio.Event = asyncio.Event()
+        self._dropped: Counter = registry.counter(
+            "fanout_frames_dropped_total", "Frames discarded for slow fan-out subscribers."
+        )
+        self._evicted: Counter = registry.counter(
+            "fanout_subscribers_evicted_total", "Fan-out subscribers disconnected as too slow."
+        )
+
+    @property
+    def buffered(self) -> int:
+        """Get the number of frames waiting to be sent."""
+        return len(self._buffer)
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Get the size of the frames waiting to be sent."""
+        return sum(map(len, self._buffer))
+
+    def trim(self) -> None:
+        """Discard the oldest half of the unsent frames."""
+        for _ in range((len(self._buffer) + 1) // 2):
+            self._buffer.popleft()
+            self._dropped.inc()
+
+    def offer(self, frame: bytes) -> bool:
+        """Queue a frame, applying the slow-consumer policy if the buffer is full.
+
+        Args:
+            frame: The frame to send.
+
+        Returns:
+            False if the subscriber is closed or was evicted, True otherwise.
+        """
+        if self.closed:
+            return False
+        if len(self._buffer) >= self.max_buffer:
+            if self.policy is SlowConsumerPolicy.EVICT:
+                logger.warning("Evicting a slow fan-out subscriber.")
+                self._evicted.inc()
+                self.close(abort=True)
+                return False
+            self._buffer.popleft()
+            self._dropped.inc()
+        self._buffer.append(frame)
+        self._ready.set()
+        return True
+
+    def close(self, *, abort: bool = False) -> None:
+        """Stop sending after the buffered frames, or at once if aborting.
+
+        Args:
+            abort: Drop the buffered frames and reset the connection.
+        """
+        self.closed = True
+        if abort:
+            self._buffer.clear()
+            self._writer.transport.abort()
+        self._ready.set()
+
+    async def send(self, heartbeat: float) -> None:
+        """Write buffered frames until the subscriber is closed.
+
+        Args:
+            heartbeat: Idle time after which a heartbeat frame is sent.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(self._ready.wait(), heartbeat)
+            except TimeoutError:
+                self._buffer.append(HEARTBEATS[self.protocol])
+            self._ready.clear()
+            if self._buffer and not self._writer.is_closing():
+                frames: bytes = b"".join(self._buffer)
+                self._buffer.clear()
+                self._writer.write(frames)
+                await self._writer.drain()
+            if self.closed:
+                return
+
+
+class _Request(typing.NamedTuple):
+    """The parts of an HTTP request the server uses."""
+
+    method: str
+    path: str
+    query: dict[str, list[str]]
+    headers: dict[str, str]
+
+
+class FanoutServer:
+    """Serve one poller's events to many WebSocket and SSE subscribers.
+
+    Clients connect to ``/events``, as a WebSocket when they send an upgrade
+    request and as an ``text/event-stream`` otherwise, optionally passing
+    ``?methods=tip,chatMessage`` to receive only those methods. Each event is
+    serialized to JSON once, framed once per protocol in use and queued for
+    every matching subscriber. Subscribers have a bounded buffer; when one is
+    full, the slow-consumer policy either disconnects the subscriber or drops
+    its oldest frame. Under memory pressure, every subscriber drops the
+    oldest half of its buffer.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on; 0 picks a free port.
+        max_buffer: Frames buffered per subscriber.
+        policy: What to do with a subscriber whose buffer is full.
+        heartbeat: Idle time, in seconds, after which a keepalive is sent.
+    """
+
+    def __init__(
+        self,
+        host: str = FANOUT_HOST,
+        port: int = 0,
+        *,
+        max_buffer: int = FANOUT_BUFFER_SIZE,
+        policy: SlowConsumerPolicy = SlowConsumerPolicy.EVICT,
+        heartbeat: float = FANOUT_HEARTBEAT,
+    ) -> None:
+        """Initialize the server without listening yet."""
+        if max_buffer < 1 or heartbeat <= 0:
+            msg = "Fan-out buffer size and heartbeat must be positive."
+            raise ValueError(msg)
+        self.host: str = host
+        self.max_buffer: int = max_buffer
+        self.policy: SlowConsumerPolicy = policy
+        self.heartbeat: float = heartbeat
+        self._port: int = port
+        self._server: asyncio.Server | None = None
+        self._subscribers: set[Subscriber] = set()
+        self._connected: Gauge = registry.gauge(
+            "fanout_subscribers", "Connected fan-out subscribers."
+        )
+        shared_memory_budget().register("fanout", self)
+
+    @property
+    def port(self) -> int:
+        """Get the port the server listens on."""
+        if self._server is not None and self._server.sockets:
+            return int(self._server.sockets[0].getsockname()[1])
+        return self._port
+
+    @property
+    def subscribers(self) -> int:
+        """Get the number of connected subscribers."""
+        return len(self._subscribers)
+
+    def memory_usage(self) -> int:
+        """Get the size of the frames buffered for subscribers.
+
+        Frames shared by several subscribers are counted once per subscriber.
+
+        Returns:
+            The buffered bytes.
+        """
+        return sum(subscriber.buffered_bytes for subscriber in self._subscribers)
+
+    def shed_memory(self) -> None:
+        """Discard the oldest half of every subscriber's unsent frames."""
+        for subscriber in self._subscribers:
+            subscriber.trim()
+
+    async def start(self) -> None:
+        """Start listening for subscribers."""
+        self._server = await asyncio.start_server(self._serve, self.host, self._port)
+        logger.info("Fan-out server listening on %s:%d%s.", self.host, self.port, FANOUT_PATH)
+
+    async def close(self) -> None:
+        """Stop listening and disconnect every subscriber after its buffered frames."""
+        if self._server is None:
+            return
+        self._server.close()
+        for subscriber in list(self._subscribers):
+            subscriber.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    def publish(self, events: Sequence[Event]) -> None:
+        """Queue a page of events for every subscriber whose filter matches.
+
+        Args:
+            events: The events to send.
+        """
+        if not self._subscribers:
+            return
+        subscribers: list[Subscriber] = list(self._subscribers)
+        protocols: set[Protocol] = {subscriber.protocol for subscriber in subscribers}
+        for event in events:
+            method: str = event.method.value
+            payload: bytes = EVENT_ADAPTER.dump_json(event, by_alias=True)
+            frames: dict[Protocol, bytes] = {}
+            if Protocol.SSE in protocols:
+                frames[Protocol.SSE] = sse_frame(method, payload)
+            if Protocol.WEBSOCKET in protocols:
+                frames[Protocol.WEBSOCKET] = websocket_frame(payload)
+            for subscriber in subscribers:
+                if subscriber.methods is None or method in subscriber.methods:
+                    subscriber.offer(frames[subscriber.protocol])
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Handle one client connection from handshake to disconnect."""
+        try:
+            subscriber: Subscriber | None = await self._handshake(reader, writer)
+            if subscriber is not None:
+                await self._stream(subscriber, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError) as exc:
+            logger.debug("Fan-out subscriber disconnected: %s", exc)
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _handshake(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> Subscriber | None:
+        """Read the request and answer it, returning the new subscriber if it is valid."""
+        try:
+            async with asyncio.timeout(FANOUT_HANDSHAKE_TIMEOUT):
+                request: _Request = await self._read_request(reader)
+        except (TimeoutError, ValueError, asyncio.LimitOverrunError) as exc:
+            logger.debug("Rejected a fan-out request: %s", exc)
+            writer.write(_response("400 Bad Request"))
+            return None
+        if request.path != FANOUT_PATH:
+            writer.write(_response("404 Not Found"))
+            return None
+        if request.method != "GET":
+            writer.write(_response("405 Method Not Allowed"))
+            return None
+        names: list[str] = [
+            name for value in request.query.get("methods", []) for name in value.split(",") if name
+        ]
+        unknown: list[str] = [name for name in names if name not in METHOD_NAMES]
+        if unknown:
+            writer.write(_response("400 Bad Request", f"Unknown methods: {', '.join(unknown)}"))
+            return None
+        protocol: Protocol = Protocol.SSE
+        if request.headers.get("upgrade", "").lower() == "websocket":
+            key: str | None = request.headers.get("sec-websocket-key")
+            if not key:
+                writer.write(_response("400 Bad Request", "Missing Sec-WebSocket-Key"))
+                return None
+            accept: str = base64.b64encode(
+                hashlib.sha1(key.encode() + WEBSOCKET_GUID, usedforsecurity=False).digest()
+            ).decode()
+            writer.write(
+                (
+                    "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                    f"Connection: Upgrade\r\nSec-WebSocket-Accept: {accept}\r\n\r\n"
+                ).encode()
+            )
+            protocol = Protocol.WEBSOCKET
+        else:
+            headers: bytes = (
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                b"Cache-Control: no-cache\r\nAccess-Control-Allow-Origin: *\r\n\r\n"
+            )
+            writer.write(headers)
+        return Subscriber(protocol, writer, frozenset(names) or None, self.max_buffer, self.policy)
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader) -> _Request:
+        """Read and parse the request line and headers."""
+        head: bytes = await reader.readuntil(b"\r\n\r\n")
+        lines: list[str] = head.decode("latin-1").split("\r\n")
+        method, target, _ = lines[0].split(" ", 2)
+        headers: dict[str, str] = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+        url = urllib.parse.urlsplit(target)
+        return _Request(method, url.path, urllib.parse.parse_qs(url.query), headers)
+
+    async def _stream(
+        self, subscriber: Subscriber, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Send frames to a subscriber until it disconnects or is closed."""
+        self._subscribers.add(subscriber)
+        self._connected.set(len(self._subscribers))
+        logger.info(
+            "Fan-out %s subscriber connected (%d total).",
+            subscriber.protocol.value,
+            len(self._subscribers),
+        )
+        sending: asyncio.Task[None] = asyncio.create_task(subscriber.send(self.heartbeat))
+        receiving: asyncio.Task[None] = asyncio.create_task(
+            _receive_websocket(reader, writer)
+            if subscriber.protocol is Protocol.WEBSOCKET
+            else _receive_eof(reader)
+        )
+        try:
+            await asyncio.wait({sending, receiving}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            subscriber.close()
+            if receiving.done():
+                # The client has gone, so nothing buffered can reach it.
+                sending.cancel()
+            else:
+                receiving.cancel()
+                with contextlib.suppress(TimeoutError, ConnectionError):
+                    await asyncio.wait_for(asyncio.shield(sending), self.heartbeat)
+                sending.cancel()
+            self._subscribers.discard(subscriber)
+            self._connected.set(len(self._subscribers))
+            for task in (sending, receiving):
+                with contextlib.suppress(asyncio.CancelledError, ConnectionError):
+                    await task
+
+
+def _response(status: str, body: str = "") -> bytes:
+    """Build a plain-text HTTP response that closes the connection."""
+    content: bytes = body.encode()
+    return (
+        f"HTTP/1.1 {status}\r\nContent-Type: text/plain\r\n"
+        f"Content-Length: {len(content)}\r\nConnection: close\r\n\r\n"
+    ).encode() + content
+
+
+async def _receive_eof(reader: asyncio.StreamReader) -> None:
+    """Discard what an SSE client sends until it disconnects."""
+    while await reader.read(1024):
+        pass
+
+
+async def _receive_websocket(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Answer a WebSocket client's pings and close frame, ignoring its messages."""
+    while True:
+        first, second = await reader.readexactly(2)
+        opcode: int = first & 0x0F
+        length: int = second & 0x7F
+        if length == 126:  # noqa: PLR2004
+            (length,) = struct.unpack("!H", await reader.readexactly(2))
+        elif length == 127:  # noqa: PLR2004
+            (length,) = struct.unpack("!Q", await reader.readexactly(8))
+        if length > FANOUT_MAX_CLIENT_FRAME:
+            writer.write(websocket_frame(struct.pack("!H", 1009), OPCODE_CLOSE))
+            return
+        mask: bytes = await reader.readexactly(4) if second & 0x80 else b"\0\0\0\0"
+        data: bytes = bytes(
+            byte ^ mask[index % 4] for index, byte in enumerate(await reader.readexactly(length))
+        )
+        if opcode == OPCODE_CLOSE:
+            writer.write(websocket_frame(data[:2], OPCODE_CLOSE))
+            return
+        if opcode == OPCODE_PING:
+            writer.write(websocket_frame(data, OPCODE_PONG))
@@ -0,0 +1,123 @@
+"""Serve the poller's liveness, readiness and metrics over HTTP."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import typing
+
+from chaturbate_poller.constants import HEALTH_HOST, HEALTH_REQUEST_TIMEOUT
+from chaturbate_poller.metrics import registry
+
+if typing.TYPE_CHECKING:
+    from chaturbate_poller.core.health import PollerHealth
+
+logger = logging.getLogger(__name__)
+
+
+METRICS_CONTENT_TYPE: bytes = b"text/plain; version=0.0.4; charset=utf-8"
+"""bytes: Content type of the Prometheus text format."""
+
+
+def _response(status: bytes, body: bytes, content_type: bytes = b"text/plain") -> bytes:
+    """Build an HTTP response that closes the connection."""
+    template: bytes = (
+        b"HTTP/1.1 %s\r\nContent-Type: %s\r\nContent-Length: %d\r\n"
+        b"Cache-Control: no-store\r\nConnection: close\r\n\r\n%s"
+    )
+    return template % (status, content_type, len(body), body)
+
+
+OK: bytes = _response(b"200 OK", b"ok\n")
+"""bytes: Response to a probe that passes."""
+NOT_FOUND: bytes = _response(b"404 Not Found", b"not found\n")
+"""bytes: Response to a path other than the probes and metrics."""
+METHOD_NOT_ALLOWED: bytes = _response(b"405 Method Not Allowed", b"method not allowed\n")
+"""bytes: Response to a request other than GET."""
+BAD_REQUEST: bytes = _response(b"400 Bad Request", b"bad request\n")
+"""bytes: Response to a request that could not be read."""
+
+
+class HealthServer:
+    """Answer ``/healthz`` and ``/readyz`` from the poller's health state, and ``/metrics``.
+
+    ``/healthz`` fails while polling makes no progress, so an orchestrator
+    restarts the process; ``/readyz`` also fails while fetches keep failing,
+    a sink is down or a handler queue is full, so traffic and alerts can
+    wait. A passing probe gets a prebuilt ``200`` response; a failing one
+    gets ``503`` with the reason. Probes only read the state that polling
+    records. ``/metrics`` renders the process-wide metrics registry in the
+    Prometheus text format, so pool, timeout, loop lag, handler queue and
+    memory metrics can be scraped.
+
+    Args:
+        health: The health state to report.
+        host: Interface to listen on.
+        port: Port to listen on; 0 picks a free port.
+    """
+
+    def __init__(self, health: PollerHealth, host: str = HEALTH_HOST, port: int = 0) -> None:
+        """Initialize the server without listening yet."""
+        self.health: PollerHealth = health
+        self.host: str = host
+        self._port: int = port
+        self._server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        """Get the port the server listens on."""
+        if self._server is not None and self._server.sockets:
+            return int(self._server.sockets[0].getsockname()[1])
+        return self._port
+
+    async def start(self) -> None:
+        """Start listening for probes."""
+        self._server = await asyncio.start_server(self._serve, self.host, self._port)
+        logger.info("Health server listening on %s:%d.", self.host, self.port)
+
+    async def close(self) -> None:
+        """Stop listening."""
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    def respond(self, method: bytes, target: bytes) -> bytes:
+        """Build the response to a request.
+
+        Args:
+            method: The request method.
+            target: The request target, possibly with a query string.
+
+        Returns:
+            The HTTP response.
+        """
+        path: bytes = target.partition(b"?")[0]
+        if path not in {b"/healthz", b"/readyz", b"/metrics"}:
+            return NOT_FOUND
+        if method != b"GET":
+            return METHOD_NOT_ALLOWED
+        if path == b"/metrics":
+            return _response(b"200 OK", registry.exposition().encode(), METRICS_CONTENT_TYPE)
+        problem: str | None = (
+            self.health.liveness() if path == b"/healthz" else self.health.readiness()
+        )
+        if problem is None:
+            return OK
+        return _response(b"503 Service Unavailable", problem.encode() + b"\n")
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer one probe and close the connection."""
+        try:
+            async with asyncio.timeout(HEALTH_REQUEST_TIMEOUT):
+                head: bytes = await reader.readuntil(b"\r\n\r\n")
+            method, target, _ = head.split(b" ", 2)
+            writer.write(self.respond(method, target))
+        except (TimeoutError, ValueError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            writer.write(BAD_REQUEST)
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
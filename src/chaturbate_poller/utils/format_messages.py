@@ -1,151 +1,400 @@
-"""Module to format different types of events from Chaturbate."""
+"""Module to format different types of events from Chaturbate.
+
+Messages are built from templates in :func:`str.format` syntax, one per event
+method. Each template is parsed once into literal text and field readers, so
+formatting an event is a table lookup and a join, with no parsing.
+"""
 
 from __future__ import annotations
 
+import dataclasses
+import json
+import operator
+import pathlib
+import string
 import typing
-from typing import Literal
 
 from chaturbate_poller.constants import EventMethod
 
 if typing.TYPE_CHECKING:
+    import os
+    from collections.abc import Callable, Iterable, Mapping
+
     from chaturbate_poller.models.event import Event
-    from chaturbate_poller.models.media import Media
-    from chaturbate_poller.models.message import Message
+    from chaturbate_poller.models.event_data import EventData
     from chaturbate_poller.models.tip import Tip
 
 
-def format_message(event: Event) -> str | None:
-    """Format a message for a given Chaturbate event."""
-    # Map event methods to their formatters
-    formatters = {
-        EventMethod.BROADCAST_START: format_broadcast_event,
-        EventMethod.BROADCAST_STOP: format_broadcast_event,
-        EventMethod.USER_ENTER: format_user_event,
-        EventMethod.USER_LEAVE: format_user_event,
-        EventMethod.FOLLOW: format_user_event,
-        EventMethod.UNFOLLOW: format_user_event,
-        EventMethod.FANCLUB_JOIN: format_user_event,
-        EventMethod.CHAT_MESSAGE: format_message_event,
-        EventMethod.PRIVATE_MESSAGE: format_message_event,
-        EventMethod.TIP: format_tip_event,
-        EventMethod.ROOM_SUBJECT_CHANGE: format_room_subject_change_event,
-        EventMethod.MEDIA_PURCHASE: format_media_purchase_event,
-    }
-
-    formatter = formatters.get(event.method)
-    return formatter(event) if formatter else None
+DEFAULT_TEMPLATES: dict[EventMethod, str] = {
+    EventMethod.BROADCAST_START: "Broadcast started",
+    EventMethod.BROADCAST_STOP: "Broadcast stopped",
+    EventMethod.USER_ENTER: "{user} entered the room",
+    EventMethod.USER_LEAVE: "{user} left the room",
+    EventMethod.FOLLOW: "{user} followed",
+    EventMethod.UNFOLLOW: "{user} unfollowed",
+    EventMethod.FANCLUB_JOIN: "{user} joined the fanclub",
+    EventMethod.CHAT_MESSAGE: "{user} sent message: {message}",
+    EventMethod.PRIVATE_MESSAGE: "{user} sent message: {message}",
+    EventMethod.TIP: "{user} tipped {tokens} tokens{anonymously}{with_message}",
+    EventMethod.ROOM_SUBJECT_CHANGE: "Room subject changed to: '{subject}'",
+    EventMethod.MEDIA_PURCHASE: (
+        "{user} purchased {media_type} set: '{media_name}' for {media_tokens} tokens"
+    ),
+}
+"""dict[EventMethod, str]: The built-in template of each event method."""
+
+
+def _tip_note(event: Event) -> str:
+    """Get a tip's message without the ``| `` prefix the API adds."""
+    tip: Tip | None = event.object.tip
+    return tip.message.removeprefix("| ").strip() if tip is not None else ""
+
+
+def _with_message(event: Event) -> str:
+    """Describe a tip's message, or nothing if it is empty."""
+    note: str = _tip_note(event)
+    return f" with message: '{note}'" if note else ""
+
+
+def _anonymously(event: Event) -> str:
+    """Describe whether a tip is anonymous."""
+    tip: Tip | None = event.object.tip
+    return " anonymously" if tip is not None and tip.is_anon else ""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Field:
+    """A template field: the payload it reads and the function reading it."""
+
+    payload: str | None
+    """str | None: Attribute of the event data that must be set, if any."""
+    get: Callable[[Event], object]
+    """Callable[[Event], object]: Reads the value from an event."""
+
+
+FIELDS: dict[str, _Field] = {
+    "broadcaster": _Field(None, operator.attrgetter("object.broadcaster")),
+    "method": _Field(None, operator.attrgetter("method.value")),
+    "id": _Field(None, operator.attrgetter("id")),
+    "user": _Field("user", operator.attrgetter("object.user.username")),
+    "gender": _Field("user", operator.attrgetter("object.user.gender")),
+    "tokens": _Field("tip", operator.attrgetter("object.tip.tokens")),
+    "note": _Field("tip", _tip_note),
+    "anonymously": _Field("tip", _anonymously),
+    "with_message": _Field("tip", _with_message),
+    "message": _Field("message", operator.attrgetter("object.message.message")),
+    "subject": _Field("subject", operator.attrgetter("object.subject")),
+    "media_type": _Field("media", operator.attrgetter("object.media.type")),
+    "media_name": _Field("media", operator.attrgetter("object.media.name")),
+    "media_tokens": _Field("media", operator.attrgetter("object.media.tokens")),
+}
+"""dict[str, _Field]: The fields available to templates, by name."""
+
+_CONVERSIONS: dict[str | None, Callable[[object], object] | None] = {
+    None: None,
+    "r": repr,
+    "s": str,
+    "a": ascii,
+}
+"""dict[str | None, Callable[[object], object] | None]: Conversions by their ``!`` letter."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Part:
+    """Literal text followed by at most one field."""
+
+    literal: str
+    """str: Text before the field."""
+    get: Callable[[Event], object] | None
+    """Callable[[Event], object] | None: Reads the field's value, if there is a field."""
+    convert: Callable[[object], object] | None
+    """Callable[[object], object] | None: The field's conversion, if any."""
+    spec: str
+    """str: The field's format spec."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CompiledTemplate:
+    """A template parsed once into literal text and field readers.
+
+    Use :meth:`compile` to build one.
+    """
 
+    source: str
+    """str: The template as written."""
+    payloads: tuple[str, ...]
+    """tuple[str, ...]: Attributes of the event data the template needs."""
+    parts: tuple[_Part, ...]
+    """tuple[_Part, ...]: The literal text and fields, in order."""
+
+    @classmethod
+    def compile(cls, source: str) -> CompiledTemplate:
+        """Compile a template.
+
+        Fields are looked up in :data:`FIELDS` and literal text is kept as
+        is, so nothing from the template itself is evaluated.
+
+        Args:
+            source: The template, in :func:`str.format` syntax, using the names
+                in :data:`FIELDS`.
+
+        Returns:
+            The compiled template.
+
+        Raises:
+            ValueError: If the template is malformed or uses an unknown field.
+        """
+        parts: list[_Part] = []
+        payloads: dict[str, None] = {}
+        for literal, name, spec, conversion in string.Formatter().parse(source):
+            if name is None:
+                parts.append(_Part(literal, None, None, ""))
+                continue
+            field: _Field | None = FIELDS.get(name)
+            if field is None:
+                msg = f"Unknown field {name!r} in template {source!r}."
+                raise ValueError(msg)
+            if conversion not in _CONVERSIONS or "{" in (spec or ""):
+                msg = f"Unsupported conversion or nested field in template {source!r}."
+                raise ValueError(msg)
+            parts.append(_Part(literal, field.get, _CONVERSIONS[conversion], spec or ""))
+            if field.payload is not None:
+                payloads[field.payload] = None
+        return cls(source=source, payloads=tuple(payloads), parts=tuple(parts))
+
+    def render(self, event: Event) -> str | None:
+        """Format an event.
+
+        Args:
+            event: The event to format.
+
+        Returns:
+            The message, or None if a payload the template reads is missing.
+        """
+        data: EventData = event.object
+        for payload in self.payloads:
+            if not getattr(data, payload):
+                return None
+        pieces: list[str] = []
+        for part in self.parts:
+            pieces.append(part.literal)
+            if part.get is not None:
+                value: object = part.get(event)
+                if part.convert is not None:
+                    value = part.convert(value)
+                pieces.append(format(value, part.spec))
+        return "".join(pieces)
+
+
+class MessageFormatter:
+    """Format events with a compiled template per event method.
 
-def format_broadcast_event(event: Event) -> str | None:
-    """Format broadcast start/stop events.
+    Args:
+        templates: Templates overriding the defaults, by event method. A
+            template of None silences that method.
+    """
+
+    def __init__(self, templates: Mapping[EventMethod | str, str | None] | None = None) -> None:
+        """Compile the templates into the dispatch table."""
+        merged: dict[EventMethod, str | None] = dict(DEFAULT_TEMPLATES)
+        for method, template in (templates or {}).items():
+            try:
+                merged[EventMethod(method)] = template
+            except ValueError:
+                msg = f"Unknown event method {method!r} in message templates."
+                raise ValueError(msg) from None
+        self._sources: dict[EventMethod, str] = {
+            method: template for method, template in merged.items() if template is not None
+        }
+        self._table: dict[EventMethod, Callable[[Event], str | None]] = {
+            method: CompiledTemplate.compile(template).render
+            for method, template in self._sources.items()
+        }
+
+    @property
+    def templates(self) -> dict[EventMethod, str]:
+        """Get the template of each formatted event method."""
+        return dict(self._sources)
+
+    def format(self, event: Event) -> str | None:
+        """Format an event.
+
+        Args:
+            event: The event to format.
+
+        Returns:
+            The message, or None if the event is not formatted.
+        """
+        render: Callable[[Event], str | None] | None = self._table.get(event.method)
+        return render(event) if render else None
+
+    def format_many(self, events: Iterable[Event]) -> list[str]:
+        """Format a page of events, skipping those that are not formatted.
+
+        Args:
+            events: The events to format.
+
+        Returns:
+            The messages, in event order.
+        """
+        table: dict[EventMethod, Callable[[Event], str | None]] = self._table
+        messages: list[str] = []
+        for event in events:
+            render: Callable[[Event], str | None] | None = table.get(event.method)
+            if render is not None and (message := render(event)) is not None:
+                messages.append(message)
+        return messages
+
+    def format_batch(self, events: Iterable[Event], separator: str = "\n") -> str:
+        """Format a page of events into a single string.
+
+        Args:
+            events: The events to format.
+            separator: String placed between messages.
+
+        Returns:
+            The messages, joined by ``separator``.
+        """
+        return separator.join(self.format_many(events))
+
+
+def load_templates(path: str | os.PathLike[str]) -> dict[str, str | None]:
+    """Read message templates from a JSON file.
+
+    The file holds an object mapping event methods, such as ``"tip"``, to
+    templates, or to null to silence a method.
 
     Args:
-        event (Event): The event object to format.
+        path: The JSON file.
 
     Returns:
-        str | None: The formatted message or None if unrecognized.
+        The templates by event method.
+
+    Raises:
+        ValueError: If the file does not hold an object of strings.
     """
-    action: typing.Literal["started", "stopped"] = (
-        "started" if event.method == EventMethod.BROADCAST_START else "stopped"
-    )
-    return f"Broadcast {action}"
+    loaded: object = json.loads(pathlib.Path(path).read_text(encoding="utf-8"))
+    if isinstance(loaded, dict):
+        items = typing.cast("dict[object, object]", loaded).items()
+        templates: dict[str, str | None] = {
+            method: template
+            for method, template in items
+            if isinstance(method, str) and isinstance(template, str | None)
+        }
+        if len(templates) == len(items):
+            return templates
+    msg = f"Message templates in {path} must map event methods to strings."
+    raise ValueError(msg)
 
 
-def format_user_event(event: Event) -> str | None:
-    """Format user-related events.
+DEFAULT_FORMATTER: MessageFormatter = MessageFormatter()
+"""MessageFormatter: The formatter using the built-in templates."""
+
+
+def format_message(event: Event) -> str | None:
+    """Format a message for a given Chaturbate event.
 
     Args:
-        event (Event): The event object to format.
+        event: The event to format.
 
     Returns:
-        str | None: The formatted message or None if unrecognized.
+        The message, or None if the event is not formatted.
     """
-    if not event.object.user:
-        return None
-
-    user: str = event.object.user.username
-    messages: dict[str, str] = {
-        EventMethod.USER_ENTER: f"{user} entered the room",
-        EventMethod.USER_LEAVE: f"{user} left the room",
-        EventMethod.FOLLOW: f"{user} followed",
-        EventMethod.UNFOLLOW: f"{user} unfollowed",
-        EventMethod.FANCLUB_JOIN: f"{user} joined the fanclub",
-    }
-    return messages.get(event.method)
+    return DEFAULT_FORMATTER.format(event)
+
+
+_BROADCAST_METHODS: frozenset[EventMethod] = frozenset({
+    EventMethod.BROADCAST_START,
+    EventMethod.BROADCAST_STOP,
+})
+_USER_METHODS: frozenset[EventMethod] = frozenset({
+    EventMethod.USER_ENTER,
+    EventMethod.USER_LEAVE,
+    EventMethod.FOLLOW,
+    EventMethod.UNFOLLOW,
+    EventMethod.FANCLUB_JOIN,
+})
+_MESSAGE_METHODS: frozenset[EventMethod] = frozenset({
+    EventMethod.CHAT_MESSAGE,
+    EventMethod.PRIVATE_MESSAGE,
+})
+_TIP_METHODS: frozenset[EventMethod] = frozenset({EventMethod.TIP})
+_SUBJECT_METHODS: frozenset[EventMethod] = frozenset({EventMethod.ROOM_SUBJECT_CHANGE})
+_MEDIA_METHODS: frozenset[EventMethod] = frozenset({EventMethod.MEDIA_PURCHASE})
+
+
+def _format_if(event: Event, methods: frozenset[EventMethod]) -> str | None:
+    """Format an event with the default formatter if it has one of the given methods."""
+    return DEFAULT_FORMATTER.format(event) if event.method in methods else None
 
 
-def format_message_event(event: Event) -> str | None:
-    """Format chat or private message events.
+def format_broadcast_event(event: Event) -> str | None:
+    """Format broadcast start/stop events with the default templates.
 
     Args:
-        event (Event): The event object to format.
+        event: The event to format.
 
     Returns:
-        str | None: The formatted message or None if unrecognized.
+        The message, or None if the event is not a broadcast start or stop.
     """
-    if not event.object.message or not event.object.user:
-        return None
+    return _format_if(event, _BROADCAST_METHODS)
 
-    message: Message = event.object.message
-    sender: str = event.object.user.username
-    return f"{sender} sent message: {message.message}"
 
+def format_user_event(event: Event) -> str | None:
+    """Format user-related events with the default templates.
+
+    Args:
+        event: The event to format.
+
+    Returns:
+        The message, or None if the event is not a user event or has no user.
+    """
+    return _format_if(event, _USER_METHODS)
 
-def format_tip_event(event: Event) -> str | None:
-    """Format tip events.
+
+def format_message_event(event: Event) -> str | None:
+    """Format chat or private message events with the default templates.
 
     Args:
-        event (Event): The event object to format.
+        event: The event to format.
 
     Returns:
-        str | None: The formatted message or None if unrecognized.
+        The message, or None if the event is not a message or lacks its payload.
     """
-    if not event.object.user or not event.object.tip:
-        return None
+    return _format_if(event, _MESSAGE_METHODS)
 
-    user: str = event.object.user.username
-    tip: Tip = event.object.tip
 
-    # Build message components
-    anonymously: Literal["anonymously", ""] = "anonymously" if tip.is_anon else ""
+def format_tip_event(event: Event) -> str | None:
+    """Format tip events with the default templates.
 
-    # Clean up message formatting
-    tip_message = ""
-    if tip.message:
-        clean_message = tip.message.removeprefix("| ").strip()
-        if clean_message:
-            tip_message = f" with message: '{clean_message}'"
+    Args:
+        event: The event to format.
 
-    # Handle spacing properly for anonymous tips
-    anon_part: str = f" {anonymously}" if anonymously else ""
-    return f"{user} tipped {tip.tokens} tokens{anon_part}{tip_message}"
+    Returns:
+        The message, or None if the event is not a tip or lacks its payload.
+    """
+    return _format_if(event, _TIP_METHODS)
 
 
 def format_room_subject_change_event(event: Event) -> str | None:
-    """Format room subject change events.
+    """Format room subject change events with the default templates.
 
     Args:
-        event (Event): The event object to format.
+        event: The event to format.
 
     Returns:
-        str | None: The formatted message or None if unrecognized.
+        The message, or None if the event is not a subject change or has no subject.
     """
-    subject: str | None = event.object.subject
-    return f"Room subject changed to: '{subject}'" if subject else None
+    return _format_if(event, _SUBJECT_METHODS)
 
 
 def format_media_purchase_event(event: Event) -> str | None:
-    """Format media purchase events.
+    """Format media purchase events with the default templates.
 
     Args:
-        event (Event): The event object to format.
+        event: The event to format.
 
     Returns:
-        str | None: The formatted message or None if unrecognized.
+        The message, or None if the event is not a media purchase or lacks its payload.
     """
-    if not event.object.user or not event.object.media:
-        return None
-
-    user: str = event.object.user.username
-    media: Media = event.object.media
-    return f"{user} purchased {media.type} set: '{media.name}' for {media.tokens} tokens"
+    return _format_if(event, _MEDIA_METHODS)
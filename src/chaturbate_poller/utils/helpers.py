@@ -35,3 +35,17 @@ def need_retry(exception: Exception) -> bool:
         logger.debug("Checking retry for status code: %s", status_code)
         return status_code in RETRYABLE_STATUS_CODES
     return False
+
+
+def is_upstream_failure(exception: BaseException) -> bool:
+    """Determine if an exception means the upstream API is unhealthy.
+
+    Args:
+        exception: The exception to check.
+
+    Returns:
+        True for retryable HTTP statuses, transport errors, and timeouts.
+    """
+    if isinstance(exception, httpx.HTTPStatusError):
+        return need_retry(exception=exception)
+    return isinstance(exception, (httpx.TransportError, TimeoutError))
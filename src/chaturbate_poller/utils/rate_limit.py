@@ -0,0 +1,86 @@
+"""Token bucket rate limiting."""
+
+from __future__ import annotations
+
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    The bucket starts full and refills continuously at ``refill_rate`` tokens
+    per second, up to ``capacity``.
+
+    Args:
+        capacity: Maximum number of tokens the bucket can hold.
+        refill_rate: Tokens added per second.
+        clock: Monotonic clock used to measure refills.
+
+    Raises:
+        ValueError: If capacity or refill rate is not positive.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_rate: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket."""
+        if capacity <= 0 or refill_rate <= 0:
+            msg = "Token bucket capacity and refill rate must be positive."
+            raise ValueError(msg)
+        self.capacity: float = capacity
+        self.refill_rate: float = refill_rate
+        self._clock: Callable[[], float] = clock
+        self._tokens: float = capacity
+        self._updated: float = clock()
+        self._lock: threading.Lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last update."""
+        now: float = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """Get the number of tokens currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens from the bucket if enough are available.
+
+        Args:
+            tokens: Number of tokens to take.
+
+        Returns:
+            True if the tokens were taken, False otherwise.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def time_until_available(self, tokens: float = 1.0) -> float:
+        """Get the seconds until enough tokens will be available.
+
+        Args:
+            tokens: Number of tokens needed.
+
+        Returns:
+            Zero if the tokens are available now, otherwise the wait in seconds.
+        """
+        with self._lock:
+            self._refill()
+            return max(tokens - self._tokens, 0.0) / self.refill_rate
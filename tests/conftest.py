@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterator
 from logging.config import dictConfig
 from typing import Any
 
@@ -6,7 +7,7 @@ import pytest
 from pytest_mock import MockerFixture
 
 from chaturbate_poller.config.backoff import BackoffConfig
-from chaturbate_poller.config.manager import ConfigManager
+from chaturbate_poller.config.manager import ConfigManager, get_config
 from chaturbate_poller.constants import EventMethod
 from chaturbate_poller.core.client import ChaturbateClient
 from chaturbate_poller.database.influxdb_handler import InfluxDBHandler
@@ -66,6 +67,14 @@ def setup_logging() -> None:
     logging.getLogger().setLevel(logging.DEBUG)
 
 
+@pytest.fixture(autouse=True)
+def clear_config_cache() -> Iterator[None]:
+    """Give every test a fresh configuration snapshot."""
+    get_config.cache_clear()
+    yield
+    get_config.cache_clear()
+
+
 @pytest.fixture
 def disabled_backoff_config() -> BackoffConfig:
     """Fixture for creating a disabled BackoffConfig instance for tests.
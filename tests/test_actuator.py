@@ -0,0 +1,112 @@
+"""Tests for the rate-limited, coalescing actuator."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+
+import pytest
+
+from chaturbate_poller import metrics
+from chaturbate_poller.core.actuator import Actuator, Command
+from chaturbate_poller.handlers.blocking_handler import BlockingPool
+from chaturbate_poller.utils.rate_limit import TokenBucket
+
+
+def _actuator(max_pending: int = 16) -> Actuator:
+    """Create an actuator sending one command every 50ms."""
+    return Actuator(TokenBucket(1, 20), max_pending=max_pending)
+
+
+class TestActuator:
+    """Tests for Actuator."""
+
+    @pytest.mark.asyncio
+    async def test_latest_command_per_key_wins(self) -> None:
+        """Test that a burst of commands for one key sends only the latest."""
+        metrics.registry.clear()
+        sent: list[str] = []
+        actuator = _actuator()
+        for color in ("red", "blue", "green"):
+            actuator.submit("color", functools.partial(sent.append, color))
+        assert [command.key for command in actuator.pending] == ["color"]
+        await actuator.close()
+        assert sent == ["green"]
+        snapshot = metrics.registry.snapshot()
+        assert snapshot['actuator_coalesced_total{actuator="device"}'] == 2
+        assert snapshot['actuator_commands_total{actuator="device"}'] == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_and_merge(self) -> None:
+        """Test that commands are spaced by the bucket and can be merged."""
+        sent: list[tuple[str, float]] = []
+        actuator = _actuator()
+
+        def command(name: str) -> None:
+            sent.append((name, time.monotonic()))
+
+        actuator.submit("color", lambda: command("red"))
+        actuator.submit("flash", lambda: command("flash 1"))
+        actuator.submit("flash", lambda: command("flash 2"), merge=lambda waiting, _: waiting)
+        await asyncio.sleep(0)
+        actuator.submit("color", lambda: command("blue"))
+        await actuator.close()
+
+        assert [name for name, _ in sent] == ["red", "flash 1", "blue"]
+        assert sent[2][1] - sent[0][1] >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_overload_drops_oldest(self) -> None:
+        """Test that the oldest waiting command is dropped when too many keys wait."""
+        metrics.registry.clear()
+        sent: list[str] = []
+        actuator = _actuator(max_pending=2)
+        for key in "abc":
+            actuator.submit(key, functools.partial(sent.append, key))
+        await actuator.close()
+        assert sent == ["b", "c"]
+        assert metrics.registry.snapshot()['actuator_dropped_total{actuator="device"}'] == 1
+
+    @pytest.mark.asyncio
+    async def test_blocking_and_async_actions(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that blocking actions run on the pool and failures do not stop the worker."""
+        threads: list[str] = []
+        actuator = Actuator(TokenBucket(10, 100), blocking=True, pool=BlockingPool(1))
+
+        def fail() -> None:
+            msg = "bridge unreachable"
+            raise OSError(msg)
+
+        async def settle() -> None:
+            threads.append("awaited")
+
+        actuator.submit("a", fail)
+        actuator.submit("b", lambda: threads.append(threading.current_thread().name))
+        actuator.submit("c", settle)
+        await actuator.close()
+        assert threads[0].startswith("blocking")
+        assert threads[1] == "awaited"
+        assert "Command 'a' for device failed." in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_close_without_draining(self) -> None:
+        """Test that waiting commands can be discarded and closed actuators refuse more."""
+        sent: list[str] = []
+        actuator = _actuator()
+        actuator.submit("a", lambda: sent.append("a"))
+        actuator.submit("b", lambda: sent.append("b"))
+        await asyncio.sleep(0.01)
+        await actuator.close(drain=False)
+        assert sent == ["a"]
+        with pytest.raises(RuntimeError, match="closed"):
+            actuator.submit("c", lambda: None)
+
+    def test_invalid_settings(self) -> None:
+        """Test that pending limits and command costs are validated."""
+        with pytest.raises(ValueError, match="pending commands"):
+            _actuator(max_pending=0)
+        with pytest.raises(ValueError, match="bucket capacity"):
+            _actuator().submit("a", lambda: None, cost=2)
+        assert Command("a", print).cost == 1.0
@@ -0,0 +1,84 @@
+"""Tests for adaptive long-poll timeout tuning."""
+
+import httpx
+import pytest
+
+from chaturbate_poller import metrics
+from chaturbate_poller.core.adaptive_timeout import AdaptiveTimeout
+from chaturbate_poller.core.client import ChaturbateClient
+from chaturbate_poller.core.transport import PooledTransport
+from chaturbate_poller.metrics import MetricsRegistry
+
+from .constants import TEST_URL, TOKEN, USERNAME, VALID_TIP_EVENT
+
+
+class TestAdaptiveTimeout:
+    """Tests for AdaptiveTimeout."""
+
+    def test_initial_value_is_clamped(self) -> None:
+        """Test that the initial timeout is clamped to the bounds."""
+        assert AdaptiveTimeout(initial=0, minimum=5, maximum=30).value == 5
+        assert AdaptiveTimeout(initial=90, minimum=5, maximum=30).value == 30
+
+    @pytest.mark.parametrize(
+        ("minimum", "maximum", "busy_threshold"), [(0, 10, 5), (10, 5, 5), (1, 10, 0)]
+    )
+    def test_invalid_configuration(self, minimum: int, maximum: int, busy_threshold: int) -> None:
+        """Test that invalid bounds or thresholds are rejected."""
+        with pytest.raises(ValueError, match="must"):
+            AdaptiveTimeout(minimum=minimum, maximum=maximum, busy_threshold=busy_threshold)
+
+    def test_idle_responses_grow_until_maximum(self) -> None:
+        """Test that idle returns increase the timeout up to the maximum."""
+        timeout = AdaptiveTimeout(initial=10, minimum=1, maximum=30)
+        assert [timeout.observe(0) for _ in range(3)] == [20, 30, 30]
+
+    def test_full_pages_shrink_until_minimum(self) -> None:
+        """Test that full pages decrease the timeout down to the minimum."""
+        timeout = AdaptiveTimeout(initial=10, minimum=3, maximum=30, busy_threshold=5)
+        assert [timeout.observe(5) for _ in range(3)] == [5, 3, 3]
+        assert timeout.fill_rate == 1.0
+
+    def test_partial_pages_keep_timeout(self) -> None:
+        """Test that partially filled pages leave the timeout unchanged."""
+        timeout = AdaptiveTimeout(initial=10, busy_threshold=10)
+        assert timeout.observe(4) == 10
+        assert timeout.fill_rate == 0.4
+
+    def test_reports_to_gauge(self) -> None:
+        """Test that the chosen timeout is published as a metric."""
+        gauge = MetricsRegistry().gauge("long_poll_timeout_seconds")
+        timeout = AdaptiveTimeout(initial=10, maximum=60, gauge=gauge)
+        assert gauge.value == 10
+        timeout.observe(0)
+        assert gauge.value == 20
+
+    def test_apply_replaces_timeout_parameter(self) -> None:
+        """Test that the URL's timeout parameter is set to the current value."""
+        timeout = AdaptiveTimeout(initial=25)
+        url = timeout.apply(f"{TEST_URL}?i=abc&timeout=10")
+        assert url == f"{TEST_URL}?i=abc&timeout=25"
+        assert timeout.apply(TEST_URL) == f"{TEST_URL}?timeout=25"
+
+    @pytest.mark.asyncio
+    async def test_client_applies_and_observes(self) -> None:
+        """Test that the client rewrites request URLs and feeds back page sizes."""
+        requested: list[str] = []
+        pages = iter([[], [VALID_TIP_EVENT]])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            return httpx.Response(200, json={"events": next(pages)})
+
+        adaptive = AdaptiveTimeout(initial=10, maximum=60, busy_threshold=1)
+        transport = PooledTransport(transport=httpx.MockTransport(handler))
+        async with ChaturbateClient(
+            USERNAME, TOKEN, transport=transport, adaptive_timeout=adaptive
+        ) as client:
+            await client.fetch_events()
+            await client.fetch_events()
+
+        assert requested == [f"{TEST_URL}?timeout=10", f"{TEST_URL}?timeout=20"]
+        assert adaptive.value == 10
+        key = f'long_poll_timeout_seconds{{broadcaster="{USERNAME}"}}'
+        assert metrics.registry.snapshot()[key] == 10
@@ -0,0 +1,132 @@
+"""Tests for blocking handlers run on a thread pool."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from chaturbate_poller import metrics
+from chaturbate_poller.handlers.blocking_handler import BlockingEventHandler, BlockingPool
+
+if TYPE_CHECKING:
+    from chaturbate_poller.models.event import Event
+
+
+class Recorder(BlockingEventHandler):
+    """Blocking handler recording its calls, optionally held until released."""
+
+    def __init__(self, release: threading.Event | None = None, **options: int) -> None:
+        """Initialize with an optional gate every call waits on."""
+        super().__init__(pool=BlockingPool(4), **options)
+        self.release: threading.Event = release or threading.Event()
+        if release is None:
+            self.release.set()
+        self.events: list[Event] = []
+        self.threads: set[str] = set()
+        self.running: int = 0
+        self.peak: int = 0
+        self.lock: threading.Lock = threading.Lock()
+        self.shut_down: bool = False
+
+    def process(self, event: Event) -> None:
+        """Record the event after the gate opens."""
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        self.release.wait(5)
+        with self.lock:
+            self.running -= 1
+            self.events.append(event)
+            self.threads.add(threading.current_thread().name)
+
+    def shutdown(self) -> None:
+        """Record the shutdown."""
+        self.shut_down = True
+
+
+class TestBlockingEventHandler:
+    """Tests for BlockingEventHandler."""
+
+    @pytest.mark.asyncio
+    async def test_polling_does_not_wait_for_work(self, sample_event: Event) -> None:
+        """Test that pages are queued and processed on the pool off the loop."""
+        metrics.registry.clear()
+        release = threading.Event()
+        handler = Recorder(release)
+        await asyncio.wait_for(handler.handle_event(sample_event), 1)
+        await asyncio.wait_for(handler.handle_batch([sample_event, sample_event]), 1)
+        await asyncio.sleep(0.05)
+        assert handler.events == []
+        assert metrics.registry.snapshot()["blocking_pool_saturation"] == 0.25
+
+        release.set()
+        await handler.close()
+        assert handler.events == [sample_event] * 3
+        assert all(name.startswith("blocking") for name in handler.threads)
+        assert handler.shut_down
+        assert metrics.registry.snapshot()["blocking_pool_calls"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, sample_event: Event) -> None:
+        """Test that at most the configured number of pages run at once."""
+        release = threading.Event()
+        handler = Recorder(release, concurrency=2)
+        for _ in range(4):
+            await handler.handle_event(sample_event)
+        await asyncio.sleep(0.05)
+        assert handler.running == 2
+        release.set()
+        await handler.close()
+        assert (handler.peak, len(handler.events)) == (2, 4)
+
+    @pytest.mark.asyncio
+    async def test_full_queue_applies_backpressure(self, sample_event: Event) -> None:
+        """Test that polling waits, and the wait is counted, when the queue is full."""
+        metrics.registry.clear()
+        release = threading.Event()
+        handler = Recorder(release, queue_size=1)
+        await handler.handle_event(sample_event)
+        await asyncio.sleep(0.05)
+        await handler.handle_event(sample_event)
+        blocked = asyncio.create_task(handler.handle_event(sample_event))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+        release.set()
+        await blocked
+        await handler.close()
+        assert len(handler.events) == 3
+        snapshot = metrics.registry.snapshot()
+        assert snapshot['blocking_handler_queue_full_total{handler="Recorder"}'] == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_logged(
+        self, sample_event: Event, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a failing page is logged and counted without stopping the worker."""
+        metrics.registry.clear()
+
+        class Failing(Recorder):
+            def process(self, event: Event) -> None:
+                if not self.events:
+                    self.events.append(event)
+                    msg = "boom"
+                    raise RuntimeError(msg)
+                super().process(event)
+
+        handler = Failing()
+        await handler.handle_event(sample_event)
+        await handler.handle_event(sample_event)
+        await handler.close()
+        assert len(handler.events) == 2
+        assert "Failing failed on 1 event(s)." in caplog.text
+        assert metrics.registry.snapshot()['blocking_handler_errors_total{handler="Failing"}'] == 1
+
+    def test_invalid_settings(self) -> None:
+        """Test that the pool size, concurrency and queue size are validated."""
+        with pytest.raises(ValueError, match="pool size"):
+            BlockingPool(0)
+        with pytest.raises(ValueError, match="concurrency and queue size"):
+            Recorder(concurrency=0)
@@ -4,6 +4,7 @@ import pytest
 from click.testing import CliRunner
 
 from chaturbate_poller.cli import cli
+from chaturbate_poller.constants import LoopImplementation
 from chaturbate_poller.exceptions import AuthenticationError, PollingError
 from chaturbate_poller.models.options import PollerOptions
 
@@ -32,8 +33,8 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Manage and run the Chaturbate Poller CLI" in result.output
 
-    @patch("chaturbate_poller.cli.commands.ConfigManager")
-    @patch("chaturbate_poller.cli.commands.main", new_callable=AsyncMock)
+    @patch("chaturbate_poller.config.manager.ConfigManager")
+    @patch("chaturbate_poller.core.runner.main", new_callable=AsyncMock)
     def test_start_command_defaults(
         self, mock_main: AsyncMock, mock_config_manager: AsyncMock, runner: CliRunner
     ) -> None:
@@ -55,7 +56,7 @@ class TestCLI:
         )
         mock_main.assert_awaited_once_with(expected_options)
 
-    @patch("chaturbate_poller.cli.commands.main", new_callable=AsyncMock)
+    @patch("chaturbate_poller.core.runner.main", new_callable=AsyncMock)
     def test_start_command_custom_options(self, mock_main: AsyncMock, runner: CliRunner) -> None:
         """Test the `start` command with custom options."""
         result = runner.invoke(
@@ -71,6 +72,19 @@ class TestCLI:
                 "--testbed",
                 "--database",
                 "--verbose",
+                "--http2",
+                "--monitor-loop",
+                "--slow-callback-threshold",
+                "0.5",
+                "--loop",
+                "asyncio",
+                "--executor-workers",
+                "4",
+                "--eager-tasks",
+                "--health-port",
+                "8081",
+                "--memory-budget",
+                "200",
             ],
         )
         assert result.exit_code == 0
@@ -81,17 +95,25 @@ class TestCLI:
             testbed=True,
             use_database=True,
             verbose=True,
+            http2=True,
+            monitor_loop=True,
+            slow_callback_threshold=0.5,
+            event_loop=LoopImplementation.ASYNCIO,
+            executor_workers=4,
+            eager_tasks=True,
+            health_port=8081,
+            memory_budget=200,
         )
         mock_main.assert_awaited_once_with(expected_options)
 
-    @patch("chaturbate_poller.cli.commands.main", new_callable=AsyncMock)
+    @patch("chaturbate_poller.core.runner.main", new_callable=AsyncMock)
     def test_start_command_invalid_timeout(self, mock_main: AsyncMock, runner: CliRunner) -> None:
         """Test the `start` command with invalid timeout value."""
         result = runner.invoke(cli, ["start", "--timeout", "invalid"])
         assert result.exit_code == 2
         mock_main.assert_not_awaited()
 
-    @patch("chaturbate_poller.cli.commands.main", new_callable=AsyncMock)
+    @patch("chaturbate_poller.core.runner.main", new_callable=AsyncMock)
     def test_start_command_authentication_error(
         self, mock_main: AsyncMock, runner: CliRunner
     ) -> None:
@@ -106,7 +128,7 @@ class TestCLI:
         assert result.exit_code == 1
         mock_main.assert_awaited_once()
 
-    @patch("chaturbate_poller.cli.commands.main", new_callable=AsyncMock)
+    @patch("chaturbate_poller.core.runner.main", new_callable=AsyncMock)
     def test_start_command_polling_error_verbose(
         self, mock_main: AsyncMock, runner: CliRunner
     ) -> None:
@@ -121,7 +143,7 @@ class TestCLI:
         assert result.exit_code == 1
         mock_main.assert_awaited_once()
 
-    @patch("chaturbate_poller.cli.commands.main", new_callable=AsyncMock)
+    @patch("chaturbate_poller.core.runner.main", new_callable=AsyncMock)
     def test_start_command_polling_error_non_verbose(
         self, mock_main: AsyncMock, runner: CliRunner
     ) -> None:
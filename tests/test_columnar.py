@@ -0,0 +1,103 @@
+"""Tests for columnar event batches."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from chaturbate_poller.analytics import columnar
+from chaturbate_poller.analytics.columnar import NO_USER, BatchBuilder, EventBatch, batches
+from chaturbate_poller.analytics.users import UserTable
+from chaturbate_poller.constants import EXAMPLE_JSON_STRING, EventMethod
+from chaturbate_poller.models.api_response import EventsAPIResponse
+from chaturbate_poller.models.event import Event
+from chaturbate_poller.models.event_data import EventData
+from chaturbate_poller.models.tip import Tip
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from chaturbate_poller.models.user import User
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test with the standard library and with NumPy reductions."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columnar, "_numpy", lambda: None)
+    return str(request.param)
+
+
+def _tip(user: User, tokens: int) -> Event:
+    """Build a tip event."""
+    tip = Tip(tokens=tokens, isAnon=False, message="")
+    return Event(method=EventMethod.TIP, object=EventData(user=user, tip=tip), id="t")
+
+
+@pytest.fixture
+def batch(example_user: User, sample_event: Event) -> EventBatch:
+    """Build a batch from two pages."""
+    builder = BatchBuilder(clock=lambda: 5.0)
+    media = EventsAPIResponse.model_validate_json(EXAMPLE_JSON_STRING).events
+    enter = Event(method=EventMethod.USER_ENTER, object=EventData(user=example_user), id="e")
+    subject = Event(method=EventMethod.ROOM_SUBJECT_CHANGE, object=EventData(subject="hi"), id="s")
+    builder.add_page([sample_event, enter, _tip(example_user, 10), subject], timestamp=1.0)
+    builder.add_page(media)
+    return builder.build()
+
+
+@pytest.mark.usefixtures("backend")
+class TestEventBatch:
+    """Tests for EventBatch reductions."""
+
+    def test_columns(self, batch: EventBatch) -> None:
+        """Test that each event fills one row of every column."""
+        assert len(batch) == 5
+        assert list(batch.tokens) == [100, 0, 10, 0, 25]
+        assert list(batch.user_ids) == [0, 1, 1, NO_USER, 1]
+        assert list(batch.timestamps) == [1.0, 1.0, 1.0, 1.0, 5.0]
+
+    def test_sums_and_counts(self, batch: EventBatch) -> None:
+        """Test the sums and group-by counts."""
+        assert batch.total_tokens() == 135
+        assert batch.count_by_method() == {
+            EventMethod.MEDIA_PURCHASE: 1,
+            EventMethod.ROOM_SUBJECT_CHANGE: 1,
+            EventMethod.TIP: 2,
+            EventMethod.USER_ENTER: 1,
+        }
+        assert batch.tokens_by_method() == {EventMethod.MEDIA_PURCHASE: 25, EventMethod.TIP: 110}
+        assert batch.count_by_user() == {0: 1, 1: 3}
+
+    @pytest.mark.parametrize(("q", "expected"), [(0, 10.0), (50, 25.0), (75, 62.5), (100, 100.0)])
+    def test_token_percentile(self, batch: EventBatch, q: float, expected: float) -> None:
+        """Test that percentiles interpolate between token amounts."""
+        assert batch.token_percentile(q) == pytest.approx(expected)
+
+    def test_empty_batch(self) -> None:
+        """Test reductions over an empty batch."""
+        empty = EventBatch()
+        assert (empty.total_tokens(), empty.count_by_method(), empty.count_by_user()) == (0, {}, {})
+        assert empty.token_percentile(50) == 0.0
+
+    def test_percentile_range(self) -> None:
+        """Test that the percentile must be between 0 and 100."""
+        with pytest.raises(ValueError, match="Percentile must be between 0 and 100"):
+            EventBatch().token_percentile(101)
+
+
+@pytest.mark.asyncio
+async def test_batches_group_pages(sample_event: Event) -> None:
+    """Test that pages are grouped into batches of a minimum size."""
+    users = UserTable()
+
+    async def pages() -> AsyncIterator[EventsAPIResponse]:
+        for count in (1, 2, 1):
+            yield EventsAPIResponse(events=[sample_event] * count, nextUrl=None)
+
+    sizes = [len(batch) async for batch in batches(pages(), BatchBuilder(users), size=3)]
+    assert sizes == [3, 1]
+    assert users.get("test_user") is not None
@@ -0,0 +1,97 @@
+"""Tests for the compact event representation."""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import pytest
+
+from chaturbate_poller.constants import EXAMPLE_JSON_STRING, EventMethod
+from chaturbate_poller.models.api_response import EventsAPIResponse
+from chaturbate_poller.models.compact import METHOD_CODES, METHODS, CompactEvent
+from chaturbate_poller.models.event import Event
+from chaturbate_poller.models.event_data import EventData
+from chaturbate_poller.models.message import Message
+
+if TYPE_CHECKING:
+    from chaturbate_poller.models.user import User
+
+
+def _retained(build: object) -> int:
+    """Measure the memory retained by the result of a callable."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()  # type: ignore[operator]
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return retained
+
+
+class TestCompactEvent:
+    """Tests for CompactEvent."""
+
+    def test_method_codes_round_trip(self) -> None:
+        """Test that every method has a unique code."""
+        assert [METHODS[METHOD_CODES[method]] for method in EventMethod] == list(EventMethod)
+
+    def test_round_trip_tip(self, sample_event: Event) -> None:
+        """Test that a tip event survives conversion."""
+        compact = CompactEvent.from_event(sample_event)
+        assert compact.method is EventMethod.TIP
+        assert compact.tokens == 100
+        assert compact.to_event() == sample_event
+
+    def test_round_trip_media_purchase(self) -> None:
+        """Test that a media purchase survives conversion."""
+        event = EventsAPIResponse.model_validate_json(EXAMPLE_JSON_STRING).events[0]
+        compact = CompactEvent.from_event(event)
+        assert compact.tokens == 25
+        assert compact.to_event().model_dump() == event.model_dump()
+
+    @pytest.mark.parametrize(
+        ("from_user", "to_user", "method"),
+        [(None, None, EventMethod.CHAT_MESSAGE), ("a", "b", EventMethod.PRIVATE_MESSAGE)],
+    )
+    def test_round_trip_message(
+        self,
+        example_user: User,
+        from_user: str | None,
+        to_user: str | None,
+        method: EventMethod,
+    ) -> None:
+        """Test that chat and private messages survive conversion."""
+        message = Message(
+            color="#fff",
+            bgColor=None,
+            message="hi",
+            font="default",
+            fromUser=from_user,
+            toUser=to_user,
+        )
+        event = Event(method=method, object=EventData(user=example_user, message=message), id="9")
+        restored = CompactEvent.from_event(event).to_event()
+        assert restored == event
+        assert restored.object.message is not None
+        assert restored.object.message.is_private_message is (from_user is not None)
+
+    def test_usernames_are_interned(self, sample_event: Event) -> None:
+        """Test that repeated usernames share one string."""
+        copy = Event.model_validate_json(sample_event.model_dump_json(by_alias=True))
+        first = CompactEvent.from_event(sample_event)
+        second = CompactEvent.from_event(copy)
+        assert first.username is second.username
+        assert first.username is sys.intern("test_user")
+
+    def test_uses_less_memory(self, sample_event: Event) -> None:
+        """Test that buffered compact events are much smaller than pydantic ones."""
+        raw = sample_event.model_dump_json(by_alias=True)
+        full = _retained(lambda: [Event.model_validate_json(raw) for _ in range(500)])
+        compact = _retained(
+            lambda: [CompactEvent.from_event(Event.model_validate_json(raw)) for _ in range(500)]
+        )
+        assert compact * 3 < full
@@ -2,7 +2,10 @@ import os
 from pathlib import Path
 from unittest import mock
 
-from chaturbate_poller.config.manager import ConfigManager
+import pytest
+
+from chaturbate_poller.config.manager import ConfigManager, get_config
+from chaturbate_poller.config.watcher import ConfigWatcher
 
 
 class TestConfigManager:
@@ -50,6 +53,16 @@ class TestConfigManager:
             "INFLUXDB_ORG": "",
             "INFLUXDB_BUCKET": "",
             "USE_DATABASE": False,
+            "LOG_LEVEL": "",
+            "SQLITE_PATH": "",
+            "ARCHIVE_DIR": "",
+            "JSONL_DIR": "",
+            "MESSAGE_TEMPLATES": "",
+            "WEBHOOK_URLS": "",
+            "WEBHOOK_SECRET": "",
+            "WEBHOOK_METHODS": "",
+            "WEBHOOK_DEAD_LETTER": "",
+            "HEALTH_PORT": "",
             "INFLUXDB_INIT_MODE": "",
             "INFLUXDB_INIT_USERNAME": "",
             "INFLUXDB_INIT_PASSWORD": "",
@@ -76,6 +89,16 @@ class TestConfigManager:
             "INFLUXDB_ORG": "",
             "INFLUXDB_BUCKET": "",
             "USE_DATABASE": False,
+            "LOG_LEVEL": "",
+            "SQLITE_PATH": "",
+            "ARCHIVE_DIR": "",
+            "JSONL_DIR": "",
+            "MESSAGE_TEMPLATES": "",
+            "WEBHOOK_URLS": "",
+            "WEBHOOK_SECRET": "",
+            "WEBHOOK_METHODS": "",
+            "WEBHOOK_DEAD_LETTER": "",
+            "HEALTH_PORT": "",
             "INFLUXDB_INIT_MODE": "",
             "INFLUXDB_INIT_USERNAME": "",
             "INFLUXDB_INIT_PASSWORD": "",
@@ -129,3 +152,73 @@ class TestConfigManager:
 
         # Test string value that's not boolean-ish
         assert config_manager.get_bool("CB_USERNAME", default=False) is False
+
+    @mock.patch.dict(os.environ, {"INFLUXDB_URL": "7", "INFLUXDB_ORG": "1.5"}, clear=True)
+    def test_typed_accessors(self) -> None:
+        """Test integer and float accessors with valid, invalid and missing values."""
+        config_manager = ConfigManager()
+        assert config_manager.get_int("INFLUXDB_URL") == 7
+        assert config_manager.get_int("INFLUXDB_ORG", default=3) == 3
+        assert config_manager.get_float("INFLUXDB_ORG") == 1.5
+        assert config_manager.get_float("CB_TOKEN", default=2.0) == 2.0
+
+    @mock.patch.dict(os.environ, {}, clear=True)
+    def test_get_config_is_cached(self) -> None:
+        """Test that the shared snapshot is built once."""
+        with mock.patch("chaturbate_poller.config.manager.ConfigManager") as mock_manager:
+            assert get_config() is get_config()
+        mock_manager.assert_called_once_with(env_file=".env")
+
+    @mock.patch.dict(os.environ, {}, clear=True)
+    def test_reload_picks_up_file_changes(self, tmp_path: Path) -> None:
+        """Test that reload replaces the snapshot with the file's new values."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("CB_USERNAME=first\n")
+        config_manager = ConfigManager(env_file=str(env_file))
+        snapshot = config_manager.config
+        env_file.write_text("CB_USERNAME=second\n")
+
+        config_manager.reload()
+
+        assert config_manager.get("CB_USERNAME") == "second"
+        assert snapshot["CB_USERNAME"] == "first"
+
+    @mock.patch.dict(os.environ, {"CB_TOKEN": "from_env"}, clear=True)
+    def test_reload_keeps_environment_precedence(self, tmp_path: Path) -> None:
+        """Test that reload keeps real variables over the file and unsets removed keys."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("CB_USERNAME=first\nCB_TOKEN=from_file\nLOG_LEVEL=DEBUG\n")
+        config_manager = ConfigManager(env_file=str(env_file))
+        assert config_manager.get("CB_TOKEN") == "from_env"
+        env_file.write_text("CB_USERNAME=second\nCB_TOKEN=edited\n")
+
+        config_manager.reload()
+
+        assert config_manager.get("CB_USERNAME") == "second"
+        assert config_manager.get("CB_TOKEN") == "from_env"
+        assert config_manager.get("LOG_LEVEL") == ""
+        assert "LOG_LEVEL" not in os.environ
+
+
+class TestConfigWatcher:
+    """Tests for the configuration file watcher."""
+
+    @mock.patch.dict(os.environ, {}, clear=True)
+    def test_check_reloads_on_change(self, tmp_path: Path) -> None:
+        """Test that a changed file triggers a reload and the callbacks."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("CB_USERNAME=first\n")
+        reloaded: list[ConfigManager] = []
+        config_manager = ConfigManager(env_file=str(env_file))
+        watcher = ConfigWatcher(config_manager, on_reload=[reloaded.append])
+
+        assert watcher.check() is False
+        env_file.write_text("CB_USERNAME=changed\n")
+        assert watcher.check() is True
+        assert reloaded == [config_manager]
+        assert config_manager.get("CB_USERNAME") == "changed"
+
+    def test_invalid_interval(self, config_manager: ConfigManager) -> None:
+        """Test that a non-positive interval is rejected."""
+        with pytest.raises(ValueError, match="Watch interval must be positive"):
+            ConfigWatcher(config_manager, interval=0)
@@ -1,8 +1,12 @@
+import logging
+from unittest import mock
 from unittest.mock import AsyncMock
 
 import pytest
 
+from chaturbate_poller.database.influxdb_handler import InfluxDBHandler
 from chaturbate_poller.handlers.database_handler import DatabaseEventHandler
+from chaturbate_poller.handlers.event_handler import EventHandler
 from chaturbate_poller.handlers.factory import HandlerType, create_event_handler
 from chaturbate_poller.handlers.logging_handler import LoggingEventHandler
 from chaturbate_poller.models.event import Event
@@ -35,3 +39,56 @@ class TestEventHandler:
         mock_influxdb_handler.write_event.assert_called_once_with(
             measurement="chaturbate_events", data=sample_event.model_dump()
         )
+
+    @pytest.mark.asyncio
+    async def test_default_handle_batch(self, sample_event: Event) -> None:
+        """Test that the default batch adapter handles each event in order."""
+        handled: list[str] = []
+
+        class RecordingHandler(EventHandler):
+            async def handle_event(self, event: Event) -> None:
+                handled.append(event.id)
+
+        second = sample_event.model_copy(update={"id": "2"})
+        await RecordingHandler().handle_batch([sample_event, second])
+        assert handled == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_logging_handle_batch(
+        self, sample_event: Event, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that the logging handler formats a page only when INFO is enabled."""
+        handler = LoggingEventHandler()
+        with caplog.at_level(logging.INFO):
+            await handler.handle_batch([sample_event, sample_event])
+        assert caplog.text.count("test_user tipped 100 tokens") == 2
+
+        caplog.clear()
+        with (
+            caplog.at_level(logging.WARNING, logger="chaturbate_poller.handlers.logging_handler"),
+            mock.patch.object(handler.formatter, "format_many") as formatter,
+        ):
+            await handler.handle_batch([sample_event])
+        formatter.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_database_handle_batch(
+        self, influxdb_handler: InfluxDBHandler, sample_event: Event
+    ) -> None:
+        """Test that the database handler writes a page in one request."""
+        event = sample_event.model_copy(
+            update={"object": sample_event.object.model_copy(update={"broadcaster": "b"})}
+        )
+        handler = DatabaseEventHandler(influxdb_handler)
+        with (
+            mock.patch.object(influxdb_handler, "encode_event", side_effect=["a", "b"]) as encode,
+            mock.patch.object(influxdb_handler, "write_line_protocol") as write,
+            mock.patch("time.time_ns", return_value=5),
+        ):
+            await handler.handle_batch([event, event])
+            await handler.handle_batch([])
+        assert encode.call_args_list == [
+            mock.call("chaturbate_events", event.model_dump(), timestamp=5),
+            mock.call("chaturbate_events", event.model_dump(), timestamp=6),
+        ]
+        write.assert_awaited_once_with("a\nb")
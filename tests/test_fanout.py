@@ -0,0 +1,244 @@
+"""Tests for the WebSocket and SSE fan-out server."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from chaturbate_poller import metrics
+from chaturbate_poller.constants import EventMethod
+from chaturbate_poller.core.runner import _handler_factory
+from chaturbate_poller.handlers.fanout_handler import FanoutEventHandler
+from chaturbate_poller.models.event import Event
+from chaturbate_poller.models.event_data import EventData
+from chaturbate_poller.models.options import PollerOptions
+from chaturbate_poller.server.fanout import (
+    OPCODE_CLOSE,
+    OPCODE_PING,
+    OPCODE_PONG,
+    FanoutServer,
+    Protocol,
+    SlowConsumerPolicy,
+    Subscriber,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+KEY = "dGhlIHNhbXBsZSBub25jZQ=="
+
+
+@pytest.fixture
+async def server() -> AsyncIterator[FanoutServer]:
+    """Run a fan-out server on a free port."""
+    server = FanoutServer(port=0)
+    await server.start()
+    yield server
+    await server.close()
+
+
+async def _connect(
+    server: FanoutServer, request: str
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, bytes]:
+    """Send a request and read the response head."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    writer.write(request.encode())
+    head = await reader.readuntil(b"\r\n\r\n")
+    return reader, writer, head
+
+
+async def _subscribed(server: FanoutServer, count: int) -> None:
+    """Wait until the server has registered the subscribers."""
+    while server.subscribers < count:  # noqa: ASYNC110
+        await asyncio.sleep(0)
+
+
+def _masked(payload: bytes, opcode: int) -> bytes:
+    """Frame a payload as a masked client WebSocket frame."""
+    mask = b"\x01\x02\x03\x04"
+    data = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+    return struct.pack("!BB", 0x80 | opcode, 0x80 | len(payload)) + mask + data
+
+
+async def _frame(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Read one unmasked server WebSocket frame."""
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    return first & 0x0F, await reader.readexactly(length)
+
+
+class TestFanoutServer:
+    """Tests for FanoutServer."""
+
+    @pytest.mark.asyncio
+    async def test_sse_filters_methods(self, server: FanoutServer, sample_event: Event) -> None:
+        """Test that an SSE subscriber only receives the methods it asked for."""
+        reader, writer, head = await _connect(
+            server, "GET /events?methods=tip HTTP/1.1\r\nHost: x\r\n\r\n"
+        )
+        assert b"text/event-stream" in head
+        await _subscribed(server, 1)
+
+        enter = Event(method=EventMethod.USER_ENTER, object=EventData(), id="e")
+        server.publish([enter, sample_event])
+        frame = await reader.readuntil(b"\n\n")
+        assert frame.startswith(b"event: tip\ndata: ")
+        assert json.loads(frame.split(b"data: ", 1)[1])["object"]["user"]["inFanclub"] is False
+        writer.close()
+
+    @pytest.mark.asyncio
+    async def test_websocket(self, server: FanoutServer, sample_event: Event) -> None:
+        """Test the handshake, event frames, pings and the closing handshake."""
+        reader, writer, head = await _connect(
+            server,
+            "GET /events HTTP/1.1\r\nHost: x\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {KEY}\r\nSec-WebSocket-Version: 13\r\n\r\n",
+        )
+        # The accept value from the example handshake in RFC 6455.
+        assert b"101 Switching Protocols" in head
+        assert b"Sec-WebSocket-Accept: s3pPLMBiTxaQ9kYGzzhZRbK+xOo=" in head
+        await _subscribed(server, 1)
+
+        server.publish([sample_event, sample_event])
+        for _ in range(2):
+            opcode, payload = await _frame(reader)
+            assert opcode == 1
+            assert Event.model_validate_json(payload) == sample_event
+
+        writer.write(_masked(b"hi", OPCODE_PING))
+        assert await _frame(reader) == (OPCODE_PONG, b"hi")
+        writer.write(_masked(struct.pack("!H", 1000), OPCODE_CLOSE))
+        assert await _frame(reader) == (OPCODE_CLOSE, struct.pack("!H", 1000))
+        assert await reader.read() == b""
+        assert server.subscribers == 0
+
+    @pytest.mark.parametrize(
+        ("request_head", "status"),
+        [
+            ("GET /other HTTP/1.1\r\n\r\n", b"404"),
+            ("POST /events HTTP/1.1\r\n\r\n", b"405"),
+            ("GET /events?methods=tips HTTP/1.1\r\n\r\n", b"400"),
+            ("GET /events HTTP/1.1\r\nUpgrade: websocket\r\n\r\n", b"400"),
+            ("nonsense\r\n\r\n", b"400"),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_rejects_bad_requests(
+        self, server: FanoutServer, request_head: str, status: bytes
+    ) -> None:
+        """Test that invalid requests are answered and closed."""
+        reader, writer, head = await _connect(server, request_head)
+        assert head.split(b" ")[1] == status
+        await reader.read()
+        writer.close()
+        assert server.subscribers == 0
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_subscribers(
+        self, server: FanoutServer, sample_event: Event
+    ) -> None:
+        """Test that closing the server sends what is buffered, then disconnects."""
+        reader, writer, _ = await _connect(server, "GET /events HTTP/1.1\r\n\r\n")
+        await _subscribed(server, 1)
+        server.publish([sample_event])
+        await server.close()
+        assert (await reader.read()).count(b"event: tip") == 1
+        writer.close()
+
+    def test_invalid_settings(self) -> None:
+        """Test that the buffer size and heartbeat must be positive."""
+        with pytest.raises(ValueError, match="must be positive"):
+            FanoutServer(max_buffer=0)
+
+
+class TestSubscriber:
+    """Tests for the slow-consumer policies."""
+
+    def test_evicts_when_full(self) -> None:
+        """Test that a full subscriber is disconnected under the evict policy."""
+        metrics.registry.clear()
+        writer = mock.Mock()
+        subscriber = Subscriber(Protocol.SSE, writer, None, 2, SlowConsumerPolicy.EVICT)
+        assert subscriber.offer(b"1")
+        assert subscriber.offer(b"2")
+        assert not subscriber.offer(b"3")
+        assert subscriber.closed
+        assert subscriber.buffered == 0
+        writer.transport.abort.assert_called_once_with()
+        assert metrics.registry.snapshot()["fanout_subscribers_evicted_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_drops_oldest(self) -> None:
+        """Test that a full subscriber loses its oldest frames under the drop policy."""
+        metrics.registry.clear()
+        writer = mock.Mock(drain=mock.AsyncMock(), is_closing=mock.Mock(return_value=False))
+        subscriber = Subscriber(Protocol.SSE, writer, None, 2, SlowConsumerPolicy.DROP_OLDEST)
+        for frame in (b"1", b"2", b"3"):
+            assert subscriber.offer(frame)
+        subscriber.close()
+        await subscriber.send(heartbeat=1)
+        writer.write.assert_called_once_with(b"23")
+        assert metrics.registry.snapshot()["fanout_frames_dropped_total"] == 1
+
+    def test_trim(self) -> None:
+        """Test that trimming discards the oldest half of the unsent frames."""
+        metrics.registry.clear()
+        subscriber = Subscriber(Protocol.SSE, mock.Mock(), None, 10, SlowConsumerPolicy.EVICT)
+        for frame in (b"1", b"22", b"333"):
+            subscriber.offer(frame)
+        assert subscriber.buffered_bytes == 6
+        subscriber.trim()
+        assert (subscriber.buffered, subscriber.buffered_bytes) == (1, 3)
+        assert metrics.registry.snapshot()["fanout_frames_dropped_total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_heartbeat(self) -> None:
+        """Test that an idle subscriber receives a keepalive frame."""
+        writer = mock.Mock(drain=mock.AsyncMock(), is_closing=mock.Mock(return_value=False))
+        subscriber = Subscriber(Protocol.SSE, writer, None, 2, SlowConsumerPolicy.EVICT)
+        sending = asyncio.create_task(subscriber.send(heartbeat=0.01))
+        while not writer.write.called:  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+        subscriber.close()
+        await sending
+        writer.write.assert_any_call(b": ping\n\n")
+
+
+class TestFanoutEventHandler:
+    """Tests for FanoutEventHandler."""
+
+    @pytest.mark.asyncio
+    async def test_publishes_then_delegates(self, sample_event: Event) -> None:
+        """Test that pages reach the server and the wrapped handler."""
+        server = mock.Mock()
+        inner = mock.AsyncMock()
+        handler = FanoutEventHandler(server, inner)
+        await handler.handle_event(sample_event)
+        await handler.close()
+        server.publish.assert_called_once_with([sample_event])
+        inner.handle_batch.assert_awaited_once_with([sample_event])
+        inner.close.assert_awaited_once_with()
+        server.close.assert_not_called()
+
+    def test_runner_wraps_handlers(self) -> None:
+        """Test that the runner wraps each rebuilt handler when fanning out."""
+        options = PollerOptions(username="u", token="t", timeout=10, fanout_port=0)  # noqa: S106
+        config = mock.Mock(get=mock.Mock(return_value=""), get_bool=mock.Mock(return_value=False))
+        server = FanoutServer()
+        handler = _handler_factory(options, server)(config)
+        assert isinstance(handler, FanoutEventHandler)
+        assert handler.server is server
+
+    def test_accept_key(self) -> None:
+        """Test the accept key computation against RFC 6455."""
+        digest = hashlib.sha1((KEY + "258EAFA5-E914-47DA-95CA-C5AB0DC85B11").encode()).digest()  # noqa: S324
+        assert base64.b64encode(digest) == b"s3pPLMBiTxaQ9kYGzzhZRbK+xOo="
@@ -1,13 +1,36 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from unittest import mock
+
 import pytest
 
 from chaturbate_poller.constants import EventMethod
+from chaturbate_poller.handlers.factory import HandlerType, create_event_handler
+from chaturbate_poller.handlers.logging_handler import LoggingEventHandler
 from chaturbate_poller.models.event import Event
 from chaturbate_poller.models.event_data import EventData
-from chaturbate_poller.models.media import Media
-from chaturbate_poller.models.message import Message
 from chaturbate_poller.models.tip import Tip
-from chaturbate_poller.models.user import User
-from chaturbate_poller.utils.format_messages import format_message
+from chaturbate_poller.utils.format_messages import (
+    CompiledTemplate,
+    MessageFormatter,
+    format_broadcast_event,
+    format_media_purchase_event,
+    format_message,
+    format_message_event,
+    format_room_subject_change_event,
+    format_tip_event,
+    format_user_event,
+    load_templates,
+)
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from chaturbate_poller.models.media import Media
+    from chaturbate_poller.models.message import Message
+    from chaturbate_poller.models.user import User
 
 
 class TestFormatMessages:
@@ -275,3 +298,72 @@ class TestFormatMessages:
         )
         message = format_message(event)
         assert message is None
+
+    def test_per_method_functions(self, sample_event: Event, example_user: User) -> None:
+        """Test that the per-method functions format only their own methods."""
+        enter = Event(method=EventMethod.USER_ENTER, object=EventData(user=example_user), id="e")
+        start = Event(method=EventMethod.BROADCAST_START, object=EventData(), id="b")
+        assert format_tip_event(sample_event) == format_message(sample_event)
+        assert format_user_event(enter) == "example_user entered the room"
+        assert format_broadcast_event(start) == "Broadcast started"
+        for function in (
+            format_broadcast_event,
+            format_user_event,
+            format_message_event,
+            format_room_subject_change_event,
+            format_media_purchase_event,
+        ):
+            assert function(sample_event) is None
+        assert format_tip_event(enter) is None
+
+
+class TestMessageFormatter:
+    """Tests for compiled templates and custom formatters."""
+
+    def test_compile(self, sample_event: Event) -> None:
+        """Test that literal braces, quotes, conversions and specs survive."""
+        compiled = CompiledTemplate.compile("{{'{user}'}} \\ {tokens:>5} {user!r:>12}")
+        assert compiled.payloads == ("user", "tip")
+        assert compiled.render(sample_event) == "{'test_user'} \\   100  'test_user'"
+
+    @pytest.mark.parametrize(
+        "template", ["{nope}", "{user.username}", "{user", "{user!x}", "{user:{tokens}}"]
+    )
+    def test_compile_invalid(self, template: str) -> None:
+        """Test that malformed templates and unknown fields are rejected."""
+        with pytest.raises(ValueError, match=r"template|Single|expected"):
+            CompiledTemplate.compile(template)
+
+    def test_custom_templates(self, sample_event: Event, example_user: User) -> None:
+        """Test overriding and silencing methods, and batch formatting."""
+        formatter = MessageFormatter({"tip": "+{tokens} from {user} ({note})", "userEnter": None})
+        enter = Event(method=EventMethod.USER_ENTER, object=EventData(user=example_user), id="e")
+        follow = Event(method=EventMethod.FOLLOW, object=EventData(user=example_user), id="f")
+        bare = Event(method=EventMethod.FOLLOW, object=EventData(), id="b")
+        assert formatter.format(sample_event) == "+100 from test_user (test message)"
+        assert formatter.format(enter) is None
+        assert EventMethod.USER_ENTER not in formatter.templates
+        assert formatter.format_batch([sample_event, enter, bare, follow]) == (
+            "+100 from test_user (test message)\nexample_user followed"
+        )
+
+    def test_unknown_method(self) -> None:
+        """Test that templates for unknown methods are rejected."""
+        with pytest.raises(ValueError, match="Unknown event method 'tips'"):
+            MessageFormatter({"tips": "{user}"})
+
+    def test_load_templates(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test loading templates from JSON and the logging handler factory."""
+        path = tmp_path / "templates.json"
+        path.write_text(json.dumps({"tip": "{user}: {tokens}", "follow": None}))
+        assert load_templates(path) == {"tip": "{user}: {tokens}", "follow": None}
+
+        handler = create_event_handler(
+            HandlerType.LOGGING, mock.Mock(get=mock.Mock(return_value=str(path)))
+        )
+        assert isinstance(handler, LoggingEventHandler)
+        assert handler.formatter.format(sample_event) == "test_user: 100"
+
+        path.write_text(json.dumps({"tip": 1}))
+        with pytest.raises(ValueError, match="must map event methods to strings"):
+            load_templates(path)
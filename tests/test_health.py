@@ -0,0 +1,150 @@
+"""Tests for the health state and the health probe server."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from chaturbate_poller import metrics
+from chaturbate_poller.core.client import ChaturbateClient
+from chaturbate_poller.core.health import PollerHealth
+from chaturbate_poller.core.transport import PooledTransport
+from chaturbate_poller.exceptions import PollingError
+from chaturbate_poller.server.health import HealthServer
+
+from .constants import TEST_URL, TOKEN, USERNAME
+from .test_rate_limit import FakeClock
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from chaturbate_poller.config.backoff import BackoffConfig
+
+
+class TestPollerHealth:
+    """Tests for PollerHealth."""
+
+    def test_liveness_follows_successful_fetches(self) -> None:
+        """Test that the poller is alive until no fetch succeeds for too long."""
+        clock = FakeClock()
+        health = PollerHealth(stale_after=60, clock=clock)
+        clock.now = 60
+        assert health.liveness() is None
+        clock.now = 61
+        assert health.liveness() == "no successful fetch for 61s"
+        health.record_success()
+        assert health.liveness() is None
+
+    def test_readiness(self) -> None:
+        """Test that readiness needs a fetch and no failures, failing sinks or full queues."""
+        metrics.registry.clear()
+        health = PollerHealth(max_failures=2, max_queue_depth=10, clock=FakeClock())
+        assert health.readiness() == "no successful fetch yet"
+        health.record_success()
+        assert health.readiness() is None
+
+        health.record_failure()
+        health.record_failure()
+        assert health.readiness() == "2 consecutive failed fetches"
+        health.record_success()
+
+        sink = metrics.registry.gauge("sink_failing", sink="influxdb")
+        sink.set(1)
+        assert health.readiness() == "sink influxdb is failing"
+        sink.set(0)
+
+        metrics.registry.gauge("sqlite_queue_depth").set(10)
+        assert health.readiness() == "sqlite_queue_depth is 10"
+        metrics.registry.gauge("sqlite_queue_depth").set(0)
+
+        metrics.registry.gauge("blocking_handler_queue_depth", handler="Slow").set(10)
+        assert health.readiness() == 'blocking_handler_queue_depth{handler="Slow"} is 10'
+
+    def test_invalid_limits(self) -> None:
+        """Test that the limits must be positive."""
+        with pytest.raises(ValueError, match=r"Health check limits must be positive\."):
+            PollerHealth(max_failures=0)
+
+    @pytest.mark.asyncio
+    async def test_client_records_fetches(self, disabled_backoff_config: BackoffConfig) -> None:
+        """Test that the client records failed attempts and successful fetches."""
+        codes = iter([503, 200])
+        health = PollerHealth(clock=FakeClock())
+        transport = PooledTransport(
+            transport=httpx.MockTransport(
+                lambda _: httpx.Response(next(codes), json={"events": []})
+            )
+        )
+        client = ChaturbateClient(
+            USERNAME,
+            TOKEN,
+            transport=transport,
+            backoff_config=disabled_backoff_config,
+            health=health,
+        )
+        async with client:
+            with pytest.raises(PollingError):
+                await client.fetch_events(TEST_URL)
+            assert (health.fetches, health.failures) == (0, 1)
+            await client.fetch_events(TEST_URL)
+        assert (health.fetches, health.failures) == (1, 0)
+
+
+@pytest.fixture
+async def server() -> AsyncIterator[HealthServer]:
+    """Run a health server on a free port for a poller that has fetched once."""
+    metrics.registry.clear()
+    health = PollerHealth(max_failures=1, clock=FakeClock())
+    health.record_success()
+    server = HealthServer(health)
+    await server.start()
+    yield server
+    await server.close()
+
+
+async def _request(server: HealthServer, request: bytes) -> bytes:
+    """Send a raw request and read the whole response."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    writer.write(request)
+    response = await reader.read()
+    writer.close()
+    return response
+
+
+class TestHealthServer:
+    """Tests for HealthServer."""
+
+    @pytest.mark.asyncio
+    async def test_probes(self, server: HealthServer) -> None:
+        """Test that both probes pass, and readiness fails with its reason."""
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{server.port}") as client:
+            live = await client.get("/healthz")
+            assert (live.status_code, live.text) == (200, "ok\n")
+            assert (await client.get("/readyz?verbose")).status_code == 200
+
+            server.health.record_failure()
+            ready = await client.get("/readyz")
+            assert (ready.status_code, ready.text) == (503, "1 consecutive failed fetches\n")
+            assert (await client.get("/healthz")).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_metrics(self, server: HealthServer) -> None:
+        """Test that the registry is served in the Prometheus text format."""
+        metrics.registry.gauge("memory_used_bytes", "Memory used.").set(1024)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{server.port}") as client:
+            response = await client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE memory_used_bytes gauge\nmemory_used_bytes 1024.0\n" in response.text
+
+    @pytest.mark.asyncio
+    async def test_invalid_requests(self, server: HealthServer) -> None:
+        """Test that unknown paths, other methods and unreadable requests are rejected."""
+        assert (await _request(server, b"GET /status HTTP/1.1\r\n\r\n")).startswith(b"HTTP/1.1 404")
+        assert (await _request(server, b"POST /healthz HTTP/1.1\r\n\r\n")).startswith(
+            b"HTTP/1.1 405"
+        )
+        assert (await _request(server, b"garbage\r\n\r\n")).startswith(b"HTTP/1.1 400")
@@ -0,0 +1,75 @@
+"""Tests for lazy imports and the CLI import-time budget."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+import chaturbate_poller
+
+HEAVY_MODULES = (
+    "asyncio",
+    "backoff",
+    "chaturbate_poller.database.influxdb_handler",
+    "dotenv",
+    "httpx",
+    "numpy",
+    "pyarrow",
+    "pydantic",
+    "rich.traceback",
+)
+"""tuple[str, ...]: Modules the CLI must not import until a command runs."""
+
+IMPORT_TIME_BUDGET = 0.3
+"""float: Seconds importing the CLI may add to starting a bare interpreter."""
+
+IMPORT_TIME_RUNS = 5
+"""int: Interpreter starts timed; the fastest counts, to discount machine load."""
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    """Run a fresh interpreter and capture its output."""
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *args], capture_output=True, text=True, check=True, timeout=60
+    )
+
+
+def test_cli_import_skips_heavy_modules() -> None:
+    """Test that importing the CLI does not import the runtime dependencies."""
+    code = (
+        "import sys, chaturbate_poller.cli; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert _run_python("-c", code).stdout.strip() == ""
+
+
+def _startup_time(*args: str) -> float:
+    """Get the fastest wall-clock time of running a fresh interpreter."""
+    fastest: float = float("inf")
+    for _ in range(IMPORT_TIME_RUNS):
+        started: float = time.perf_counter()
+        _run_python(*args)
+        fastest = min(fastest, time.perf_counter() - started)
+    return fastest
+
+
+@pytest.mark.xdist_group("import_time")
+def test_cli_import_time_budget() -> None:
+    """Test that importing the CLI adds little to the interpreter's own startup."""
+    baseline = _startup_time("-c", "pass")
+    cli = _startup_time("-c", "import chaturbate_poller.cli")
+    assert cli - baseline < IMPORT_TIME_BUDGET
+
+
+def test_lazy_attributes() -> None:
+    """Test that public attributes are importable on first access."""
+    from chaturbate_poller.core.client import ChaturbateClient  # noqa: PLC0415
+
+    assert chaturbate_poller.ChaturbateClient is ChaturbateClient
+    assert isinstance(chaturbate_poller.__version__, str)
+    assert "format_message" in dir(chaturbate_poller)
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        _ = chaturbate_poller.missing  # type: ignore[attr-defined]
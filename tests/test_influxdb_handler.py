@@ -79,6 +79,18 @@ class TestInfluxDBHandler:
             await influxdb_handler.write_event("test_measurement", {"event": "data"})
         assert "Network error occurred while writing data to InfluxDB" in caplog.text
 
+    def test_timestamps_are_unique(self, influxdb_handler: InfluxDBHandler) -> None:
+        """Test that points encoded together get distinct, increasing timestamps."""
+        with mock.patch("time.time_ns", return_value=1_000):
+            lines = [
+                influxdb_handler.encode_event(
+                    "events", {"x": 1}, timestamp=influxdb_handler.next_timestamp()
+                )
+                for _ in range(3)
+            ]
+        assert lines == ["events x=1i 1000", "events x=1i 1001", "events x=1i 1002"]
+        assert influxdb_handler.write_url.endswith("&precision=ns")
+
     def test_flatten_dict_nested(self, influxdb_handler: InfluxDBHandler) -> None:
         """Test flattening of nested dictionaries."""
         nested_dict: NestedDict = {"a": {"b": {"c": 1}}, "d": 2}
@@ -0,0 +1,132 @@
+"""Tests for the JSON Lines event log sink."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from chaturbate_poller import metrics
+from chaturbate_poller.database.jsonl_log import EVENT_ADAPTER, JSONLEventLog
+from chaturbate_poller.handlers.factory import HandlerType, create_event_handler
+from chaturbate_poller.handlers.jsonl_handler import JSONLEventHandler
+from chaturbate_poller.models.event import Event
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+def _events(sample_event: Event, *ids: str) -> list[Event]:
+    """Copy the sample event with new IDs."""
+    return [sample_event.model_copy(update={"id": event_id}) for event_id in ids]
+
+
+class TestJSONLEventLog:
+    """Tests for JSONLEventLog."""
+
+    def test_lines_match_api_format(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test that each event is one JSON line that parses back to the event."""
+        log = JSONLEventLog(tmp_path, compress=False)
+        log.write(_events(sample_event, "1", "2"), received_at=10.0)
+        log.close()
+
+        (segment,) = log.segments()
+        lines = segment.read_bytes().splitlines()
+        assert lines[0] == EVENT_ADAPTER.dump_json(sample_event, by_alias=True)
+        assert json.loads(lines[1])["object"]["user"]["inFanclub"] is False
+        assert [Event.model_validate_json(line).id for line in lines] == ["1", "2"]
+
+    def test_rotates_and_compresses(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test size and time rotation, and compression of closed segments."""
+        line_size = len(EVENT_ADAPTER.dump_json(sample_event, by_alias=True)) + 1
+        log = JSONLEventLog(tmp_path, max_bytes=2 * line_size, max_age=60)
+        log.write(_events(sample_event, "1", "2"), received_at=0.0)
+        log.write(_events(sample_event, "3"), received_at=1.0)
+        log.write(_events(sample_event, "4"), received_at=61.0)
+        log.close()
+
+        segments = log.segments()
+        assert [path.suffix for path in segments] == [".gz", ".gz", ".gz"]
+        with gzip.open(segments[0]) as first:
+            assert len(first.read().splitlines()) == 2
+        assert [entry.event_id for entry in log.index(segments[1])] == ["3"]
+
+    def test_index_seeks(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test lookups by event ID and replay from a time."""
+        log = JSONLEventLog(tmp_path, max_bytes=1)
+        log.write(_events(sample_event, "a", "b"), received_at=100.0)
+        log.write(_events(sample_event, "c"), received_at=200.0)
+        log.write(_events(sample_event, "d"), received_at=300.0)
+
+        offsets = [entry.offset for entry in log.index(log.segments()[0])]
+        assert offsets[0] == 0 < offsets[1]
+        found = log.find("b")
+        assert found is not None
+        assert found.id == "b"
+        assert log.find("missing") is None
+        assert [event.id for event in log.replay(since=200.0)] == ["c", "d"]
+        log.close()
+        assert [event.id for event in log.replay()] == ["a", "b", "c", "d"]
+
+    def test_find_in_open_segment(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test that lookups see lines appended after an earlier lookup, in any ID order."""
+        log = JSONLEventLog(tmp_path, compress=False)
+        log.write(_events(sample_event, "m", "c", "x"), received_at=100.0)
+        assert log.find("a") is None
+        log.write(_events(sample_event, "a", "c"), received_at=200.0)
+        found = [log.find(event_id) for event_id in ("a", "c", "m", "x")]
+        assert [event.id if event else None for event in found] == ["a", "c", "m", "x"]
+        assert [event.id for event in log.replay(since=150.0)] == ["a", "c"]
+        assert list(log.replay(since=300.0)) == []
+        log.close()
+
+    def test_compression_failure_is_logged(
+        self, tmp_path: pathlib.Path, sample_event: Event, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a failed compression keeps the segment and is logged."""
+        log = JSONLEventLog(tmp_path)
+        log.write([sample_event], received_at=0.0)
+        with mock.patch(
+            "chaturbate_poller.database.jsonl_log.shutil.copyfileobj", side_effect=OSError("full")
+        ):
+            log.close()
+        assert "Failed to compress a segment: full" in caplog.text
+        assert [event.id for event in log.replay()] == ["1"]
+
+    def test_invalid_limits(self, tmp_path: pathlib.Path) -> None:
+        """Test that rotation limits must be positive."""
+        with pytest.raises(ValueError, match="Segment size and age limits must be positive"):
+            JSONLEventLog(tmp_path, max_bytes=0)
+
+
+class TestJSONLEventHandler:
+    """Tests for JSONLEventHandler."""
+
+    @pytest.mark.asyncio
+    async def test_handler_appends(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test that the handler appends pages and compresses on close."""
+        config = mock.Mock(get=mock.Mock(return_value=str(tmp_path)))
+        handler = create_event_handler(HandlerType.JSONL, config)
+        assert isinstance(handler, JSONLEventHandler)
+        await handler.handle_event(sample_event)
+        await handler.handle_batch(_events(sample_event, "2", "3"))
+        await handler.close()
+        assert [event.id for event in handler.log.replay()] == ["1", "2", "3"]
+        assert [path.suffix for path in handler.log.segments()] == [".gz"]
+
+    @pytest.mark.asyncio
+    async def test_failed_write_marks_sink(
+        self, tmp_path: pathlib.Path, sample_event: Event
+    ) -> None:
+        """Test that a failed write is logged and reported instead of raised."""
+        metrics.registry.clear()
+        handler = JSONLEventHandler(JSONLEventLog(tmp_path))
+        with mock.patch.object(handler.log, "write", side_effect=OSError("disk full")):
+            await handler.handle_event(sample_event)
+        assert metrics.registry.snapshot()['sink_failing{sink="jsonl"}'] == 1
+        await handler.handle_event(sample_event)
+        assert metrics.registry.snapshot()['sink_failing{sink="jsonl"}'] == 0
+        await handler.close()
@@ -0,0 +1,120 @@
+"""Tests for the event loop monitor."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from chaturbate_poller import metrics
+from chaturbate_poller.core.loop_monitor import LoopMonitor
+from chaturbate_poller.core.runner import _handler_factory
+from chaturbate_poller.handlers.logging_handler import LoggingEventHandler
+from chaturbate_poller.handlers.monitored_handler import MonitoredEventHandler
+from chaturbate_poller.models.options import PollerOptions
+
+if TYPE_CHECKING:
+    from chaturbate_poller.models.event import Event
+
+
+class TestLoopMonitor:
+    """Tests for LoopMonitor."""
+
+    @pytest.mark.asyncio
+    async def test_reports_blocking_handler(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that a blocked loop is logged with the handler, stack and lag."""
+        metrics.registry.clear()
+        monitor = LoopMonitor(0.05, interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.03)
+        with caplog.at_level(logging.WARNING), monitor.track("Blocking.handle_batch"):
+            time.sleep(0.3)  # noqa: ASYNC251
+        await asyncio.sleep(0.03)
+        await monitor.close()
+
+        blocked = [record.getMessage() for record in caplog.records if "blocked" in record.msg]
+        assert len(blocked) == 1
+        assert "in Blocking.handle_batch" in blocked[0]
+        assert "test_loop_monitor.py" in blocked[0]
+        assert "Slow call: Blocking.handle_batch took" in caplog.text
+        assert monitor.percentiles()[0.99] >= 0.2
+        snapshot = metrics.registry.snapshot()
+        assert snapshot["event_loop_stalls_total"] == 1
+        assert snapshot['slow_handler_calls_total{handler="Blocking.handle_batch"}'] == 1
+        assert snapshot["event_loop_lag_max_seconds"] >= 0.2
+        assert snapshot['event_loop_lag_seconds{quantile="0.5"}'] < 0.2
+
+    @pytest.mark.asyncio
+    async def test_awaiting_handler_is_not_blamed(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that a handler awaiting while another task blocks is only reported as slow."""
+        monitor = LoopMonitor(0.05, interval=0.01)
+        monitor.start()
+
+        async def waiting() -> None:
+            with monitor.track("Waiting.handle_batch"):
+                await asyncio.sleep(0.3)
+
+        with caplog.at_level(logging.WARNING):
+            task = asyncio.create_task(waiting())
+            await asyncio.sleep(0.03)
+            time.sleep(0.2)  # noqa: ASYNC251
+            await task
+        await monitor.close()
+
+        blocked = [record.getMessage() for record in caplog.records if "blocked" in record.msg]
+        assert len(blocked) == 1
+        assert "in a callback" in blocked[0]
+        assert "Slow call: Waiting.handle_batch took" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_idle_loop_is_quiet(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that an idle loop logs nothing and fast calls are not reported."""
+        monitor = LoopMonitor(0.5, interval=0.01)
+        assert monitor.percentiles() == {0.5: 0.0, 0.9: 0.0, 0.99: 0.0}
+        monitor.start()
+        with caplog.at_level(logging.WARNING), monitor.track("Fast.handle_batch"):
+            await asyncio.sleep(0.05)
+        await monitor.close()
+        assert caplog.text == ""
+        assert max(monitor.percentiles().values()) < 0.5
+
+    def test_invalid_settings(self) -> None:
+        """Test that the settings must be positive."""
+        with pytest.raises(ValueError, match="must be positive"):
+            LoopMonitor(0)
+
+
+class TestMonitoredEventHandler:
+    """Tests for MonitoredEventHandler."""
+
+    @pytest.mark.asyncio
+    async def test_tracks_calls(self, sample_event: Event) -> None:
+        """Test that calls are delegated under the wrapped handler's name."""
+        monitor = mock.MagicMock()
+        inner = mock.AsyncMock()
+        handler = MonitoredEventHandler(monitor, inner)
+        await handler.handle_event(sample_event)
+        await handler.handle_batch([sample_event])
+        await handler.close()
+        inner.handle_event.assert_awaited_once_with(sample_event)
+        inner.handle_batch.assert_awaited_once_with([sample_event])
+        inner.close.assert_awaited_once_with()
+        assert [call.args for call in monitor.track.call_args_list] == [
+            ("AsyncMock.handle_event",),
+            ("AsyncMock.handle_batch",),
+            ("AsyncMock.close",),
+        ]
+
+    def test_runner_wraps_primary_handler(self) -> None:
+        """Test that the runner monitors the handler it builds."""
+        options = PollerOptions(username="u", token="t", timeout=10, monitor_loop=True)  # noqa: S106
+        config = mock.Mock(get=mock.Mock(return_value=""), get_bool=mock.Mock(return_value=False))
+        monitor = LoopMonitor()
+        handler = _handler_factory(options, monitor=monitor)(config)
+        assert isinstance(handler, MonitoredEventHandler)
+        assert isinstance(handler.handler, LoggingEventHandler)
+        assert handler.monitor is monitor
@@ -40,12 +40,15 @@ class TestMain:
             mocker.call(url="next_url"),
         ]
 
-        assert mock_event_handler.handle_event.call_count == 3
+        assert mock_event_handler.handle_batch.await_args_list == [
+            mocker.call(response1.events),
+            mocker.call(response2.events),
+        ]
 
     @pytest.mark.asyncio
     async def test_main_success(self, mocker: MockerFixture) -> None:
         """Test successful execution of main function."""
-        mock_event_handler = mocker.Mock()
+        mock_event_handler = mocker.AsyncMock()
         mocker.patch(
             "chaturbate_poller.core.runner.create_event_handler", return_value=mock_event_handler
         )
@@ -92,7 +95,7 @@ class TestMain:
     @pytest.mark.asyncio
     async def test_main_authentication_error_propagated(self, mocker: MockerFixture) -> None:
         """Test main function when authentication error occurs during polling."""
-        mock_event_handler = mocker.Mock()
+        mock_event_handler = mocker.AsyncMock()
         mocker.patch(
             "chaturbate_poller.core.runner.create_event_handler", return_value=mock_event_handler
         )
@@ -135,7 +138,7 @@ class TestMain:
         )
 
         mock_client.fetch_events.assert_called_once_with(url=None)
-        mock_event_handler.handle_event.assert_not_called()
+        mock_event_handler.handle_batch.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_start_polling_breaks_on_empty_events(self, mocker: MockerFixture) -> None:
@@ -161,12 +164,12 @@ class TestMain:
         )
 
         mock_client.fetch_events.assert_called_once_with(url=None)
-        mock_event_handler.handle_event.assert_not_called()
+        mock_event_handler.handle_batch.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_main_handles_cancelled_error(self, mocker: MockerFixture) -> None:
         """Test main function handles CancelledError gracefully."""
-        mock_event_handler = mocker.Mock()
+        mock_event_handler = mocker.AsyncMock()
         mocker.patch(
             "chaturbate_poller.core.runner.create_event_handler", return_value=mock_event_handler
         )
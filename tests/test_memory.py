@@ -0,0 +1,148 @@
+"""Tests for the process memory budget."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+
+import pytest
+
+from chaturbate_poller import metrics
+from chaturbate_poller.core.memory import (
+    MIB,
+    MemoryBudget,
+    resident_memory,
+    shared_memory_budget,
+)
+
+
+class Buffer:
+    """Memory consumer holding a fixed number of bytes until it sheds them."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize with the bytes held."""
+        self.size: int = size
+        self.sheds: int = 0
+
+    def memory_usage(self) -> int:
+        """Get the bytes held."""
+        return self.size
+
+    def shed_memory(self) -> None:
+        """Release every byte."""
+        self.size = 0
+        self.sheds += 1
+
+
+class Used:
+    """Settable measure of process memory."""
+
+    def __init__(self, used: int | None = None) -> None:
+        """Initialize with the memory in use."""
+        self.used: int | None = used
+
+    def __call__(self) -> int | None:
+        """Get the memory in use."""
+        return self.used
+
+
+class TestMemoryBudget:
+    """Tests for MemoryBudget."""
+
+    def test_usage_per_component(self) -> None:
+        """Test that usage is summed per component name and reported as gauges."""
+        metrics.registry.clear()
+        budget = MemoryBudget(measure=Used())
+        buffers = [Buffer(100), Buffer(50), Buffer(7)]
+        budget.register("archive", buffers[0])
+        budget.register("archive", buffers[1])
+        budget.register("users", buffers[2])
+        assert budget.usage() == {"archive": 150, "users": 7}
+        assert budget.check() == 157
+        snapshot = metrics.registry.snapshot()
+        assert snapshot['memory_component_bytes{component="archive"}'] == 150
+        assert snapshot["memory_used_bytes"] == 157
+
+        budget.unregister(buffers[2])
+        del buffers[1]
+        gc.collect()
+        assert budget.usage() == {"archive": 100}
+
+    def test_sheds_largest_first_under_pressure(self) -> None:
+        """Test that only components over their share shed, and only until usage falls."""
+        metrics.registry.clear()
+        package = logging.getLogger("chaturbate_poller")
+        level = package.level
+        package.setLevel(logging.DEBUG)
+        used = Used(95 * MIB)
+        budget = MemoryBudget(100 * MIB, high_water=0.9, low_water=0.5, measure=used)
+        small, large = Buffer(10 * MIB), Buffer(60 * MIB)
+        budget.register("small", small)
+        budget.register("large", large)
+
+        assert budget.check() == 95 * MIB
+        assert budget.under_pressure
+        assert (large.sheds, small.sheds) == (1, 0)
+        assert package.isEnabledFor(logging.INFO)
+        assert not package.isEnabledFor(logging.DEBUG)
+        snapshot = metrics.registry.snapshot()
+        assert snapshot['memory_sheds_total{component="large"}'] == 1
+        assert snapshot["memory_pressure"] == 1
+
+        budget.check()
+        assert (large.sheds, small.sheds) == (1, 0)
+        used.used = 60 * MIB
+        budget.check()
+        assert budget.under_pressure
+        used.used = 40 * MIB
+        budget.check()
+        assert not budget.under_pressure
+        assert package.level == logging.DEBUG
+        package.setLevel(level)
+
+    def test_stops_once_measured_under_the_mark(self) -> None:
+        """Test that usage is measured again after each component sheds."""
+        budget = MemoryBudget(100 * MIB, measure=Used())
+        first, second = Buffer(60 * MIB), Buffer(55 * MIB)
+        budget.register("first", first)
+        budget.register("second", second)
+        assert budget.check() == 55 * MIB
+        assert (first.sheds, second.sheds) == (1, 0)
+        budget.check()
+        assert (first.sheds, second.sheds) == (1, 0)
+        assert not budget.under_pressure
+
+    @pytest.mark.asyncio
+    async def test_close_restores_debug_logs(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that closing the budget ends the pressure state and failed sheds are logged."""
+
+        class Failing(Buffer):
+            def shed_memory(self) -> None:
+                msg = "disk full"
+                raise OSError(msg)
+
+        level = logging.getLogger("chaturbate_poller").level
+        budget = MemoryBudget(MIB, measure=Used(MIB), interval=60)
+        failing = Failing(MIB)
+        budget.register("failing", failing)
+        budget.start()
+        await asyncio.sleep(0)
+        assert budget.under_pressure
+        await budget.close()
+        assert "failing failed to shed memory." in caplog.text
+        assert not budget.under_pressure
+        assert logging.getLogger("chaturbate_poller").level == level
+
+    def test_invalid_settings(self) -> None:
+        """Test that the limit, interval and marks are validated."""
+        with pytest.raises(ValueError, match="must be positive"):
+            MemoryBudget(0)
+        with pytest.raises(ValueError, match="low_water <= high_water"):
+            MemoryBudget(MIB, high_water=0.5, low_water=0.8)
+
+    def test_shared_budget(self) -> None:
+        """Test that the shared budget only reports until a limit is set."""
+        assert shared_memory_budget() is shared_memory_budget()
+        assert shared_memory_budget().limit is None
+        assert (resident_memory() or 1) > 0
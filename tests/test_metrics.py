@@ -0,0 +1,76 @@
+"""Tests for the in-process metrics registry."""
+
+import pytest
+
+from chaturbate_poller.metrics import Counter, Gauge, MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    def test_gauge_is_reused_per_label_set(self) -> None:
+        """Test that the same name and labels return the same gauge."""
+        registry = MetricsRegistry()
+        gauge = registry.gauge("timeout_seconds", broadcaster="alice")
+        assert registry.gauge("timeout_seconds", broadcaster="alice") is gauge
+        assert registry.gauge("timeout_seconds", broadcaster="bob") is not gauge
+        assert isinstance(gauge, Gauge)
+
+    def test_snapshot_keys_include_labels(self) -> None:
+        """Test that snapshot keys render labels in sorted order."""
+        registry = MetricsRegistry()
+        registry.gauge("timeout_seconds", broadcaster="alice", env="test").set(20)
+        registry.counter("requests_total").inc(3)
+        assert registry.snapshot() == {
+            'timeout_seconds{broadcaster="alice",env="test"}': 20,
+            "requests_total": 3.0,
+        }
+
+    def test_counter_rejects_negative_increment(self) -> None:
+        """Test that counters cannot decrease."""
+        counter = MetricsRegistry().counter("requests_total")
+        assert isinstance(counter, Counter)
+        with pytest.raises(ValueError, match=r"Counters can only increase\."):
+            counter.inc(-1)
+
+    def test_kind_conflict(self) -> None:
+        """Test that a name cannot be registered as two metric kinds."""
+        registry = MetricsRegistry()
+        registry.gauge("events")
+        with pytest.raises(TypeError, match="already registered as a gauge"):
+            registry.counter("events")
+
+    def test_clear(self) -> None:
+        """Test that clearing the registry removes every metric."""
+        registry = MetricsRegistry()
+        registry.gauge("events").set(1)
+        registry.clear()
+        assert registry.snapshot() == {}
+
+    def test_series(self) -> None:
+        """Test that every label set of a metric is returned by name."""
+        registry = MetricsRegistry()
+        alice = registry.gauge("timeout_seconds", broadcaster="alice")
+        bob = registry.gauge("timeout_seconds", broadcaster="bob")
+        registry.counter("requests_total")
+        assert registry.series("timeout_seconds") == [alice, bob]
+        assert registry.series("missing") == []
+
+    def test_exposition(self) -> None:
+        """Test that metrics are rendered in the Prometheus text format."""
+        registry = MetricsRegistry()
+        registry.gauge("lag_seconds", "Loop lag.", quantile="0.99").set(0.25)
+        registry.gauge("lag_seconds", quantile="0.5").set(float("inf"))
+        registry.counter("lag_seconds_total", 'Lag "stalls".').inc()
+        registry.gauge("sink_failing", sink='a"b').set(1)
+        assert registry.exposition() == (
+            "# HELP lag_seconds Loop lag.\n"
+            "# TYPE lag_seconds gauge\n"
+            'lag_seconds{quantile="0.5"} +Inf\n'
+            'lag_seconds{quantile="0.99"} 0.25\n'
+            '# HELP lag_seconds_total Lag "stalls".\n'
+            "# TYPE lag_seconds_total counter\n"
+            "lag_seconds_total 1.0\n"
+            "# TYPE sink_failing gauge\n"
+            'sink_failing{sink="a\\"b"} 1.0\n'
+        )
@@ -158,3 +158,74 @@ class TestPollerOptions:
         assert options.testbed == "true"  # type: ignore[comparison-overlap]
         assert options.use_database == 1
         assert options.verbose == 0
+
+    def test_adaptive_timeout_bounds(self) -> None:
+        """Test that adaptive timeout bounds are validated only when enabled."""
+        with pytest.raises(ValueError, match=r"Adaptive timeout bounds must satisfy"):
+            PollerOptions(
+                username="test_user",
+                token="test_token",  # noqa: S106
+                timeout=10,
+                adaptive_timeout=True,
+                min_timeout=30,
+                max_timeout=5,
+            )
+
+        options = PollerOptions(
+            username="test_user",
+            token="test_token",  # noqa: S106
+            timeout=10,
+            min_timeout=30,
+            max_timeout=5,
+        )
+        assert options.adaptive_timeout is False
+
+    def test_shutdown_timeout_must_be_positive(self) -> None:
+        """Test that a non-positive shutdown timeout is rejected."""
+        with pytest.raises(ValueError, match=r"Shutdown timeout must be positive\."):
+            PollerOptions(
+                username="test_user",
+                token="test_token",  # noqa: S106
+                timeout=10,
+                shutdown_timeout=0,
+            )
+
+    def test_fanout_port_range(self) -> None:
+        """Test that the fan-out port must be a valid TCP port."""
+        with pytest.raises(ValueError, match=r"Fan-out port must be between 0 and 65535\."):
+            PollerOptions(
+                username="test_user",
+                token="test_token",  # noqa: S106
+                timeout=10,
+                fanout_port=70000,
+            )
+
+    def test_health_port_range(self) -> None:
+        """Test that the health port must be a valid TCP port."""
+        with pytest.raises(ValueError, match=r"Health port must be between 0 and 65535\."):
+            PollerOptions(
+                username="test_user",
+                token="test_token",  # noqa: S106
+                timeout=10,
+                health_port=-1,
+            )
+
+    def test_memory_budget_positive(self) -> None:
+        """Test that the memory budget must be positive."""
+        with pytest.raises(ValueError, match=r"Memory budget must be a positive number of MiB\."):
+            PollerOptions(
+                username="test_user",
+                token="test_token",  # noqa: S106
+                timeout=10,
+                memory_budget=0,
+            )
+
+    def test_slow_callback_threshold_positive(self) -> None:
+        """Test that the slow callback threshold must be positive."""
+        with pytest.raises(ValueError, match=r"Slow callback threshold must be positive\."):
+            PollerOptions(
+                username="test_user",
+                token="test_token",  # noqa: S106
+                timeout=10,
+                slow_callback_threshold=0,
+            )
@@ -0,0 +1,197 @@
+"""Tests for the Parquet archive sink."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from chaturbate_poller import metrics
+from chaturbate_poller.constants import EXAMPLE_JSON_STRING
+from chaturbate_poller.database import parquet_archive
+from chaturbate_poller.database.parquet_archive import ParquetArchive, arrow_schema
+from chaturbate_poller.handlers.factory import HandlerType, create_event_handler
+from chaturbate_poller.handlers.parquet_handler import ParquetEventHandler
+from chaturbate_poller.models.api_response import EventsAPIResponse
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from chaturbate_poller.models.event import Event
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+ds = pytest.importorskip("pyarrow.dataset")
+
+HOUR = 3600
+
+
+def test_schema_follows_models() -> None:
+    """Test that the schema is flattened from the event models."""
+    schema = arrow_schema()
+    assert schema.field("method").type == pa.dictionary(pa.int32(), pa.string())
+    assert schema.field("user_username").type == pa.dictionary(pa.int32(), pa.string())
+    assert schema.field("tip_tokens").type == pa.int64()
+    assert schema.field("media_type").type == pa.string()
+    assert schema.field("id").nullable is False
+    assert schema.field("user_in_fanclub").nullable is True
+
+
+class TestParquetArchive:
+    """Tests for ParquetArchive."""
+
+    def test_rolls_by_hour_and_broadcaster(
+        self, tmp_path: pathlib.Path, sample_event: Event
+    ) -> None:
+        """Test that each hour and broadcaster gets its own file."""
+        media = EventsAPIResponse.model_validate_json(EXAMPLE_JSON_STRING).events[0]
+        named = media.model_copy(
+            update={"object": media.object.model_copy(update={"broadcaster": "other"})}
+        )
+        archive = ParquetArchive(tmp_path, broadcaster="me")
+        archive.add([sample_event, named], received_at=HOUR)
+        archive.flush()
+        archive.add([sample_event], received_at=HOUR + 60)
+        archive.add([sample_event], received_at=2 * HOUR)
+        assert archive.buffered == 2
+        archive.close()
+
+        files = sorted(path.relative_to(tmp_path).parts[:2] for path in tmp_path.rglob("*.parquet"))
+        assert files == [
+            ("broadcaster=me", "hour=1970-01-01T01"),
+            ("broadcaster=me", "hour=1970-01-01T02"),
+            ("broadcaster=other", "hour=1970-01-01T01"),
+        ]
+        first_hour = next((tmp_path / "broadcaster=me" / "hour=1970-01-01T01").iterdir())
+        metadata = pq.ParquetFile(first_hour).metadata
+        assert (metadata.num_rows, metadata.num_row_groups) == (2, 2)
+        assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+    def test_round_trip(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test that archived events read back as typed columns."""
+        archive = ParquetArchive(tmp_path, broadcaster="me")
+        archive.add([sample_event, sample_event], received_at=HOUR)
+        archive.close()
+
+        # The broadcaster and hour live in the path; read the file's own columns only.
+        table = pq.read_table(next(tmp_path.rglob("*.parquet")), partitioning=None)
+        assert table.schema.equals(arrow_schema())
+        assert table.schema.names[:3] == ["received_at", "method", "user_username"]
+        assert "broadcaster" not in table.schema.names
+        assert "hour" not in table.schema.names
+        assert table.schema.field("received_at").type == pa.timestamp("ms", tz="UTC")
+        assert table.schema.field("tip_tokens").type == pa.int64()
+        assert table.schema.field("id").nullable is False
+        rows = table.to_pylist()
+        assert rows[0]["method"] == "tip"
+        assert rows[0]["user_username"] == "test_user"
+        assert rows[0]["tip_tokens"] == 100
+        assert rows[0]["media_id"] is None
+        assert table.column("user_username").chunk(0).dictionary.to_pylist() == ["test_user"]
+
+        dataset = ds.dataset(tmp_path, format="parquet", partitioning="hive")
+        assert dataset.to_table(columns=["broadcaster"]).column(0).to_pylist() == ["me", "me"]
+
+    def test_due(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test that a flush is due when full, when rows wait too long and when an hour ends."""
+        archive = ParquetArchive(tmp_path, flush_rows=3, flush_interval=60)
+        archive.add([sample_event], received_at=HOUR)
+        assert not archive.due(HOUR + 10)
+        assert archive.due(2 * HOUR)
+        archive.add([sample_event, sample_event], received_at=HOUR)
+        assert archive.due(HOUR + 10)
+        archive.flush(now=HOUR + 10)
+        assert not archive.due(HOUR + 20)
+
+        archive.add([sample_event], received_at=2 * HOUR)
+        assert archive.due()
+        archive.flush()
+        # The finished hour's file is closed, so it can be read while the archive is open.
+        finished = next((tmp_path / "broadcaster=unknown" / "hour=1970-01-01T01").iterdir())
+        assert pq.read_table(finished, partitioning=None).num_rows == 3
+        archive.close()
+
+        stale = ParquetArchive(tmp_path, flush_interval=0)
+        assert not stale.due()
+        stale.add([sample_event], received_at=HOUR)
+        assert stale.due(HOUR)
+        stale.close()
+
+    def test_requires_pyarrow(self, tmp_path: pathlib.Path) -> None:
+        """Test that a missing PyArrow is reported clearly."""
+        parquet_archive._pyarrow.cache_clear()
+        try:
+            with (
+                mock.patch.object(parquet_archive, "pyarrow_available", return_value=False),
+                pytest.raises(ImportError, match=r"chaturbate-poller\[parquet\]"),
+            ):
+                ParquetArchive(tmp_path)
+        finally:
+            parquet_archive._pyarrow.cache_clear()
+
+
+class TestParquetEventHandler:
+    """Tests for ParquetEventHandler."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_full(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test that the handler writes once the buffer is full and on close."""
+        handler = ParquetEventHandler(ParquetArchive(tmp_path, flush_rows=2))
+        await handler.handle_event(sample_event)
+        assert not list(tmp_path.rglob("*.parquet"))
+        await handler.handle_batch([sample_event])
+        assert handler.archive.buffered == 0
+        await handler.handle_event(sample_event)
+        await handler.close()
+        assert pq.read_table(next(tmp_path.rglob("*.parquet"))).num_rows == 3
+
+    @pytest.mark.asyncio
+    async def test_spills_under_memory_pressure(
+        self, tmp_path: pathlib.Path, sample_event: Event
+    ) -> None:
+        """Test that shedding memory writes the buffer with the next page."""
+        handler = ParquetEventHandler(ParquetArchive(tmp_path, flush_rows=100))
+        await handler.handle_event(sample_event)
+        assert handler.memory_usage() > 0
+        handler.shed_memory()
+        await handler.handle_event(sample_event)
+        assert (handler.archive.buffered, handler.memory_usage()) == (0, 0)
+        await handler.close()
+
+    @pytest.mark.asyncio
+    async def test_flushes_periodically(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test that buffered rows are written after the flush interval without new events."""
+        handler = ParquetEventHandler(ParquetArchive(tmp_path, flush_interval=0.01))
+        await handler.handle_event(sample_event)
+        await asyncio.sleep(0.1)
+        assert handler.archive.buffered == 0
+        assert list(tmp_path.rglob("*.parquet"))
+        await handler.close()
+        assert pq.read_table(next(tmp_path.rglob("*.parquet"))).num_rows == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_write_marks_sink(
+        self, tmp_path: pathlib.Path, sample_event: Event
+    ) -> None:
+        """Test that a failed write is reported, keeps the rows and does not raise."""
+        metrics.registry.clear()
+        handler = ParquetEventHandler(ParquetArchive(tmp_path, flush_rows=1))
+        with mock.patch.object(handler.archive, "flush", side_effect=OSError("disk full")):
+            await handler.handle_event(sample_event)
+        assert handler.archive.buffered == 1
+        assert metrics.registry.snapshot()['sink_failing{sink="parquet"}'] == 1
+        await handler.handle_event(sample_event)
+        assert metrics.registry.snapshot()['sink_failing{sink="parquet"}'] == 0
+        await handler.close()
+        assert pq.read_table(next(tmp_path.rglob("*.parquet"))).num_rows == 2
+
+    @pytest.mark.asyncio
+    async def test_factory(self, tmp_path: pathlib.Path) -> None:
+        """Test that the factory archives to the configured directory."""
+        config = mock.Mock(get=mock.Mock(return_value=str(tmp_path)))
+        handler = create_event_handler(HandlerType.PARQUET, config)
+        assert isinstance(handler, ParquetEventHandler)
+        assert handler.archive.directory == tmp_path
+        await handler.close()
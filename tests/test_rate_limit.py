@@ -0,0 +1,45 @@
+"""Tests for the token bucket rate limiter."""
+
+import pytest
+
+from chaturbate_poller.utils.rate_limit import TokenBucket
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_starts_full_and_drains(self) -> None:
+        """Test that a new bucket allows a burst up to its capacity."""
+        bucket = TokenBucket(capacity=2, refill_rate=1, clock=FakeClock())
+        assert bucket.try_acquire()
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+
+    def test_refills_over_time(self) -> None:
+        """Test that tokens refill at the configured rate without exceeding capacity."""
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=2, refill_rate=0.5, clock=clock)
+        bucket.try_acquire(2)
+        assert bucket.time_until_available() == 2.0
+        clock.now = 2.0
+        assert bucket.time_until_available() == 0.0
+        clock.now = 100.0
+        assert bucket.tokens == 2
+
+    @pytest.mark.parametrize(("capacity", "refill_rate"), [(0, 1), (1, 0)])
+    def test_invalid_configuration(self, capacity: float, refill_rate: float) -> None:
+        """Test that non-positive settings are rejected."""
+        with pytest.raises(ValueError, match="must be positive"):
+            TokenBucket(capacity=capacity, refill_rate=refill_rate)
@@ -0,0 +1,160 @@
+"""Tests for hot-reloading the configuration and handlers."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from chaturbate_poller.config.manager import ConfigManager
+from chaturbate_poller.core.reload import HotReloader
+from chaturbate_poller.handlers.event_handler import EventHandler
+from chaturbate_poller.handlers.reloadable_handler import ReloadableEventHandler
+from chaturbate_poller.logging.config import set_log_level
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable
+
+    from chaturbate_poller.models.event import Event
+
+
+class GatedHandler(EventHandler):
+    """Handler that blocks on a gate and records what it handled."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize the handler."""
+        self.name: str = name
+        self.gate: asyncio.Event = asyncio.Event()
+        self.gate.set()
+        self.handled: list[str] = []
+        self.closed: bool = False
+
+    async def handle_event(self, event: Event) -> None:
+        """Wait for the gate, then record the event."""
+        await self.gate.wait()
+        self.handled.append(event.id)
+
+    async def close(self) -> None:
+        """Record that the handler was closed."""
+        self.closed = True
+
+
+def _factory(built: list[GatedHandler]) -> Callable[[ConfigManager], EventHandler]:
+    """Build a factory that names handlers after the configured user."""
+
+    def build(config: ConfigManager) -> EventHandler:
+        handler = GatedHandler(config.get("CB_USERNAME") or "")
+        built.append(handler)
+        return handler
+
+    return build
+
+
+class TestReloadableEventHandler:
+    """Tests for ReloadableEventHandler."""
+
+    @pytest.mark.asyncio
+    @mock.patch.dict(os.environ, {"CB_USERNAME": "old"}, clear=True)
+    async def test_in_flight_events_finish_on_old_graph(self, sample_event: Event) -> None:
+        """Test that a swap leaves in-flight events on the old handler."""
+        built: list[GatedHandler] = []
+        config = ConfigManager(env_file="missing.env")
+        handler = ReloadableEventHandler(_factory(built), config)
+        old = built[0]
+        old.gate.clear()
+        in_flight = asyncio.create_task(handler.handle_event(sample_event))
+        await asyncio.sleep(0)
+
+        os.environ["CB_USERNAME"] = "new"
+        config.reload()
+        assert handler.rebuild(config)
+        await handler.handle_event(sample_event)
+        assert not old.closed
+
+        old.gate.set()
+        await in_flight
+        await handler.close()
+
+        new = built[1]
+        assert (old.name, old.handled, old.closed) == ("old", ["1"], True)
+        assert (new.name, new.handled, new.closed) == ("new", ["1"], True)
+        assert handler.handler is new
+
+    @pytest.mark.asyncio
+    async def test_handle_batch_uses_current(
+        self, config_manager: ConfigManager, sample_event: Event
+    ) -> None:
+        """Test that a page is handled by the current graph."""
+        built: list[GatedHandler] = []
+        handler = ReloadableEventHandler(_factory(built), config_manager)
+        await handler.handle_batch([sample_event, sample_event])
+        assert built[0].handled == ["1", "1"]
+
+    @pytest.mark.asyncio
+    async def test_failed_rebuild_keeps_current(self, config_manager: ConfigManager) -> None:
+        """Test that a factory error leaves the current handler in place."""
+        current = GatedHandler("current")
+        factory = mock.Mock(side_effect=[current, RuntimeError("bad config")])
+        handler = ReloadableEventHandler(factory, config_manager)
+        assert handler.rebuild(config_manager) is False
+        assert handler.handler is current
+
+
+class TestHotReloader:
+    """Tests for HotReloader."""
+
+    @pytest.mark.asyncio
+    @mock.patch.dict(os.environ, {}, clear=True)
+    async def test_sighup_reloads(self, tmp_path: pathlib.Path) -> None:
+        """Test that SIGHUP re-reads the file, applies LOG_LEVEL and swaps handlers."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("CB_USERNAME=before\n")
+        built: list[GatedHandler] = []
+        config = ConfigManager(env_file=str(env_file))
+        handler = ReloadableEventHandler(_factory(built), config)
+        reloader = HotReloader(config, handler)
+        task = asyncio.create_task(reloader.run())
+        await asyncio.sleep(0)
+
+        env_file.write_text("CB_USERNAME=after\nLOG_LEVEL=warning\n")
+        os.kill(os.getpid(), signal.SIGHUP)
+        for _ in range(100):
+            if len(built) == 2:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+        assert [h.name for h in built] == ["before", "after"]
+        assert logging.getLogger().level == logging.WARNING
+
+    @pytest.mark.asyncio
+    @mock.patch.dict(os.environ, {}, clear=True)
+    async def test_watch_mode(self, tmp_path: pathlib.Path) -> None:
+        """Test that a file change triggers a reload when watching."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("CB_USERNAME=before\n")
+        built: list[GatedHandler] = []
+        config = ConfigManager(env_file=str(env_file))
+        handler = ReloadableEventHandler(_factory(built), config)
+        reloader = HotReloader(config, handler, watch=True, interval=60)
+
+        env_file.write_text("CB_USERNAME=watched\n")
+        assert reloader.watcher is not None
+        assert reloader.watcher.check()
+        assert built[-1].name == "watched"
+
+
+def test_set_log_level_rejects_unknown_level() -> None:
+    """Test that an unknown level name is ignored."""
+    assert set_log_level("loud") is False
+    assert set_log_level("debug") is True
+    assert logging.getLogger().level == logging.DEBUG
@@ -0,0 +1,175 @@
+"""Tests for the circuit breaker, retry budget, and jittered backoff."""
+
+from typing import Any
+
+import httpx
+import pytest
+
+from chaturbate_poller.config.backoff import BackoffConfig
+from chaturbate_poller.core.client import ChaturbateClient
+from chaturbate_poller.core.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    RetryBudget,
+    decorrelated_jitter,
+    shared_circuit_breaker,
+    shared_retry_budget,
+)
+from chaturbate_poller.core.transport import PooledTransport
+from chaturbate_poller.exceptions import AuthenticationError, PollingError
+
+from .constants import TEST_URL, TOKEN, USERNAME
+from .test_rate_limit import FakeClock
+
+
+class TestDecorrelatedJitter:
+    """Tests for the decorrelated jitter wait generator."""
+
+    def test_waits_stay_within_bounds(self) -> None:
+        """Test that waits are at least the factor and never exceed the cap."""
+        waits = decorrelated_jitter(base=3.0, factor=1.0, max_value=10.0)
+        next(waits)
+        values = [next(waits) for _ in range(200)]
+        assert all(1.0 <= value <= 10.0 for value in values)
+        assert len(set(values)) > 1
+
+    def test_disabled_backoff_yields_zero(self) -> None:
+        """Test that a zero factor produces no waiting."""
+        waits = decorrelated_jitter(base=1, factor=0)
+        next(waits)
+        assert [next(waits) for _ in range(3)] == [0, 0, 0]
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold(self) -> None:
+        """Test that consecutive failures open the circuit."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN  # type: ignore[comparison-overlap]
+        clock.now = 4.0
+        assert breaker.acquire() == 6.0
+
+    def test_success_resets_failure_count(self) -> None:
+        """Test that a success between failures keeps the circuit closed."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_allows_single_probe(self) -> None:
+        """Test that only one probe passes while half-open."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=clock)
+        breaker.record_failure()
+        clock.now = 5.0
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.acquire() == 0.0
+        assert breaker.acquire() == 5.0
+        breaker.release()
+        assert breaker.acquire() == 0.0
+
+    def test_probe_outcome(self) -> None:
+        """Test that probe success closes and probe failure reopens the circuit."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=clock)
+        breaker.record_failure()
+        clock.now = 5.0
+        breaker.acquire()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        clock.now = 10.0
+        breaker.acquire()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED  # type: ignore[comparison-overlap]
+
+    def test_invalid_configuration(self) -> None:
+        """Test that non-positive settings are rejected."""
+        with pytest.raises(ValueError, match="must be positive"):
+            CircuitBreaker(failure_threshold=0)
+
+    def test_shared_instances(self) -> None:
+        """Test that the shared breaker and budget are process-wide singletons."""
+        assert shared_circuit_breaker() is shared_circuit_breaker()
+        assert shared_retry_budget() is shared_retry_budget()
+
+
+class TestClientResilience:
+    """Tests for circuit breaker and retry budget integration in the client."""
+
+    @staticmethod
+    def _client(status_codes: list[int], **kwargs: Any) -> ChaturbateClient:
+        """Create a client whose requests return the given status codes in order."""
+        codes = iter(status_codes)
+
+        def handler(_: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(codes), json={"events": []})
+
+        return ChaturbateClient(
+            USERNAME,
+            TOKEN,
+            transport=PooledTransport(transport=httpx.MockTransport(handler)),
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_records_upstream_failures(self, disabled_backoff_config: BackoffConfig) -> None:
+        """Test that server errors count against the breaker and successes reset it."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        client = self._client(
+            [503, 200], circuit_breaker=breaker, backoff_config=disabled_backoff_config
+        )
+        async with client:
+            with pytest.raises(PollingError):
+                await client.fetch_events(TEST_URL)
+            assert breaker._failures == 1
+            await client.fetch_events(TEST_URL)
+        assert breaker._failures == 0
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_trip_breaker(
+        self, disabled_backoff_config: BackoffConfig
+    ) -> None:
+        """Test that authentication failures are not counted as upstream failures."""
+        breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+        client = self._client(
+            [401], circuit_breaker=breaker, backoff_config=disabled_backoff_config
+        )
+        async with client:
+            with pytest.raises(AuthenticationError):
+                await client.fetch_events(TEST_URL)
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_waits_for_open_circuit(self, mocker: Any) -> None:
+        """Test that the client sleeps until an open circuit allows a probe."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+
+        async def advance(seconds: float) -> None:
+            clock.now += seconds
+
+        sleep = mocker.patch("chaturbate_poller.core.client.asyncio.sleep", side_effect=advance)
+        async with self._client([200], circuit_breaker=breaker) as client:
+            await client.fetch_events(TEST_URL)
+
+        wait = sleep.await_args.args[0]
+        assert 10.0 <= wait <= 20.0
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_retry_budget_limits_retries(self, mocker: Any) -> None:
+        """Test that an exhausted retry budget stops further retries."""
+        mocker.patch("asyncio.sleep", new_callable=mocker.AsyncMock)
+        budget = RetryBudget(capacity=1, refill_rate=0.001, clock=FakeClock())
+        client = self._client([500, 500, 500, 200], retry_budget=budget)
+        async with client:
+            with pytest.raises(PollingError, match=r"Unhandled polling error encountered\."):
+                await client.fetch_events(TEST_URL)
+        assert budget.tokens < 1
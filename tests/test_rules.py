@@ -0,0 +1,141 @@
+"""Tests for the windowed rules engine."""
+
+from __future__ import annotations
+
+import pytest
+
+from chaturbate_poller import metrics
+from chaturbate_poller.analytics.rules import FollowedBy, Match, Repeated, RuleEngine, TipBurst
+from chaturbate_poller.constants import EventMethod
+from chaturbate_poller.models.event import Event
+from chaturbate_poller.models.event_data import EventData
+from chaturbate_poller.models.tip import Tip
+from chaturbate_poller.models.user import User
+
+
+def _event(method: EventMethod, username: str, tokens: int = 0, broadcaster: str = "b") -> Event:
+    """Build an event from a user, with a tip when tokens are given."""
+    user = User(
+        username=username,
+        inFanclub=False,
+        hasTokens=True,
+        isMod=False,
+        recentTips="none",
+        gender="m",
+    )
+    tip = Tip(tokens=tokens, isAnon=False, message="") if tokens else None
+    data = EventData(broadcaster=broadcaster, user=user, tip=tip)
+    return Event(method=method, object=data, id=f"{username}-{tokens}")
+
+
+class _Clock:
+    """A clock advanced by hand."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        return self.now
+
+
+class TestRules:
+    """Tests for the rule state machines."""
+
+    def test_tip_burst_needs_distinct_users_and_tokens(self) -> None:
+        """Test that a burst needs enough different tippers and tokens in the window."""
+        clock = _Clock()
+        engine = RuleEngine([TipBurst("rush", tips=3, tokens=300, within=60)], clock=clock)
+        assert engine.process(_event(EventMethod.TIP, "a", 100)) == []
+        assert engine.process(_event(EventMethod.TIP, "a", 100)) == []
+        assert engine.process(_event(EventMethod.TIP, "b", 50)) == []
+        clock.now = 61
+        assert engine.process(_event(EventMethod.TIP, "c", 100)) == []
+
+        clock.now = 70
+        tips = [_event(EventMethod.TIP, user, 100) for user in "de"]
+        (match,) = engine.process_batch(tips)
+        assert (match.rule, match.key, match.time) == ("rush", "b", 70)
+        tippers = [event.object.user.username for event in match.events if event.object.user]
+        assert tippers == ["c", "d", "e"]
+        assert engine.process(_event(EventMethod.TIP, "f", 100)) == []
+
+    def test_tip_burst_counts_tips_and_caps_window(self) -> None:
+        """Test counting every tip and dropping the oldest beyond the tips kept."""
+        rule = TipBurst("many", tips=2, tokens=30, within=60, distinct_users=False, max_tips=2)
+        engine = RuleEngine([rule], clock=_Clock())
+        assert engine.process(_event(EventMethod.TIP, "a", 1)) == []
+        assert engine.process(_event(EventMethod.TIP, "a", 1)) == []
+        (match,) = engine.process(_event(EventMethod.TIP, "a", 29))
+        assert len(match.events) == 2
+
+    def test_followed_by(self) -> None:
+        """Test that a follow then a tip from the same user within the window matches."""
+        clock = _Clock()
+        engine = RuleEngine(
+            [FollowedBy("thanks", EventMethod.FOLLOW, EventMethod.TIP, within=60)], clock=clock
+        )
+        follow = _event(EventMethod.FOLLOW, "a")
+        engine.process_batch([follow, _event(EventMethod.FOLLOW, "b")])
+        assert engine.process(_event(EventMethod.TIP, "c", 10)) == []
+        clock.now = 30
+        tip = _event(EventMethod.TIP, "a", 10)
+        assert engine.process(tip) == [Match("thanks", ("b", "a"), 30, (follow, tip))]
+        assert engine.process(tip) == []
+        clock.now = 61
+        assert engine.process(_event(EventMethod.TIP, "b", 10)) == []
+        assert len(engine.rules[0]) == 0
+
+    def test_repeated(self) -> None:
+        """Test that a user entering too often within the window matches."""
+        clock = _Clock()
+        engine = RuleEngine(
+            [Repeated("restless", EventMethod.USER_ENTER, count=3, within=3600)], clock=clock
+        )
+        enter = _event(EventMethod.USER_ENTER, "a")
+        for now in (0, 10, 3601):
+            clock.now = now
+            assert engine.process(enter) == []
+        clock.now = 3602
+        (match,) = engine.process(enter)
+        assert (match.key, len(match.events)) == (("b", "a"), 3)
+        assert engine.process(enter) == []
+
+    def test_keys_are_bounded(self) -> None:
+        """Test that the least recently updated keys are dropped."""
+        rule = Repeated("restless", EventMethod.USER_ENTER, count=2, within=60, max_keys=2)
+        engine = RuleEngine([rule], clock=_Clock())
+        engine.process_batch([_event(EventMethod.USER_ENTER, user) for user in "abc"])
+        assert len(rule) == 2
+        assert engine.process(_event(EventMethod.USER_ENTER, "a")) == []
+        assert len(engine.process(_event(EventMethod.USER_ENTER, "c"))) == 1
+
+
+class TestRuleEngine:
+    """Tests for RuleEngine."""
+
+    def test_only_indexed_rules_see_events(self) -> None:
+        """Test that events only reach the rules reading their method and count matches."""
+        metrics.registry.clear()
+        burst = TipBurst("rush", tips=1, tokens=1, within=60)
+        repeat = Repeated("chatty", EventMethod.CHAT_MESSAGE, count=1, within=60)
+        engine = RuleEngine([burst, repeat], clock=_Clock())
+        engine.process(_event(EventMethod.USER_ENTER, "a"))
+        assert (len(burst), len(repeat)) == (0, 0)
+        assert [match.rule for match in engine.process(_event(EventMethod.TIP, "a", 5))] == ["rush"]
+        assert metrics.registry.snapshot()['rule_matches_total{rule="rush"}'] == 1
+
+    def test_invalid_rules(self) -> None:
+        """Test that rule settings and names are validated."""
+        with pytest.raises(ValueError, match="unique"):
+            RuleEngine([
+                Repeated("x", EventMethod.TIP, count=1, within=1),
+                Repeated("x", EventMethod.TIP, count=1, within=1),
+            ])
+        with pytest.raises(ValueError, match="Repeat count"):
+            Repeated("x", EventMethod.TIP, count=0, within=1)
+        with pytest.raises(ValueError, match="Tip count"):
+            TipBurst("x", tips=5, tokens=1, within=1, max_tips=4)
+        with pytest.raises(ValueError, match="key limit"):
+            FollowedBy("x", EventMethod.FOLLOW, EventMethod.TIP, within=1, max_keys=0)
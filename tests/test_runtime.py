@@ -0,0 +1,90 @@
+"""Tests for event loop selection and tuning."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from unittest import mock
+
+import pytest
+
+from chaturbate_poller.constants import LoopImplementation
+from chaturbate_poller.core import runtime
+
+
+class TestRuntime:
+    """Tests for the runtime helpers."""
+
+    def test_run_tunes_the_loop(self) -> None:
+        """Test that the executor size and eager task factory are applied."""
+
+        async def probe() -> tuple[str, bool, str]:
+            started: list[bool] = []
+
+            async def mark() -> None:
+                started.append(True)
+
+            task = asyncio.create_task(mark())
+            eager = bool(started)
+            await task
+            thread = await asyncio.to_thread(lambda: threading.current_thread().name)
+            return type(asyncio.get_running_loop()).__module__, eager, thread
+
+        module, eager, thread = runtime.run(
+            probe(), loop=LoopImplementation.ASYNCIO, executor_workers=2, eager_tasks=True
+        )
+        assert module.startswith("asyncio")
+        assert eager
+        assert thread.startswith("chaturbate-poller")
+
+    def test_run_defaults_to_lazy_tasks(self) -> None:
+        """Test that tasks are scheduled normally without eager tasks."""
+
+        async def probe() -> bool:
+            started: list[bool] = []
+
+            async def mark() -> None:
+                started.append(True)
+
+            task = asyncio.create_task(mark())
+            eager = bool(started)
+            await task
+            return eager
+
+        assert runtime.run(probe(), loop=LoopImplementation.ASYNCIO) is False
+
+    def test_invalid_executor_workers(self) -> None:
+        """Test that the executor size must be positive."""
+        coroutine = asyncio.sleep(0)
+        with pytest.raises(ValueError, match="Executor workers"):
+            runtime.run(coroutine, executor_workers=0)
+        coroutine.close()
+
+    @pytest.mark.parametrize(
+        ("implementation", "available", "uses_uvloop"),
+        [
+            (LoopImplementation.ASYNCIO, True, False),
+            (LoopImplementation.AUTO, True, True),
+            (LoopImplementation.AUTO, False, False),
+            (LoopImplementation.UVLOOP, True, True),
+            (LoopImplementation.UVLOOP, False, False),
+        ],
+    )
+    def test_loop_factory(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        implementation: LoopImplementation,
+        available: bool,
+        uses_uvloop: bool,
+    ) -> None:
+        """Test that uvloop is used when available and requested or automatic."""
+        factory = mock.Mock()
+        with (
+            mock.patch.object(runtime, "uvloop_available", return_value=available),
+            mock.patch.object(runtime, "_uvloop_factory", return_value=factory),
+            caplog.at_level(logging.WARNING),
+        ):
+            assert runtime.loop_factory(implementation) is (factory if uses_uvloop else None)
+        warned = implementation is LoopImplementation.UVLOOP and not available
+        assert ("uvloop requested but not installed" in caplog.text) is warned
@@ -0,0 +1,142 @@
+"""Tests for sharded polling."""
+
+from __future__ import annotations
+
+import multiprocessing
+from typing import TYPE_CHECKING
+
+import pytest
+
+from chaturbate_poller.core.sharding import (
+    BroadcasterCredentials,
+    LineProtocolPipeHandler,
+    ShardedRunner,
+    assign_shards,
+    run_shard,
+    shard_for,
+)
+
+from .constants import TOKEN
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from chaturbate_poller.database.influxdb_handler import InfluxDBHandler
+    from chaturbate_poller.models.event import Event
+
+BROADCASTERS = [BroadcasterCredentials(f"user{index}", TOKEN) for index in range(20)]
+
+
+class TestShardAssignment:
+    """Tests for hashing broadcasters onto shards."""
+
+    def test_shard_is_stable(self) -> None:
+        """Test that a broadcaster always maps to the same shard."""
+        assert shard_for("TestUser", 4) == shard_for("testuser", 4)
+        assert 0 <= shard_for("testuser", 4) < 4
+
+    def test_assign_covers_every_broadcaster(self) -> None:
+        """Test that every broadcaster is assigned exactly once."""
+        groups = assign_shards(BROADCASTERS, 4)
+        assert len(groups) == 4
+        assert sorted(b.username for group in groups for b in group) == sorted(
+            b.username for b in BROADCASTERS
+        )
+
+    def test_invalid_shard_count(self) -> None:
+        """Test that a non-positive shard count is rejected."""
+        with pytest.raises(ValueError, match="Shard count must be a positive integer"):
+            assign_shards(BROADCASTERS, 0)
+
+    def test_runner_caps_workers(self, influxdb_handler: InfluxDBHandler) -> None:
+        """Test that no more workers than broadcasters are started."""
+        runner = ShardedRunner(BROADCASTERS[:2], workers=8, writer=influxdb_handler)
+        assert runner.workers == 2
+
+    def test_runner_requires_broadcasters(self, influxdb_handler: InfluxDBHandler) -> None:
+        """Test that a runner needs at least one broadcaster."""
+        with pytest.raises(ValueError, match="At least one broadcaster"):
+            ShardedRunner([], writer=influxdb_handler)
+
+
+class TestLineProtocolPipeHandler:
+    """Tests for the worker-side handler."""
+
+    @pytest.mark.asyncio
+    async def test_batches_lines(
+        self, sample_event: Event, influxdb_handler: InfluxDBHandler
+    ) -> None:
+        """Test that events are sent as one message per full batch."""
+        reader, sender = multiprocessing.Pipe(duplex=False)
+        handler = LineProtocolPipeHandler(
+            sender, batch_size=2, flush_interval=60.0, encoder=influxdb_handler
+        )
+        await handler.handle_event(sample_event)
+        assert not reader.poll()
+        await handler.handle_event(sample_event)
+        lines = reader.recv_bytes().split(b"\n")
+        assert len(lines) == 2
+        assert all(line.startswith(b"chaturbate_events ") for line in lines)
+        timestamps = [int(line.rsplit(b" ", 1)[1]) for line in lines]
+        assert timestamps[0] < timestamps[1]
+
+    @pytest.mark.asyncio
+    async def test_flush_without_lines(self, influxdb_handler: InfluxDBHandler) -> None:
+        """Test that an empty buffer sends nothing."""
+        reader, sender = multiprocessing.Pipe(duplex=False)
+        await LineProtocolPipeHandler(sender, encoder=influxdb_handler).flush()
+        assert not reader.poll()
+
+    @pytest.mark.asyncio
+    async def test_run_shard_flushes_on_exit(
+        self, mocker: MockerFixture, sample_event: Event, influxdb_handler: InfluxDBHandler
+    ) -> None:
+        """Test that lines buffered when polling stops are still sent."""
+        mocker.patch(
+            "chaturbate_poller.core.sharding.InfluxDBHandler", return_value=influxdb_handler
+        )
+
+        async def fake_polling(**kwargs: object) -> None:
+            await kwargs["event_handler"].handle_event(sample_event)  # type: ignore[attr-defined]
+
+        mocker.patch("chaturbate_poller.core.sharding.start_polling", side_effect=fake_polling)
+        reader, sender = multiprocessing.Pipe(duplex=False)
+        await run_shard(BROADCASTERS[:3], sender)
+        assert len(reader.recv_bytes().split(b"\n")) == 3
+
+
+class TestWriter:
+    """Tests for the single writer in the parent process."""
+
+    @pytest.mark.asyncio
+    async def test_drain_until_eof(
+        self, mocker: MockerFixture, influxdb_handler: InfluxDBHandler
+    ) -> None:
+        """Test that the writer writes every batch and stops once all pipes close."""
+        write = mocker.patch.object(influxdb_handler, "write_line_protocol")
+        runner = ShardedRunner(BROADCASTERS, writer=influxdb_handler, poll_interval=0.1)
+        reader, sender = multiprocessing.Pipe(duplex=False)
+        sender.send_bytes(b"a x=1\na x=2")
+        sender.close()
+
+        await runner.drain([reader])
+
+        write.assert_awaited_once_with(b"a x=1\na x=2")
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_logged(
+        self,
+        mocker: MockerFixture,
+        influxdb_handler: InfluxDBHandler,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that a failed write drops the batch without stopping the writer."""
+        mocker.patch.object(influxdb_handler, "write_line_protocol", side_effect=OSError)
+        runner = ShardedRunner(BROADCASTERS, writer=influxdb_handler, poll_interval=0.1)
+        reader, sender = multiprocessing.Pipe(duplex=False)
+        sender.send_bytes(b"a x=1")
+        sender.close()
+
+        await runner.drain([reader])
+
+        assert "Dropped 1 line(s)" in caplog.text
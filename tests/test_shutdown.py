@@ -0,0 +1,186 @@
+"""Tests for graceful shutdown and checkpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from chaturbate_poller.core.checkpoint import Checkpoint, cursor_from_url
+from chaturbate_poller.core.polling import start_polling
+from chaturbate_poller.core.shutdown import GracefulShutdown
+from chaturbate_poller.exceptions import ShutdownTimeoutError
+from chaturbate_poller.handlers.event_handler import EventHandler
+
+from .constants import TOKEN, USERNAME
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from chaturbate_poller.models.event import Event
+
+
+class RecordingHandler(EventHandler):
+    """Handler that records events and whether it was closed."""
+
+    def __init__(self, close_delay: float = 0.0) -> None:
+        """Initialize the handler."""
+        self.events: list[Event] = []
+        self.closed: bool = False
+        self.close_delay: float = close_delay
+
+    async def handle_event(self, event: Event) -> None:
+        """Record an event."""
+        self.events.append(event)
+
+    async def close(self) -> None:
+        """Record that the handler was closed."""
+        await asyncio.sleep(self.close_delay)
+        self.closed = True
+
+
+def _page(event_id: str, next_cursor: str) -> dict[str, object]:
+    """Build an API response with a single tip event."""
+    return {
+        "events": [
+            {
+                "method": "tip",
+                "id": event_id,
+                "object": {
+                    "user": {
+                        "username": "fan",
+                        "inFanclub": False,
+                        "hasTokens": True,
+                        "isMod": False,
+                        "gender": "m",
+                        "recentTips": "none",
+                    },
+                    "tip": {"tokens": 10, "message": "", "isAnon": False},
+                },
+            }
+        ],
+        "nextUrl": f"https://eventsapi.chaturbate.com/events/{USERNAME}/{TOKEN}/?i={next_cursor}&timeout=10",
+    }
+
+
+class TestGracefulShutdown:
+    """Tests for GracefulShutdown."""
+
+    def test_invalid_timeout(self) -> None:
+        """Test that a non-positive timeout is rejected."""
+        with pytest.raises(ValueError, match="Shutdown timeout must be positive"):
+            GracefulShutdown(timeout=0)
+
+    @pytest.mark.asyncio
+    async def test_closes_handler_when_polling_ends(self) -> None:
+        """Test that the handler is closed after polling finishes on its own."""
+        handler = RecordingHandler()
+
+        async def polling() -> None:
+            await asyncio.sleep(0)
+
+        await GracefulShutdown().run(polling(), handler)
+        assert handler.closed
+
+    @pytest.mark.asyncio
+    async def test_sigterm_drains_and_logs_timing(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that SIGTERM stops polling and flushes the handler."""
+        caplog.set_level("INFO")
+        handler = RecordingHandler()
+        shutdown = GracefulShutdown(timeout=5.0)
+
+        async def polling() -> None:
+            os.kill(os.getpid(), signal.SIGTERM)
+            await shutdown.stop_event.wait()
+
+        await shutdown.run(polling(), handler)
+
+        assert shutdown.received is signal.SIGTERM
+        assert handler.closed
+        assert "Shutdown completed in" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_deadline_exceeded(self) -> None:
+        """Test that a handler slower than the deadline raises ShutdownTimeoutError."""
+        handler = RecordingHandler(close_delay=5.0)
+        shutdown = GracefulShutdown(timeout=0.05)
+
+        async def polling() -> None:
+            shutdown.request_stop()
+            await asyncio.sleep(0)
+
+        with pytest.raises(ShutdownTimeoutError):
+            await shutdown.run(polling(), handler)
+        assert not handler.closed
+
+    def test_repeated_request_is_ignored(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that a second stop request only logs a warning."""
+        shutdown = GracefulShutdown()
+        shutdown.request_stop(signal.SIGINT)
+        shutdown.request_stop(signal.SIGTERM)
+        assert shutdown.received is signal.SIGINT
+        assert "Shutdown already in progress" in caplog.text
+
+
+class TestCheckpoint:
+    """Tests for Checkpoint."""
+
+    def test_round_trip(self, tmp_path: pathlib.Path) -> None:
+        """Test that saved cursors are loaded per broadcaster."""
+        checkpoint = Checkpoint(tmp_path / "state" / "checkpoint.json")
+        assert checkpoint.load(USERNAME) is None
+        checkpoint.save(USERNAME, "abc")
+        checkpoint.save("other", "def")
+        assert Checkpoint(checkpoint.path).load(USERNAME) == "abc"
+        assert TOKEN not in checkpoint.path.read_text()
+
+    def test_corrupt_file_is_ignored(self, tmp_path: pathlib.Path) -> None:
+        """Test that an unreadable file is treated as empty."""
+        path = tmp_path / "checkpoint.json"
+        path.write_text("{not json")
+        assert Checkpoint(path).load(USERNAME) is None
+
+    def test_cursor_from_url(self) -> None:
+        """Test extracting the cursor from a next URL."""
+        assert cursor_from_url("https://example.com/events/u/t/?i=42&timeout=10") == "42"
+        assert cursor_from_url("https://example.com/events/u/t/") is None
+
+
+class TestStopAndResume:
+    """Tests for stopping and resuming start_polling."""
+
+    @pytest.mark.asyncio
+    async def test_stop_abandons_fetch_and_saves_cursor(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+    ) -> None:
+        """Test that a stop mid-request keeps the cursor of the last handled page."""
+        requested: list[httpx.URL] = []
+        stop = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url)
+            if len(requested) == 1:
+                return httpx.Response(200, json=_page("1", "cursor-1"))
+            stop.set()
+            await asyncio.sleep(60)
+            return httpx.Response(200, json=_page("2", "cursor-2"))  # pragma: no cover
+
+        monkeypatch.setattr(
+            "chaturbate_poller.core.transport.httpx.AsyncHTTPTransport",
+            lambda **_: httpx.MockTransport(handler),
+        )
+        checkpoint = Checkpoint(tmp_path / "checkpoint.json")
+        checkpoint.save(USERNAME, "cursor-0")
+        events = RecordingHandler()
+
+        await asyncio.wait_for(
+            start_polling(USERNAME, TOKEN, 10, events, stop=stop, checkpoint=checkpoint), 5
+        )
+
+        assert requested[0].params["i"] == "cursor-0"
+        assert [event.id for event in events.events] == ["1"]
+        assert checkpoint.load(USERNAME) == "cursor-1"
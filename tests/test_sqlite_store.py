@@ -0,0 +1,222 @@
+"""Tests for the SQLite event store and handler."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from chaturbate_poller import metrics
+from chaturbate_poller.constants import EXAMPLE_JSON_STRING, EventMethod
+from chaturbate_poller.database.sqlite_store import SQLiteStore
+from chaturbate_poller.handlers.factory import HandlerType, create_event_handler
+from chaturbate_poller.handlers.sqlite_handler import SQLiteEventHandler
+from chaturbate_poller.models.api_response import EventsAPIResponse
+from chaturbate_poller.models.event import Event
+from chaturbate_poller.models.event_data import EventData
+from chaturbate_poller.models.tip import Tip
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterator
+
+    from chaturbate_poller.models.message import Message
+    from chaturbate_poller.models.user import User
+
+HOUR = 3600
+
+
+@pytest.fixture
+def store(tmp_path: pathlib.Path) -> Iterator[SQLiteStore]:
+    """Open a store in a temporary directory."""
+    store = SQLiteStore(str(tmp_path / "events.db"))
+    yield store
+    store.close()
+
+
+def _tip(user: User, tokens: int) -> Event:
+    """Build a tip event."""
+    tip = Tip(tokens=tokens, isAnon=False, message="hi")
+    return Event(method=EventMethod.TIP, object=EventData(user=user, tip=tip), id="t")
+
+
+class TestSQLiteStore:
+    """Tests for SQLiteStore."""
+
+    def test_uses_wal(self, store: SQLiteStore) -> None:
+        """Test that the database is in WAL mode."""
+        with sqlite3.connect(store.path) as connection:
+            assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+    def test_writes_normalized_rows(
+        self, store: SQLiteStore, sample_event: Event, chat_message_example: Message
+    ) -> None:
+        """Test that each payload lands in its own table."""
+        media = EventsAPIResponse.model_validate_json(EXAMPLE_JSON_STRING).events
+        chat = Event(
+            method=EventMethod.CHAT_MESSAGE,
+            object=EventData(user=sample_event.object.user, message=chat_message_example),
+            id="c",
+        )
+        subject = Event(
+            method=EventMethod.ROOM_SUBJECT_CHANGE,
+            object=EventData(broadcaster="b", subject="topic"),
+            id="s",
+        )
+        store.submit([sample_event, chat, subject], received_at=HOUR)
+        store.submit(media, received_at=HOUR)
+        store.flush()
+
+        with sqlite3.connect(store.path) as connection:
+            tables = {
+                table: connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]  # noqa: S608
+                for table in (
+                    "events",
+                    "users",
+                    "tips",
+                    "messages",
+                    "media_purchases",
+                    "room_subjects",
+                )
+            }
+        assert tables == {
+            "events": 4,
+            "users": 2,
+            "tips": 1,
+            "messages": 1,
+            "media_purchases": 1,
+            "room_subjects": 1,
+        }
+        assert store.count() == 4
+
+    def test_queries(self, store: SQLiteStore, example_user: User, sample_event: Event) -> None:
+        """Test the top tippers and events per hour rollups."""
+        store.submit([sample_event, _tip(example_user, 30)], received_at=HOUR)
+        store.submit([_tip(example_user, 90)], received_at=2 * HOUR + 5)
+        store.flush()
+
+        assert store.top_tippers(1) == [("example_user", 120, 2)]
+        assert store.top_tippers() == [("example_user", 120, 2), ("test_user", 100, 1)]
+        assert store.events_per_hour() == [(HOUR, 2), (2 * HOUR, 1)]
+        assert store.events_per_hour(since=2 * HOUR, method="tip") == [(2 * HOUR, 1)]
+        assert store.events_per_hour(until=2 * HOUR) == [(HOUR, 2)]
+
+    def test_reopen_keeps_ids(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test that a reopened database continues its event and user IDs."""
+        path = str(tmp_path / "events.db")
+        first = SQLiteStore(path)
+        first.submit([sample_event], received_at=HOUR)
+        first.close()
+        second = SQLiteStore(path)
+        second.submit([sample_event], received_at=HOUR)
+        second.close()
+        with sqlite3.connect(path) as connection:
+            assert connection.execute("SELECT id, user_id FROM events").fetchall() == [
+                (1, 1),
+                (2, 1),
+            ]
+            assert connection.execute("SELECT tokens, tips FROM tip_totals").fetchall() == [
+                (200, 2)
+            ]
+
+    def test_two_stores_share_a_file(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test that stores writing to one file, as across a reload, do not reuse IDs."""
+        metrics.registry.clear()
+        path = str(tmp_path / "events.db")
+        old, new = SQLiteStore(path), SQLiteStore(path)
+        for _ in range(3):
+            old.submit([sample_event], received_at=HOUR)
+            old.flush()
+            new.submit([sample_event, sample_event], received_at=HOUR)
+            new.flush()
+        old.close()
+        new.close()
+        with sqlite3.connect(path) as connection:
+            assert connection.execute("SELECT COUNT(*) FROM events").fetchone() == (9,)
+            assert connection.execute("SELECT COUNT(*) FROM tips").fetchone() == (9,)
+        assert metrics.registry.snapshot()["sqlite_events_dropped_total"] == 0
+
+    def test_failed_write_is_dropped(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test that a failed transaction is rolled back and counted."""
+        metrics.registry.clear()
+        store = SQLiteStore(str(tmp_path / "events.db"))
+        with mock.patch.object(store, "_user_id", side_effect=sqlite3.OperationalError("locked")):
+            store.submit([sample_event])
+            store.flush()
+            assert metrics.registry.snapshot()['sink_failing{sink="sqlite"}'] == 1
+        store.submit([sample_event])
+        store.close()
+        snapshot = metrics.registry.snapshot()
+        assert snapshot["sqlite_events_dropped_total"] == 1
+        assert snapshot["sqlite_events_written_total"] == 1
+        assert snapshot['sink_failing{sink="sqlite"}'] == 0
+        assert snapshot["sqlite_queue_depth"] == 0
+
+    def test_bad_row_is_dropped(self, store: SQLiteStore, sample_event: Event) -> None:
+        """Test that an error other than a database error does not stop the writer."""
+        with mock.patch.object(store, "_user_id", side_effect=TypeError("bad row")):
+            store.submit([sample_event])
+            store.flush()
+        store.submit([sample_event])
+        store.flush()
+        assert store.count() == 1
+
+    def test_failed_writer_closes_store(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test that a writer that fails outright closes the store instead of hanging."""
+        metrics.registry.clear()
+        store = SQLiteStore(str(tmp_path / "events.db"))
+        with mock.patch.object(store, "_write", side_effect=MemoryError):
+            store.submit([sample_event])
+            store.flush()
+        with pytest.raises(RuntimeError, match="has been closed"):
+            store.submit([sample_event])
+        store.close()
+        snapshot = metrics.registry.snapshot()
+        assert snapshot["sqlite_events_dropped_total"] == 2
+        assert snapshot['sink_failing{sink="sqlite"}'] == 1
+
+
+class TestSQLiteEventHandler:
+    """Tests for SQLiteEventHandler."""
+
+    @pytest.mark.asyncio
+    async def test_handler_writes_and_closes(
+        self, tmp_path: pathlib.Path, sample_event: Event
+    ) -> None:
+        """Test that the handler queues pages and flushes them on close."""
+        store = SQLiteStore(str(tmp_path / "events.db"), queue_size=1)
+        handler = SQLiteEventHandler(store)
+        await handler.handle_event(sample_event)
+        await handler.handle_batch([sample_event, sample_event])
+        await handler.close()
+        with sqlite3.connect(store.path) as connection:
+            assert connection.execute("SELECT COUNT(*) FROM events").fetchone() == (3,)
+
+    @pytest.mark.asyncio
+    async def test_closed_store_drops_pages(
+        self, tmp_path: pathlib.Path, sample_event: Event, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that pages for a store whose writer shut down are dropped, not raised."""
+        metrics.registry.clear()
+        store = SQLiteStore(str(tmp_path / "events.db"))
+        handler = SQLiteEventHandler(store)
+        with mock.patch.object(store, "_write", side_effect=MemoryError):
+            await handler.handle_batch([sample_event])
+            store.flush()
+        await handler.handle_batch([sample_event, sample_event])
+        await handler.handle_event(sample_event)
+        await handler.close()
+        assert caplog.text.count("SQLite store is closed") == 1
+        assert metrics.registry.snapshot()["sqlite_events_dropped_total"] == 4
+
+    @pytest.mark.asyncio
+    async def test_factory(self, tmp_path: pathlib.Path) -> None:
+        """Test that the factory opens the configured database."""
+        path = tmp_path / "configured.db"
+        config = mock.Mock(get=mock.Mock(return_value=str(path)))
+        handler = create_event_handler(HandlerType.SQLITE, config)
+        assert isinstance(handler, SQLiteEventHandler)
+        await handler.close()
+        assert path.exists()
@@ -0,0 +1,111 @@
+"""Tests for the pooled HTTP transport."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from chaturbate_poller.config.http import HTTPClientConfig
+from chaturbate_poller.core.client import ChaturbateClient
+from chaturbate_poller.core.transport import ConnectionStats, PooledTransport
+
+from .constants import TEST_URL, TOKEN, USERNAME
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+class _Stream:
+    """Stand-in for an httpcore network stream."""
+
+
+class TestHTTPClientConfig:
+    """Tests for HTTPClientConfig."""
+
+    def test_default_limits(self) -> None:
+        """Test that the defaults translate into httpx limits."""
+        limits = HTTPClientConfig().limits
+        assert limits.max_connections == 100
+        assert limits.max_keepalive_connections == 20
+        assert limits.keepalive_expiry == 60.0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"max_connections": 0}, {"max_keepalive_connections": -1}, {"keepalive_expiry": -1.0}],
+    )
+    def test_invalid_values(self, kwargs: dict[str, float]) -> None:
+        """Test that invalid pool settings are rejected."""
+        with pytest.raises(ValueError, match="must be"):
+            HTTPClientConfig(**kwargs)  # type: ignore[arg-type]
+
+
+class TestPooledTransport:
+    """Tests for PooledTransport."""
+
+    def test_reuse_ratio_without_requests(self) -> None:
+        """Test that the reuse ratio is zero before any request."""
+        assert ConnectionStats().reuse_ratio == 0.0
+
+    @pytest.mark.asyncio
+    async def test_tracks_connection_reuse(self) -> None:
+        """Test that responses over the same stream count as reused connections."""
+        streams = [_Stream(), _Stream()]
+        order = iter([streams[0], streams[0], streams[1], streams[0]])
+
+        def handler(_: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={}, extensions={"network_stream": next(order)})
+
+        async with PooledTransport(transport=httpx.MockTransport(handler)) as transport:
+            async with httpx.AsyncClient(transport=transport) as client:
+                for _ in range(4):
+                    await client.get(TEST_URL)
+
+        assert transport.stats.requests == 4
+        assert transport.stats.connections_opened == 2
+        assert transport.stats.connections_reused == 2
+        assert transport.stats.reuse_ratio == 0.5
+
+    @pytest.mark.asyncio
+    async def test_shared_between_clients(self) -> None:
+        """Test that a shared transport stays open until its last user releases it."""
+        transport = PooledTransport(
+            transport=httpx.MockTransport(lambda _: httpx.Response(200, json={"events": []}))
+        )
+        async with transport:
+            async with ChaturbateClient(USERNAME, TOKEN, transport=transport) as first:
+                async with ChaturbateClient(USERNAME, TOKEN, transport=transport) as second:
+                    await first.fetch_events(TEST_URL)
+                    await second.fetch_events(TEST_URL)
+                    assert first.connection_stats is second.connection_stats
+                assert not transport.closed
+            assert not transport.closed
+        assert transport.closed
+        assert transport.stats.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_acquire_after_close(self) -> None:
+        """Test that a closed transport cannot be reused."""
+        transport = PooledTransport(transport=httpx.MockTransport(lambda _: httpx.Response(200)))
+        async with transport:
+            pass
+        with pytest.raises(RuntimeError, match="Transport has been closed"):
+            transport.acquire()
+
+    def test_http2_falls_back_without_h2(self, mocker: MockerFixture) -> None:
+        """Test that HTTP/2 is disabled when the optional dependency is missing."""
+        mocker.patch("chaturbate_poller.core.transport.http2_available", return_value=False)
+        transport = PooledTransport(HTTPClientConfig(http2=True))
+        assert transport.http2 is False
+
+    @pytest.mark.asyncio
+    async def test_client_uses_private_transport(self) -> None:
+        """Test that a client creates its own pooled transport by default."""
+        client = ChaturbateClient(USERNAME, TOKEN, http_config=HTTPClientConfig(max_connections=5))
+        assert client.connection_stats is None
+        async with client:
+            assert client.connection_stats == ConnectionStats()
+            assert client._transport is not None
+            assert client._transport.config.max_connections == 5
+        assert client._transport.closed
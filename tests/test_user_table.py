@@ -0,0 +1,106 @@
+"""Tests for the per-broadcaster user table."""
+
+from __future__ import annotations
+
+import itertools
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from chaturbate_poller import metrics
+from chaturbate_poller.analytics.users import UserTable, UserTables
+from chaturbate_poller.constants import MEMORY_USER_BYTES, EventMethod
+from chaturbate_poller.models.event import Event
+from chaturbate_poller.models.event_data import EventData
+
+if TYPE_CHECKING:
+    from chaturbate_poller.models.message import Message
+    from chaturbate_poller.models.user import User
+
+
+def _event(user: User, method: EventMethod = EventMethod.USER_ENTER, **data: object) -> Event:
+    """Build an event for a user."""
+    return Event(method=method, object=EventData(user=user, **data), id="1")  # type: ignore[arg-type]
+
+
+class TestUserTable:
+    """Tests for UserTable."""
+
+    def test_record_accumulates_state(
+        self, sample_event: Event, example_user: User, chat_message_example: Message
+    ) -> None:
+        """Test that tips, messages and flags are tracked per user."""
+        clock = itertools.count(100)
+        table = UserTable(clock=lambda: float(next(clock)))
+        table.record(sample_event)
+        table.record(sample_event)
+        fan = example_user.model_copy(update={"in_fanclub": True, "is_mod": True})
+        table.record(_event(example_user))
+        state = table.record(_event(fan, EventMethod.CHAT_MESSAGE, message=chat_message_example))
+
+        tipper = table.get("test_user")
+        assert tipper is not None
+        assert (tipper.tip_total, tipper.tip_count, tipper.message_count) == (200, 2, 0)
+        assert state is not None
+        assert (state.message_count, state.in_fanclub, state.is_mod) == (1, True, True)
+        assert (state.first_seen, state.last_seen) == (102, 103)
+        assert table.by_id(state.user_id) is state
+        assert [user.username for user in table.top_tippers(1)] == ["test_user"]
+
+    def test_ids_are_stable_and_interned(self) -> None:
+        """Test that a username keeps its ID and shares one string."""
+        table = UserTable()
+        built = "".join(["al", "ice"])  # noqa: FLY002
+        first = table.user_id(built)
+        assert table.user_id("alice") == first
+        assert table.user_id("bob") == first + 1
+        state = table.by_id(first)
+        assert state is not None
+        assert state.username is sys.intern("alice")
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently seen user is evicted."""
+        metrics.registry.clear()
+        table = UserTable(2, broadcaster="b")
+        alice = table.user_id("alice")
+        table.user_id("bob")
+        table.user_id("alice")
+        table.user_id("carol")
+
+        assert "bob" not in table
+        assert [user.username for user in table] == ["alice", "carol"]
+        assert table.user_id("bob") not in {alice, 1, 2}
+        assert table.by_id(alice) is None
+        assert metrics.registry.snapshot()['user_table_evictions_total{broadcaster="b"}'] == 2
+
+    def test_shed_memory_evicts_oldest_half(self) -> None:
+        """Test that shedding memory evicts the least recently seen half of the users."""
+        table = UserTable()
+        for name in ("alice", "bob", "carol"):
+            table.user_id(name)
+        assert table.memory_usage() == 3 * MEMORY_USER_BYTES
+        table.shed_memory()
+        assert [user.username for user in table] == ["carol"]
+
+    def test_ignores_events_without_user(self) -> None:
+        """Test that events without a user leave the table empty."""
+        table = UserTable()
+        event = Event(method=EventMethod.ROOM_SUBJECT_CHANGE, object=EventData(), id="1")
+        assert table.record(event) is None
+        assert len(table) == 0
+
+    def test_invalid_size(self) -> None:
+        """Test that the table size must be positive."""
+        with pytest.raises(ValueError, match="User table size must be a positive integer"):
+            UserTable(0)
+
+
+def test_tables_per_broadcaster(sample_event: Event, example_user: User) -> None:
+    """Test that events are filed under their broadcaster."""
+    tables = UserTables()
+    tables.record(sample_event, "fallback")
+    tables.record(_event(example_user, broadcaster="named"))
+    assert sorted(tables) == ["fallback", "named"]
+    assert "test_user" in tables["fallback"]
+    assert "example_user" in tables["named"]
@@ -0,0 +1,229 @@
+"""Tests for the batched webhook sink."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import httpx
+import pytest
+
+from chaturbate_poller import metrics
+from chaturbate_poller.constants import EventMethod
+from chaturbate_poller.core.webhooks import WebhookDestination, WebhookDispatcher
+from chaturbate_poller.handlers.factory import create_webhook_dispatcher
+from chaturbate_poller.handlers.webhook_handler import WebhookEventHandler
+from chaturbate_poller.models.event import Event
+from chaturbate_poller.models.event_data import EventData
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable
+
+URL = "https://hooks.example/events"
+
+
+def _recorder(
+    responses: list[int | Exception] | None = None,
+) -> tuple[list[httpx.Request], httpx.MockTransport]:
+    """Build a transport that records requests and answers with the given statuses."""
+    requests: list[httpx.Request] = []
+    answers = iter(responses or [])
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        answer = next(answers, 200)
+        if isinstance(answer, Exception):
+            raise answer
+        return httpx.Response(answer)
+
+    return requests, httpx.MockTransport(handle)
+
+
+def _dispatcher(
+    tmp_path: pathlib.Path,
+    transport: httpx.AsyncBaseTransport,
+    destination: WebhookDestination | None = None,
+    **settings: int,
+) -> WebhookDispatcher:
+    """Create a dispatcher with fast retries and a temporary dead-letter file."""
+    return WebhookDispatcher(
+        [destination or WebhookDestination(URL)],
+        flush_interval=0.01,
+        retry_wait=0.001,
+        dead_letter_path=tmp_path / "dead.jsonl",
+        transport=transport,
+        **settings,
+    )
+
+
+def _dead_letters(tmp_path: pathlib.Path) -> list[dict[str, object]]:
+    """Read the dead-letter file."""
+    path = tmp_path / "dead.jsonl"
+    return [json.loads(line) for line in path.read_text().splitlines()] if path.exists() else []
+
+
+class TestWebhookDispatcher:
+    """Tests for WebhookDispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_batches_filters_and_signs(
+        self, tmp_path: pathlib.Path, sample_event: Event
+    ) -> None:
+        """Test that matching events are POSTed as signed JSON arrays."""
+        requests, transport = _recorder()
+        destination = WebhookDestination(URL, secret="s3cret", methods=frozenset({"tip"}))  # noqa: S106
+        dispatcher = _dispatcher(tmp_path, transport, destination=destination, batch_size=2)
+        enter = Event(method=EventMethod.USER_ENTER, object=EventData(), id="e")
+        dispatcher.submit([sample_event, enter, sample_event, sample_event])
+        await dispatcher.close()
+
+        assert [len(json.loads(request.content)) for request in requests] == [2, 1]
+        body = requests[0].content
+        assert json.loads(body)[0]["object"]["tip"]["isAnon"] is False
+        expected = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+        assert requests[0].headers["X-Signature-256"] == f"sha256={expected}"
+        assert requests[0].headers["Content-Type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_retries_then_succeeds(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test that transient failures are retried."""
+        metrics.registry.clear()
+        requests, transport = _recorder([503, httpx.ConnectError("refused"), 200])
+        dispatcher = _dispatcher(tmp_path, transport)
+        dispatcher.submit([sample_event])
+        await dispatcher.close()
+
+        assert len(requests) == 3
+        assert _dead_letters(tmp_path) == []
+        snapshot = metrics.registry.snapshot()
+        assert snapshot["webhook_retries_total"] == 2
+        assert snapshot["webhook_events_sent_total"] == 1
+        assert snapshot[f'sink_failing{{sink="webhook",url="{URL}"}}'] == 0
+        assert snapshot[f'webhook_queue_depth{{url="{URL}"}}'] == 0
+
+    @pytest.mark.parametrize(
+        ("responses", "attempts", "error"),
+        [
+            ([500, 500], 2, "HTTP 500"),
+            ([400], 1, "HTTP 400"),
+            ([httpx.TooManyRedirects("loop")], 1, "TooManyRedirects: loop"),
+            ([httpx.InvalidURL("bad")], 1, "InvalidURL: bad"),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_dead_letters(
+        self,
+        tmp_path: pathlib.Path,
+        sample_event: Event,
+        responses: list[int | Exception],
+        attempts: int,
+        error: str,
+    ) -> None:
+        """Test that exhausted and non-retryable batches go to the dead-letter file."""
+        metrics.registry.clear()
+        requests, transport = _recorder(responses)
+        dispatcher = _dispatcher(tmp_path, transport, max_tries=2)
+        dispatcher.submit([sample_event])
+        await dispatcher.close()
+
+        assert len(requests) == attempts
+        (record,) = _dead_letters(tmp_path)
+        assert (record["url"], record["error"], record["attempts"]) == (URL, error, attempts)
+        assert record["events"] == [json.loads(sample_event.model_dump_json(by_alias=True))]
+        assert metrics.registry.snapshot()[f'sink_failing{{sink="webhook",url="{URL}"}}'] == 1
+
+    @pytest.mark.asyncio
+    async def test_overflow_is_dead_lettered(
+        self, tmp_path: pathlib.Path, sample_event: Event
+    ) -> None:
+        """Test that events beyond a full queue are dead-lettered, not blocking."""
+        _, transport = _recorder()
+        dispatcher = _dispatcher(tmp_path, transport, queue_size=1)
+        dispatcher.submit([sample_event, sample_event, sample_event])
+        await dispatcher.close()
+
+        (record,) = _dead_letters(tmp_path)
+        assert record["error"] == "Queue full"
+        assert len(record["events"]) == 2  # type: ignore[arg-type]
+        with pytest.raises(RuntimeError, match="closed"):
+            dispatcher.submit([sample_event])
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(
+        self, tmp_path: pathlib.Path, sample_event: Event
+    ) -> None:
+        """Test that a slow webhook holds at most its concurrency in flight."""
+        in_flight: list[int] = [0, 0]
+        release = asyncio.Event()
+
+        async def handle(_: httpx.Request) -> httpx.Response:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+            await release.wait()
+            in_flight[0] -= 1
+            return httpx.Response(204)
+
+        destination = WebhookDestination(URL, concurrency=2)
+        dispatcher = _dispatcher(
+            tmp_path, httpx.MockTransport(handle), destination=destination, batch_size=1
+        )
+        dispatcher.submit([sample_event] * 5)
+        await asyncio.sleep(0.05)
+        assert in_flight == [2, 2]
+        release.set()
+        await dispatcher.close()
+        assert in_flight == [0, 2]
+
+    def test_invalid_settings(self) -> None:
+        """Test that batch size, tries and concurrency are validated."""
+        with pytest.raises(ValueError, match="batch size and tries"):
+            WebhookDispatcher([], batch_size=0)
+        with pytest.raises(ValueError, match="concurrency"):
+            WebhookDestination(URL, concurrency=0)
+
+
+class TestWebhookConfiguration:
+    """Tests for the webhook factory and handler."""
+
+    @staticmethod
+    def _config(values: dict[str, str]) -> mock.Mock:
+        """Build a configuration mock from a dictionary."""
+        get: Callable[[str], str | None] = values.get
+        return mock.Mock(get=mock.Mock(side_effect=get))
+
+    @pytest.mark.asyncio
+    async def test_factory(self, tmp_path: pathlib.Path) -> None:
+        """Test that destinations are read from the configuration."""
+        assert create_webhook_dispatcher(self._config({})) is None
+        dispatcher = create_webhook_dispatcher(
+            self._config({
+                "WEBHOOK_URLS": f"{URL}, https://other.example/hook,",
+                "WEBHOOK_SECRET": "key",
+                "WEBHOOK_METHODS": "tip, follow",
+                "WEBHOOK_DEAD_LETTER": str(tmp_path / "dead.jsonl"),
+            })
+        )
+        assert dispatcher is not None
+        assert dispatcher.destinations == [
+            WebhookDestination(URL, "key", frozenset({"tip", "follow"})),
+            WebhookDestination("https://other.example/hook", "key", frozenset({"tip", "follow"})),
+        ]
+        assert dispatcher.dead_letter_path == tmp_path / "dead.jsonl"
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_handler(self, tmp_path: pathlib.Path, sample_event: Event) -> None:
+        """Test that the handler queues events, passes them on and drains on close."""
+        requests, transport = _recorder()
+        inner = mock.AsyncMock()
+        handler = WebhookEventHandler(_dispatcher(tmp_path, transport), inner)
+        await handler.handle_event(sample_event)
+        inner.handle_batch.assert_awaited_once_with([sample_event])
+        await handler.close()
+        assert len(requests) == 1
+        inner.close.assert_awaited_once_with()